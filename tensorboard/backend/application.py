@@ -19,17 +19,20 @@ Provides TensorBoardWSGIApp for building a TensorBoard WSGI app.
 
 import base64
 import collections
+import concurrent.futures
 import hashlib
 import io
 import json
 import re
 import textwrap
+import threading
 import time
 from urllib import parse as urlparse
 import zipfile
 
 from werkzeug import wrappers
 
+from tensorboard import context as context_lib
 from tensorboard import errors
 from tensorboard import plugin_util
 from tensorboard.backend import auth_context_middleware
@@ -39,6 +42,7 @@ from tensorboard.backend import experiment_id
 from tensorboard.backend import experimental_plugin
 from tensorboard.backend import http_util
 from tensorboard.backend import path_prefix
+from tensorboard.backend import request_metrics as request_metrics_lib
 from tensorboard.backend import security_validator
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.core import core_plugin
@@ -49,6 +53,7 @@ DATA_PREFIX = "/data"
 PLUGIN_PREFIX = "/plugin"
 PLUGINS_LISTING_ROUTE = "/plugins_listing"
 PLUGIN_ENTRY_ROUTE = "/plugin_entry.html"
+REQUEST_METRICS_ROUTE = "/request_metrics"
 
 EXPERIMENTAL_PLUGINS_QUERY_PARAM = "experimentalPlugin"
 
@@ -57,6 +62,17 @@ EXPERIMENTAL_PLUGINS_QUERY_PARAM = "experimentalPlugin"
 # names as follows.
 _VALID_PLUGIN_RE = re.compile(r"^[A-Za-z0-9_-]+$")
 
+# How long results of `TBPlugin.is_active()` are cached when serving the
+# plugins listing, if not tied to the reload interval.
+_DEFAULT_IS_ACTIVE_TTL_SECS = 5.0
+
+# How long the plugins listing waits for `TBPlugin.is_active()` calls. A
+# plugin that takes longer is listed as inactive until its call completes.
+_IS_ACTIVE_TIMEOUT_SECS = 10.0
+
+# Maximum number of `TBPlugin.is_active()` calls evaluated concurrently.
+_IS_ACTIVE_MAX_WORKERS = 8
+
 logger = tb_logging.get_logger()
 
 
@@ -104,6 +120,11 @@ def TensorBoardWSGIApp(
     """
     if assets_zip_provider is None:
         assets_zip_provider = _placeholder_assets_zip_provider
+    metrics = request_metrics_lib.RequestMetrics()
+    if data_provider is not None:
+        data_provider = request_metrics_lib.InstrumentedDataProvider(
+            data_provider, metrics
+        )
     plugin_name_to_instance = {}
     context = base_plugin.TBContext(
         data_provider=data_provider,
@@ -136,6 +157,9 @@ def TensorBoardWSGIApp(
         ) or isinstance(plugin, experimental_plugin.ExperimentalPlugin):
             experimental_plugins.append(plugin.plugin_name)
         plugin_name_to_instance[plugin.plugin_name] = plugin
+    # Cache `is_active` results for one reload cycle, since new data may
+    # only make a plugin active once it has been reloaded.
+    reload_interval = getattr(flags, "reload_interval", None)
     return TensorBoardWSGI(
         tbplugins,
         flags.path_prefix,
@@ -143,6 +167,9 @@ def TensorBoardWSGIApp(
         experimental_plugins,
         auth_providers,
         experimental_middlewares,
+        is_active_ttl_secs=reload_interval or None,
+        request_metrics=metrics,
+        slow_request_secs=getattr(flags, "slow_request_secs", None),
     )
 
 
@@ -170,6 +197,105 @@ def make_plugin_loader(plugin_spec):
     raise TypeError("Not a TBLoader or TBPlugin subclass: %r" % (plugin_spec,))
 
 
+class _IsActiveCache:
+    """Evaluates `TBPlugin.is_active()` concurrently, caching the results.
+
+    Calls for different plugins run in parallel on a bounded thread pool,
+    and concurrent requests for the same plugin share a single call.
+    Callers wait for at most a fixed timeout; a plugin whose call is still
+    running by then is reported as inactive, and its result is cached
+    once the call completes.
+
+    `is_active()` takes no request context, so its results can be shared
+    by all users.
+    """
+
+    def __init__(self, ttl_secs, timeout_secs):
+        """Creates a cache.
+
+        Args:
+          ttl_secs: The number of seconds for which to cache each result.
+          timeout_secs: The maximum number of seconds for which `get`
+            waits for pending calls.
+        """
+        self._ttl_secs = ttl_secs
+        self._timeout_secs = timeout_secs
+        self._lock = threading.Lock()
+        # Maps plugin name to a tuple `(expiry_time, is_active)`.
+        self._results = {}
+        # Maps plugin name to the `Future` of its running `is_active` call.
+        self._pending = {}
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_IS_ACTIVE_MAX_WORKERS,
+            thread_name_prefix="TensorBoardIsActive",
+        )
+
+    def get(self, plugins):
+        """Determines whether each of the given plugins is active.
+
+        Args:
+          plugins: A list of `base_plugin.TBPlugin` instances.
+
+        Returns:
+          A dict mapping each plugin name to its `is_active()` result.
+        """
+        result = {}
+        futures = {}
+        now = time.monotonic()
+        with self._lock:
+            for plugin in plugins:
+                name = plugin.plugin_name
+                cached = self._results.get(name)
+                if cached is not None and cached[0] > now:
+                    result[name] = cached[1]
+                    continue
+                future = self._pending.get(name)
+                if future is None:
+                    future = self._executor.submit(self._evaluate, plugin)
+                    self._pending[name] = future
+                futures[name] = future
+        if futures:
+            concurrent.futures.wait(
+                futures.values(), timeout=self._timeout_secs
+            )
+        for name, future in futures.items():
+            if future.done():
+                result[name] = future.result()
+            else:
+                logger.warning(
+                    "Plugin listing: is_active() for %s is taking more than "
+                    "%0.1f seconds (marking inactive for now)",
+                    name,
+                    self._timeout_secs,
+                )
+                result[name] = False
+        return result
+
+    def _evaluate(self, plugin):
+        """Calls `plugin.is_active()` and caches the result."""
+        try:
+            start = time.time()
+            is_active = plugin.is_active()
+            elapsed = time.time() - start
+            logger.info(
+                "Plugin listing: is_active() for %s took %0.3f seconds",
+                plugin.plugin_name,
+                elapsed,
+            )
+        except Exception:
+            is_active = False
+            logger.error(
+                "Plugin listing: is_active() for %s failed (marking inactive)",
+                plugin.plugin_name,
+                exc_info=True,
+            )
+        with self._lock:
+            expiry_time = time.monotonic() + self._ttl_secs
+            self._results[plugin.plugin_name] = (expiry_time, is_active)
+            del self._pending[plugin.plugin_name]
+        return is_active
+
+
 class TensorBoardWSGI:
     """The TensorBoard WSGI app that delegates to a set of TBPlugin."""
 
@@ -181,6 +307,9 @@ class TensorBoardWSGI:
         experimental_plugins=None,
         auth_providers=None,
         experimental_middlewares=None,
+        is_active_ttl_secs=None,
+        request_metrics=None,
+        slow_request_secs=None,
     ):
         """Constructs TensorBoardWSGI instance.
 
@@ -201,6 +330,16 @@ class TensorBoardWSGI:
           experimental_middlewares: Optional list of WSGI middlewares to apply
             directly around the core TensorBoard app itself. Defaults to `[]`.
             This parameter is experimental and may be reworked or removed.
+          is_active_ttl_secs: Optional number of seconds for which to cache
+            the results of `TBPlugin.is_active()` calls in the plugins
+            listing. Defaults to `_DEFAULT_IS_ACTIVE_TTL_SECS`.
+          request_metrics: Optional `request_metrics.RequestMetrics` to which
+            requests are reported, and which is served at
+            `/data/request_metrics`. Pass the same value to any
+            `InstrumentedDataProvider` wrapping `data_provider`. Defaults to
+            a new instance.
+          slow_request_secs: Optional number of seconds; requests that take
+            longer are logged. Defaults to logging no requests.
 
         Returns:
           A WSGI application for the set of all TBPlugin instances.
@@ -221,6 +360,20 @@ class TensorBoardWSGI:
         self._experimental_plugins = frozenset(experimental_plugins or ())
         self._auth_providers = auth_providers or {}
         self._extra_middlewares = list(experimental_middlewares or [])
+        self._request_metrics = (
+            request_metrics
+            if request_metrics is not None
+            else request_metrics_lib.RequestMetrics()
+        )
+        self._slow_request_secs = slow_request_secs
+        self._is_active_cache = _IsActiveCache(
+            ttl_secs=(
+                _DEFAULT_IS_ACTIVE_TTL_SECS
+                if is_active_ttl_secs is None
+                else is_active_ttl_secs
+            ),
+            timeout_secs=_IS_ACTIVE_TIMEOUT_SECS,
+        )
         if self._path_prefix.endswith("/"):
             # Should have been fixed by `fix_flags`.
             raise ValueError(
@@ -233,6 +386,7 @@ class TensorBoardWSGI:
             # active.
             DATA_PREFIX + PLUGINS_LISTING_ROUTE: self._serve_plugins_listing,
             DATA_PREFIX + PLUGIN_ENTRY_ROUTE: self._serve_plugin_entry,
+            DATA_PREFIX + REQUEST_METRICS_ROUTE: self._serve_request_metrics,
         }
         unordered_prefix_routes = {}
 
@@ -334,6 +488,9 @@ class TensorBoardWSGI:
         app = path_prefix.PathPrefixMiddleware(app, self._path_prefix)
         app = security_validator.SecurityValidatorMiddleware(app)
         app = _handling_errors(app)
+        app = request_metrics_lib.RequestMetricsMiddleware(
+            app, self._request_metrics, self._slow_request_secs
+        )
         return app
 
     @wrappers.Request.application
@@ -417,6 +574,7 @@ class TensorBoardWSGI:
         plugins_to_skip = self._experimental_plugins - frozenset(
             request.args.getlist(EXPERIMENTAL_PLUGINS_QUERY_PARAM)
         )
+        plugins = []
         for plugin in self._plugins:
             if plugin.plugin_name in plugins_to_skip:
                 continue
@@ -427,26 +585,23 @@ class TensorBoardWSGI:
                 # This plugin's existence is a backend implementation detail.
                 continue
 
-            is_active = bool(
+            plugins.append(plugin)
+
+        # Plugins without data of their own may still be active, but
+        # determining that may be slow, so it is done concurrently.
+        plugin_to_is_active = {
+            plugin.plugin_name: bool(
                 frozenset(plugin.data_plugin_names()) & plugins_with_data
             )
-            if not is_active:
-                try:
-                    start = time.time()
-                    is_active = plugin.is_active()
-                    elapsed = time.time() - start
-                    logger.info(
-                        "Plugin listing: is_active() for %s took %0.3f seconds",
-                        plugin.plugin_name,
-                        elapsed,
-                    )
-                except Exception:
-                    is_active = False
-                    logger.error(
-                        "Plugin listing: is_active() for %s failed (marking inactive)",
-                        plugin.plugin_name,
-                        exc_info=True,
-                    )
+            for plugin in plugins
+        }
+        plugin_to_is_active.update(
+            self._is_active_cache.get(
+                [p for p in plugins if not plugin_to_is_active[p.plugin_name]]
+            )
+        )
+        for plugin in plugins:
+            is_active = plugin_to_is_active[plugin.plugin_name]
 
             plugin_metadata = plugin.frontend_metadata()
             output_metadata = {
@@ -515,6 +670,28 @@ class TensorBoardWSGI:
             response[plugin.plugin_name] = output_metadata
         return http_util.Respond(request, response, "application/json")
 
+    @wrappers.Request.application
+    def _serve_request_metrics(self, request):
+        """Serves latency and size metrics of requests, by route.
+
+        Responds with JSON by default, or in the Prometheus text exposition
+        format given the query parameter `format=prometheus`.
+        """
+        output_format = request.args.get("format", "json")
+        if output_format == "prometheus":
+            return http_util.Respond(
+                request,
+                self._request_metrics.as_prometheus_text(),
+                "text/plain; version=0.0.4",
+            )
+        if output_format != "json":
+            raise errors.InvalidArgumentError(
+                "Unknown format: %r" % output_format
+            )
+        return http_util.Respond(
+            request, self._request_metrics.as_dict(), "application/json"
+        )
+
     def __call__(self, environ, start_response):
         """Central entry point for the TensorBoard application.
 
@@ -545,13 +722,18 @@ class TensorBoardWSGI:
         request = wrappers.Request(environ)
         parsed_url = urlparse.urlparse(request.path)
         clean_path = _clean_path(parsed_url.path)
+        record = context_lib.from_environ(environ).request_record
 
         # pylint: disable=too-many-function-args
         if clean_path in self.exact_routes:
+            if record is not None:
+                record.set_route(clean_path)
             return self.exact_routes[clean_path](environ, start_response)
         else:
             for path_prefix in self.prefix_routes:
                 if clean_path.startswith(path_prefix):
+                    if record is not None:
+                        record.set_route(path_prefix + "*")
                     return self.prefix_routes[path_prefix](
                         environ, start_response
                     )
@@ -16,6 +16,7 @@
 
 
 import json
+import threading
 from unittest import mock
 
 from werkzeug import test as werkzeug_test
@@ -484,6 +485,60 @@ class ApplicationTest(tb_test.TestCase):
             server.get("/data/plugins_listing")
 
 
+class IsActiveCacheTest(tb_test.TestCase):
+    def testCachesResultsUntilExpiry(self):
+        plugin = FakePlugin(plugin_name="foo", is_active_value=False)
+        cache = application._IsActiveCache(ttl_secs=60, timeout_secs=10)
+        with mock.patch.object(
+            plugin, "is_active", wraps=plugin.is_active
+        ) as is_active:
+            self.assertEqual({"foo": False}, cache.get([plugin]))
+            self.assertEqual({"foo": False}, cache.get([plugin]))
+            self.assertEqual(1, is_active.call_count)
+
+        expired = application._IsActiveCache(ttl_secs=0, timeout_secs=10)
+        with mock.patch.object(
+            plugin, "is_active", wraps=plugin.is_active
+        ) as is_active:
+            expired.get([plugin])
+            expired.get([plugin])
+            self.assertEqual(2, is_active.call_count)
+
+    def testEvaluatesConcurrently(self):
+        # Each call waits until both calls have started, so this only
+        # completes in time if the calls run in parallel.
+        barrier = threading.Barrier(2, timeout=10)
+        plugins = [
+            FakePlugin(plugin_name="foo", is_active_value=True),
+            FakePlugin(plugin_name="bar", is_active_value=False),
+        ]
+
+        def wait_then_return(value):
+            def is_active():
+                barrier.wait()
+                return value
+
+            return is_active
+
+        for plugin in plugins:
+            plugin.is_active = wait_then_return(plugin.is_active())
+        cache = application._IsActiveCache(ttl_secs=60, timeout_secs=10)
+        self.assertEqual({"foo": True, "bar": False}, cache.get(plugins))
+
+    def testSlowPluginIsInactiveUntilDone(self):
+        done = threading.Event()
+        plugin = FakePlugin(plugin_name="foo", is_active_value=True)
+        plugin.is_active = mock.Mock(side_effect=lambda: done.wait(10))
+        cache = application._IsActiveCache(ttl_secs=60, timeout_secs=0.01)
+        self.assertEqual({"foo": False}, cache.get([plugin]))
+        # A second request does not start another call.
+        self.assertEqual({"foo": False}, cache.get([plugin]))
+        done.set()
+        cache._executor.shutdown(wait=True)
+        self.assertEqual({"foo": True}, cache.get([plugin]))
+        self.assertEqual(1, plugin.is_active.call_count)
+
+
 class ApplicationBaseUrlTest(tb_test.TestCase):
     path_prefix = "/test"
 
@@ -803,6 +858,38 @@ class TensorBoardPluginsTest(tb_test.TestCase):
         data = json.loads(response.get_data().decode("utf-8"))
         self.assertEqual(data, {"experiment_id": "123"})
 
+    def testRequestMetrics(self):
+        for path in (
+            "/data/plugin/bar/wildcard/ok",
+            "/data/plugin/bar/wildcard/bogus",
+            "/experiment/123/data/plugin/whoami/eid",
+            "/nonexistent/path",
+        ):
+            with self.server.get(path) as response:
+                response.get_data()
+        with self.assertRaises(NotImplementedError):
+            self.context.data_provider.list_runs(experiment_id="123")
+
+        response = self.server.get("/data/request_metrics")
+        self.assertEqual(response.status_code, 200)
+        metrics = json.loads(response.get_data())
+        routes = metrics["routes"]
+        self.assertEqual(
+            routes["/data/plugin/bar/wildcard/*"]["status_counts"],
+            {"200": 1, "401": 1},
+        )
+        self.assertEqual(routes["/data/plugin/whoami/eid"]["count"], 1)
+        self.assertEqual(routes["(unmatched)"]["status_counts"], {"404": 1})
+        self.assertEqual(metrics["data_provider"]["list_runs"]["count"], 1)
+
+        response = self.server.get("/data/request_metrics?format=prometheus")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            b'tensorboard_http_request_seconds_count{route="/data/plugin/whoami/eid"} 1',
+            response.get_data(),
+        )
+        self._test_route("/data/request_metrics?format=xml", 400)
+
     def testEmptyRoute(self):
         self._test_route("", 301)
 
@@ -0,0 +1,256 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""A columnar binary encoding for scalar and histogram time series.
+
+Routes that return time series as JSON lists of `[wall_time, step, ...]`
+may instead return this format when the client lists `MIME_TYPE` in its
+`Accept` header. JSON remains the default.
+
+A response is a header followed by one record per series. All integers
+and floats are little-endian, and every array starts at an offset that is
+a multiple of 8 bytes from the start of the response, so that a browser
+can view each column as a typed array over the response buffer without
+copying:
+
+    header:
+      magic          4 bytes, b"TBCF"
+      version        uint32, currently 1
+      kind           uint32, `KIND_SCALARS` or `KIND_HISTOGRAMS`
+      num_series     uint32
+    each series:
+      name_length    uint32, in bytes
+      num_points     uint32
+      name           UTF-8, zero-padded to a multiple of 8 bytes
+      wall_time      float64[num_points]
+      step           int64[num_points]
+      for scalars:
+        value        float32[num_points], zero-padded to 8 bytes
+      for histograms:
+        num_buckets  uint32[num_points], zero-padded to 8 bytes
+        buckets      float64[sum(num_buckets), 3], rows of
+                     `[left_edge, right_edge, count]`
+"""
+
+
+import struct
+
+import numpy as np
+
+from tensorboard.data import provider
+
+
+MIME_TYPE = "application/vnd.tensorboard.columnar"
+
+MAGIC = b"TBCF"
+VERSION = 1
+
+KIND_SCALARS = 1
+KIND_HISTOGRAMS = 2
+
+_HEADER = struct.Struct("<4sIII")
+_SERIES_HEADER = struct.Struct("<II")
+
+_WALL_TIME_DTYPE = np.dtype("<f8")
+_STEP_DTYPE = np.dtype("<i8")
+_VALUE_DTYPE = np.dtype("<f4")
+_BUCKET_COUNT_DTYPE = np.dtype("<u4")
+_BUCKET_DTYPE = np.dtype("<f8")
+
+
+def accepts(request):
+    """Whether the client of `request` explicitly accepts this format.
+
+    Wildcards such as `*/*` do not count, so that clients which have not
+    opted in keep receiving JSON.
+
+    Args:
+      request: A `werkzeug.wrappers.Request`.
+
+    Returns:
+      A `bool`.
+    """
+    return any(
+        mime_type == MIME_TYPE and quality > 0
+        for (mime_type, quality) in request.accept_mimetypes
+    )
+
+
+def encode_scalars(series):
+    """Encodes scalar time series.
+
+    Args:
+      series: A `dict` mapping series name (typically a run name) to a
+        `provider.ScalarColumns` value, or to a sequence of
+        `provider.ScalarDatum` values or any objects with `wall_time`,
+        `step`, and `value` attributes.
+
+    Returns:
+      A `bytes` object in the format described in the module docstring.
+    """
+    writer = _Writer(KIND_SCALARS, len(series))
+    for name, data in series.items():
+        writer.write_series_header(name, len(data))
+        writer.write_array(_column(data, "wall_time", _WALL_TIME_DTYPE))
+        writer.write_array(_column(data, "step", _STEP_DTYPE))
+        writer.write_array(_column(data, "value", _VALUE_DTYPE))
+    return writer.getvalue()
+
+
+def encode_histograms(series):
+    """Encodes histogram time series.
+
+    Args:
+      series: A `dict` mapping series name (typically a run name) to a
+        `provider.TensorColumns` value, or to a sequence of
+        `provider.TensorDatum` values, whose tensors are `[k, 3]`-shaped
+        arrays of `[left_edge, right_edge, count]`.
+
+    Returns:
+      A `bytes` object in the format described in the module docstring.
+    """
+    writer = _Writer(KIND_HISTOGRAMS, len(series))
+    for name, data in series.items():
+        writer.write_series_header(name, len(data))
+        writer.write_array(_column(data, "wall_time", _WALL_TIME_DTYPE))
+        writer.write_array(_column(data, "step", _STEP_DTYPE))
+        if isinstance(data, provider.TensorColumns):
+            stacked = data.stacked()
+            if stacked is not None and stacked.size:
+                # Every point has the same number of buckets, so write
+                # them all at once.
+                stacked = stacked.reshape(len(data), -1, 3)
+                writer.write_array(
+                    np.full(len(data), stacked.shape[1], _BUCKET_COUNT_DTYPE)
+                )
+                writer.write_array(stacked.reshape(-1, 3).astype(_BUCKET_DTYPE))
+                continue
+            data = data.to_data()
+        buckets = [np.asarray(d.numpy).reshape(-1, 3) for d in data]
+        writer.write_array(
+            np.fromiter(
+                (len(b) for b in buckets),
+                dtype=_BUCKET_COUNT_DTYPE,
+                count=len(buckets),
+            )
+        )
+        if buckets:
+            writer.write_array(np.concatenate(buckets).astype(_BUCKET_DTYPE))
+    return writer.getvalue()
+
+
+def decode(data):
+    """Decodes a response produced by `encode_scalars` or `encode_histograms`.
+
+    This is the inverse of the encoders, for use by Python clients and
+    tests. Returned arrays are read-only views over `data`.
+
+    Args:
+      data: A bytes-like object.
+
+    Returns:
+      A tuple `(kind, series)`, where `series` is a `dict` mapping series
+      name to a `dict` of NumPy arrays with keys `"wall_time"`, `"step"`,
+      and either `"value"` (for scalars) or `"buckets"` (for histograms;
+      a list of `[k, 3]` arrays, one per point).
+
+    Raises:
+      ValueError: If `data` is not in this format.
+    """
+    buf = memoryview(data)
+    if len(buf) < _HEADER.size:
+        raise ValueError("Truncated columnar response header")
+    (magic, version, kind, num_series) = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("Bad magic: %r" % magic)
+    if version != VERSION:
+        raise ValueError("Unsupported version: %d" % version)
+    if kind not in (KIND_SCALARS, KIND_HISTOGRAMS):
+        raise ValueError("Unsupported kind: %d" % kind)
+    offset = _HEADER.size
+    result = {}
+
+    def read_array(dtype, count):
+        nonlocal offset
+        array = np.frombuffer(buf, dtype=dtype, count=count, offset=offset)
+        offset = _aligned(offset + array.nbytes)
+        return array
+
+    for _ in range(num_series):
+        (name_length, num_points) = _SERIES_HEADER.unpack_from(buf, offset)
+        offset += _SERIES_HEADER.size
+        name = bytes(buf[offset : offset + name_length]).decode("utf-8")
+        offset = _aligned(offset + name_length)
+        columns = {
+            "wall_time": read_array(_WALL_TIME_DTYPE, num_points),
+            "step": read_array(_STEP_DTYPE, num_points),
+        }
+        if kind == KIND_SCALARS:
+            columns["value"] = read_array(_VALUE_DTYPE, num_points)
+        else:
+            counts = read_array(_BUCKET_COUNT_DTYPE, num_points)
+            if num_points:
+                total = int(counts.sum())
+                flat = read_array(_BUCKET_DTYPE, 3 * total).reshape(-1, 3)
+                splits = np.cumsum(counts)[:-1]
+                columns["buckets"] = np.split(flat, splits)
+            else:
+                columns["buckets"] = []
+        result[name] = columns
+    return (kind, result)
+
+
+def _column(data, attr, dtype):
+    """Gathers `getattr(x, attr)` for each `x` in `data` into an array.
+
+    If `data` is a `provider.ScalarColumns` or `provider.TensorColumns`,
+    its `attr` column is used directly instead.
+    """
+    if isinstance(data, (provider.ScalarColumns, provider.TensorColumns)):
+        return np.asarray(getattr(data, attr), dtype=dtype)
+    return np.fromiter(
+        (getattr(x, attr) for x in data), dtype=dtype, count=len(data)
+    )
+
+
+def _aligned(offset):
+    return (offset + 7) & ~7
+
+
+class _Writer:
+    """Accumulates chunks of a response, padding each to 8 bytes."""
+
+    def __init__(self, kind, num_series):
+        self._chunks = [_HEADER.pack(MAGIC, VERSION, kind, num_series)]
+        self._size = _HEADER.size
+
+    def _append(self, chunk):
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        padding = _aligned(self._size) - self._size
+        if padding:
+            self._chunks.append(b"\0" * padding)
+            self._size += padding
+
+    def write_series_header(self, name, num_points):
+        name = name.encode("utf-8")
+        self._chunks.append(_SERIES_HEADER.pack(len(name), num_points))
+        self._size += _SERIES_HEADER.size
+        self._append(name)
+
+    def write_array(self, array):
+        self._append(np.ascontiguousarray(array).tobytes())
+
+    def getvalue(self):
+        return b"".join(self._chunks)
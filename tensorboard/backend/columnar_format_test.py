@@ -0,0 +1,160 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for the columnar binary format."""
+
+
+import numpy as np
+from werkzeug import test as wtest
+from werkzeug import wrappers
+
+from tensorboard import test as tb_test
+from tensorboard.backend import columnar_format
+from tensorboard.data import provider
+
+
+def _request(accept=None):
+    headers = {"Accept": accept} if accept is not None else {}
+    return wrappers.Request(wtest.EnvironBuilder(headers=headers).get_environ())
+
+
+class AcceptsTest(tb_test.TestCase):
+    def test_explicit(self):
+        self.assertTrue(
+            columnar_format.accepts(
+                _request(
+                    "%s, application/json;q=0.5" % columnar_format.MIME_TYPE
+                )
+            )
+        )
+
+    def test_not_listed(self):
+        self.assertFalse(columnar_format.accepts(_request()))
+        self.assertFalse(columnar_format.accepts(_request("*/*")))
+        self.assertFalse(
+            columnar_format.accepts(_request("application/json, */*"))
+        )
+
+    def test_zero_quality(self):
+        self.assertFalse(
+            columnar_format.accepts(
+                _request("%s;q=0" % columnar_format.MIME_TYPE)
+            )
+        )
+
+
+class EncodeScalarsTest(tb_test.TestCase):
+    def test_roundtrip(self):
+        series = {
+            "train": [
+                provider.ScalarDatum(step=0, wall_time=1.25, value=0.5),
+                provider.ScalarDatum(step=2**40, wall_time=2.5, value=-1.0),
+            ],
+            "eval/é": [
+                provider.ScalarDatum(step=7, wall_time=3.0, value=np.inf),
+            ],
+            "empty": [],
+        }
+        encoded = columnar_format.encode_scalars(series)
+        self.assertEqual(encoded[:4], columnar_format.MAGIC)
+        self.assertEqual(len(encoded) % 8, 0)
+
+        (kind, decoded) = columnar_format.decode(encoded)
+        self.assertEqual(kind, columnar_format.KIND_SCALARS)
+        self.assertEqual(list(decoded), ["train", "eval/é", "empty"])
+        train = decoded["train"]
+        self.assertEqual(train["wall_time"].dtype, np.dtype("<f8"))
+        self.assertEqual(train["step"].dtype, np.dtype("<i8"))
+        self.assertEqual(train["value"].dtype, np.dtype("<f4"))
+        np.testing.assert_array_equal(train["wall_time"], [1.25, 2.5])
+        np.testing.assert_array_equal(train["step"], [0, 2**40])
+        np.testing.assert_array_equal(train["value"], [0.5, -1.0])
+        np.testing.assert_array_equal(decoded["eval/é"]["value"], [np.inf])
+        self.assertEqual(len(decoded["empty"]["step"]), 0)
+
+    def test_scalar_columns(self):
+        data = [
+            provider.ScalarDatum(step=1, wall_time=1.0, value=0.5),
+            provider.ScalarDatum(step=2, wall_time=2.0, value=0.25),
+        ]
+        self.assertEqual(
+            columnar_format.encode_scalars(
+                {"train": provider.ScalarColumns.from_data(data)}
+            ),
+            columnar_format.encode_scalars({"train": data}),
+        )
+
+    def test_columns_are_aligned(self):
+        series = {
+            "a": [provider.ScalarDatum(step=1, wall_time=1.0, value=1.0)],
+            "bcd": [provider.ScalarDatum(step=2, wall_time=2.0, value=2.0)],
+        }
+        encoded = columnar_format.encode_scalars(series)
+        (_, decoded) = columnar_format.decode(encoded)
+        base = np.frombuffer(encoded, dtype=np.uint8).ctypes.data
+        for columns in decoded.values():
+            for array in columns.values():
+                self.assertEqual((array.ctypes.data - base) % 8, 0)
+
+    def test_bad_magic(self):
+        encoded = bytearray(columnar_format.encode_scalars({}))
+        encoded[0:4] = b"JSON"
+        with self.assertRaisesRegex(ValueError, "magic"):
+            columnar_format.decode(bytes(encoded))
+
+
+class EncodeHistogramsTest(tb_test.TestCase):
+    def test_roundtrip(self):
+        first = np.array([[0.0, 1.0, 3.0], [1.0, 2.0, 4.0]])
+        second = np.array([[-1.0, 0.0, 5.0]])
+        series = {
+            "train": [
+                provider.TensorDatum(step=1, wall_time=10.0, numpy=first),
+                provider.TensorDatum(step=2, wall_time=20.0, numpy=second),
+            ],
+            "empty": [],
+        }
+        (kind, decoded) = columnar_format.decode(
+            columnar_format.encode_histograms(series)
+        )
+        self.assertEqual(kind, columnar_format.KIND_HISTOGRAMS)
+        train = decoded["train"]
+        np.testing.assert_array_equal(train["wall_time"], [10.0, 20.0])
+        np.testing.assert_array_equal(train["step"], [1, 2])
+        self.assertLen(train["buckets"], 2)
+        np.testing.assert_array_equal(train["buckets"][0], first)
+        np.testing.assert_array_equal(train["buckets"][1], second)
+        self.assertEqual(decoded["empty"]["buckets"], [])
+
+    def test_tensor_columns(self):
+        data = [
+            provider.TensorDatum(
+                step=i, wall_time=float(i), numpy=np.full((3, 3), float(i))
+            )
+            for i in range(4)
+        ]
+        ragged = data[:1] + [
+            provider.TensorDatum(step=9, wall_time=9.0, numpy=np.ones((2, 3)))
+        ]
+        for points in (data, ragged, []):
+            self.assertEqual(
+                columnar_format.encode_histograms(
+                    {"train": provider.TensorColumns.from_data(points)}
+                ),
+                columnar_format.encode_histograms({"train": points}),
+            )
+
+
+if __name__ == "__main__":
+    tb_test.main()
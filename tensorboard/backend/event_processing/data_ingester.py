@@ -21,6 +21,7 @@ import time
 
 
 from tensorboard.backend.event_processing import data_provider
+from tensorboard.backend.event_processing import data_snapshot
 from tensorboard.backend.event_processing import plugin_event_multiplexer
 from tensorboard.backend.event_processing import tag_types
 from tensorboard.compat import tf
@@ -76,6 +77,8 @@ class LocalDataIngester(ingester.DataIngester):
         )
         self._reload_interval = flags.reload_interval
         self._reload_task = flags.reload_task
+        self._snapshot_dir = None
+        self._snapshot_publisher = None
         if flags.logdir:
             self._path_to_run = {os.path.expanduser(flags.logdir): None}
         else:
@@ -93,6 +96,20 @@ class LocalDataIngester(ingester.DataIngester):
     def deprecated_multiplexer(self):
         return self._multiplexer
 
+    def publish_snapshots(self, directory):
+        """Publishes loaded data to `directory` after each reload.
+
+        Must be called before `start`. Other processes can then serve the
+        data with a `data_snapshot.SnapshotDataProvider` on `directory`.
+        With `--reload_task=auto`, the reload then runs in a child process.
+
+        Args:
+          directory: Snapshot directory, as from
+            `data_snapshot.make_snapshot_dir`.
+        """
+        self._snapshot_dir = directory
+        self._snapshot_publisher = data_snapshot.Publisher(directory)
+
     def start(self):
         """Starts ingesting data based on the ingester flag configuration."""
 
@@ -107,15 +124,31 @@ class LocalDataIngester(ingester.DataIngester):
                 )
                 self._multiplexer.Reload()
                 duration = time.time() - start
+                self._multiplexer.IngestionMetrics().RecordCycle(duration)
                 logger.info(
                     "TensorBoard done reloading. Load took %0.3f secs", duration
                 )
+                if self._snapshot_dir is not None:
+                    start = time.time()
+                    published = self._snapshot_publisher.publish(
+                        self._data_provider,
+                        self._multiplexer.RunGenerations(),
+                    )
+                    if published:
+                        logger.info(
+                            "TensorBoard published snapshot in %0.3f secs",
+                            time.time() - start,
+                        )
                 if self._reload_interval == 0:
                     # Only load the multiplexer once. Do not continuously reload.
                     break
                 time.sleep(self._reload_interval)
 
-        if self._reload_task == "process":
+        reload_task = self._reload_task
+        if reload_task == "auto" and self._snapshot_dir is not None:
+            # Keep loading off the GIL of the processes that serve requests.
+            reload_task = "process"
+        if reload_task == "process":
             logger.info("Launching reload in a child process")
             import multiprocessing
 
@@ -124,20 +157,20 @@ class LocalDataIngester(ingester.DataIngester):
             # kill all its daemonic children.
             process.daemon = True
             process.start()
-        elif self._reload_task in ("thread", "auto"):
+        elif reload_task in ("thread", "auto"):
             logger.info("Launching reload in a daemon thread")
             thread = threading.Thread(target=_reload, name="Reloader")
             # Make this a daemon thread, which won't block TB from exiting.
             thread.daemon = True
             thread.start()
-        elif self._reload_task == "blocking":
+        elif reload_task == "blocking":
             if self._reload_interval != 0:
                 raise ValueError(
                     "blocking reload only allowed with load_interval=0"
                 )
             _reload()
         else:
-            raise ValueError("unrecognized reload_task: %s" % self._reload_task)
+            raise ValueError("unrecognized reload_task: %s" % reload_task)
 
 
 def _get_event_file_active_filter(flags):
@@ -20,14 +20,23 @@ import collections
 import json
 import random
 
+import numpy as np
+
 from tensorboard import errors
 from tensorboard.compat.proto import summary_pb2
+from tensorboard.compat.proto import types_pb2
 from tensorboard.data import provider
 from tensorboard.util import tb_logging
 from tensorboard.util import tensor_util
 
 logger = tb_logging.get_logger()
 
+# Dtypes of `tensor_content` that `_scalar_values` decodes in bulk.
+_SCALAR_CONTENT_DTYPES = {
+    types_pb2.DT_FLOAT: np.dtype("<f4"),
+    types_pb2.DT_DOUBLE: np.dtype("<f8"),
+}
+
 
 class MultiplexerDataProvider(provider.DataProvider):
     def __init__(self, multiplexer, logdir):
@@ -138,6 +147,34 @@ class MultiplexerDataProvider(provider.DataProvider):
         )
         return self._read(_convert_scalar_event, index, downsample)
 
+    def read_scalars_columnar(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        self._validate_context(ctx)
+        self._validate_experiment_id(experiment_id)
+        self._validate_downsample(downsample)
+        index = self._index(
+            plugin_name, run_tag_filter, summary_pb2.DATA_CLASS_SCALAR
+        )
+        result = {}
+        for run, tags_for_run in index.items():
+            result_for_run = {}
+            result[run] = result_for_run
+            for tag in tags_for_run:
+                # Downsampling picks the same points as `read_scalars`,
+                # but before any of them are decoded.
+                events = _downsample(
+                    self._multiplexer.Tensors(run, tag), downsample
+                )
+                result_for_run[tag] = _scalar_columns(events)
+        return result
+
     def read_last_scalars(
         self,
         ctx=None,
@@ -154,10 +191,10 @@ class MultiplexerDataProvider(provider.DataProvider):
         run_tag_to_last_scalar_datum = collections.defaultdict(dict)
         for run, tags_for_run in index.items():
             for tag, metadata in tags_for_run.items():
-                events = self._multiplexer.Tensors(run, tag)
-                if events:
+                event = self._multiplexer.LastTensor(run, tag)
+                if event is not None:
                     run_tag_to_last_scalar_datum[run][tag] = (
-                        _convert_scalar_event(events[-1])
+                        _convert_scalar_event(event)
                     )
 
         return run_tag_to_last_scalar_datum
@@ -217,24 +254,32 @@ class MultiplexerDataProvider(provider.DataProvider):
                 metadata = self._multiplexer.SummaryMetadata(run, tag)
             except KeyError:
                 return {}
-            all_metadata = {run: {tag: metadata}}
-        else:
-            all_metadata = self._multiplexer.AllSummaryMetadata()
+            if metadata.data_class != data_class_filter:
+                return {}
+            if metadata.plugin_data.plugin_name != plugin_name:
+                return {}
+            return {run: {tag: metadata}}
+
+        # Only time series of the right plugin and data class are returned
+        # by the multiplexer, so we need only filter by runs and tags.
+        all_metadata = self._multiplexer.SummaryMetadataForPlugin(
+            plugin_name, data_class_filter
+        )
+        if runs is None and tags is None:
+            return all_metadata
 
         result = {}
         for run, tag_to_metadata in all_metadata.items():
             if runs is not None and run not in runs:
                 continue
-            result_for_run = {}
-            for tag, metadata in tag_to_metadata.items():
-                if tags is not None and tag not in tags:
-                    continue
-                if metadata.data_class != data_class_filter:
-                    continue
-                if metadata.plugin_data.plugin_name != plugin_name:
-                    continue
-                result[run] = result_for_run
-                result_for_run[tag] = metadata
+            if tags is not None:
+                tag_to_metadata = {
+                    tag: metadata
+                    for (tag, metadata) in tag_to_metadata.items()
+                    if tag in tags
+                }
+            if tag_to_metadata:
+                result[run] = tag_to_metadata
 
         return result
 
@@ -453,6 +498,62 @@ def _convert_scalar_event(event):
     )
 
 
+def _scalar_columns(events):
+    """Helper for `read_scalars_columnar`."""
+    n = len(events)
+    return provider.ScalarColumns(
+        step=np.fromiter((e.step for e in events), np.int64, count=n),
+        wall_time=np.fromiter(
+            (e.wall_time for e in events), np.float64, count=n
+        ),
+        value=_scalar_values([e.tensor_proto for e in events]),
+    )
+
+
+def _scalar_values(tensor_protos):
+    """Decodes scalar `TensorProto`s into a `float64` array.
+
+    When every proto holds its value as `tensor_content` of the same
+    float dtype, as the scalar summaries of TensorFlow 2 do, all values
+    are decoded at once from their concatenated bytes.
+    """
+    if tensor_protos:
+        dtype = _SCALAR_CONTENT_DTYPES.get(tensor_protos[0].dtype)
+        if dtype is not None and all(
+            p.dtype == tensor_protos[0].dtype
+            and len(p.tensor_content) == dtype.itemsize
+            and not p.tensor_shape.dim
+            for p in tensor_protos
+        ):
+            content = b"".join(p.tensor_content for p in tensor_protos)
+            return np.frombuffer(content, dtype).astype(np.float64)
+    return np.fromiter(
+        (_scalar_value(p) for p in tensor_protos),
+        np.float64,
+        count=len(tensor_protos),
+    )
+
+
+def _scalar_value(tensor_proto):
+    """Returns the value of a scalar `TensorProto` as a Python number.
+
+    Reads the common float and double scalars straight from the proto,
+    which is much cheaper than building an array with `make_ndarray`.
+    """
+    if not tensor_proto.tensor_content and not tensor_proto.tensor_shape.dim:
+        if (
+            tensor_proto.dtype == types_pb2.DT_FLOAT
+            and len(tensor_proto.float_val) == 1
+        ):
+            return tensor_proto.float_val[0]
+        if (
+            tensor_proto.dtype == types_pb2.DT_DOUBLE
+            and len(tensor_proto.double_val) == 1
+        ):
+            return tensor_proto.double_val[0]
+    return tensor_util.make_ndarray(tensor_proto).item()
+
+
 def _convert_tensor_event(event):
     """Helper for `read_tensors`."""
     return provider.TensorDatum(
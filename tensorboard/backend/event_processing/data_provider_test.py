@@ -312,6 +312,29 @@ class MultiplexerDataProviderTest(tf.test.TestCase):
         )
         self.assertLen(result["waves"]["sine"], 3)
 
+    def test_read_scalars_columnar(self):
+        provider = self.create_provider()
+        for plugin_name in (scalar_metadata.PLUGIN_NAME, "marigraphs"):
+            for downsample in (3, 100):
+                kwargs = {
+                    "experiment_id": "unused",
+                    "plugin_name": plugin_name,
+                    "downsample": downsample,
+                }
+                expected = provider.read_scalars(self.ctx, **kwargs)
+                result = provider.read_scalars_columnar(self.ctx, **kwargs)
+                self.assertEqual(result.keys(), expected.keys())
+                for run in result:
+                    self.assertEqual(result[run].keys(), expected[run].keys())
+                    for tag, columns in result[run].items():
+                        self.assertEqual(
+                            columns,
+                            base_provider.ScalarColumns.from_data(
+                                expected[run][tag]
+                            ),
+                        )
+                        self.assertEqual(columns.value.dtype, np.float64)
+
     def test_read_scalars_but_not_rank_0(self):
         provider = self.create_provider()
         run_tag_filter = base_provider.RunTagFilter(["waves"], ["bad"])
@@ -0,0 +1,773 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Snapshots of loaded data that other processes can read in place.
+
+The process that loads a logdir publishes a snapshot of everything its
+data provider serves after each reload, with a `Publisher`. Any number
+of other processes can then serve that data with a
+`SnapshotDataProvider`, which maps the snapshot into memory: the
+operating system shares its pages among all readers, so the data is not
+duplicated per process, and no reader ever contends for the loading
+process's GIL.
+
+A snapshot directory holds one data file per run and a small JSON
+manifest, named `SNAPSHOT_FILENAME`, that lists the runs and the file of
+each. Publishing writes new files only for runs whose data changed since
+the last publication, then atomically replaces the manifest; files that
+neither the new manifest nor the one it replaced refer to are removed.
+Nothing at all is written when no run changed.
+
+A run file consists of an 8-byte magic number, the offset and length of
+a JSON header as two little-endian 64-bit integers, then data sections,
+each aligned to 8 bytes, and finally the header itself. The header
+describes every time series of the run, and refers to arrays and byte
+strings in the data sections as `[offset, count]` pairs. Scalar values
+are stored as arrays that readers wrap without copying. The tensors of a
+series are stored the same way, stacked into one array, when they all
+have the same shape and numeric dtype, as histograms usually do;
+otherwise they are stored as serialized `TensorProto`s. Blobs are stored
+as raw bytes.
+"""
+
+import base64
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+from tensorboard import context
+from tensorboard import errors
+from tensorboard.backend.event_processing import data_provider
+from tensorboard.compat.proto import tensor_pb2
+from tensorboard.data import provider
+from tensorboard.util import tb_logging
+from tensorboard.util import tensor_util
+
+
+logger = tb_logging.get_logger()
+
+# Name of the manifest of the current snapshot within a snapshot
+# directory.
+SNAPSHOT_FILENAME = "snapshot"
+
+# Prefix and suffix of the names of run files in a snapshot directory.
+_RUN_FILE_PREFIX = "run-"
+_RUN_FILE_SUFFIX = ".tbsnap"
+
+# Times to try loading a snapshot whose run files are being replaced.
+_LOAD_ATTEMPTS = 3
+
+_MAGIC = b"TBSNAP01"
+_PREAMBLE = struct.Struct("<8sQQ")
+
+_STEP_DTYPE = np.dtype("<i8")
+_WALL_TIME_DTYPE = np.dtype("<f8")
+_VALUE_DTYPE = np.dtype("<f8")
+_OFFSET_DTYPE = np.dtype("<i8")
+
+# Kinds of dtype whose tensors can be stacked into a single array.
+_STACKABLE_DTYPE_KINDS = "biufc"
+
+_SCALARS = "scalars"
+_TENSORS = "tensors"
+_BLOB_SEQUENCES = "blob_sequences"
+
+# Read all points when publishing: the loading process has already
+# downsampled each time series to its reservoir size.
+_ALL_POINTS = sys.maxsize
+
+
+def make_snapshot_dir():
+    """Creates a directory for snapshots, in shared memory if possible.
+
+    Returns:
+      The path to a new, empty directory. On Linux, this is on the
+      `/dev/shm` memory file system, so snapshots are never written back
+      to disk.
+    """
+    shm = "/dev/shm"
+    parent = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+    return tempfile.mkdtemp(prefix="tensorboard-snapshot-", dir=parent)
+
+
+def publish(source, directory, experiment_id=""):
+    """Writes a full snapshot of `source` and makes it current in `directory`.
+
+    Use a `Publisher` instead to publish repeatedly to the same
+    directory, rewriting only the runs that changed.
+
+    Args:
+      source: The `provider.DataProvider` whose data to snapshot,
+        typically a `MultiplexerDataProvider`.
+      directory: Snapshot directory, as from `make_snapshot_dir`.
+      experiment_id: Experiment ID to pass to `source`.
+    """
+    Publisher(directory, experiment_id).publish(source)
+
+
+class Publisher:
+    """Publishes snapshots of a data provider to a directory.
+
+    Remembers what it last published, so that each publication writes
+    only the runs whose data has changed since. Not thread-safe; there
+    should be one publisher per snapshot directory.
+    """
+
+    def __init__(self, directory, experiment_id=""):
+        """Initializes a `Publisher`.
+
+        Args:
+          directory: Snapshot directory, as from `make_snapshot_dir`.
+          experiment_id: Experiment ID to pass to data providers.
+        """
+        self._directory = directory
+        self._experiment_id = experiment_id
+        # Maps each run name to `(generation, filename)` as published.
+        self._published = {}
+        # The manifest last published, or `None`.
+        self._manifest = None
+
+    def publish(self, source, generations=None):
+        """Publishes a snapshot of `source`, unless nothing has changed.
+
+        Args:
+          source: The `provider.DataProvider` whose data to snapshot,
+            typically a `MultiplexerDataProvider`.
+          generations: Optional `dict` mapping run names to values that
+            change whenever the runs' data does, as returned by
+            `EventMultiplexer.RunGenerations`. Runs whose generation is
+            the same as when last published keep their files. If `None`,
+            or for runs that it does not list, every run is rewritten.
+
+        Returns:
+          Whether a new snapshot was published.
+        """
+        ctx = context.RequestContext()
+        kwargs = {"experiment_id": self._experiment_id}
+        plugins = list(source.list_plugins(ctx, **kwargs) or ())
+        runs = [
+            [run.run_name, run.start_time]
+            for run in source.list_runs(ctx, **kwargs)
+        ]
+        published = {}
+        for run, _ in runs:
+            generation = (generations or {}).get(run)
+            previous = self._published.get(run)
+            if generation is not None and previous is not None:
+                if previous[0] == generation:
+                    published[run] = previous
+                    continue
+            filename = self._write_run(source, ctx, plugins, run)
+            published[run] = (generation, filename)
+        manifest = {
+            "data_location": source.experiment_metadata(
+                ctx, **kwargs
+            ).data_location,
+            "plugins": plugins,
+            "runs": runs,
+            "run_files": {
+                run: filename for (run, (_, filename)) in published.items()
+            },
+        }
+        self._published = published
+        if manifest == self._manifest:
+            return False
+        manifest_path = os.path.join(self._directory, SNAPSHOT_FILENAME)
+        keep = set(manifest["run_files"].values())
+        # Readers may still be loading the manifest that this one
+        # replaces, so keep its files until the next publication.
+        previous_manifest = _read_manifest(manifest_path)
+        if previous_manifest is not None:
+            keep.update(previous_manifest["run_files"].values())
+        (fd, temp_path) = tempfile.mkstemp(
+            prefix=".snapshot-", dir=self._directory
+        )
+        try:
+            with os.fdopen(fd, "w") as outfile:
+                json.dump(manifest, outfile)
+            os.replace(temp_path, manifest_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._manifest = manifest
+        for name in os.listdir(self._directory):
+            if name.startswith(_RUN_FILE_PREFIX) and name not in keep:
+                try:
+                    os.unlink(os.path.join(self._directory, name))
+                except FileNotFoundError:
+                    pass
+        return True
+
+    def _write_run(self, source, ctx, plugins, run):
+        """Writes a new file with the data of `run`; returns its name."""
+        (fd, path) = tempfile.mkstemp(
+            prefix=_RUN_FILE_PREFIX,
+            suffix=_RUN_FILE_SUFFIX,
+            dir=self._directory,
+        )
+        try:
+            with os.fdopen(fd, "wb") as outfile:
+                _write_run(
+                    source, ctx, self._experiment_id, plugins, run, outfile
+                )
+        except BaseException:
+            os.unlink(path)
+            raise
+        return os.path.basename(path)
+
+
+def _read_manifest(path):
+    """Returns the manifest at `path` as a `dict`, or `None` if none."""
+    try:
+        with open(path) as infile:
+            return json.load(infile)
+    except FileNotFoundError:
+        return None
+
+
+def _write_run(source, ctx, experiment_id, plugins, run, outfile):
+    writer = _Writer(outfile)
+    header = {"series": {}, "blobs": {}}
+    run_tag_filter = provider.RunTagFilter(runs=[run])
+    for plugin_name in plugins:
+        try:
+            (series, blobs) = _write_plugin(
+                source, ctx, writer, experiment_id, plugin_name, run_tag_filter
+            )
+        except Exception:
+            # Serve the rest of the data, as the source would; requests
+            # for this plugin's data will find none.
+            logger.warning(
+                "Failed to snapshot data for plugin %r of run %r",
+                plugin_name,
+                run,
+                exc_info=True,
+            )
+            continue
+        if series:
+            header["series"][plugin_name] = series.get(run, {})
+        header["blobs"].update(blobs)
+    writer.finish(json.dumps(header).encode("utf-8"))
+
+
+def _write_plugin(
+    source, ctx, writer, experiment_id, plugin_name, run_tag_filter
+):
+    """Writes the time series of one plugin that match `run_tag_filter`.
+
+    Returns:
+      A tuple `(series, blobs)`, where `series[run][tag]` is the header
+      entry for a time series and `blobs` maps blob keys to their
+      locations.
+    """
+    kwargs = {
+        "experiment_id": experiment_id,
+        "plugin_name": plugin_name,
+        "run_tag_filter": run_tag_filter,
+    }
+    series = {}
+    blobs = {}
+    listing = source.list_scalars(ctx, **kwargs)
+    data = source.read_scalars(ctx, downsample=_ALL_POINTS, **kwargs)
+    for run, tag, metadata, points in _join(listing, data):
+        entry = _metadata_entry(_SCALARS, metadata)
+        entry.update(_write_times(writer, points))
+        entry["value"] = writer.array(
+            np.fromiter((d.value for d in points), _VALUE_DTYPE)
+        )
+        series.setdefault(run, {})[tag] = entry
+    listing = source.list_tensors(ctx, **kwargs)
+    data = source.read_tensors(ctx, downsample=_ALL_POINTS, **kwargs)
+    for run, tag, metadata, points in _join(listing, data):
+        entry = _metadata_entry(_TENSORS, metadata)
+        entry.update(_write_times(writer, points))
+        stacked = provider.TensorColumns.from_data(points).stacked()
+        if stacked is not None and stacked.dtype.kind in _STACKABLE_DTYPE_KINDS:
+            stacked = stacked.astype(
+                stacked.dtype.newbyteorder("<"), copy=False
+            )
+            entry["tensor_dtype"] = stacked.dtype.str
+            entry["tensor_shape"] = list(stacked.shape[1:])
+            entry["tensor_stack"] = writer.array(stacked.reshape(-1))
+        else:
+            (entry["tensor_offsets"], entry["tensor_data"]) = writer.strings(
+                tensor_util.make_tensor_proto(d.numpy).SerializeToString()
+                for d in points
+            )
+        series.setdefault(run, {})[tag] = entry
+    listing = source.list_blob_sequences(ctx, **kwargs)
+    data = source.read_blob_sequences(ctx, downsample=_ALL_POINTS, **kwargs)
+    for run, tag, metadata, points in _join(listing, data):
+        entry = _metadata_entry(_BLOB_SEQUENCES, metadata)
+        entry["max_length"] = metadata.max_length
+        entry.update(_write_times(writer, points))
+        entry["blob_refs"] = [
+            [[ref.blob_key, ref.url] for ref in d.values] for d in points
+        ]
+        for d in points:
+            for ref in d.values:
+                blob = source.read_blob(ctx, blob_key=ref.blob_key)
+                blobs[ref.blob_key] = writer.bytes(blob)
+        series.setdefault(run, {})[tag] = entry
+    return (series, blobs)
+
+
+def _join(listing, data):
+    """Yields `(run, tag, metadata, points)` for series in both inputs."""
+    for run, tags in listing.items():
+        for tag, metadata in tags.items():
+            points = data.get(run, {}).get(tag)
+            if points is not None:
+                yield (run, tag, metadata, points)
+
+
+def _metadata_entry(kind, metadata):
+    return {
+        "kind": kind,
+        "max_step": metadata.max_step,
+        "max_wall_time": metadata.max_wall_time,
+        "plugin_content": base64.b64encode(metadata.plugin_content).decode(
+            "ascii"
+        ),
+        "description": metadata.description,
+        "display_name": metadata.display_name,
+    }
+
+
+def _write_times(writer, points):
+    return {
+        "step": writer.array(
+            np.fromiter((d.step for d in points), _STEP_DTYPE)
+        ),
+        "wall_time": writer.array(
+            np.fromiter((d.wall_time for d in points), _WALL_TIME_DTYPE)
+        ),
+    }
+
+
+class _Writer:
+    """Writes the data sections of a run file, then its header."""
+
+    def __init__(self, outfile):
+        self._outfile = outfile
+        self._offset = _PREAMBLE.size
+        outfile.write(b"\0" * _PREAMBLE.size)
+
+    def bytes(self, data):
+        """Writes a byte string; returns its `[offset, length]`."""
+        padding = -self._offset % 8
+        self._outfile.write(b"\0" * padding)
+        offset = self._offset + padding
+        self._outfile.write(data)
+        self._offset = offset + len(data)
+        return [offset, len(data)]
+
+    def array(self, array):
+        """Writes a 1-D array; returns its `[offset, count]`."""
+        [offset, _] = self.bytes(array.tobytes())
+        return [offset, len(array)]
+
+    def strings(self, strings):
+        """Writes byte strings; returns `[offset, count]` of an array of
+        their `count + 1` boundaries and `[offset, length]` of their
+        concatenation."""
+        strings = list(strings)
+        boundaries = np.zeros(len(strings) + 1, dtype=_OFFSET_DTYPE)
+        np.cumsum([len(s) for s in strings], out=boundaries[1:])
+        return (self.array(boundaries), self.bytes(b"".join(strings)))
+
+    def finish(self, header):
+        [offset, length] = self.bytes(header)
+        self._outfile.seek(0)
+        self._outfile.write(_PREAMBLE.pack(_MAGIC, offset, length))
+
+
+class _RunFile:
+    """A run file, mapped into memory."""
+
+    def __init__(self, path):
+        with open(path, "rb") as infile:
+            self._buffer = mmap.mmap(
+                infile.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        (magic, offset, length) = _PREAMBLE.unpack_from(self._buffer)
+        if magic != _MAGIC:
+            raise ValueError("Not a snapshot run file: %r" % path)
+        self.header = json.loads(self._buffer[offset : offset + length])
+
+    def array(self, dtype, ref):
+        """Returns a read-only array that views the snapshot in place."""
+        [offset, count] = ref
+        return np.frombuffer(self._buffer, dtype, count=count, offset=offset)
+
+    def bytes(self, ref):
+        [offset, length] = ref
+        return self._buffer[offset : offset + length]
+
+
+class _Snapshot:
+    """A snapshot's manifest, with its run files mapped into memory.
+
+    Attributes:
+      header: The manifest.
+      series: A `dict` such that `series[plugin][run][tag]` is a tuple
+        `(run_file, entry)` of a `_RunFile` and its header entry for
+        the time series.
+      blobs: A `dict` mapping each blob key to a tuple `(run_file, ref)`.
+    """
+
+    def __init__(self, directory, manifest, previous=None):
+        """Maps the run files of `manifest` in `directory`.
+
+        Run files that `previous`, an earlier `_Snapshot`, has already
+        mapped are reused.
+
+        Raises:
+          FileNotFoundError: If a run file has been removed; the
+            manifest has then been replaced.
+        """
+        reusable = previous._files if previous is not None else {}
+        self.header = manifest
+        self.series = {}
+        self.blobs = {}
+        self._files = {}
+        for run, filename in manifest["run_files"].items():
+            run_file = reusable.get(filename)
+            if run_file is None:
+                run_file = _RunFile(os.path.join(directory, filename))
+            self._files[filename] = run_file
+            for plugin_name, entries in run_file.header["series"].items():
+                self.series.setdefault(plugin_name, {})[run] = {
+                    tag: (run_file, entry) for (tag, entry) in entries.items()
+                }
+            for blob_key, ref in run_file.header["blobs"].items():
+                self.blobs[blob_key] = (run_file, ref)
+
+
+class SnapshotDataProvider(provider.DataProvider):
+    """Data provider that serves the current snapshot in a directory.
+
+    Each call reads from whichever snapshot is current when it starts,
+    and picks up a newly published one by checking the manifest's
+    identity. Until the first snapshot is published, there is no data.
+    Experiment IDs are ignored, as by `MultiplexerDataProvider`.
+    """
+
+    def __init__(self, directory):
+        """Initializes a `SnapshotDataProvider`.
+
+        Args:
+          directory: Snapshot directory to which another process calls
+            `publish`.
+        """
+        self._directory = directory
+        self._path = os.path.join(directory, SNAPSHOT_FILENAME)
+        self._lock = threading.Lock()
+        # Tuple `(file_identity, _Snapshot)`, or `None` if not yet loaded.
+        self._current = None
+
+    def __str__(self):
+        return "SnapshotDataProvider(path=%r)" % self._path
+
+    def _snapshot(self):
+        """Returns the current `_Snapshot`, or `None` if there is none."""
+        for attempt in range(_LOAD_ATTEMPTS):
+            try:
+                return self._load_snapshot()
+            except FileNotFoundError:
+                # A newer snapshot replaced the one that we read the
+                # manifest of; read its manifest instead.
+                if attempt + 1 == _LOAD_ATTEMPTS:
+                    raise
+
+    def _load_snapshot(self):
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        current = self._current
+        if current is not None and current[0] == identity:
+            return current[1]
+        with self._lock:
+            current = self._current
+            if current is None or current[0] != identity:
+                manifest = _read_manifest(self._path)
+                if manifest is None:
+                    return None
+                previous = current[1] if current is not None else None
+                snapshot = _Snapshot(self._directory, manifest, previous)
+                current = (identity, snapshot)
+                self._current = current
+        return current[1]
+
+    def _index(self, kind, plugin_name, run_tag_filter):
+        """Returns `d` such that `d[run][tag]` is a `(run_file, entry)`."""
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return {}
+        runs = run_tag_filter.runs if run_tag_filter else None
+        tags = run_tag_filter.tags if run_tag_filter else None
+        result = {}
+        for run, entries in snapshot.series.get(plugin_name, {}).items():
+            if runs is not None and run not in runs:
+                continue
+            for tag, item in entries.items():
+                if tags is not None and tag not in tags:
+                    continue
+                if item[1]["kind"] == kind:
+                    result.setdefault(run, {})[tag] = item
+        return result
+
+    def experiment_metadata(self, ctx=None, *, experiment_id):
+        snapshot = self._snapshot()
+        data_location = snapshot.header["data_location"] if snapshot else ""
+        return provider.ExperimentMetadata(data_location=data_location)
+
+    def list_plugins(self, ctx=None, *, experiment_id):
+        snapshot = self._snapshot()
+        return list(snapshot.header["plugins"]) if snapshot else []
+
+    def list_runs(self, ctx=None, *, experiment_id):
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return []
+        return [
+            provider.Run(run_id=run, run_name=run, start_time=start_time)
+            for (run, start_time) in snapshot.header["runs"]
+        ]
+
+    def list_scalars(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        index = self._index(_SCALARS, plugin_name, run_tag_filter)
+        return _list(provider.ScalarTimeSeries, index)
+
+    def read_scalars(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        columns = self.read_scalars_columnar(
+            ctx,
+            experiment_id=experiment_id,
+            plugin_name=plugin_name,
+            downsample=downsample,
+            run_tag_filter=run_tag_filter,
+        )
+        return _map_series(lambda c: c.to_data(), columns)
+
+    def read_scalars_columnar(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        index = self._index(_SCALARS, plugin_name, run_tag_filter)
+
+        def read(item):
+            (run_file, entry) = item
+            step = run_file.array(_STEP_DTYPE, entry["step"])
+            indices = _downsample_indices(len(step), downsample)
+            columns = (
+                step,
+                run_file.array(_WALL_TIME_DTYPE, entry["wall_time"]),
+                run_file.array(_VALUE_DTYPE, entry["value"]),
+            )
+            if indices is not None:
+                columns = tuple(column[indices] for column in columns)
+            return provider.ScalarColumns(*columns)
+
+        return _map_series(read, index)
+
+    def read_last_scalars(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        result = self.read_scalars(
+            ctx,
+            experiment_id=experiment_id,
+            plugin_name=plugin_name,
+            downsample=1,
+            run_tag_filter=run_tag_filter,
+        )
+        return {
+            run: {tag: data[-1] for (tag, data) in tags.items() if data}
+            for (run, tags) in result.items()
+        }
+
+    def list_tensors(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        index = self._index(_TENSORS, plugin_name, run_tag_filter)
+        return _list(provider.TensorTimeSeries, index)
+
+    def read_tensors(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        columns = self.read_tensors_columnar(
+            ctx,
+            experiment_id=experiment_id,
+            plugin_name=plugin_name,
+            downsample=downsample,
+            run_tag_filter=run_tag_filter,
+        )
+        return _map_series(lambda c: c.to_data(), columns)
+
+    def read_tensors_columnar(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        index = self._index(_TENSORS, plugin_name, run_tag_filter)
+
+        def read(item):
+            (run_file, entry) = item
+            step = run_file.array(_STEP_DTYPE, entry["step"])
+            wall_time = run_file.array(_WALL_TIME_DTYPE, entry["wall_time"])
+            indices = _downsample_indices(len(step), downsample)
+            if "tensor_stack" in entry:
+                stacked = run_file.array(
+                    np.dtype(entry["tensor_dtype"]), entry["tensor_stack"]
+                ).reshape([len(step)] + entry["tensor_shape"])
+                columns = (step, wall_time, stacked)
+                if indices is not None:
+                    columns = tuple(column[indices] for column in columns)
+                return provider.TensorColumns(*columns)
+            boundaries = run_file.array(_OFFSET_DTYPE, entry["tensor_offsets"])
+            data = run_file.bytes(entry["tensor_data"])
+            if indices is None:
+                indices = np.arange(len(step))
+            tensors = tuple(
+                tensor_util.make_ndarray(
+                    tensor_pb2.TensorProto.FromString(
+                        data[boundaries[i] : boundaries[i + 1]]
+                    )
+                )
+                for i in indices
+            )
+            return provider.TensorColumns(
+                step[indices], wall_time[indices], tensors
+            )
+
+        return _map_series(read, index)
+
+    def list_blob_sequences(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        index = self._index(_BLOB_SEQUENCES, plugin_name, run_tag_filter)
+        return _map_series(
+            lambda item: provider.BlobSequenceTimeSeries(
+                max_length=item[1]["max_length"], **_metadata_kwargs(item[1])
+            ),
+            index,
+        )
+
+    def read_blob_sequences(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        index = self._index(_BLOB_SEQUENCES, plugin_name, run_tag_filter)
+
+        def read(item):
+            (run_file, entry) = item
+            step = run_file.array(_STEP_DTYPE, entry["step"])
+            wall_time = run_file.array(_WALL_TIME_DTYPE, entry["wall_time"])
+            indices = _downsample_indices(len(step), downsample)
+            if indices is None:
+                indices = range(len(step))
+            return [
+                provider.BlobSequenceDatum(
+                    step=int(step[i]),
+                    wall_time=float(wall_time[i]),
+                    values=tuple(
+                        provider.BlobReference(blob_key=key, url=url)
+                        for (key, url) in entry["blob_refs"][i]
+                    ),
+                )
+                for i in indices
+            ]
+
+        return _map_series(read, index)
+
+    def read_blob(self, ctx=None, *, blob_key):
+        snapshot = self._snapshot()
+        item = snapshot.blobs.get(blob_key) if snapshot else None
+        if item is None:
+            raise errors.NotFoundError("no such blob: %r" % blob_key)
+        (run_file, ref) = item
+        return run_file.bytes(ref)
+
+
+def _metadata_kwargs(entry):
+    return {
+        "max_step": entry["max_step"],
+        "max_wall_time": entry["max_wall_time"],
+        "plugin_content": base64.b64decode(entry["plugin_content"]),
+        "description": entry["description"],
+        "display_name": entry["display_name"],
+    }
+
+
+def _list(construct_time_series, index):
+    return _map_series(
+        lambda item: construct_time_series(**_metadata_kwargs(item[1])), index
+    )
+
+
+def _map_series(fn, index):
+    """Applies `fn` to each value of a dict of dicts."""
+    return {
+        run: {tag: fn(value) for (tag, value) in tags.items()}
+        for (run, tags) in index.items()
+    }
+
+
+def _downsample_indices(n, downsample):
+    """Returns the indices of `n` points to keep, or `None` for all.
+
+    Points are chosen exactly as `MultiplexerDataProvider` chooses them.
+    """
+    if downsample is None:
+        raise TypeError("`downsample` required but not given")
+    if downsample >= n:
+        return None
+    return np.array(data_provider._downsample(range(n), downsample), np.int64)
@@ -0,0 +1,354 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Unit tests for `tensorboard.backend.event_processing.data_snapshot`."""
+
+
+import json
+import os
+import shutil
+
+import numpy as np
+
+from tensorboard import context
+from tensorboard import errors
+from tensorboard.backend.event_processing import data_provider
+from tensorboard.backend.event_processing import data_snapshot
+from tensorboard.backend.event_processing import (
+    plugin_event_multiplexer as event_multiplexer,
+)
+from tensorboard.compat.proto import summary_pb2
+from tensorboard.data import provider as base_provider
+from tensorboard.plugins.histogram import metadata as histogram_metadata
+from tensorboard.plugins.histogram import summary_v2 as histogram_summary
+from tensorboard.plugins.image import metadata as image_metadata
+from tensorboard.plugins.image import summary_v2 as image_summary
+from tensorboard.plugins.scalar import metadata as scalar_metadata
+from tensorboard.plugins.scalar import summary_v2 as scalar_summary
+import tensorflow.compat.v1 as tf1
+import tensorflow.compat.v2 as tf
+
+
+tf1.enable_eager_execution()
+
+
+class SnapshotDataProviderTest(tf.test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logdir = self.get_temp_dir()
+        self.snapshot_dir = os.path.join(self.get_temp_dir(), "snapshots")
+        os.mkdir(self.snapshot_dir)
+        self.ctx = context.RequestContext()
+
+        logdir = os.path.join(self.logdir, "polynomials")
+        with tf.summary.create_file_writer(logdir).as_default():
+            for i in range(10):
+                scalar_summary.scalar(
+                    "square", i**2, step=2 * i, description="boxen"
+                )
+                scalar_summary.scalar("cube", i**3, step=3 * i)
+
+        logdir = os.path.join(self.logdir, "waves")
+        with tf.summary.create_file_writer(logdir).as_default():
+            for i in range(10):
+                scalar_summary.scalar("sine", tf.sin(float(i)), step=i)
+                # Summary with rank-1 data of scalar data class (bad!).
+                metadata = summary_pb2.SummaryMetadata()
+                metadata.plugin_data.plugin_name = "greetings"
+                metadata.data_class = summary_pb2.DATA_CLASS_SCALAR
+                tf.summary.write(
+                    "bad", tensor=[i, i], step=i, metadata=metadata
+                )
+
+        logdir = os.path.join(self.logdir, "lebesgue")
+        with tf.summary.create_file_writer(logdir).as_default():
+            tensor = tf.constant([(0.0, 0.25, 0.5, 0.75, 1.0)])
+            for i in range(1, 11):
+                histogram_summary.histogram(
+                    "uniform", tensor * i, step=i, description="smooth"
+                )
+
+        logdir = os.path.join(self.logdir, "mondrian")
+        with tf.summary.create_file_writer(logdir).as_default():
+            image_1x1 = tf.constant([[[(221, 28, 38)]]], dtype=tf.uint8)
+            for i in range(1, 11):
+                k = 6 - abs(6 - i)  # 1, .., 6, .., 2
+                image = tf.tile(image_1x1, [k, i, i, 1])
+                image_summary.image("red", image, step=i, max_outputs=99)
+
+    def create_source(self):
+        multiplexer = event_multiplexer.EventMultiplexer()
+        multiplexer.AddRunsFromDirectory(self.logdir)
+        multiplexer.Reload()
+        return data_provider.MultiplexerDataProvider(multiplexer, self.logdir)
+
+    def create_provider(self):
+        source = self.create_source()
+        with self.assertLogs(level="WARNING"):
+            # The "greetings" plugin's data cannot be read as scalars.
+            data_snapshot.publish(source, self.snapshot_dir)
+        return (source, data_snapshot.SnapshotDataProvider(self.snapshot_dir))
+
+    def test_no_snapshot_yet(self):
+        provider = data_snapshot.SnapshotDataProvider(self.snapshot_dir)
+        self.assertEqual(provider.list_plugins(experiment_id="e"), [])
+        self.assertEqual(provider.list_runs(experiment_id="e"), [])
+        result = provider.list_scalars(
+            experiment_id="e", plugin_name=scalar_metadata.PLUGIN_NAME
+        )
+        self.assertEqual(result, {})
+
+    def test_metadata(self):
+        (source, provider) = self.create_provider()
+        kwargs = {"experiment_id": "unused"}
+        self.assertEqual(
+            provider.experiment_metadata(self.ctx, **kwargs).data_location,
+            self.logdir,
+        )
+        self.assertCountEqual(
+            provider.list_plugins(self.ctx, **kwargs),
+            source.list_plugins(self.ctx, **kwargs),
+        )
+        self.assertCountEqual(
+            provider.list_runs(self.ctx, **kwargs),
+            source.list_runs(self.ctx, **kwargs),
+        )
+
+    def test_scalars(self):
+        (source, provider) = self.create_provider()
+        kwargs = {
+            "experiment_id": "unused",
+            "plugin_name": scalar_metadata.PLUGIN_NAME,
+        }
+        self.assertEqual(
+            provider.list_scalars(self.ctx, **kwargs),
+            source.list_scalars(self.ctx, **kwargs),
+        )
+        for downsample in (1, 3, 100):
+            self.assertEqual(
+                provider.read_scalars(
+                    self.ctx, downsample=downsample, **kwargs
+                ),
+                source.read_scalars(self.ctx, downsample=downsample, **kwargs),
+            )
+        run_tag_filter = base_provider.RunTagFilter(
+            runs=["polynomials"], tags=["square", "sine"]
+        )
+        result = provider.read_scalars(
+            self.ctx, downsample=100, run_tag_filter=run_tag_filter, **kwargs
+        )
+        self.assertEqual(list(result), ["polynomials"])
+        self.assertEqual(list(result["polynomials"]), ["square"])
+        self.assertEqual(
+            provider.read_last_scalars(self.ctx, **kwargs),
+            source.read_last_scalars(self.ctx, **kwargs),
+        )
+
+    def test_read_scalars_columnar(self):
+        (_, provider) = self.create_provider()
+        result = provider.read_scalars_columnar(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            downsample=100,
+        )
+        columns = result["polynomials"]["square"]
+        np.testing.assert_array_equal(columns.step, np.arange(10) * 2)
+        np.testing.assert_array_equal(columns.value, np.arange(10) ** 2)
+        self.assertEqual(columns.value.dtype, np.float64)
+
+    def test_unreadable_plugin(self):
+        (_, provider) = self.create_provider()
+        result = provider.read_scalars(
+            self.ctx,
+            experiment_id="unused",
+            plugin_name="greetings",
+            downsample=100,
+        )
+        self.assertEqual(result, {})
+
+    def test_tensors(self):
+        (source, provider) = self.create_provider()
+        kwargs = {
+            "experiment_id": "unused",
+            "plugin_name": histogram_metadata.PLUGIN_NAME,
+        }
+        self.assertEqual(
+            provider.list_tensors(self.ctx, **kwargs),
+            source.list_tensors(self.ctx, **kwargs),
+        )
+        for downsample in (3, 100):
+            expected = source.read_tensors(
+                self.ctx, downsample=downsample, **kwargs
+            )
+            actual = provider.read_tensors(
+                self.ctx, downsample=downsample, **kwargs
+            )
+            self.assertEqual(actual, expected)
+
+    def test_tensors_columnar(self):
+        logdir = os.path.join(self.logdir, "ragged")
+        metadata = summary_pb2.SummaryMetadata()
+        metadata.plugin_data.plugin_name = "ragged"
+        metadata.data_class = summary_pb2.DATA_CLASS_TENSOR
+        with tf.summary.create_file_writer(logdir).as_default():
+            for i in range(1, 4):
+                tf.summary.write(
+                    "ragged", tf.range(i), step=i, metadata=metadata
+                )
+        (source, provider) = self.create_provider()
+        kwargs = {"experiment_id": "unused", "downsample": 100}
+
+        kwargs["plugin_name"] = histogram_metadata.PLUGIN_NAME
+        expected = source.read_tensors_columnar(self.ctx, **kwargs)
+        actual = provider.read_tensors_columnar(self.ctx, **kwargs)
+        self.assertEqual(actual, expected)
+        # Histograms share a shape, so are stored and read stacked.
+        columns = actual["lebesgue"]["uniform"]
+        self.assertIsInstance(columns.numpy, np.ndarray)
+        self.assertEqual(columns.numpy.shape, (10, 30, 3))
+        self.assertIs(columns.stacked(), columns.numpy)
+
+        kwargs["plugin_name"] = "ragged"
+        expected = source.read_tensors_columnar(self.ctx, **kwargs)
+        actual = provider.read_tensors_columnar(self.ctx, **kwargs)
+        self.assertEqual(actual, expected)
+        self.assertIsNone(actual["ragged"]["ragged"].stacked())
+        self.assertEqual(
+            provider.read_tensors(self.ctx, **kwargs),
+            source.read_tensors(self.ctx, **kwargs),
+        )
+
+    def test_blob_sequences(self):
+        (source, provider) = self.create_provider()
+        # Blob keys encode the experiment ID given when publishing.
+        kwargs = {
+            "experiment_id": "",
+            "plugin_name": image_metadata.PLUGIN_NAME,
+        }
+        self.assertEqual(
+            provider.list_blob_sequences(self.ctx, **kwargs),
+            source.list_blob_sequences(self.ctx, **kwargs),
+        )
+        result = provider.read_blob_sequences(self.ctx, downsample=4, **kwargs)
+        expected = source.read_blob_sequences(self.ctx, downsample=4, **kwargs)
+        self.assertEqual(result, expected)
+        for datum in result["mondrian"]["red"]:
+            for ref in datum.values:
+                self.assertEqual(
+                    provider.read_blob(self.ctx, blob_key=ref.blob_key),
+                    source.read_blob(self.ctx, blob_key=ref.blob_key),
+                )
+                self.assertEqual(
+                    b"".join(
+                        provider.read_blob_stream(
+                            self.ctx, blob_key=ref.blob_key
+                        )
+                    ),
+                    source.read_blob(self.ctx, blob_key=ref.blob_key),
+                )
+
+    def test_read_blob_not_found(self):
+        (_, provider) = self.create_provider()
+        with self.assertRaises(errors.NotFoundError):
+            provider.read_blob(self.ctx, blob_key="nope")
+
+    def test_picks_up_new_snapshot(self):
+        (_, provider) = self.create_provider()
+        kwargs = {"experiment_id": "unused"}
+        runs = [r.run_name for r in provider.list_runs(**kwargs)]
+        self.assertIn("waves", runs)
+
+        shutil.rmtree(os.path.join(self.logdir, "waves"))
+        data_snapshot.publish(self.create_source(), self.snapshot_dir)
+        runs = [r.run_name for r in provider.list_runs(**kwargs)]
+        self.assertCountEqual(runs, ["polynomials", "lebesgue", "mondrian"])
+
+    def read_manifest(self):
+        path = os.path.join(self.snapshot_dir, data_snapshot.SNAPSHOT_FILENAME)
+        with open(path) as infile:
+            return json.load(infile)
+
+    def test_publisher_rewrites_only_changed_runs(self):
+        multiplexer = event_multiplexer.EventMultiplexer()
+        multiplexer.AddRunsFromDirectory(self.logdir)
+        multiplexer.Reload()
+        source = data_provider.MultiplexerDataProvider(multiplexer, self.logdir)
+        publisher = data_snapshot.Publisher(self.snapshot_dir)
+        with self.assertLogs(level="WARNING"):
+            self.assertTrue(
+                publisher.publish(source, multiplexer.RunGenerations())
+            )
+        first = self.read_manifest()["run_files"]
+        provider = data_snapshot.SnapshotDataProvider(self.snapshot_dir)
+        kwargs = {
+            "experiment_id": "unused",
+            "plugin_name": scalar_metadata.PLUGIN_NAME,
+            "downsample": 100,
+        }
+        self.assertLen(provider.read_scalars(**kwargs)["waves"]["sine"], 10)
+
+        # Nothing has changed, so nothing is written.
+        multiplexer.Reload()
+        mtime = os.stat(
+            os.path.join(self.snapshot_dir, data_snapshot.SNAPSHOT_FILENAME)
+        ).st_mtime_ns
+        self.assertFalse(
+            publisher.publish(source, multiplexer.RunGenerations())
+        )
+        self.assertEqual(
+            os.stat(
+                os.path.join(self.snapshot_dir, data_snapshot.SNAPSHOT_FILENAME)
+            ).st_mtime_ns,
+            mtime,
+        )
+
+        def add_sine_point(step):
+            logdir = os.path.join(self.logdir, "waves")
+            with tf.summary.create_file_writer(logdir).as_default():
+                scalar_summary.scalar("sine", 0.0, step=step)
+            multiplexer.Reload()
+            with self.assertLogs(level="WARNING"):
+                self.assertTrue(
+                    publisher.publish(source, multiplexer.RunGenerations())
+                )
+            return self.read_manifest()["run_files"]
+
+        second = add_sine_point(10)
+        for run in ("polynomials", "lebesgue", "mondrian"):
+            self.assertEqual(second[run], first[run])
+        self.assertNotEqual(second["waves"], first["waves"])
+        self.assertLen(provider.read_scalars(**kwargs)["waves"]["sine"], 11)
+        # Readers of the replaced snapshot may still need its files.
+        self.assertIn(first["waves"], os.listdir(self.snapshot_dir))
+
+        third = add_sine_point(11)
+        self.assertLen(provider.read_scalars(**kwargs)["waves"]["sine"], 12)
+        self.assertCountEqual(
+            os.listdir(self.snapshot_dir),
+            [data_snapshot.SNAPSHOT_FILENAME]
+            + sorted(set(third.values()) | {second["waves"]}),
+        )
+
+    def test_make_snapshot_dir(self):
+        directory = data_snapshot.make_snapshot_dir()
+        try:
+            self.assertTrue(os.path.isdir(directory))
+            self.assertEqual(os.listdir(directory), [])
+        finally:
+            os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    tf.test.main()
@@ -16,6 +16,7 @@
 """Functionality for loading events from a record file."""
 
 import contextlib
+import time
 
 from tensorboard import data_compat
 from tensorboard import dataclass_compat
@@ -117,7 +118,7 @@ class _PyRecordReaderIterator:
 class RawEventFileLoader:
     """An iterator that yields Event protos as serialized bytestrings."""
 
-    def __init__(self, file_path, detect_file_replacement=False):
+    def __init__(self, file_path, detect_file_replacement=False, metrics=None):
         """Constructs a RawEventFileLoader for the given file path.
 
         Args:
@@ -127,12 +128,16 @@ class RawEventFileLoader:
               that the file has grown, it will reopen the file entirely (while
               preserving the current offset) before attempting to read from it.
               Otherwise, Load() will simply poll at EOF for new data.
+          metrics: optional `ingestion_metrics.RunMetrics` to which each call
+              to Load() reports the bytes and records it read and the time
+              spent reading them.
         """
         if file_path is None:
             raise ValueError("A file path is required")
         self._file_path = platform_util.readahead_file_path(file_path)
         self._detect_file_replacement = detect_file_replacement
         self._file_size = None
+        self._metrics = metrics
         self._iterator = _make_tf_record_iterator(self._file_path)
         if self._detect_file_replacement and not hasattr(
             self._iterator, "reopen"
@@ -173,6 +178,34 @@ class RawEventFileLoader:
                         self._file_size,
                     )
                     return
+        if self._metrics is None:
+            yield from self._LoadRecords()
+            return
+        # Only time spent in the record iterator is counted, not time that
+        # callers spend between records.
+        bytes_read = 0
+        records_read = 0
+        read_secs = 0.0
+        records = self._LoadRecords()
+        try:
+            while True:
+                start = time.perf_counter()
+                record = next(records, None)
+                read_secs += time.perf_counter() - start
+                if record is None:
+                    break
+                records_read += 1
+                # Each record is framed by a length, a CRC of the length, and
+                # a CRC of the data: 8 + 4 + 4 bytes.
+                bytes_read += len(record) + 16
+                yield record
+        finally:
+            if records_read or read_secs:
+                self._metrics.RecordFileRead(
+                    self._file_path, bytes_read, records_read, read_secs
+                )
+
+    def _LoadRecords(self):
         while True:
             try:
                 yield next(self._iterator)
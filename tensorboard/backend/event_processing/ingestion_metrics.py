@@ -0,0 +1,260 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Counters describing where time goes while ingesting event files.
+
+An `IngestionMetrics` is owned by an `EventMultiplexer`, which hands a
+`RunMetrics` to each of its accumulators. Event file loaders report bytes
+and records read per file; accumulators report time spent reading and
+parsing events versus inserting them into reservoirs; the data ingester
+reports the duration of each reload cycle.
+
+Updates take one uncontended lock acquisition per file per reload, or per
+run per reload, rather than per event, so that the metrics can stay
+enabled in production.
+"""
+
+
+import bisect
+import threading
+
+
+# Upper bounds of the buckets of the reload cycle duration histogram.
+_CYCLE_BUCKETS_SECS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+
+class _FileStats:
+    __slots__ = ("bytes_read", "records_read", "read_secs")
+
+    def __init__(self):
+        self.bytes_read = 0
+        self.records_read = 0
+        self.read_secs = 0.0
+
+
+class RunMetrics:
+    """Ingestion metrics for a single run.
+
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files = {}
+        self._reloads = 0
+        self._reload_secs = 0.0
+        self._events = 0
+        self._parse_secs = 0.0
+        self._insert_secs = 0.0
+
+    def RecordFileRead(self, path, bytes_read, records_read, read_secs):
+        """Records that records were read from an event file.
+
+        Args:
+          path: Path of the event file.
+          bytes_read: Number of bytes read, including record framing.
+          records_read: Number of records read.
+          read_secs: Time spent reading and checking the records.
+        """
+        with self._lock:
+            stats = self._files.get(path)
+            if stats is None:
+                stats = self._files[path] = _FileStats()
+            stats.bytes_read += bytes_read
+            stats.records_read += records_read
+            stats.read_secs += read_secs
+
+    def RecordReload(self, reload_secs, events, parse_secs, insert_secs):
+        """Records a reload of the run's accumulator.
+
+        Args:
+          reload_secs: Total duration of the reload.
+          events: Number of events processed.
+          parse_secs: Time spent waiting on the event generator, which
+            includes listing, reading, and parsing event files.
+          insert_secs: Time spent processing events, mostly inserting
+            them into reservoirs.
+        """
+        with self._lock:
+            self._reloads += 1
+            self._reload_secs += reload_secs
+            self._events += events
+            self._parse_secs += parse_secs
+            self._insert_secs += insert_secs
+
+    def AsDict(self):
+        """Returns a JSON-serializable snapshot of these metrics."""
+        with self._lock:
+            files = {
+                path: {
+                    "bytes_read": stats.bytes_read,
+                    "records_read": stats.records_read,
+                    "read_seconds": stats.read_secs,
+                }
+                for (path, stats) in self._files.items()
+            }
+            return {
+                "reloads": self._reloads,
+                "reload_seconds": self._reload_secs,
+                "events_processed": self._events,
+                "parse_seconds": self._parse_secs,
+                "insert_seconds": self._insert_secs,
+                "bytes_read": sum(f["bytes_read"] for f in files.values()),
+                "records_read": sum(f["records_read"] for f in files.values()),
+                "files": files,
+            }
+
+
+class IngestionMetrics:
+    """Ingestion metrics for all runs of a multiplexer.
+
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runs = {}
+        self._cycle_bucket_counts = [0] * (len(_CYCLE_BUCKETS_SECS) + 1)
+        self._cycles = 0
+        self._cycle_secs = 0.0
+        self._last_cycle_secs = None
+
+    def ForRun(self, run_name):
+        """Returns the `RunMetrics` for the given run, creating it if needed."""
+        with self._lock:
+            metrics = self._runs.get(run_name)
+            if metrics is None:
+                metrics = self._runs[run_name] = RunMetrics()
+            return metrics
+
+    def RemoveRun(self, run_name):
+        """Discards the metrics of a run that is no longer loaded."""
+        with self._lock:
+            self._runs.pop(run_name, None)
+
+    def RecordCycle(self, duration_secs):
+        """Records the duration of a full reload cycle."""
+        index = bisect.bisect_left(_CYCLE_BUCKETS_SECS, duration_secs)
+        with self._lock:
+            self._cycle_bucket_counts[index] += 1
+            self._cycles += 1
+            self._cycle_secs += duration_secs
+            self._last_cycle_secs = duration_secs
+
+    def AsDict(self):
+        """Returns a JSON-serializable snapshot of these metrics.
+
+        Histogram buckets are cumulative, as in Prometheus: each is a pair
+        `[upper_bound_secs, count]`, and the last bound is `"+Inf"`.
+        """
+        with self._lock:
+            runs = dict(self._runs)
+            cumulative = []
+            total = 0
+            bounds = list(_CYCLE_BUCKETS_SECS) + ["+Inf"]
+            for bound, count in zip(bounds, self._cycle_bucket_counts):
+                total += count
+                cumulative.append([bound, total])
+            cycles = {
+                "count": self._cycles,
+                "total_seconds": self._cycle_secs,
+                "last_seconds": self._last_cycle_secs,
+                "buckets": cumulative,
+            }
+        return {
+            "cycles": cycles,
+            "runs": {name: m.AsDict() for (name, m) in sorted(runs.items())},
+        }
+
+    def AsPrometheusText(self):
+        """Returns a snapshot in the Prometheus text exposition format."""
+        snapshot = self.AsDict()
+        lines = []
+
+        def metric(name, metric_type, help_text):
+            lines.append("# HELP %s %s" % (name, help_text))
+            lines.append("# TYPE %s %s" % (name, metric_type))
+
+        def sample(name, value, **labels):
+            if labels:
+                label_text = ",".join(
+                    '%s="%s"' % (k, _escape_label_value(v))
+                    for (k, v) in sorted(labels.items())
+                )
+                name = "%s{%s}" % (name, label_text)
+            lines.append("%s %r" % (name, value))
+
+        cycles = snapshot["cycles"]
+        name = "tensorboard_ingestion_cycle_seconds"
+        metric(name, "histogram", "Duration of full reload cycles.")
+        for bound, count in cycles["buckets"]:
+            sample(name + "_bucket", count, le=str(bound))
+        sample(name + "_sum", cycles["total_seconds"])
+        sample(name + "_count", cycles["count"])
+
+        runs = snapshot["runs"]
+        run_counters = (
+            ("reloads", "reloads_total", "Number of reloads of a run."),
+            ("reload_seconds", "reload_seconds_total", "Time reloading a run."),
+            ("events_processed", "events_total", "Events processed for a run."),
+            (
+                "parse_seconds",
+                "parse_seconds_total",
+                "Time listing, reading, and parsing event files of a run.",
+            ),
+            (
+                "insert_seconds",
+                "insert_seconds_total",
+                "Time inserting events of a run into reservoirs.",
+            ),
+        )
+        for key, suffix, help_text in run_counters:
+            name = "tensorboard_ingestion_run_" + suffix
+            metric(name, "counter", help_text)
+            for run, run_metrics in runs.items():
+                sample(name, run_metrics[key], run=run)
+
+        file_counters = (
+            (
+                "bytes_read",
+                "bytes_read_total",
+                "Bytes read from an event file.",
+            ),
+            (
+                "records_read",
+                "records_read_total",
+                "Records read from an event file.",
+            ),
+            (
+                "read_seconds",
+                "read_seconds_total",
+                "Time reading records from an event file.",
+            ),
+        )
+        for key, suffix, help_text in file_counters:
+            name = "tensorboard_ingestion_file_" + suffix
+            metric(name, "counter", help_text)
+            for run, run_metrics in runs.items():
+                for path, file_metrics in run_metrics["files"].items():
+                    sample(name, file_metrics[key], run=run, file=path)
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value):
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
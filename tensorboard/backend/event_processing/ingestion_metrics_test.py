@@ -0,0 +1,110 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `ingestion_metrics`."""
+
+
+import json
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import ingestion_metrics
+
+
+class IngestionMetricsTest(tb_test.TestCase):
+    def testEmpty(self):
+        metrics = ingestion_metrics.IngestionMetrics()
+        snapshot = metrics.AsDict()
+        self.assertEqual(snapshot["runs"], {})
+        self.assertEqual(snapshot["cycles"]["count"], 0)
+        self.assertIsNone(snapshot["cycles"]["last_seconds"])
+        self.assertEqual(snapshot["cycles"]["buckets"][-1], ["+Inf", 0])
+
+    def testRunMetrics(self):
+        metrics = ingestion_metrics.IngestionMetrics()
+        run = metrics.ForRun("train")
+        self.assertIs(metrics.ForRun("train"), run)
+        run.RecordFileRead("/logs/a", 100, 2, 0.25)
+        run.RecordFileRead("/logs/a", 50, 1, 0.25)
+        run.RecordFileRead("/logs/b", 10, 1, 0.5)
+        run.RecordReload(2.0, 4, 1.5, 0.5)
+        run.RecordReload(1.0, 0, 1.0, 0.0)
+
+        snapshot = metrics.AsDict()["runs"]["train"]
+        self.assertEqual(snapshot["reloads"], 2)
+        self.assertEqual(snapshot["reload_seconds"], 3.0)
+        self.assertEqual(snapshot["events_processed"], 4)
+        self.assertEqual(snapshot["parse_seconds"], 2.5)
+        self.assertEqual(snapshot["insert_seconds"], 0.5)
+        self.assertEqual(snapshot["bytes_read"], 160)
+        self.assertEqual(snapshot["records_read"], 4)
+        self.assertEqual(
+            snapshot["files"]["/logs/a"],
+            {"bytes_read": 150, "records_read": 3, "read_seconds": 0.5},
+        )
+        # Snapshots must be serializable for the debug route.
+        json.dumps(metrics.AsDict())
+
+    def testRemoveRun(self):
+        metrics = ingestion_metrics.IngestionMetrics()
+        metrics.ForRun("train").RecordFileRead("/logs/a", 1, 1, 0.0)
+        metrics.RemoveRun("train")
+        metrics.RemoveRun("nonexistent")
+        self.assertEqual(metrics.AsDict()["runs"], {})
+        self.assertEqual(metrics.ForRun("train").AsDict()["bytes_read"], 0)
+
+    def testCycleHistogramIsCumulative(self):
+        metrics = ingestion_metrics.IngestionMetrics()
+        for duration in (0.05, 0.1, 0.7, 2000.0):
+            metrics.RecordCycle(duration)
+        cycles = metrics.AsDict()["cycles"]
+        self.assertEqual(cycles["count"], 4)
+        self.assertAlmostEqual(cycles["total_seconds"], 2000.85)
+        self.assertEqual(cycles["last_seconds"], 2000.0)
+        buckets = dict((str(k), v) for (k, v) in cycles["buckets"])
+        self.assertEqual(buckets["0.1"], 2)
+        self.assertEqual(buckets["0.5"], 2)
+        self.assertEqual(buckets["1.0"], 3)
+        self.assertEqual(buckets["900.0"], 3)
+        self.assertEqual(buckets["+Inf"], 4)
+
+    def testPrometheusText(self):
+        metrics = ingestion_metrics.IngestionMetrics()
+        metrics.RecordCycle(0.2)
+        run = metrics.ForRun('odd "run"\nname')
+        run.RecordFileRead("C:\\logs\\a", 100, 2, 0.25)
+        run.RecordReload(1.0, 2, 0.75, 0.25)
+        lines = metrics.AsPrometheusText().splitlines()
+        self.assertIn(
+            "# TYPE tensorboard_ingestion_cycle_seconds histogram", lines
+        )
+        self.assertIn(
+            'tensorboard_ingestion_cycle_seconds_bucket{le="0.1"} 0', lines
+        )
+        self.assertIn(
+            'tensorboard_ingestion_cycle_seconds_bucket{le="+Inf"} 1', lines
+        )
+        self.assertIn("tensorboard_ingestion_cycle_seconds_count 1", lines)
+        self.assertIn(
+            'tensorboard_ingestion_run_events_total{run="odd \\"run\\"\\nname"} 2',
+            lines,
+        )
+        self.assertIn(
+            "tensorboard_ingestion_file_bytes_read_total"
+            '{file="C:\\\\logs\\\\a",run="odd \\"run\\"\\nname"} 100',
+            lines,
+        )
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -15,8 +15,11 @@
 """IO helper functions."""
 
 import collections
+import concurrent.futures
 import os
 import re
+import threading
+import time
 
 
 from tensorboard.compat import tf
@@ -28,6 +31,15 @@ logger = tb_logging.get_logger()
 
 _ESCAPE_GLOB_CHARACTERS_REGEX = re.compile("([*?[])")
 
+# Default number of threads used to list sibling directories in parallel.
+_DEFAULT_TRAVERSAL_WORKERS = 8
+
+# Directory listings are only cached if the directory was last modified at
+# least this long before the traversal began. On file systems with coarse
+# timestamps (e.g., some NFS servers), a directory could otherwise be
+# modified again without a change to its mtime.
+_MTIME_CACHE_MIN_AGE_NS = 2 * 10**9
+
 
 def PathSeparator(path):
     return "/" if io_util.IsCloudPath(path) else os.sep
@@ -176,7 +188,127 @@ def ListRecursivelyViaWalking(top):
         )
 
 
-def GetLogdirSubdirectories(path):
+def _IsLocalPath(path):
+    """Checks whether a path can be traversed with the `os` module."""
+    return not io_util.IsCloudPath(path) and "://" not in path
+
+
+class LocalDirectoryTraverser:
+    """Finds subdirectories with events files on the local file system.
+
+    Directories are listed with `os.scandir`, which reports whether each
+    entry is a directory without a separate `stat` call, and the
+    directories at each depth of the tree are listed in parallel on a
+    bounded pool of threads.
+
+    The listing of each directory is cached along with its mtime, so a
+    later traversal only `stat`s an unchanged directory rather than
+    listing it again. Changes to a directory's descendants do not change
+    its own mtime, so every directory is still visited on each traversal.
+
+    This class is thread-safe. A single instance should be reused across
+    reload cycles so that its cache takes effect.
+    """
+
+    def __init__(self, max_workers=None):
+        """Creates a traverser.
+
+        Args:
+          max_workers: The maximum number of directories to list
+            concurrently. Defaults to `_DEFAULT_TRAVERSAL_WORKERS`.
+
+        Raises:
+          ValueError: If `max_workers` is not positive.
+        """
+        if max_workers is None:
+            max_workers = _DEFAULT_TRAVERSAL_WORKERS
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive: %r" % max_workers)
+        self._max_workers = max_workers
+        # Maps each traversed top-level path to a dict from each directory
+        # under it to a `(mtime_ns, has_events_file, subdir_paths)` tuple.
+        # Rebuilt on each traversal, so that deleted directories are pruned.
+        self._listings_by_top = {}
+        self._listings_lock = threading.Lock()
+
+    def GetLogdirSubdirectories(self, top):
+        """Lists all subdirectories of `top` with events files.
+
+        Args:
+          top: A path to a local directory.
+
+        Returns:
+          A list of the paths of `top` and each of its subdirectories that
+          directly contain at least 1 events file, in breadth-first order.
+          If `top` does not exist, the list is empty.
+        """
+        start_time_ns = time.time_ns()
+        with self._listings_lock:
+            old_listings = self._listings_by_top.get(top, {})
+        new_listings = {}
+        result = []
+        directories = [top]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="LocalDirectoryTraverser",
+        ) as executor:
+            while directories:
+                listings = executor.map(
+                    lambda directory: self._ListDirectory(
+                        directory, old_listings.get(directory)
+                    ),
+                    directories,
+                )
+                subdirectories = []
+                for directory, listing in zip(directories, listings):
+                    if listing is None:
+                        continue
+                    (mtime_ns, has_events_file, subdir_paths) = listing
+                    if start_time_ns - mtime_ns >= _MTIME_CACHE_MIN_AGE_NS:
+                        new_listings[directory] = listing
+                    if has_events_file:
+                        result.append(directory)
+                    subdirectories.extend(subdir_paths)
+                directories = subdirectories
+        with self._listings_lock:
+            self._listings_by_top[top] = new_listings
+        return result
+
+    def _ListDirectory(self, directory, cached_listing):
+        """Lists a single directory, reusing `cached_listing` if current.
+
+        Returns:
+          A `(mtime_ns, has_events_file, subdir_paths)` tuple, or `None` if
+          `directory` does not exist, is not a directory, or cannot be
+          read, in which case it is skipped like `tf.io.gfile.walk` does.
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %r: %s", directory, e)
+            return None
+        if cached_listing is not None and cached_listing[0] == mtime_ns:
+            return cached_listing
+        has_events_file = False
+        subdir_paths = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        subdir_paths.append(entry.path)
+                    elif not has_events_file:
+                        has_events_file = IsTensorFlowEventsFile(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %r: %s", directory, e)
+            return None
+        return (mtime_ns, has_events_file, tuple(subdir_paths))
+
+
+def GetLogdirSubdirectories(path, local_traverser=None):
     """Obtains all subdirectories with events files.
 
     The order of the subdirectories returned is unspecified. The internal logic
@@ -184,6 +316,10 @@ def GetLogdirSubdirectories(path):
 
     Args:
       path: The path to a directory under which to find subdirectories.
+      local_traverser: Optional `LocalDirectoryTraverser` to use if `path` is
+        on the local file system. Callers that traverse the same directory
+        repeatedly should pass the same instance each time to benefit from
+        its cache. If omitted, a new traverser is used.
 
     Returns:
       A tuple of absolute paths of all subdirectories each with at least 1 events
@@ -202,6 +338,14 @@ def GetLogdirSubdirectories(path):
             "directory, %s" % path
         )
 
+    if _IsLocalPath(path):
+        logger.info(
+            "GetLogdirSubdirectories: Starting to list directories via scandir."
+        )
+        if local_traverser is None:
+            local_traverser = LocalDirectoryTraverser()
+        return tuple(local_traverser.GetLogdirSubdirectories(path))
+
     if io_util.IsCloudPath(path):
         # Glob-ing for files can be significantly faster than recursively
         # walking through directories for some file systems.
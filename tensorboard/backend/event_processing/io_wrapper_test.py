@@ -16,6 +16,7 @@
 
 import os
 import tempfile
+from unittest import mock
 
 import tensorflow as tf
 
@@ -325,6 +326,105 @@ class IoWrapperTest(tf.test.TestCase):
             io_wrapper.GetLogdirSubdirectories(temp_dir),
         )
 
+    def testLocalDirectoryTraverser(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        expected = [
+            "",
+            "bar",
+            "bar/baz",
+            "quuz",
+            "quuz/garply",
+            "quuz/garply/corge",
+            "quuz/garply/grault",
+            "waldo/fred",
+        ]
+        traverser = io_wrapper.LocalDirectoryTraverser(max_workers=2)
+        self.assertCountEqual(
+            [
+                (os.path.join(temp_dir, subdir) if subdir else temp_dir)
+                for subdir in expected
+            ],
+            traverser.GetLogdirSubdirectories(temp_dir),
+        )
+
+    def testLocalDirectoryTraverserNonexistentDirectory(self):
+        traverser = io_wrapper.LocalDirectoryTraverser()
+        path = os.path.join(self.get_temp_dir(), "nonexistent")
+        self.assertEqual([], traverser.GetLogdirSubdirectories(path))
+
+    def testLocalDirectoryTraverserReusesUnchangedListings(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        self._SetDirectoryMtimes(temp_dir, 1000)
+        traverser = io_wrapper.LocalDirectoryTraverser()
+        traverser.GetLogdirSubdirectories(temp_dir)
+
+        with mock.patch.object(os, "scandir", wraps=os.scandir) as scandir:
+            result = traverser.GetLogdirSubdirectories(temp_dir)
+        scandir.assert_not_called()
+        self.assertIn(os.path.join(temp_dir, "bar", "baz"), result)
+        self.assertNotIn(os.path.join(temp_dir, "bar", "quux"), result)
+
+        # Adding an events file changes the mtime of only its directory.
+        quux = os.path.join(temp_dir, "bar", "quux")
+        open(os.path.join(quux, "j.tfevents.1"), "w").close()
+        os.utime(quux, ns=(2000 * 10**9, 2000 * 10**9))
+        with mock.patch.object(os, "scandir", wraps=os.scandir) as scandir:
+            result = traverser.GetLogdirSubdirectories(temp_dir)
+        scandir.assert_called_once_with(quux)
+        self.assertIn(quux, result)
+
+    def testLocalDirectoryTraverserDoesNotCacheRecentListings(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        traverser = io_wrapper.LocalDirectoryTraverser()
+        traverser.GetLogdirSubdirectories(temp_dir)
+        with mock.patch.object(os, "scandir", wraps=os.scandir) as scandir:
+            traverser.GetLogdirSubdirectories(temp_dir)
+        # All 11 directories (including `temp_dir`) are listed again.
+        self.assertEqual(11, scandir.call_count)
+
+    def testLocalDirectoryTraverserForgetsDeletedDirectories(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        self._SetDirectoryMtimes(temp_dir, 1000)
+        traverser = io_wrapper.LocalDirectoryTraverser()
+        traverser.GetLogdirSubdirectories(temp_dir)
+        fred = os.path.join(temp_dir, "waldo", "fred")
+        os.remove(os.path.join(fred, "i.tfevents.1"))
+        os.rmdir(fred)
+        self.assertNotIn(fred, traverser.GetLogdirSubdirectories(temp_dir))
+
+    def testLocalDirectoryTraverserSkipsUnreadableDirectories(self):
+        temp_dir = tempfile.mkdtemp(prefix=self.get_temp_dir())
+        self._CreateDeepDirectoryStructure(temp_dir)
+        bar = os.path.join(temp_dir, "bar")
+        scandir = os.scandir
+
+        def fake_scandir(path):
+            if path == bar:
+                raise PermissionError("denied")
+            return scandir(path)
+
+        traverser = io_wrapper.LocalDirectoryTraverser()
+        with mock.patch.object(os, "scandir", side_effect=fake_scandir):
+            with self.assertLogs(level="WARNING"):
+                result = traverser.GetLogdirSubdirectories(temp_dir)
+        self.assertNotIn(bar, result)
+        self.assertNotIn(os.path.join(bar, "baz"), result)
+        self.assertIn(os.path.join(temp_dir, "quuz", "garply"), result)
+
+    def testLocalDirectoryTraverserInvalidMaxWorkers(self):
+        with self.assertRaises(ValueError):
+            io_wrapper.LocalDirectoryTraverser(max_workers=0)
+
+    def _SetDirectoryMtimes(self, top_directory, mtime_secs):
+        """Sets the mtime of `top_directory` and all its subdirectories."""
+        mtime_ns = mtime_secs * 10**9
+        for dir_path, _, _ in os.walk(top_directory):
+            os.utime(dir_path, ns=(mtime_ns, mtime_ns))
+
     def _CreateDeepDirectoryStructure(self, top_directory):
         """Creates a reasonable deep structure of subdirectories with files.
 
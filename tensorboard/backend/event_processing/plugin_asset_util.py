@@ -14,7 +14,11 @@
 # ==============================================================================
 """Load plugin assets from disk."""
 
+import collections
+import itertools
 import os.path
+import threading
+import time
 
 from tensorboard.compat import tf
 
@@ -103,3 +107,235 @@ def RetrieveAsset(logdir, plugin_name, asset_name):
         raise KeyError(
             "Couldn't read asset path: %s, OpError %s" % (asset_path, e)
         )
+
+
+# Default budget, in characters of asset contents, of an `AssetCache`.
+DEFAULT_ASSET_CACHE_SIZE = 32 * 1024 * 1024
+
+# Directory modification times this recent are not trusted to detect
+# changes, since a file system with coarse timestamps could record a
+# later change with the same time.
+_RACY_MTIME_SECS = 2.0
+
+
+def _Mtime(path):
+    """Returns the mtime of `path` in nanoseconds, or `None` if unknown.
+
+    Raises:
+      tf.errors.NotFoundError: If `path` does not exist.
+    """
+    try:
+        stat = tf.io.gfile.stat(path)
+    except tf.errors.NotFoundError:
+        raise
+    except tf.errors.OpError:
+        return None
+    return getattr(stat, "mtime_nsec", None) or None
+
+
+def _StableMtime(mtime):
+    """Returns `mtime` if it is old enough to detect changes by."""
+    if mtime is None or time.time() - mtime / 1e9 < _RACY_MTIME_SECS:
+        return None
+    return mtime
+
+
+def _FileStamp(path):
+    """Returns `(length, mtime_nsec)` of the file at `path`, or `None`.
+
+    Returns `None` also if the file's modification time is unknown or
+    too recent to detect changes by, as for directories.
+    """
+    try:
+        stat = tf.io.gfile.stat(path)
+    except tf.errors.OpError:
+        return None
+    mtime_nsec = _StableMtime(getattr(stat, "mtime_nsec", None) or None)
+    if mtime_nsec is None:
+        return None
+    return (stat.length, mtime_nsec)
+
+
+class AssetCache:
+    """Cache of plugin asset contents, bounded by their total size.
+
+    Maps asset paths to contents, and evicts the least recently used
+    entries once the contents total more than `max_size` characters.
+    Safe to share among `AssetIndex`es and threads.
+    """
+
+    def __init__(self, max_size=DEFAULT_ASSET_CACHE_SIZE):
+        self._max_size = max_size
+        self._size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def Get(self, path):
+        """Returns the cached contents of `path`, or `None`."""
+        with self._lock:
+            contents = self._entries.get(path)
+            if contents is not None:
+                self._entries.move_to_end(path)
+            return contents
+
+    def Put(self, path, contents):
+        """Caches `contents` for `path`, unless they exceed the budget."""
+        if len(contents) > self._max_size:
+            return
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[path] = contents
+            self._size += len(contents)
+            while self._size > self._max_size:
+                (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def Evict(self, path):
+        """Drops any cached contents of `path`."""
+        with self._lock:
+            contents = self._entries.pop(path, None)
+            if contents is not None:
+                self._size -= len(contents)
+
+    def __contains__(self, path):
+        with self._lock:
+            return path in self._entries
+
+
+class AssetIndex:
+    """Index of the plugin assets in one logdir, refreshed on demand.
+
+    `ListAssets` answers from the index rather than listing directories
+    on every call. `Invalidate` marks the index stale without touching
+    the disk; the next `ListAssets` then refreshes it, listing a
+    directory again only if its modification time has changed (or is
+    not known, as on some remote file systems). Asset contents read
+    through `RetrieveAsset` are kept in an optional `AssetCache`, and
+    checked against their files once per invalidation, when next
+    retrieved.
+    """
+
+    def __init__(self, logdir, cache=None):
+        """Creates an index, to be populated when first used.
+
+        Args:
+          logdir: A directory that was created by a TensorFlow events
+            writer.
+          cache: Optional `AssetCache` for asset contents. If `None`,
+            contents are read from disk on every call.
+        """
+        self._logdir = logdir
+        self._cache = cache
+        self._refresh_lock = threading.Lock()
+        # Whether the index must be refreshed before it is next used.
+        self._stale = True
+        # Advanced whenever files may have changed. Cached contents are
+        # checked once per generation, when retrieved.
+        self._generations = itertools.count()
+        self._generation = next(self._generations)
+        # Modification time of the plugins directory when last listed,
+        # or `None` if it must be listed again.
+        self._plugins_mtime = None
+        # Maps each plugin name to a tuple `(mtime, assets)` of its
+        # directory's modification time, like `_plugins_mtime`, and
+        # asset names. Replaced, never mutated, by `Refresh`.
+        self._assets = {}
+        # Maps each asset path that we have cached to a tuple
+        # `(stamp, generation)` of its `_FileStamp` and the generation
+        # in which the stamp was last checked.
+        self._stamps = {}
+
+    def Invalidate(self):
+        """Marks the index stale, as when new events have been loaded.
+
+        Reads nothing from disk; the work is deferred until the index is
+        next used.
+        """
+        self._generation = next(self._generations)
+        self._stale = True
+
+    def Refresh(self):
+        """Updates the index from disk now."""
+        with self._refresh_lock:
+            self._Refresh()
+
+    def _Refresh(self):
+        # Cleared first, so that an `Invalidate` during the refresh is
+        # not lost.
+        self._stale = False
+        self._generation = next(self._generations)
+        if self._cache is not None:
+            for path in list(self._stamps):
+                if path not in self._cache:
+                    # `RetrieveAsset` may remove it concurrently.
+                    self._stamps.pop(path, None)
+        old_assets = self._assets
+        plugins_dir = os.path.join(self._logdir, _PLUGINS_DIR)
+        try:
+            mtime = _Mtime(plugins_dir)
+        except tf.errors.NotFoundError:
+            # No plugin has written assets, so there is nothing to list.
+            self._plugins_mtime = None
+            self._assets = {}
+            return
+        if mtime is not None and mtime == self._plugins_mtime:
+            plugins = list(old_assets)
+        else:
+            plugins = ListPlugins(self._logdir)
+        self._plugins_mtime = _StableMtime(mtime)
+        assets = {}
+        for plugin_name in plugins:
+            try:
+                mtime = _Mtime(PluginDirectory(self._logdir, plugin_name))
+            except tf.errors.NotFoundError:
+                continue
+            old = old_assets.get(plugin_name)
+            if mtime is not None and old is not None and old[0] == mtime:
+                assets[plugin_name] = old
+            else:
+                names = ListAssets(self._logdir, plugin_name)
+                assets[plugin_name] = (_StableMtime(mtime), names)
+        self._assets = assets
+
+    def ListAssets(self, plugin_name):
+        """Lists the assets of a plugin, as `ListAssets` does.
+
+        Refreshes the index first if it is stale.
+        """
+        if self._stale:
+            with self._refresh_lock:
+                if self._stale:
+                    self._Refresh()
+        entry = self._assets.get(plugin_name)
+        return list(entry[1]) if entry is not None else []
+
+    def RetrieveAsset(self, plugin_name, asset_name):
+        """Retrieves an asset's contents, as `RetrieveAsset` does."""
+        if self._cache is None:
+            return RetrieveAsset(self._logdir, plugin_name, asset_name)
+        path = os.path.join(
+            PluginDirectory(self._logdir, plugin_name), asset_name
+        )
+        generation = self._generation
+        contents = self._cache.Get(path)
+        checked = self._stamps.get(path)
+        if contents is not None and checked is not None:
+            if checked[1] == generation:
+                return contents
+            stamp = _FileStamp(path)
+            if stamp is not None and stamp == checked[0]:
+                self._stamps[path] = (stamp, generation)
+                return contents
+            self._cache.Evict(path)
+            self._stamps.pop(path, None)
+        else:
+            stamp = _FileStamp(path)
+        # Stamp before reading, so that a change made while reading is
+        # detected by the next check.
+        contents = RetrieveAsset(self._logdir, plugin_name, asset_name)
+        if stamp is not None:
+            self._stamps[path] = (stamp, generation)
+            self._cache.Put(path, contents)
+        return contents
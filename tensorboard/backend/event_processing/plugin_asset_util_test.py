@@ -0,0 +1,239 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.backend.event_processing.plugin_asset_util`."""
+
+
+import os
+import time
+from unittest import mock
+
+from tensorboard import test as tb_test
+from tensorboard.backend.event_processing import plugin_asset_util
+
+
+class AssetIndexTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.logdir = self.get_temp_dir()
+        # Whole seconds in the past, advanced on each `_age`, since some
+        # file systems only report modification times to the second.
+        self._clock = int(time.time()) - 600
+
+    def _write_asset(self, plugin_name, asset_name, contents):
+        plugin_dir = plugin_asset_util.PluginDirectory(self.logdir, plugin_name)
+        os.makedirs(plugin_dir, exist_ok=True)
+        path = os.path.join(plugin_dir, asset_name)
+        with open(path, "w") as f:
+            f.write(contents)
+        self._age(path)
+        return path
+
+    def _age(self, path):
+        """Backdates `path` and its ancestors under the logdir, so that
+        the index can trust their modification times."""
+        self._clock += 10
+        old = self._clock
+        while len(path) >= len(self.logdir):
+            os.utime(path, (old, old))
+            old -= 1
+            path = os.path.dirname(path)
+
+    def test_lists_assets(self):
+        self._write_asset("foo", "a.txt", "A")
+        self._write_asset("foo", "b.txt", "B")
+        self._write_asset("bar", "c.txt", "C")
+        index = plugin_asset_util.AssetIndex(self.logdir)
+        self.assertCountEqual(index.ListAssets("foo"), ["a.txt", "b.txt"])
+        self.assertEqual(index.ListAssets("bar"), ["c.txt"])
+        self.assertEqual(index.ListAssets("baz"), [])
+
+    def test_no_plugins_dir(self):
+        index = plugin_asset_util.AssetIndex(self.logdir)
+        with mock.patch.object(
+            plugin_asset_util,
+            "ListPlugins",
+            wraps=plugin_asset_util.ListPlugins,
+        ) as list_plugins:
+            index.Refresh()
+            self.assertEqual(index.ListAssets("foo"), [])
+            list_plugins.assert_not_called()
+        self._write_asset("foo", "a.txt", "A")
+        index.Invalidate()
+        self.assertEqual(index.ListAssets("foo"), ["a.txt"])
+
+    def test_invalidate_defers_refresh(self):
+        self._write_asset("foo", "a.txt", "A")
+        index = plugin_asset_util.AssetIndex(self.logdir)
+        self.assertEqual(index.ListAssets("foo"), ["a.txt"])
+        self._write_asset("foo", "b.txt", "B")
+        with mock.patch.object(
+            plugin_asset_util, "_Mtime", wraps=plugin_asset_util._Mtime
+        ) as mtime:
+            index.Invalidate()
+            index.Invalidate()
+            mtime.assert_not_called()
+            self.assertCountEqual(index.ListAssets("foo"), ["a.txt", "b.txt"])
+            calls = mtime.call_count
+            self.assertCountEqual(index.ListAssets("foo"), ["a.txt", "b.txt"])
+            self.assertEqual(mtime.call_count, calls)
+
+    def test_refresh_lists_only_changed_directories(self):
+        self._write_asset("foo", "a.txt", "A")
+        self._write_asset("bar", "c.txt", "C")
+        index = plugin_asset_util.AssetIndex(self.logdir)
+        index.Refresh()
+        with mock.patch.object(
+            plugin_asset_util, "ListAssets", wraps=plugin_asset_util.ListAssets
+        ) as list_assets, mock.patch.object(
+            plugin_asset_util,
+            "ListPlugins",
+            wraps=plugin_asset_util.ListPlugins,
+        ) as list_plugins:
+            index.Refresh()
+            list_plugins.assert_not_called()
+            list_assets.assert_not_called()
+
+            self._write_asset("foo", "b.txt", "B")
+            index.Refresh()
+            list_assets.assert_called_once_with(self.logdir, "foo")
+        self.assertCountEqual(index.ListAssets("foo"), ["a.txt", "b.txt"])
+        self.assertEqual(index.ListAssets("bar"), ["c.txt"])
+
+    def test_recent_changes_are_relisted(self):
+        index = plugin_asset_util.AssetIndex(self.logdir)
+        plugin_dir = plugin_asset_util.PluginDirectory(self.logdir, "foo")
+        os.makedirs(plugin_dir)
+        index.Refresh()
+        # The directory was just modified, so its mtime cannot yet tell
+        # whether it changes again within the same clock tick.
+        with open(os.path.join(plugin_dir, "a.txt"), "w"):
+            pass
+        index.Refresh()
+        self.assertEqual(index.ListAssets("foo"), ["a.txt"])
+
+    def test_retrieve_without_cache(self):
+        path = self._write_asset("foo", "a.txt", "old")
+        index = plugin_asset_util.AssetIndex(self.logdir)
+        self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "old")
+        with open(path, "w") as f:
+            f.write("new")
+        self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "new")
+        with self.assertRaises(KeyError):
+            index.RetrieveAsset("foo", "nope.txt")
+
+    def test_retrieve_caches_until_changed(self):
+        path = self._write_asset("foo", "a.txt", "old")
+        cache = plugin_asset_util.AssetCache()
+        index = plugin_asset_util.AssetIndex(self.logdir, cache=cache)
+        index.Refresh()
+        self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "old")
+        with mock.patch.object(
+            plugin_asset_util, "RetrieveAsset"
+        ) as retrieve_asset:
+            self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "old")
+            retrieve_asset.assert_not_called()
+
+        with open(path, "w") as f:
+            f.write("newer")
+        self._age(path)
+        # Served from the cache until the index is next invalidated.
+        self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "old")
+        index.Invalidate()
+        self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "newer")
+
+        os.remove(path)
+        index.Refresh()
+        with self.assertRaises(KeyError):
+            index.RetrieveAsset("foo", "a.txt")
+
+    def test_recently_modified_assets_are_not_cached(self):
+        plugin_dir = plugin_asset_util.PluginDirectory(self.logdir, "foo")
+        os.makedirs(plugin_dir)
+        path = os.path.join(plugin_dir, "a.txt")
+        with open(path, "w") as f:
+            f.write("old")
+        cache = plugin_asset_util.AssetCache()
+        index = plugin_asset_util.AssetIndex(self.logdir, cache=cache)
+        self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "old")
+        # Its mtime cannot yet tell whether it changes again within the
+        # same clock tick.
+        self.assertNotIn(path, cache)
+
+    def test_refresh_tolerates_concurrent_retrieval(self):
+        path = self._write_asset("foo", "a.txt", "A")
+        index = None
+
+        class EvictingCache(plugin_asset_util.AssetCache):
+            def __contains__(self, key):
+                # As if `RetrieveAsset` dropped the stamp meanwhile.
+                index._stamps.pop(key, None)
+                return False
+
+        index = plugin_asset_util.AssetIndex(self.logdir, cache=EvictingCache())
+        index.RetrieveAsset("foo", "a.txt")
+        index.Refresh()
+        self.assertEqual(index.ListAssets("foo"), ["a.txt"])
+        self.assertNotIn(path, index._stamps)
+
+    def test_cached_contents_are_checked_once_per_invalidation(self):
+        self._write_asset("foo", "a.txt", "A")
+        self._write_asset("foo", "b.txt", "B")
+        cache = plugin_asset_util.AssetCache()
+        index = plugin_asset_util.AssetIndex(self.logdir, cache=cache)
+        index.RetrieveAsset("foo", "a.txt")
+        index.RetrieveAsset("foo", "b.txt")
+        with mock.patch.object(
+            plugin_asset_util,
+            "_FileStamp",
+            wraps=plugin_asset_util._FileStamp,
+        ) as file_stamp:
+            index.Invalidate()
+            index.ListAssets("foo")
+            file_stamp.assert_not_called()
+            self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "A")
+            self.assertEqual(index.RetrieveAsset("foo", "a.txt"), "A")
+            file_stamp.assert_called_once()
+
+
+class AssetCacheTest(tb_test.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = plugin_asset_util.AssetCache(max_size=10)
+        cache.Put("a", "aaaa")
+        cache.Put("b", "bbbb")
+        self.assertEqual(cache.Get("a"), "aaaa")
+        cache.Put("c", "cccc")
+        self.assertIsNone(cache.Get("b"))
+        self.assertEqual(cache.Get("a"), "aaaa")
+        self.assertEqual(cache.Get("c"), "cccc")
+
+    def test_skips_oversized_contents(self):
+        cache = plugin_asset_util.AssetCache(max_size=10)
+        cache.Put("a", "aaaa")
+        cache.Put("big", "x" * 11)
+        self.assertIsNone(cache.Get("big"))
+        self.assertEqual(cache.Get("a"), "aaaa")
+
+    def test_evict(self):
+        cache = plugin_asset_util.AssetCache(max_size=10)
+        cache.Put("a", "aaaaaaaa")
+        cache.Evict("a")
+        self.assertNotIn("a", cache)
+        cache.Put("b", "bbbbbbbb")
+        cache.Evict("nope")
+        self.assertIn("b", cache)
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -16,7 +16,9 @@
 
 import collections
 import dataclasses
+import itertools
 import threading
+import time
 
 from typing import Optional
 
@@ -55,6 +57,9 @@ STORE_EVERYTHING_SIZE_GUIDANCE = {
 
 _TENSOR_RESERVOIR_KEY = "."  # arbitrary
 
+# Source of accumulator generations, unique within the process.
+_generations = itertools.count()
+
 
 @dataclasses.dataclass(frozen=True)
 class TensorEvent:
@@ -116,6 +121,8 @@ class EventAccumulator:
         purge_orphaned_data=True,
         event_file_active_filter=None,
         detect_file_replacement=None,
+        metrics=None,
+        asset_cache=None,
     ):
         """Construct the `EventAccumulator`.
 
@@ -142,6 +149,10 @@ class EventAccumulator:
           detect_file_replacement: Optional boolean; if True, event file loading
             will try to detect when a file has been replaced with a new version
             that contains additional data, by monitoring the file size.
+          metrics: Optional `ingestion_metrics.RunMetrics` to which event
+            file reads and reloads are reported.
+          asset_cache: Optional `plugin_asset_util.AssetCache` in which to
+            keep plugin asset contents between reloads.
         """
         size_guidance = dict(size_guidance or DEFAULT_SIZE_GUIDANCE)
         sizes = {}
@@ -162,6 +173,11 @@ class EventAccumulator:
         self.summary_metadata = {}
         self.tensors_by_tag = {}
         self._tensors_by_tag_lock = threading.Lock()
+        # Maps each tag in `tensors_by_tag` to its most recent `TensorEvent`,
+        # or to `None` if all its events have been purged. Updated on ingest
+        # and purge so that the latest datum can be read without copying the
+        # tag's reservoir.
+        self._last_tensor_by_tag = {}
 
         # Keep a mapping from plugin name to a dict mapping from tag to plugin data
         # content obtained from the SummaryMetadata (metadata field of Value) for
@@ -170,15 +186,25 @@ class EventAccumulator:
         # first event encountered per tag, so we must store that first instance of
         # content for each tag.
         self._plugin_to_tag_to_content = collections.defaultdict(dict)
+        # Maps each `(plugin_name, data_class)` pair to a dict from tag to
+        # `SummaryMetadata`, so that time series can be listed by plugin and
+        # data class without scanning `summary_metadata`.
+        self._metadata_by_plugin_and_data_class = collections.defaultdict(dict)
         # Locks the dict `_plugin_to_tag_to_content` as well as the
-        # dicts `_plugin_to_tag_to_content[p]` for each `p`.
+        # dicts `_plugin_to_tag_to_content[p]` for each `p`, and likewise
+        # for `_metadata_by_plugin_and_data_class`.
         self._plugin_tag_lock = threading.Lock()
 
         self.path = path
+        self._metrics = metrics
         self._generator = _GeneratorFromPath(
-            path, event_file_active_filter, detect_file_replacement
+            path, event_file_active_filter, detect_file_replacement, metrics
         )
         self._generator_mutex = threading.Lock()
+        self._generation = next(_generations)
+        self._plugin_assets = plugin_asset_util.AssetIndex(
+            path, cache=asset_cache
+        )
 
         self.purge_orphaned_data = purge_orphaned_data
         self._seen_session_start = False
@@ -199,10 +225,40 @@ class EventAccumulator:
           The `EventAccumulator`.
         """
         with self._generator_mutex:
+            if self._metrics is None:
+                events = 0
+                for event in self._generator.Load():
+                    self._ProcessEvent(event)
+                    events += 1
+                if events:
+                    self._generation = next(_generations)
+                self._plugin_assets.Invalidate()
+                return self
+            events = 0
+            insert_secs = 0.0
+            start = time.perf_counter()
             for event in self._generator.Load():
+                insert_start = time.perf_counter()
                 self._ProcessEvent(event)
+                insert_secs += time.perf_counter() - insert_start
+                events += 1
+            reload_secs = time.perf_counter() - start
+            self._metrics.RecordReload(
+                reload_secs, events, reload_secs - insert_secs, insert_secs
+            )
+            if events:
+                self._generation = next(_generations)
+            self._plugin_assets.Invalidate()
         return self
 
+    def Generation(self):
+        """Returns a value that changes whenever `Reload` loads new events.
+
+        Generations are unique within the process, so they also tell
+        apart accumulators that have been replaced.
+        """
+        return self._generation
+
     def PluginAssets(self, plugin_name):
         """Return a list of all plugin assets for the given plugin.
 
@@ -211,9 +267,11 @@ class EventAccumulator:
 
         Returns:
           A list of string plugin asset names, or empty list if none are available.
-          If the plugin was not registered, an empty list is returned.
+          If the plugin was not registered, an empty list is returned. The
+          assets are listed again, if their directories have changed, on
+          the first call after each `Reload`.
         """
-        return plugin_asset_util.ListAssets(self.path, plugin_name)
+        return self._plugin_assets.ListAssets(plugin_name)
 
     def RetrievePluginAsset(self, plugin_name, asset_name):
         """Return the contents of a given plugin asset.
@@ -228,9 +286,7 @@ class EventAccumulator:
         Raises:
           KeyError: If the asset is not available.
         """
-        return plugin_asset_util.RetrieveAsset(
-            self.path, plugin_name, asset_name
-        )
+        return self._plugin_assets.RetrieveAsset(plugin_name, asset_name)
 
     def FirstEventTimestamp(self):
         """Returns the timestamp in seconds of the first event.
@@ -325,6 +381,26 @@ class EventAccumulator:
         """
         return dict(self.summary_metadata)
 
+    def SummaryMetadataForPlugin(self, plugin_name, data_class):
+        """Return summary metadata for tags of the given plugin and data class.
+
+        This is like `AllSummaryMetadata`, but takes time proportional to
+        the number of matching tags rather than to the number of all tags.
+
+        Args:
+          plugin_name: The `plugin_data.plugin_name` of the tags to return.
+          data_class: The `summary_pb2.DataClass` of the tags to return.
+
+        Returns:
+          A dict `d` such that `d[tag]` is a `SummaryMetadata` proto for
+          the keyed tag, which is empty if there are no matching tags.
+        """
+        key = (plugin_name, data_class)
+        with self._plugin_tag_lock:
+            if key not in self._metadata_by_plugin_and_data_class:
+                return {}
+            return dict(self._metadata_by_plugin_and_data_class[key])
+
     def _ProcessEvent(self, event):
         """Called whenever an event is loaded."""
         if self._first_event_timestamp is None:
@@ -423,12 +499,18 @@ class EventAccumulator:
                     if tag not in self.summary_metadata:
                         self.summary_metadata[tag] = value.metadata
                         plugin_data = value.metadata.plugin_data
-                        if plugin_data.plugin_name:
-                            with self._plugin_tag_lock:
+                        with self._plugin_tag_lock:
+                            self._metadata_by_plugin_and_data_class[
+                                (
+                                    plugin_data.plugin_name,
+                                    value.metadata.data_class,
+                                )
+                            ][tag] = value.metadata
+                            if plugin_data.plugin_name:
                                 self._plugin_to_tag_to_content[
                                     plugin_data.plugin_name
                                 ][tag] = plugin_data.content
-                        else:
+                        if not plugin_data.plugin_name:
                             logger.warning(
                                 (
                                     "This summary with tag %r is oddly not associated with a "
@@ -531,6 +613,22 @@ class EventAccumulator:
         """
         return self.tensors_by_tag[tag].Items(_TENSOR_RESERVOIR_KEY)
 
+    def LastTensor(self, tag):
+        """Given a summary tag, return its most recent tensor.
+
+        This is equivalent to `Tensors(tag)[-1]`, but takes constant time.
+
+        Args:
+          A string tag associated with the events.
+
+        Raises:
+          KeyError: If the tag is not found.
+
+        Returns:
+          A `TensorEvent`, or `None` if there are no tensors for the tag.
+        """
+        return self._last_tensor_by_tag[tag]
+
     def _MaybePurgeOrphanedData(self, event):
         """Maybe purge orphaned data due to a TensorFlow crash.
 
@@ -610,6 +708,8 @@ class EventAccumulator:
                 reservoir_size = self._GetTensorReservoirSize(tag)
                 self.tensors_by_tag[tag] = reservoir.Reservoir(reservoir_size)
         self.tensors_by_tag[tag].AddItem(_TENSOR_RESERVOIR_KEY, tv)
+        # Tensor reservoirs always keep the latest item.
+        self._last_tensor_by_tag[tag] = tv
 
     def _GetTensorReservoirSize(self, tag):
         default = self._size_guidance[TENSORS]
@@ -645,19 +745,24 @@ class EventAccumulator:
         ## Keep data in reservoirs that has a step less than event.step
         _NotExpired = lambda x: x.step < event.step
 
-        num_expired = 0
         if by_tags:
-            for value in event.summary.value:
-                if value.tag in self.tensors_by_tag:
-                    tag_reservoir = self.tensors_by_tag[value.tag]
-                    num_expired += tag_reservoir.FilterItems(
-                        _NotExpired, _TENSOR_RESERVOIR_KEY
-                    )
+            tags = [
+                value.tag
+                for value in event.summary.value
+                if value.tag in self.tensors_by_tag
+            ]
         else:
-            for tag_reservoir in self.tensors_by_tag.values():
-                num_expired += tag_reservoir.FilterItems(
-                    _NotExpired, _TENSOR_RESERVOIR_KEY
-                )
+            tags = list(self.tensors_by_tag)
+        num_expired = 0
+        for tag in tags:
+            tag_reservoir = self.tensors_by_tag[tag]
+            num_expired_for_tag = tag_reservoir.FilterItems(
+                _NotExpired, _TENSOR_RESERVOIR_KEY
+            )
+            if num_expired_for_tag:
+                items = tag_reservoir.Items(_TENSOR_RESERVOIR_KEY)
+                self._last_tensor_by_tag[tag] = items[-1] if items else None
+            num_expired += num_expired_for_tag
         if num_expired > 0:
             purge_msg = _GetPurgeMessage(
                 self.most_recent_step,
@@ -692,17 +797,22 @@ def _GetPurgeMessage(
 
 
 def _GeneratorFromPath(
-    path, event_file_active_filter=None, detect_file_replacement=None
+    path,
+    event_file_active_filter=None,
+    detect_file_replacement=None,
+    metrics=None,
 ):
     """Create an event generator for file or directory at given path string."""
     if not path:
         raise ValueError("path must be a valid string")
     if io_wrapper.IsSummaryEventsFile(path):
-        return event_file_loader.EventFileLoader(path, detect_file_replacement)
+        return event_file_loader.EventFileLoader(
+            path, detect_file_replacement, metrics=metrics
+        )
     elif event_file_active_filter:
         loader_factory = (
             lambda path: event_file_loader.TimestampedEventFileLoader(
-                path, detect_file_replacement
+                path, detect_file_replacement, metrics=metrics
             )
         )
         return directory_loader.DirectoryLoader(
@@ -713,7 +823,7 @@ def _GeneratorFromPath(
         )
     else:
         loader_factory = lambda path: event_file_loader.EventFileLoader(
-            path, detect_file_replacement
+            path, detect_file_replacement, metrics=metrics
         )
         return directory_watcher.DirectoryWatcher(
             path,
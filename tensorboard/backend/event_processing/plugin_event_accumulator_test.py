@@ -170,6 +170,19 @@ class MockingEventAccumulatorTest(EventAccumulatorTest):
             },
         )
 
+    def testGenerationChangesWhenEventsAreLoaded(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        other = ea.EventAccumulator("path/is/ignored")
+        self.assertNotEqual(acc.Generation(), other.Generation())
+        acc.Reload()
+        generation = acc.Generation()
+        acc.Reload()
+        self.assertEqual(acc.Generation(), generation)
+        gen.AddScalarTensor("s1", wall_time=1, step=10, value=50)
+        acc.Reload()
+        self.assertNotEqual(acc.Generation(), generation)
+
     def testKeyError(self):
         """KeyError should be raised when accessing non-existing keys."""
         gen = _EventGenerator(self)
@@ -342,6 +355,43 @@ class MockingEventAccumulatorTest(EventAccumulatorTest):
         self.assertEqual([x.step for x in acc.Tensors("s1")], [100, 200])
         self.assertEqual([x.step for x in acc.Tensors("s2")], [])
 
+    def testLastTensor(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen, size_guidance={ea.TENSORS: 2})
+        for step in range(10):
+            gen.AddScalarTensor("s1", wall_time=step, step=step, value=step)
+        acc.Reload()
+        self.assertEqual(9, acc.LastTensor("s1").step)
+        self.assertEqual(acc.Tensors("s1")[-1], acc.LastTensor("s1"))
+        with self.assertRaises(KeyError):
+            acc.LastTensor("s2")
+
+    def testLastTensorUpdatedOnPurge(self):
+        gen = _EventGenerator(self)
+        acc = self._make_accumulator(gen)
+        slog = event_pb2.SessionLog(status=event_pb2.SessionLog.START)
+
+        gen.AddEvent(
+            event_pb2.Event(wall_time=0, step=1, file_version="brain.Event:2")
+        )
+        gen.AddEvent(event_pb2.Event(wall_time=1, step=1, session_log=slog))
+        gen.AddScalarTensor("s1", wall_time=1, step=100, value=20)
+        gen.AddScalarTensor("s1", wall_time=1, step=300, value=20)
+        gen.AddScalarTensor("s2", wall_time=1, step=202, value=20)
+        gen.AddScalarTensor("s3", wall_time=1, step=50, value=20)
+        acc.Reload()
+        self.assertEqual(300, acc.LastTensor("s1").step)
+
+        gen.AddEvent(event_pb2.Event(wall_time=2, step=201, session_log=slog))
+        acc.Reload()
+        self.assertEqual(100, acc.LastTensor("s1").step)
+        self.assertIsNone(acc.LastTensor("s2"))
+        self.assertEqual(50, acc.LastTensor("s3").step)
+
+        gen.AddScalarTensor("s2", wall_time=3, step=250, value=20)
+        acc.Reload()
+        self.assertEqual(250, acc.LastTensor("s2").step)
+
     def testFirstEventTimestamp(self):
         """Test that FirstEventTimestamp() returns wall_time of the first
         event."""
@@ -906,6 +956,43 @@ class RealisticEventAccumulatorTest(EventAccumulatorTest):
             summary_metadata_1, acc.SummaryMetadata("you_are_it")
         )
 
+    def testSummaryMetadataForPlugin(self):
+        logdir = self.get_temp_dir()
+        summary_metadata_1 = summary_pb2.SummaryMetadata(
+            plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                plugin_name="outlet", content=b"120v"
+            ),
+            data_class=summary_pb2.DATA_CLASS_TENSOR,
+        )
+        self._writeMetadata(logdir, summary_metadata_1, nonce="1")
+        acc = ea.EventAccumulator(logdir)
+        acc.Reload()
+        summary_metadata_2 = summary_pb2.SummaryMetadata(
+            plugin_data=summary_pb2.SummaryMetadata.PluginData(
+                plugin_name="plug", content=b"110v"
+            ),
+            data_class=summary_pb2.DATA_CLASS_TENSOR,
+        )
+        self._writeMetadata(logdir, summary_metadata_2, nonce="2")
+        acc.Reload()
+
+        result = acc.SummaryMetadataForPlugin(
+            "outlet", summary_pb2.DATA_CLASS_TENSOR
+        )
+        self.assertEqual(["you_are_it"], list(result))
+        self.assertProtoEquals(summary_metadata_1, result["you_are_it"])
+        self.assertEqual(
+            {},
+            acc.SummaryMetadataForPlugin(
+                "outlet", summary_pb2.DATA_CLASS_SCALAR
+            ),
+        )
+        # Only the first metadata for each tag is indexed.
+        self.assertEqual(
+            {},
+            acc.SummaryMetadataForPlugin("plug", summary_pb2.DATA_CLASS_TENSOR),
+        )
+
     def testPluginTagToContent_PluginsCannotJumpOnTheBandwagon(self):
         # If there are multiple `SummaryMetadata` for a given tag, and the
         # set of plugins in the `plugin_data` of second is different from
@@ -22,10 +22,12 @@ import threading
 from typing import Optional
 
 from tensorboard.backend.event_processing import directory_watcher
+from tensorboard.backend.event_processing import ingestion_metrics
 from tensorboard.backend.event_processing import (
     plugin_event_accumulator as event_accumulator,
 )
 from tensorboard.backend.event_processing import io_wrapper
+from tensorboard.backend.event_processing import plugin_asset_util
 from tensorboard.util import tb_logging
 
 
@@ -105,10 +107,22 @@ class EventMultiplexer:
             that contains additional data, by monitoring the file size.
         """
         logger.info("Event Multiplexer initializing.")
+        # Guards writes to `_accumulators` and the publication of
+        # `_accumulator_items`.
         self._accumulators_mutex = threading.Lock()
         self._accumulators = {}
+        # An immutable snapshot of `_accumulators.items()`, republished on
+        # every change so that readers can iterate over the accumulators
+        # without taking `_accumulators_mutex` or copying the map.
+        self._accumulator_items = ()
         self._paths = {}
+        # Reused across calls to `AddRunsFromDirectory` so that unchanged
+        # directories need not be listed again on each reload.
+        self._local_traverser = io_wrapper.LocalDirectoryTraverser()
         self._reload_called = False
+        self._ingestion_metrics = ingestion_metrics.IngestionMetrics()
+        # Shared by all runs, so that the budget bounds the whole logdir.
+        self._asset_cache = plugin_asset_util.AssetCache()
         self._size_guidance = (
             size_guidance or event_accumulator.DEFAULT_SIZE_GUIDANCE
         )
@@ -159,6 +173,8 @@ class EventMultiplexer:
                         path,
                     )
                 logger.info("Constructing EventAccumulator for %s", path)
+                # A replaced accumulator starts over with fresh metrics.
+                self._ingestion_metrics.RemoveRun(name)
                 accumulator = event_accumulator.EventAccumulator(
                     path,
                     size_guidance=self._size_guidance,
@@ -166,9 +182,12 @@ class EventMultiplexer:
                     purge_orphaned_data=self.purge_orphaned_data,
                     event_file_active_filter=self._event_file_active_filter,
                     detect_file_replacement=self._detect_file_replacement,
+                    metrics=self._ingestion_metrics.ForRun(name),
+                    asset_cache=self._asset_cache,
                 )
                 self._accumulators[name] = accumulator
                 self._paths[name] = path
+                self._accumulator_items = tuple(self._accumulators.items())
         if accumulator:
             if self._reload_called:
                 accumulator.Reload()
@@ -203,7 +222,9 @@ class EventMultiplexer:
         """
         path = os.path.expanduser(path)
         logger.info("Starting AddRunsFromDirectory: %s", path)
-        for subdir in io_wrapper.GetLogdirSubdirectories(path):
+        for subdir in io_wrapper.GetLogdirSubdirectories(
+            path, local_traverser=self._local_traverser
+        ):
             logger.info("Adding run from directory %s", subdir)
             rpath = os.path.relpath(subdir, path)
             subname = os.path.join(name, rpath) if name else rpath
@@ -215,10 +236,9 @@ class EventMultiplexer:
         """Call `Reload` on every `EventAccumulator`."""
         logger.info("Beginning EventMultiplexer.Reload()")
         self._reload_called = True
-        # Build a list so we're safe even if the list of accumulators is modified
-        # even while we're reloading.
-        with self._accumulators_mutex:
-            items = list(self._accumulators.items())
+        # Use the published snapshot so we're safe even if the list of
+        # accumulators is modified even while we're reloading.
+        items = self._accumulator_items
         items_queue = queue.Queue()
         for item in items:
             items_queue.put(item)
@@ -266,9 +286,19 @@ class EventMultiplexer:
             for name in names_to_delete:
                 logger.warning("Deleting accumulator %r", name)
                 del self._accumulators[name]
+                self._ingestion_metrics.RemoveRun(name)
+            self._accumulator_items = tuple(self._accumulators.items())
         logger.info("Finished with EventMultiplexer.Reload()")
         return self
 
+    def IngestionMetrics(self):
+        """Returns the `ingestion_metrics.IngestionMetrics` of this multiplexer.
+
+        These record, per run and per event file, the bytes and records read
+        and where time was spent on each reload.
+        """
+        return self._ingestion_metrics
+
     def PluginAssets(self, plugin_name):
         """Get index of runs and assets for a given plugin.
 
@@ -279,9 +309,7 @@ class EventMultiplexer:
           A dictionary that maps from run_name to a list of plugin
             assets for that run.
         """
-        with self._accumulators_mutex:
-            # To avoid nested locks, we construct a copy of the run-accumulator map
-            items = list(self._accumulators.items())
+        items = self._accumulator_items
 
         return {run: accum.PluginAssets(plugin_name) for run, accum in items}
 
@@ -420,6 +448,27 @@ class EventMultiplexer:
         accumulator = self.GetAccumulator(run)
         return accumulator.Tensors(tag)
 
+    def LastTensor(self, run, tag):
+        """Retrieve the most recent tensor event for a run and tag.
+
+        Unlike `Tensors(run, tag)[-1]`, this does not copy the tag's
+        reservoir.
+
+        Args:
+          run: A string name of the run for which values are retrieved.
+          tag: A string name of the tag for which values are retrieved.
+
+        Raises:
+          KeyError: If the run is not found, or the tag is not available for
+            the given run.
+
+        Returns:
+          An `event_accumulator.TensorEvent`, or `None` if there are no
+          tensor events for the run and tag.
+        """
+        accumulator = self.GetAccumulator(run)
+        return accumulator.LastTensor(tag)
+
     def PluginRunToTagToContent(self, plugin_name):
         """Returns a 2-layer dictionary of the form {run: {tag: content}}.
 
@@ -452,9 +501,9 @@ class EventMultiplexer:
           all the `SummaryMetadata` protos stored in any run known to
           this multiplexer.
         """
-        with self._accumulators_mutex:
-            accumulators = list(self._accumulators.values())
-        return frozenset().union(*(a.ActivePlugins() for a in accumulators))
+        return frozenset().union(
+            *(a.ActivePlugins() for (_, a) in self._accumulator_items)
+        )
 
     def SummaryMetadata(self, run, tag):
         """Return the summary metadata for the given tag on the given run.
@@ -482,14 +531,35 @@ class EventMultiplexer:
           A nested dict `d` such that `d[run][tag]` is a
           `SummaryMetadata` proto for the keyed time series.
         """
-        with self._accumulators_mutex:
-            # To avoid nested locks, we construct a copy of the run-accumulator map
-            items = list(self._accumulators.items())
+        items = self._accumulator_items
         return {
             run_name: accumulator.AllSummaryMetadata()
             for run_name, accumulator in items
         }
 
+    def SummaryMetadataForPlugin(self, plugin_name, data_class):
+        """Return summary metadata for time series of a plugin and data class.
+
+        Args:
+          plugin_name: The `plugin_data.plugin_name` of the time series to
+            return.
+          data_class: The `summary_pb2.DataClass` of the time series to
+            return.
+
+        Returns:
+          A nested dict `d` such that `d[run][tag]` is a `SummaryMetadata`
+          proto for the keyed time series. Runs without any matching time
+          series are omitted.
+        """
+        result = {}
+        for run_name, accumulator in self._accumulator_items:
+            tag_to_metadata = accumulator.SummaryMetadataForPlugin(
+                plugin_name, data_class
+            )
+            if tag_to_metadata:
+                result[run_name] = tag_to_metadata
+        return result
+
     def Runs(self):
         """Return all the run names in the `EventMultiplexer`.
 
@@ -499,11 +569,21 @@ class EventMultiplexer:
                       graph: true, meta_graph: true}}
         ```
         """
-        with self._accumulators_mutex:
-            # To avoid nested locks, we construct a copy of the run-accumulator map
-            items = list(self._accumulators.items())
+        items = self._accumulator_items
         return {run_name: accumulator.Tags() for run_name, accumulator in items}
 
+    def RunGenerations(self):
+        """Returns a dict mapping run names to their current generations.
+
+        A run's generation changes whenever its data does; see
+        `EventAccumulator.Generation`.
+        """
+        items = self._accumulator_items
+        return {
+            run_name: accumulator.Generation()
+            for run_name, accumulator in items
+        }
+
     def RunPaths(self):
         """Returns a dict mapping run names to event file paths."""
         return self._paths
@@ -520,5 +600,6 @@ class EventMultiplexer:
         Raises:
           KeyError: If run does not exist.
         """
-        with self._accumulators_mutex:
-            return self._accumulators[run]
+        # Reading from a dict is atomic, so this does not need to take
+        # `_accumulators_mutex`, which only serializes writers.
+        return self._accumulators[run]
@@ -70,6 +70,9 @@ class _FakeAccumulator:
     def GetSourceWriter(self):
         return "%s_writer" % self._path
 
+    def Generation(self):
+        return "%s_generation" % self._path
+
     def _TagHelper(self, tag_name, enum):
         if tag_name not in self.Tags()[enum]:
             raise KeyError
@@ -78,6 +81,9 @@ class _FakeAccumulator:
     def Tensors(self, tag_name):
         return self._TagHelper(tag_name, event_accumulator.TENSORS)
 
+    def LastTensor(self, tag_name):
+        return self._TagHelper(tag_name, event_accumulator.TENSORS)[-1]
+
     def ActivePlugins(self):
         return ["%s_plugin" % (self._path,)]
 
@@ -91,6 +97,11 @@ class _FakeAccumulator:
             ].items()
         }
 
+    def SummaryMetadataForPlugin(self, plugin_name, data_class):
+        if (plugin_name, data_class) != ("%s_plugin" % self._path, 1):
+            return {}
+        return {"%s_tag" % self._path: "%s_metadata" % self._path}
+
     def Reload(self):
         self.reload_called = True
 
@@ -141,6 +152,15 @@ class EventMultiplexerTest(tf.test.TestCase):
         self.assertTrue(x.GetAccumulator("run1").reload_called)
         self.assertTrue(x.GetAccumulator("run2").reload_called)
 
+    def testRunGenerations(self):
+        x = event_multiplexer.EventMultiplexer(
+            {"run1": "path1", "run2": "path2"}
+        )
+        self.assertEqual(
+            x.RunGenerations(),
+            {"run1": "path1_generation", "run2": "path2_generation"},
+        )
+
     def testGetSourceWriter(self):
         x = event_multiplexer.EventMultiplexer(
             {"run1": "path1", "run2": "path2"}
@@ -175,6 +195,17 @@ class EventMultiplexerTest(tf.test.TestCase):
             x.PluginRunToTagToContent("baz_plugin"),
         )
 
+    def testSummaryMetadataForPlugin(self):
+        x = event_multiplexer.EventMultiplexer(
+            {"run1": "path1", "run2": "path2"}
+        )
+        self.assertEqual(
+            {"run1": {"path1_tag": "path1_metadata"}},
+            x.SummaryMetadataForPlugin("path1_plugin", 1),
+        )
+        self.assertEqual({}, x.SummaryMetadataForPlugin("path1_plugin", 2))
+        self.assertEqual({}, x.SummaryMetadataForPlugin("baz_plugin", 1))
+
     def testExceptions(self):
         """KeyError should be raised when accessing non-existing keys."""
         x = event_multiplexer.EventMultiplexer(
@@ -182,6 +213,8 @@ class EventMultiplexerTest(tf.test.TestCase):
         )
         with self.assertRaises(KeyError):
             x.Tensors("sv1", "xxx")
+        with self.assertRaises(KeyError):
+            x.LastTensor("sv1", "xxx")
 
     def testInitialization(self):
         """Tests EventMultiplexer is created properly with its params."""
@@ -460,6 +493,36 @@ class EventMultiplexerWithRealAccumulatorTest(tf.test.TestCase):
         shutil.rmtree(os.path.join(tmpdir, "run2"))
         x.Reload()
         self.assertNotIn("run2", x.Runs().keys())
+        self.assertNotIn("run2", x.IngestionMetrics().AsDict()["runs"])
+
+    def testIngestionMetrics(self):
+        multiplexer = event_multiplexer.EventMultiplexer(
+            event_file_active_filter=lambda timestamp: True
+        )
+        logdir = self.get_temp_dir()
+        run_path = os.path.join(logdir, "run1")
+        with test_util.FileWriter(run_path, filename_suffix=".a") as writer:
+            writer.add_test_summary("a", step=1)
+        with test_util.FileWriter(run_path, filename_suffix=".b") as writer:
+            writer.add_test_summary("b", step=1)
+            writer.add_test_summary("b", step=2)
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        multiplexer.Reload()
+
+        run = multiplexer.IngestionMetrics().AsDict()["runs"]["run1"]
+        self.assertEqual(run["reloads"], 2)
+        # Each file starts with a file version event.
+        self.assertEqual(run["records_read"], 5)
+        self.assertEqual(run["events_processed"], 5)
+        self.assertGreater(run["bytes_read"], 0)
+        self.assertEqual(
+            sorted(f["records_read"] for f in run["files"].values()), [2, 3]
+        )
+        self.assertEqual(
+            sum(f["bytes_read"] for f in run["files"].values()),
+            sum(os.path.getsize(path) for path in run["files"]),
+        )
 
     def _add3RunsToMultiplexer(self, logdir, multiplexer):
         """Creates and adds 3 runs to the multiplexer."""
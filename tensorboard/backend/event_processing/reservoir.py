@@ -78,8 +78,9 @@ class Reservoir:
                 size, random.Random(seed), always_keep_last
             )
         )
-        # _mutex guards the keys - creating new keys, retrieving by key, etc
-        # the internal items are guarded by the ReservoirBuckets' internal mutexes
+        # _mutex guards the keys - creating new keys, etc. Retrieving by key
+        # does not take it, as reading from a dict is atomic. The internal
+        # items are guarded by the ReservoirBuckets' internal mutexes.
         self._mutex = threading.Lock()
         self.size = size
         self.always_keep_last = always_keep_last
@@ -103,12 +104,14 @@ class Reservoir:
           KeyError: If the key is not found in the reservoir.
 
         Returns:
-          [list, of, items] associated with that key.
+          [list, of, items] associated with that key. The list is a snapshot
+          that may be shared with other callers, and must not be modified.
         """
-        with self._mutex:
-            if key not in self._buckets:
-                raise KeyError("Key %s was not found in Reservoir" % key)
-            bucket = self._buckets[key]
+        # Use `get` rather than indexing, so as not to create a bucket
+        # through the `defaultdict`.
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            raise KeyError("Key %s was not found in Reservoir" % key)
         return bucket.Items()
 
     def AddItem(self, key, item, f=lambda x: x):
@@ -165,6 +168,11 @@ class _ReservoirBucket:
     """A container for items from a stream, that implements reservoir sampling.
 
     It always stores the most recent item as its final item.
+
+    Reads are copy-on-write: `Items` returns an immutable snapshot of the
+    bucket, which is shared by all readers until the next modification.
+    Readers thus neither take the mutex nor copy the items unless the bucket
+    has changed since the last snapshot was taken.
     """
 
     def __init__(self, _max_size, _random=None, always_keep_last=True):
@@ -189,6 +197,9 @@ class _ReservoirBucket:
         # This mutex protects the internal items, ensuring that calls to Items and
         # AddItem are thread-safe
         self._mutex = threading.Lock()
+        # Snapshot of `items` as returned by `Items`, or `None` if `items` has
+        # been modified since it was taken. Only replaced under `_mutex`.
+        self._snapshot = []
         self._max_size = _max_size
         self._num_items_seen = 0
         if _random is not None:
@@ -227,6 +238,7 @@ class _ReservoirBucket:
                 elif self.always_keep_last:
                     self.items[-1] = f(item)
             self._num_items_seen += 1
+            self._snapshot = None
 
     def FilterItems(self, filterFn):
         """Filter items in a ReservoirBucket, using a filtering function.
@@ -251,6 +263,8 @@ class _ReservoirBucket:
             size_before = len(self.items)
             self.items = list(filter(filterFn, self.items))
             size_diff = size_before - len(self.items)
+            if size_diff:
+                self._snapshot = None
 
             # Estimate a correction the number of items seen
             prop_remaining = (
@@ -262,6 +276,15 @@ class _ReservoirBucket:
             return size_diff
 
     def Items(self):
-        """Get all the items in the bucket."""
+        """Get all the items in the bucket.
+
+        Returns:
+          A list of the items, which must not be modified.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
         with self._mutex:
-            return list(self.items)
+            if self._snapshot is None:
+                self._snapshot = list(self.items)
+            return self._snapshot
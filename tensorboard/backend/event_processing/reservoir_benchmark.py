@@ -0,0 +1,183 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks scalar reads from the data provider during ingestion.
+
+This simulates request handler threads reading time series while the
+reload thread is loading new events into them. An ingestion thread
+appends batches of scalar events for a set of tags to an event file,
+and reloads the multiplexer after each batch, as the reload thread does
+on each cycle; meanwhile, a number of reader threads repeatedly read a
+random tag through `MultiplexerDataProvider.read_scalars`, as the
+scalars plugin does. The latency of each read is recorded, and the
+percentiles are reported for each number of reader threads.
+"""
+
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+
+
+from absl import app
+from absl import logging
+import numpy as np
+
+from tensorboard import context
+from tensorboard.backend.event_processing import data_provider
+from tensorboard.backend.event_processing import plugin_event_multiplexer
+from tensorboard.compat.proto import event_pb2
+from tensorboard.data import provider
+from tensorboard.plugins.scalar import metadata as scalar_metadata
+from tensorboard.plugins.scalar import summary_v2 as scalar_summary
+from tensorboard.summary.writer import event_file_writer
+from tensorboard.util import benchmark_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+_NUM_TAGS = 16
+_RESERVOIR_SIZE = 1000
+_WRITER_BATCH_SIZE = 100
+_READS_PER_THREAD = 500
+
+
+def _write_events(writer, start_step, count):
+    """Write `count` scalar events, cycling through the tags."""
+    for step in range(start_step, start_step + count):
+        tag = "tag_%d" % (step % _NUM_TAGS)
+        writer.add_event(
+            event_pb2.Event(
+                wall_time=time.time(),
+                step=step,
+                summary=scalar_summary.scalar_pb(tag, float(step)),
+            )
+        )
+    writer.flush()
+    return start_step + count
+
+
+def _ingest(writer, multiplexer, step, stop_event, reloads):
+    """Write and load batches of events until `stop_event` is set."""
+    while not stop_event.is_set():
+        step = _write_events(writer, step, _WRITER_BATCH_SIZE)
+        multiplexer.Reload()
+        reloads.append(step)
+
+
+def _read(source, latencies):
+    """Time `_READS_PER_THREAD` reads of random tags, appending to `latencies`."""
+    rng = random.Random()
+    ctx = context.RequestContext()
+    for _ in range(_READS_PER_THREAD):
+        tag = "tag_%d" % rng.randrange(_NUM_TAGS)
+        start_time = time.perf_counter()
+        source.read_scalars(
+            ctx,
+            experiment_id="",
+            plugin_name=scalar_metadata.PLUGIN_NAME,
+            downsample=_RESERVOIR_SIZE,
+            run_tag_filter=provider.RunTagFilter(tags=[tag]),
+        )
+        latencies.append(time.perf_counter() - start_time)
+
+
+def bench(reader_count):
+    """Read through a data provider on `reader_count` threads during ingestion.
+
+    Returns:
+      A tuple `(latencies, reloads)` of a 1D `np.ndarray` of read
+      latencies, in seconds, and the number of reloads that ran
+      concurrently with the reads.
+    """
+    logdir = tempfile.mkdtemp(prefix="reservoir_benchmark-")
+    try:
+        writer = event_file_writer.EventFileWriter(
+            os.path.join(logdir, "train")
+        )
+        step = _write_events(writer, 0, _NUM_TAGS * _RESERVOIR_SIZE)
+        multiplexer = plugin_event_multiplexer.EventMultiplexer(
+            tensor_size_guidance={scalar_metadata.PLUGIN_NAME: _RESERVOIR_SIZE}
+        )
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        source = data_provider.MultiplexerDataProvider(multiplexer, logdir)
+
+        stop_event = threading.Event()
+        reloads = []
+        ingester = threading.Thread(
+            target=_ingest,
+            args=(writer, multiplexer, step, stop_event, reloads),
+        )
+        latencies = [[] for _ in range(reader_count)]
+        readers = [
+            threading.Thread(target=_read, args=(source, latencies[i]))
+            for i in range(reader_count)
+        ]
+        ingester.start()
+        for thread in readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+        stop_event.set()
+        ingester.join()
+        writer.close()
+        return (
+            np.concatenate([np.array(x) for x in latencies]),
+            len(reloads),
+        )
+    finally:
+        shutil.rmtree(logdir)
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    random.seed(0)
+
+    reader_counts = [1, 2, 4, 8, 16]
+
+    logger.info("Warming up...")
+    bench(1)
+
+    logger.info("Running...")
+    headers = (
+        "READERS",
+        "RELOADS",
+        "P50_USEC",
+        "P90_USEC",
+        "P99_USEC",
+        "MAX_USEC",
+    )
+    logger.info(benchmark_util.format_line(headers, headers))
+    for reader_count in reader_counts:
+        (latencies, reloads) = bench(reader_count)
+        latencies = latencies * 1e6
+        (p50, p90, p99) = np.percentile(latencies, [50, 90, 99])
+        fields = (
+            reader_count,
+            reloads,
+            float(p50),
+            float(p90),
+            float(p99),
+            float(latencies.max()),
+        )
+        logger.info(benchmark_util.format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -189,6 +189,24 @@ class ReservoirBucketTest(tf.test.TestCase):
             int(round(10000 * (1 - float(num_removed) / 100))),
         )
 
+    def testItemsSnapshotIsSharedUntilModified(self):
+        b = reservoir._ReservoirBucket(100)
+        for i in range(5):
+            b.AddItem(i)
+        snapshot = b.Items()
+        self.assertIs(snapshot, b.Items())
+
+        b.AddItem(5)
+        self.assertEqual(snapshot, [0, 1, 2, 3, 4])
+        self.assertEqual(b.Items(), [0, 1, 2, 3, 4, 5])
+
+        snapshot = b.Items()
+        b.FilterItems(lambda x: True)
+        self.assertIs(snapshot, b.Items())
+        b.FilterItems(lambda x: x % 2 == 0)
+        self.assertEqual(snapshot, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(b.Items(), [0, 2, 4])
+
     def testLazyFunctionEvaluationAndAlwaysKeepLast(self):
         class FakeRandom:
             def randint(self, a, b):  # pylint:disable=unused-argument
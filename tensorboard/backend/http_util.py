@@ -17,11 +17,13 @@
 
 import gzip
 import io
+import itertools
 import json
 import re
 import struct
 import time
 import wsgiref.handlers
+import zlib
 
 import werkzeug
 
@@ -190,13 +192,7 @@ def Respond(
     headers.append(("X-Content-Type-Options", "nosniff"))
     if content_encoding:
         headers.append(("Content-Encoding", content_encoding))
-    if expires > 0:
-        e = wsgiref.handlers.format_date_time(time.time() + float(expires))
-        headers.append(("Expires", e))
-        headers.append(("Cache-Control", "private, max-age=%d" % expires))
-    else:
-        headers.append(("Expires", "0"))
-        headers.append(("Cache-Control", "no-cache, must-revalidate"))
+    headers.extend(_caching_headers(expires))
     if mimetype == _HTML_MIMETYPE:
         frags = (
             _CSP_SCRIPT_DOMAINS_WHITELIST
@@ -259,6 +255,118 @@ def Respond(
     )
 
 
+def RespondStream(
+    request,
+    chunks,
+    content_type,
+    content_length=None,
+    code=200,
+    expires=0,
+    headers=None,
+):
+    """Construct a werkzeug Response that streams its body.
+
+    Unlike `Respond`, the body need never be held in memory all at once:
+    each element of `chunks` is sent as it is produced. This is meant for
+    large payloads, so the content is never transcoded. As in `Respond`,
+    textual content is gzipped if the browser supports it, here as it is
+    streamed; the compressed length is not known in advance, so no
+    Content-Length header is sent in that case. Caching also behaves as in
+    `Respond`.
+
+    Args:
+      request: A werkzeug Request object.
+      chunks: An iterable of byte strings that make up the payload, in
+        the charset of `content_type` if it is textual.
+      content_type: Media type and optionally a charset. Textual content
+        without a charset is assumed to be UTF-8.
+      content_length: Total length of `chunks` in bytes, or `None` if not
+        known in advance, in which case no Content-Length header is sent.
+      code: Numeric HTTP status code to use.
+      expires: Second duration for browser caching.
+      headers: Any additional headers to include on the response, as a
+        list of key-value tuples.
+
+    Returns:
+      A werkzeug Response object (a WSGI application).
+    """
+    mimetype = _EXTRACT_MIMETYPE_PATTERN.search(content_type).group(0)
+    charset_match = _EXTRACT_CHARSET_PATTERN.search(content_type)
+    textual = charset_match or mimetype in _TEXTUAL_MIMETYPES
+    if textual and not charset_match and mimetype not in _JSON_MIMETYPES:
+        content_type += "; charset=utf-8"
+    headers = list(headers or [])
+    if textual and _ALLOWS_GZIP_PATTERN.search(
+        request.headers.get("Accept-Encoding", "")
+    ):
+        chunks = _gzip_chunks(chunks)
+        content_length = None
+        headers.append(("Content-Encoding", "gzip"))
+    if content_length is not None:
+        headers.append(("Content-Length", str(content_length)))
+    headers.append(("X-Content-Type-Options", "nosniff"))
+    headers.extend(_caching_headers(expires))
+    if request.method == "HEAD":
+        chunks = None
+    return werkzeug.wrappers.Response(
+        response=chunks,
+        status=code,
+        headers=headers,
+        content_type=content_type,
+        direct_passthrough=True,
+    )
+
+
+def peek_stream(chunks):
+    """Reads the start of a stream of byte strings for `RespondStream`.
+
+    Reads ahead at most two chunks, so that the caller can inspect the
+    first one (e.g., to sniff a media type) and, when the stream turns
+    out to have only one chunk, send its length as a Content-Length
+    header.
+
+    Args:
+      chunks: An iterable of byte strings.
+
+    Returns:
+      A tuple `(head, chunks, content_length)`, where `head` is the first
+      chunk (or `b""` for an empty stream), `chunks` is an iterable of
+      all the original chunks including `head`, and `content_length` is
+      the total length of the stream if known or else `None`.
+    """
+    chunks = iter(chunks)
+    head = next(chunks, b"")
+    second = next(chunks, None)
+    if second is None:
+        return (head, (head,), len(head))
+    return (head, itertools.chain((head, second), chunks), None)
+
+
+def _gzip_chunks(chunks):
+    """Gzips a stream of byte strings, as `Respond` does a whole payload."""
+    # Same compression level as `Respond`; wbits=31 writes a gzip header.
+    compressor = zlib.compressobj(3, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _caching_headers(expires):
+    """Returns the headers for `Respond`'s `expires` parameter."""
+    if expires > 0:
+        e = wsgiref.handlers.format_date_time(time.time() + float(expires))
+        return [
+            ("Expires", e),
+            ("Cache-Control", "private, max-age=%d" % expires),
+        ]
+    return [
+        ("Expires", "0"),
+        ("Cache-Control", "no-cache, must-revalidate"),
+    ]
+
+
 def _create_csp_string(*csp_fragments):
     csp_string = " ".join([frag for frag in csp_fragments if frag])
     return csp_string if csp_string else "'none'"
@@ -351,6 +351,94 @@ def _gzip(bs):
     return out.getvalue()
 
 
+class RespondStreamTest(tb_test.TestCase):
+    def testStreamsChunks(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        consumed = []
+
+        def chunks():
+            for chunk in (b"hello", b" ", b"world"):
+                consumed.append(chunk)
+                yield chunk
+
+        r = http_util.RespondStream(
+            q, chunks(), "application/octet-stream", content_length=11
+        )
+        self.assertEqual(consumed, [])
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.headers.get("Content-Length"), "11")
+        self.assertEqual(r.headers.get("Expires"), "0")
+        self.assertEqual(b"".join(r.response), b"hello world")
+
+    def testUnknownLength_omitsContentLength(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        r = http_util.RespondStream(q, [b"abc"], "application/octet-stream")
+        self.assertIsNone(r.headers.get("Content-Length"))
+        self.assertEqual(b"".join(r.response), b"abc")
+
+    def testTextual_gzipsWhenAccepted(self):
+        q = wrappers.Request(
+            wtest.EnvironBuilder(
+                headers={"Accept-Encoding": "gzip"}
+            ).get_environ()
+        )
+        chunks = [b"a\tb\n" * 1000, b"c\td\n" * 1000]
+        r = http_util.RespondStream(
+            q, iter(chunks), "text/plain", content_length=8000
+        )
+        self.assertEqual(r.headers.get("Content-Encoding"), "gzip")
+        self.assertEqual(
+            r.headers.get("Content-Type"), "text/plain; charset=utf-8"
+        )
+        self.assertIsNone(r.headers.get("Content-Length"))
+        self.assertEqual(_gunzip(b"".join(r.response)), b"".join(chunks))
+
+    def testTextual_notGzippedWhenNotAccepted(self):
+        q = wrappers.Request(wtest.EnvironBuilder().get_environ())
+        r = http_util.RespondStream(
+            q, [b"hello"], "text/plain", content_length=5
+        )
+        self.assertIsNone(r.headers.get("Content-Encoding"))
+        self.assertEqual(r.headers.get("Content-Length"), "5")
+        self.assertEqual(b"".join(r.response), b"hello")
+
+    def testHeadRequest_doesNotWrite(self):
+        q = wrappers.Request(wtest.EnvironBuilder(method="HEAD").get_environ())
+        r = http_util.RespondStream(
+            q, [b"abc"], "application/octet-stream", content_length=3
+        )
+        self.assertEqual(r.headers.get("Content-Length"), "3")
+        self.assertEqual(r.response, [])
+
+
+class PeekStreamTest(tb_test.TestCase):
+    def testSingleChunk_knowsLength(self):
+        (head, chunks, length) = http_util.peek_stream(iter([b"hello"]))
+        self.assertEqual(head, b"hello")
+        self.assertEqual(list(chunks), [b"hello"])
+        self.assertEqual(length, 5)
+
+    def testEmpty(self):
+        (head, chunks, length) = http_util.peek_stream(iter([]))
+        self.assertEqual(head, b"")
+        self.assertEqual(b"".join(chunks), b"")
+        self.assertEqual(length, 0)
+
+    def testManyChunks_readsAheadOnlyTwo(self):
+        consumed = []
+
+        def source():
+            for chunk in (b"ab", b"cd", b"ef"):
+                consumed.append(chunk)
+                yield chunk
+
+        (head, chunks, length) = http_util.peek_stream(source())
+        self.assertEqual(head, b"ab")
+        self.assertIsNone(length)
+        self.assertEqual(consumed, [b"ab", b"cd"])
+        self.assertEqual(list(chunks), [b"ab", b"cd", b"ef"])
+
+
 def _gunzip(bs):
     with gzip.GzipFile(fileobj=io.BytesIO(bs), mode="rb") as f:
         return f.read()
@@ -0,0 +1,204 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Deferred importing and construction of TensorBoard plugins.
+
+Importing a plugin module can be slow, since it may pull in large
+dependencies and protos, and constructing a plugin may do further work.
+A `LazyLoader` names a plugin class by module and attribute instead, and
+loads a stand-in plugin that only imports and constructs the real one
+the first time it is needed: when one of its routes is requested, or
+when TensorBoard asks whether it is active or how to render it. This
+keeps that cost off the path to the server binding its port.
+"""
+
+import collections
+import importlib
+import threading
+
+from werkzeug import wrappers
+
+from tensorboard import context as context_lib
+from tensorboard.backend import application
+from tensorboard.backend import http_util
+from tensorboard.plugins import base_plugin
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+
+class LazyLoader(base_plugin.TBLoader):
+    """TBLoader for a plugin class that is imported on first use.
+
+    The plugin class is constructed with the `TBContext` like a plugin
+    given to `BasicLoader`. It must not define command-line flags, and
+    must not be an `ExperimentalPlugin`, since neither can be known
+    without importing it.
+    """
+
+    def __init__(self, plugin_name, module_name, class_name):
+        """Creates a loader for a plugin class.
+
+        Args:
+          plugin_name: The `plugin_name` of the plugin class, which must
+            be known without importing it.
+          module_name: Fully qualified name of the module that defines
+            the plugin class.
+          class_name: Name of the plugin class within that module.
+        """
+        self.plugin_name = plugin_name
+        self.module_name = module_name
+        self.class_name = class_name
+
+    def plugin_class(self):
+        """Imports and returns the plugin class."""
+        module = importlib.import_module(self.module_name)
+        return getattr(module, self.class_name)
+
+    def load(self, context):
+        return _LazyPlugin(self, context)
+
+    def __repr__(self):
+        return "LazyLoader(%r, %r, %r)" % (
+            self.plugin_name,
+            self.module_name,
+            self.class_name,
+        )
+
+
+class _LazyPlugin(base_plugin.TBPlugin):
+    """Stands in for a plugin until it is first used.
+
+    Attributes other than those of `TBPlugin` are read from the real
+    plugin, so other plugins that find this one in the `TBContext`'s
+    `plugin_name_to_instance` can call its methods as usual.
+    """
+
+    def __init__(self, loader, context):
+        self.plugin_name = loader.plugin_name
+        self._loader = loader
+        self._context = context
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._plugin = None
+        self._routes = None
+
+    def _load(self):
+        """Returns the real plugin, or `None` if it failed to load."""
+        if self._loaded:
+            return self._plugin
+        with self._lock:
+            if not self._loaded:
+                try:
+                    plugin = self._loader.plugin_class()(self._context)
+                    routes = _Routes(plugin.get_plugin_apps())
+                except Exception:
+                    logger.error(
+                        "Failed to load plugin %r; ignoring it.",
+                        self._loader,
+                        exc_info=True,
+                    )
+                    plugin = None
+                    routes = _Routes({})
+                self._plugin = plugin
+                self._routes = routes
+                self._loaded = True
+        return self._plugin
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the stand-in itself.
+        # Private names are never forwarded, which also keeps lookups of
+        # this object's own state from recursing before `__init__` runs.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        plugin = self._load()
+        if plugin is None:
+            raise AttributeError(name)
+        return getattr(plugin, name)
+
+    def get_plugin_apps(self):
+        # Route within this plugin's prefix once the plugin is loaded.
+        return {"/*": self._serve}
+
+    def _serve(self, environ, start_response):
+        self._load()
+        request = wrappers.Request(environ)
+        path = request.path.rstrip("/")
+        mount = "%s%s/%s" % (
+            application.DATA_PREFIX,
+            application.PLUGIN_PREFIX,
+            self.plugin_name,
+        )
+        (route, app) = self._routes.get(path[len(mount) :] or "/")
+        if app is None:
+            logger.warning("path %s not found, sending 404", request.path)
+            app = http_util.Respond(
+                request, "Not found", "text/plain", code=404
+            )
+        else:
+            # The router only saw this plugin's catch-all route; report
+            # metrics under the route that the real plugin matched.
+            record = context_lib.from_environ(environ).request_record
+            if record is not None:
+                record.refine_route(mount + route)
+        return app(environ, start_response)
+
+    def is_active(self):
+        plugin = self._load()
+        return plugin is not None and plugin.is_active()
+
+    def frontend_metadata(self):
+        plugin = self._load()
+        if plugin is None:
+            return base_plugin.FrontendMetadata()
+        return plugin.frontend_metadata()
+
+    def data_plugin_names(self):
+        plugin = self._load()
+        if plugin is None:
+            return ()
+        return plugin.data_plugin_names()
+
+
+class _Routes:
+    """Matches routes as `TensorBoardWSGI` does, within one plugin."""
+
+    def __init__(self, plugin_apps):
+        self._exact = {}
+        prefixes = {}
+        for route, app in plugin_apps.items():
+            if route.endswith("/*"):
+                prefixes[route[:-1]] = app
+            else:
+                self._exact[route] = app
+        # Longest first, so that more specific routes take precedence.
+        self._prefixes = collections.OrderedDict(
+            sorted(prefixes.items(), key=lambda x: len(x[0]), reverse=True)
+        )
+
+    def get(self, route):
+        """Matches a route.
+
+        Returns:
+          A tuple `(pattern, app)` of the matching route pattern, such as
+          `"/files/*"`, and its app, or `(None, None)` if none matches.
+        """
+        app = self._exact.get(route)
+        if app is not None:
+            return (route, app)
+        for prefix, app in self._prefixes.items():
+            if route.startswith(prefix):
+                return (prefix + "*", app)
+        return (None, None)
@@ -0,0 +1,125 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of TensorBoard startup cost attributable to each plugin.
+
+Each measurement runs in a fresh interpreter, so that modules imported
+by one measurement do not make another look cheap. For each lazily
+loaded default plugin, this reports the time to import its module once
+`tensorboard.program` (which every TensorBoard process imports) has
+been imported. It then reports the time to build the WSGI app from the
+default plugins, as TensorBoard does before binding its port, both with
+plugins loaded lazily and with all of them loaded up front.
+"""
+
+
+import subprocess
+import sys
+
+
+from absl import app
+from absl import logging
+
+from tensorboard import default
+from tensorboard.backend import lazy_plugin
+from tensorboard.util import benchmark_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+_TRIALS = 3
+
+# Prints the seconds taken to import module `sys.argv[1]`.
+_IMPORT_SCRIPT = """
+import importlib
+import sys
+import time
+
+import tensorboard.program
+
+start_time = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print(time.perf_counter() - start_time)
+"""
+
+# Prints the seconds taken to build the default app; loads all plugins
+# up front if `sys.argv[1]` is "eager".
+_STARTUP_SCRIPT = """
+import argparse
+import sys
+import time
+
+start_time = time.perf_counter()
+from tensorboard import default
+from tensorboard.backend import application
+
+flags = argparse.Namespace(
+    logdir="",
+    path_prefix="",
+    samples_per_plugin={},
+    window_title="",
+    reload_interval=0,
+    load_fast="false",
+)
+app = application.TensorBoardWSGIApp(flags, default.get_static_plugins())
+if sys.argv[1] == "eager":
+    for plugin in app._plugins:
+        plugin.data_plugin_names()
+print(time.perf_counter() - start_time)
+"""
+
+
+def _min_secs(script, arg):
+    """Runs `script` with `arg` in fresh interpreters; returns the fastest."""
+    return min(
+        float(
+            subprocess.check_output(
+                [sys.executable, "-c", script, arg],
+                stderr=subprocess.DEVNULL,
+            )
+        )
+        for _ in range(_TRIALS)
+    )
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.WARNING)
+    loaders = [
+        p
+        for p in default.get_static_plugins()
+        if isinstance(p, lazy_plugin.LazyLoader)
+    ]
+    rows = [
+        (loader.plugin_name, _min_secs(_IMPORT_SCRIPT, loader.module_name))
+        for loader in loaders
+    ]
+    rows.sort(key=lambda row: row[1], reverse=True)
+    headers = ("PLUGIN         ", "IMPORT_SECS")
+    logger.warning(benchmark_util.format_line(headers, headers))
+    for row in rows:
+        logger.warning(benchmark_util.format_line(headers, row))
+
+    headers = ("PLUGINS", "STARTUP_SECS")
+    logger.warning(benchmark_util.format_line(headers, headers))
+    for mode in ("lazy", "eager"):
+        logger.warning(
+            benchmark_util.format_line(
+                headers, (mode, _min_secs(_STARTUP_SCRIPT, mode))
+            )
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
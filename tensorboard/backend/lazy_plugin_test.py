@@ -0,0 +1,175 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.backend.lazy_plugin`."""
+
+import argparse
+import json
+
+from werkzeug import test as werkzeug_test
+from werkzeug import wrappers
+
+from tensorboard import test as tb_test
+from tensorboard.backend import application
+from tensorboard.backend import lazy_plugin
+from tensorboard.plugins import base_plugin
+
+
+# Appended to by `_FakePlugin` on construction.
+_constructions = []
+
+
+class _FakePlugin(base_plugin.TBPlugin):
+    plugin_name = "fake"
+
+    def __init__(self, context):
+        _constructions.append(context)
+
+    def get_plugin_apps(self):
+        return {
+            "/exact": _respond("exact"),
+            "/files/*": _respond("files"),
+            "/files/special/*": _respond("special"),
+        }
+
+    def is_active(self):
+        return True
+
+    def frontend_metadata(self):
+        return base_plugin.FrontendMetadata(element_name="tf-fake-dashboard")
+
+    def greeting(self):
+        return "hello"
+
+
+class _BrokenPlugin(base_plugin.TBPlugin):
+    plugin_name = "broken"
+
+    def __init__(self, context):
+        raise RuntimeError("cannot construct")
+
+
+def _respond(body):
+    @wrappers.Request.application
+    def app(request):
+        return wrappers.Response(body)
+
+    return app
+
+
+def _flags():
+    return argparse.Namespace(
+        logdir="",
+        path_prefix="",
+        samples_per_plugin={},
+        window_title="",
+        reload_interval=0,
+    )
+
+
+class LazyPluginTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        del _constructions[:]
+
+    def _app(self, *loaders):
+        app = application.TensorBoardWSGIApp(_flags(), list(loaders))
+        return werkzeug_test.Client(app, wrappers.Response)
+
+    def test_constructs_on_first_request(self):
+        loader = lazy_plugin.LazyLoader("fake", __name__, "_FakePlugin")
+        server = self._app(loader)
+        self.assertEqual(_constructions, [])
+
+        response = server.get("/data/plugin/fake/exact")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(), b"exact")
+        self.assertLen(_constructions, 1)
+
+        server.get("/data/plugin/fake/exact")
+        self.assertLen(_constructions, 1)
+
+    def test_routes(self):
+        loader = lazy_plugin.LazyLoader("fake", __name__, "_FakePlugin")
+        server = self._app(loader)
+
+        def get(path):
+            response = server.get("/data/plugin/fake" + path)
+            return (response.status_code, response.get_data())
+
+        self.assertEqual(get("/exact/"), (200, b"exact"))
+        self.assertEqual(get("/files/a/b"), (200, b"files"))
+        self.assertEqual(get("/files/special/c"), (200, b"special"))
+        self.assertEqual(get("/nope")[0], 404)
+        self.assertEqual(get("/exactly")[0], 404)
+
+    def test_request_metrics_routes(self):
+        loader = lazy_plugin.LazyLoader("fake", __name__, "_FakePlugin")
+        server = self._app(loader)
+        for path in ("/exact", "/files/a", "/files/special/b"):
+            # Requests are recorded once their responses are closed.
+            server.get("/data/plugin/fake" + path).close()
+
+        response = server.get("/data/request_metrics")
+        routes = json.loads(response.get_data())["routes"]
+        for route in (
+            "/data/plugin/fake/exact",
+            "/data/plugin/fake/files/*",
+            "/data/plugin/fake/files/special/*",
+        ):
+            self.assertEqual(routes[route]["count"], 1, route)
+            self.assertEqual(routes[route]["in_flight"], 0, route)
+        self.assertNotIn("/data/plugin/fake/*", routes)
+
+    def test_plugins_listing(self):
+        loader = lazy_plugin.LazyLoader("fake", __name__, "_FakePlugin")
+        server = self._app(loader)
+        response = server.get("/data/plugins_listing")
+        self.assertEqual(response.status_code, 200)
+        listing = json.loads(response.get_data())
+        self.assertTrue(listing["fake"]["enabled"])
+        self.assertEqual(
+            listing["fake"]["loading_mechanism"]["element_name"],
+            "tf-fake-dashboard",
+        )
+
+    def test_forwards_attributes(self):
+        loader = lazy_plugin.LazyLoader("fake", __name__, "_FakePlugin")
+        plugin = loader.load(base_plugin.TBContext())
+        self.assertEqual(plugin.plugin_name, "fake")
+        self.assertEqual(_constructions, [])
+        self.assertEqual(plugin.greeting(), "hello")
+        with self.assertRaises(AttributeError):
+            plugin._private
+
+    def test_failure_to_load(self):
+        loader = lazy_plugin.LazyLoader("broken", __name__, "_BrokenPlugin")
+        plugin = loader.load(base_plugin.TBContext())
+        with self.assertLogs(level="ERROR"):
+            self.assertFalse(plugin.is_active())
+        self.assertEqual(plugin.data_plugin_names(), ())
+        server = self._app(loader)
+        with self.assertLogs(level="ERROR"):
+            response = server.get("/data/plugin/broken/anything")
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing_module(self):
+        loader = lazy_plugin.LazyLoader("gone", "no_such_module", "Plugin")
+        plugin = loader.load(base_plugin.TBContext())
+        with self.assertLogs(level="ERROR"):
+            self.assertFalse(plugin.is_active())
+
+
+if __name__ == "__main__":
+    tb_test.main()
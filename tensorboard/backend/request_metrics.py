@@ -0,0 +1,413 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Latency and size metrics for HTTP requests and data provider calls.
+
+`RequestMetricsMiddleware` times each request from the moment the server
+calls the application until the response body has been fully sent. It
+stores a `RequestRecord` on the request's `RequestContext`; the router
+names the route that served the request on the record, and an
+`InstrumentedDataProvider` charges the time of each data provider call to
+it. Completed requests are aggregated per route in a `RequestMetrics`.
+"""
+
+
+import bisect
+import threading
+import time
+
+from tensorboard import context
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+# Route name for requests that no route handled, so that requests for
+# arbitrary paths do not create unbounded numbers of series.
+UNMATCHED_ROUTE = "(unmatched)"
+
+# Upper bounds of the buckets of latency histograms, in seconds.
+_LATENCY_BUCKETS_SECS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class _Histogram:
+    """Latency histogram with fixed buckets. Not thread-safe."""
+
+    __slots__ = ("bucket_counts", "count", "total")
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(_LATENCY_BUCKETS_SECS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        self.bucket_counts[
+            bisect.bisect_left(_LATENCY_BUCKETS_SECS, value)
+        ] += 1
+        self.count += 1
+        self.total += value
+
+    def as_dict(self):
+        cumulative = []
+        running = 0
+        bounds = list(_LATENCY_BUCKETS_SECS) + ["+Inf"]
+        for bound, count in zip(bounds, self.bucket_counts):
+            running += count
+            cumulative.append([bound, running])
+        return {
+            "count": self.count,
+            "total_seconds": self.total,
+            "buckets": cumulative,
+        }
+
+
+class _RouteStats:
+    __slots__ = ("latency", "response_bytes", "status_counts", "in_flight")
+
+    def __init__(self):
+        self.latency = _Histogram()
+        self.response_bytes = 0
+        self.status_counts = {}
+        self.in_flight = 0
+
+
+class RequestRecord:
+    """Mutable record of a single request, carried on its `RequestContext`.
+
+    The record is shared by reference among all copies of the request's
+    context and WSGI environment, so that inner layers can annotate it.
+    """
+
+    def __init__(self, metrics):
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self.route = None
+        # Maps data provider method name to `[calls, total_secs]`.
+        self.provider_calls = {}
+
+    def set_route(self, route):
+        """Names the route that is serving this request."""
+        if self.route is None:
+            self.route = route
+            self._metrics._route_started(route)
+
+    def refine_route(self, route):
+        """Renames the route serving this request to a more specific one.
+
+        For apps that route further within a route that the router
+        matched, such as a prefix route for a whole plugin.
+        """
+        if self.route is None:
+            self.set_route(route)
+        elif route != self.route:
+            self._metrics._route_changed(self.route, route)
+            self.route = route
+
+    def add_provider_call(self, method, duration_secs):
+        with self._lock:
+            entry = self.provider_calls.get(method)
+            if entry is None:
+                entry = self.provider_calls[method] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += duration_secs
+
+
+class RequestMetrics:
+    """Aggregated metrics for requests and data provider calls.
+
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+        self._provider_methods = {}
+        self._in_flight = 0
+
+    def _route_stats(self, route):
+        stats = self._routes.get(route)
+        if stats is None:
+            stats = self._routes[route] = _RouteStats()
+        return stats
+
+    def _request_started(self):
+        with self._lock:
+            self._in_flight += 1
+
+    def _route_started(self, route):
+        with self._lock:
+            self._route_stats(route).in_flight += 1
+
+    def _route_changed(self, old_route, new_route):
+        with self._lock:
+            old_stats = self._route_stats(old_route)
+            old_stats.in_flight -= 1
+            if not old_stats.in_flight and not old_stats.latency.count:
+                # Never reported; e.g., a lazy plugin's catch-all route.
+                del self._routes[old_route]
+            self._route_stats(new_route).in_flight += 1
+
+    def _request_finished(self, record, status, response_bytes, latency_secs):
+        with self._lock:
+            self._in_flight -= 1
+            if record.route is None:
+                stats = self._route_stats(UNMATCHED_ROUTE)
+            else:
+                stats = self._route_stats(record.route)
+                stats.in_flight -= 1
+            stats.latency.add(latency_secs)
+            stats.response_bytes += response_bytes
+            stats.status_counts[status] = stats.status_counts.get(status, 0) + 1
+
+    def record_provider_call(self, method, duration_secs):
+        """Records the duration of a call to a data provider method."""
+        with self._lock:
+            histogram = self._provider_methods.get(method)
+            if histogram is None:
+                histogram = self._provider_methods[method] = _Histogram()
+            histogram.add(duration_secs)
+
+    def as_dict(self):
+        """Returns a JSON-serializable snapshot of these metrics."""
+        with self._lock:
+            routes = {}
+            for route, stats in sorted(self._routes.items()):
+                route_dict = stats.latency.as_dict()
+                route_dict["in_flight"] = stats.in_flight
+                route_dict["response_bytes"] = stats.response_bytes
+                route_dict["status_counts"] = {
+                    str(status): count
+                    for (status, count) in sorted(stats.status_counts.items())
+                }
+                routes[route] = route_dict
+            return {
+                "in_flight": self._in_flight,
+                "routes": routes,
+                "data_provider": {
+                    method: histogram.as_dict()
+                    for (method, histogram) in sorted(
+                        self._provider_methods.items()
+                    )
+                },
+            }
+
+    def as_prometheus_text(self):
+        """Returns a snapshot in the Prometheus text exposition format."""
+        snapshot = self.as_dict()
+        lines = []
+
+        def metric(name, metric_type, help_text):
+            lines.append("# HELP %s %s" % (name, help_text))
+            lines.append("# TYPE %s %s" % (name, metric_type))
+
+        def sample(name, value, **labels):
+            if labels:
+                label_text = ",".join(
+                    '%s="%s"' % (k, _escape_label_value(v))
+                    for (k, v) in sorted(labels.items())
+                )
+                name = "%s{%s}" % (name, label_text)
+            lines.append("%s %r" % (name, value))
+
+        def histogram(name, values, **labels):
+            for bound, count in values["buckets"]:
+                sample(name + "_bucket", count, le=str(bound), **labels)
+            sample(name + "_sum", values["total_seconds"], **labels)
+            sample(name + "_count", values["count"], **labels)
+
+        name = "tensorboard_http_requests_in_flight"
+        metric(name, "gauge", "Requests currently being served.")
+        sample(name, snapshot["in_flight"])
+
+        routes = snapshot["routes"]
+        name = "tensorboard_http_request_seconds"
+        metric(name, "histogram", "Time to serve a request, by route.")
+        for route, values in routes.items():
+            histogram(name, values, route=route)
+        name = "tensorboard_http_response_bytes_total"
+        metric(name, "counter", "Bytes of response bodies, by route.")
+        for route, values in routes.items():
+            sample(name, values["response_bytes"], route=route)
+        name = "tensorboard_http_responses_total"
+        metric(name, "counter", "Responses, by route and status code.")
+        for route, values in routes.items():
+            for status, count in values["status_counts"].items():
+                sample(name, count, route=route, code=status)
+        name = "tensorboard_http_route_requests_in_flight"
+        metric(name, "gauge", "Requests currently being served, by route.")
+        for route, values in routes.items():
+            sample(name, values["in_flight"], route=route)
+
+        name = "tensorboard_data_provider_call_seconds"
+        metric(name, "histogram", "Time in data provider calls, by method.")
+        for method, values in snapshot["data_provider"].items():
+            histogram(name, values, method=method)
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value):
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+class RequestMetricsMiddleware:
+    """WSGI middleware recording the latency and size of each request.
+
+    Latency runs until the server closes the response iterable, so it
+    includes the time to stream the response body.
+    """
+
+    def __init__(self, application, metrics, slow_request_secs=None):
+        """Initializes this middleware.
+
+        Args:
+          application: The WSGI application to wrap (see PEP 3333).
+          metrics: A `RequestMetrics` to which requests are reported.
+          slow_request_secs: Optional number of seconds; requests that take
+            longer are logged along with their data provider calls.
+        """
+        self._application = application
+        self._metrics = metrics
+        self._slow_request_secs = slow_request_secs or None
+
+    def __call__(self, environ, start_response):
+        start_time = time.perf_counter()
+        record = RequestRecord(self._metrics)
+        ctx = context.from_environ(environ).replace(request_record=record)
+        context.set_in_environ(environ, ctx)
+        status = []
+
+        def recording_start_response(status_line, headers, exc_info=None):
+            status[:] = [status_line]
+            return start_response(status_line, headers, exc_info)
+
+        self._metrics._request_started()
+        try:
+            body = self._application(environ, recording_start_response)
+        except BaseException:
+            self._finish(environ, record, start_time, "500", 0)
+            raise
+        return _RecordingIterable(
+            body,
+            lambda response_bytes: self._finish(
+                environ,
+                record,
+                start_time,
+                status[0].split(" ", 1)[0] if status else "500",
+                response_bytes,
+            ),
+        )
+
+    def _finish(self, environ, record, start_time, status, response_bytes):
+        latency_secs = time.perf_counter() - start_time
+        self._metrics._request_finished(
+            record, status, response_bytes, latency_secs
+        )
+        if (
+            self._slow_request_secs is not None
+            and latency_secs >= self._slow_request_secs
+        ):
+            provider_calls = ", ".join(
+                "%s x%d %.3fs" % (method, calls, secs)
+                for (method, (calls, secs)) in sorted(
+                    record.provider_calls.items()
+                )
+            )
+            logger.warning(
+                "Slow request: %s %s (route %s) took %.3fs, status %s, "
+                "%d bytes; data provider calls: %s",
+                environ.get("REQUEST_METHOD", ""),
+                environ.get("PATH_INFO", ""),
+                record.route or UNMATCHED_ROUTE,
+                latency_secs,
+                status,
+                response_bytes,
+                provider_calls or "none",
+            )
+
+
+class _RecordingIterable:
+    """Wraps a WSGI response iterable to count bytes until it is closed."""
+
+    def __init__(self, body, on_close):
+        self._body = body
+        self._on_close = on_close
+        self._response_bytes = 0
+        self._closed = False
+
+    def __iter__(self):
+        for chunk in self._body:
+            self._response_bytes += len(chunk)
+            yield chunk
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            close = getattr(self._body, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._on_close(self._response_bytes)
+
+
+class InstrumentedDataProvider:
+    """Wraps a data provider to time each of its public method calls.
+
+    Each call is recorded in a `RequestMetrics`, and also charged to the
+    `RequestRecord` of the `RequestContext` that it was given, if any.
+    All other attribute access is delegated to the wrapped provider.
+    """
+
+    def __init__(self, data_provider, metrics):
+        self._data_provider = data_provider
+        self._metrics = metrics
+
+    def __getattr__(self, name):
+        attr = getattr(self._data_provider, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        metrics = self._metrics
+
+        def timed(*args, **kwargs):
+            ctx = args[0] if args else kwargs.get("ctx")
+            start_time = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                duration_secs = time.perf_counter() - start_time
+                metrics.record_provider_call(name, duration_secs)
+                record = getattr(ctx, "request_record", None)
+                if record is not None:
+                    record.add_provider_call(name, duration_secs)
+
+        return timed
@@ -0,0 +1,206 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.backend.request_metrics`."""
+
+
+import json
+from unittest import mock
+
+import werkzeug
+from werkzeug import test as werkzeug_test
+
+from tensorboard import context
+from tensorboard import test as tb_test
+from tensorboard.backend import request_metrics
+
+
+class _FakeDataProvider:
+    def __init__(self):
+        self.data_location_calls = 0
+
+    def read_scalars(self, ctx=None, *, experiment_id):
+        return {"experiment": experiment_id}
+
+    def data_location(self, ctx=None, *, experiment_id):
+        self.data_location_calls += 1
+        raise ValueError("no location")
+
+    some_constant = 42
+
+
+class RequestMetricsMiddlewareTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.metrics = request_metrics.RequestMetrics()
+        self.provider = request_metrics.InstrumentedDataProvider(
+            _FakeDataProvider(), self.metrics
+        )
+
+    def _app(self, environ, start_response):
+        ctx = context.from_environ(environ)
+        path = environ["PATH_INFO"]
+        if path == "/data/scalars":
+            ctx.request_record.set_route(path)
+            self.provider.read_scalars(ctx, experiment_id="123")
+            self.provider.read_scalars(ctx=ctx, experiment_id="123")
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return [b"hello", b" world"]
+        if path.startswith("/data/plugin/"):
+            ctx.request_record.set_route("/data/plugin/*")
+            ctx.request_record.refine_route(path)
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return [b"plugin"]
+        if path == "/data/broken":
+            ctx.request_record.set_route(path)
+            raise RuntimeError("broken")
+        start_response("404 Not Found", [("Content-Type", "text/plain")])
+        return [b"nope"]
+
+    def _get(self, path, **kwargs):
+        """Fetches `path` and closes the response, as a WSGI server would."""
+        app = request_metrics.RequestMetricsMiddleware(
+            self._app, self.metrics, **kwargs
+        )
+        client = werkzeug_test.Client(app, werkzeug.Response)
+        with client.get(path) as response:
+            response.get_data()
+        return response
+
+    def test_records_routes(self):
+        for _ in range(2):
+            response = self._get("/data/scalars?tag=loss")
+            self.assertEqual(response.get_data(), b"hello world")
+        self._get("/some/random/path")
+        self._get("/another/random/path")
+
+        snapshot = self.metrics.as_dict()
+        self.assertEqual(snapshot["in_flight"], 0)
+        self.assertEqual(
+            sorted(snapshot["routes"]),
+            sorted(["/data/scalars", request_metrics.UNMATCHED_ROUTE]),
+        )
+        scalars = snapshot["routes"]["/data/scalars"]
+        self.assertEqual(scalars["count"], 2)
+        self.assertEqual(scalars["response_bytes"], 22)
+        self.assertEqual(scalars["status_counts"], {"200": 2})
+        self.assertEqual(scalars["in_flight"], 0)
+        self.assertEqual(scalars["buckets"][-1], ["+Inf", 2])
+        unmatched = snapshot["routes"][request_metrics.UNMATCHED_ROUTE]
+        self.assertEqual(unmatched["status_counts"], {"404": 2})
+        self.assertEqual(snapshot["data_provider"]["read_scalars"]["count"], 4)
+        json.dumps(snapshot)
+
+    def test_refines_routes(self):
+        self._get("/data/plugin/a")
+        self._get("/data/plugin/b")
+        snapshot = self.metrics.as_dict()
+        self.assertEqual(
+            sorted(snapshot["routes"]), ["/data/plugin/a", "/data/plugin/b"]
+        )
+        for stats in snapshot["routes"].values():
+            self.assertEqual(stats["count"], 1)
+            self.assertEqual(stats["in_flight"], 0)
+
+    def test_records_exceptions_as_errors(self):
+        with self.assertRaises(RuntimeError):
+            self._get("/data/broken")
+        snapshot = self.metrics.as_dict()
+        self.assertEqual(snapshot["in_flight"], 0)
+        broken = snapshot["routes"]["/data/broken"]
+        self.assertEqual(broken["status_counts"], {"500": 1})
+        self.assertEqual(broken["in_flight"], 0)
+
+    def test_counts_in_flight_until_closed(self):
+        app = request_metrics.RequestMetricsMiddleware(self._app, self.metrics)
+        environ = werkzeug_test.EnvironBuilder(
+            path="/data/scalars"
+        ).get_environ()
+        body = app(environ, lambda status, headers, exc_info=None: None)
+        snapshot = self.metrics.as_dict()
+        self.assertEqual(snapshot["in_flight"], 1)
+        self.assertEqual(snapshot["routes"]["/data/scalars"]["in_flight"], 1)
+        self.assertEqual(b"".join(body), b"hello world")
+        body.close()
+        body.close()
+        snapshot = self.metrics.as_dict()
+        self.assertEqual(snapshot["in_flight"], 0)
+        self.assertEqual(snapshot["routes"]["/data/scalars"]["count"], 1)
+
+    def test_slow_request_log(self):
+        with mock.patch.object(request_metrics.logger, "warning") as warning:
+            self._get("/data/scalars", slow_request_secs=1e9)
+        warning.assert_not_called()
+        with mock.patch.object(request_metrics.logger, "warning") as warning:
+            self._get("/data/scalars", slow_request_secs=1e-9)
+        warning.assert_called_once()
+        message = warning.call_args[0][0] % warning.call_args[0][1:]
+        self.assertIn("/data/scalars", message)
+        self.assertIn("read_scalars x2", message)
+
+    def test_prometheus_text(self):
+        self._get("/data/scalars")
+        lines = self.metrics.as_prometheus_text().splitlines()
+        self.assertIn(
+            "# TYPE tensorboard_http_request_seconds histogram", lines
+        )
+        self.assertIn(
+            'tensorboard_http_request_seconds_count{route="/data/scalars"} 1',
+            lines,
+        )
+        self.assertIn(
+            'tensorboard_http_responses_total{code="200",route="/data/scalars"} 1',
+            lines,
+        )
+        self.assertIn(
+            'tensorboard_http_response_bytes_total{route="/data/scalars"} 11',
+            lines,
+        )
+        self.assertIn(
+            'tensorboard_data_provider_call_seconds_count{method="read_scalars"} 2',
+            lines,
+        )
+
+
+class InstrumentedDataProviderTest(tb_test.TestCase):
+    def test_delegates(self):
+        metrics = request_metrics.RequestMetrics()
+        fake = _FakeDataProvider()
+        provider = request_metrics.InstrumentedDataProvider(fake, metrics)
+        self.assertEqual(provider.some_constant, 42)
+        self.assertEqual(
+            provider.read_scalars(experiment_id="e"), {"experiment": "e"}
+        )
+        with self.assertRaisesRegex(ValueError, "no location"):
+            provider.data_location(experiment_id="e")
+        self.assertEqual(fake.data_location_calls, 1)
+        snapshot = metrics.as_dict()["data_provider"]
+        self.assertEqual(snapshot["read_scalars"]["count"], 1)
+        self.assertEqual(snapshot["data_location"]["count"], 1)
+
+    def test_charges_request_record(self):
+        metrics = request_metrics.RequestMetrics()
+        provider = request_metrics.InstrumentedDataProvider(
+            _FakeDataProvider(), metrics
+        )
+        record = request_metrics.RequestRecord(metrics)
+        ctx = context.RequestContext(request_record=record)
+        provider.read_scalars(ctx, experiment_id="e")
+        provider.read_scalars(ctx, experiment_id="e")
+        self.assertEqual(list(record.provider_calls), ["read_scalars"])
+        self.assertEqual(record.provider_calls["read_scalars"][0], 2)
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -0,0 +1,242 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Admission control and prioritization of HTTP requests.
+
+A `RequestScheduler` bounds how many requests execute application code at
+once. Requests beyond that bound wait in one of several priority lanes:
+static assets first, then metadata routes such as run and tag listings,
+then data routes that read and serialize time series. Each lane has a
+bounded queue, and a request that arrives when its lane is full is shed
+with `503 Service Unavailable` rather than queued indefinitely.
+
+Cheap requests thus never wait behind more than a worker's worth of heavy
+ones, and the number of threads competing for the GIL stays fixed no
+matter how many connections are open.
+"""
+
+
+import collections
+import re
+import threading
+
+from werkzeug import wrappers
+
+from tensorboard.backend import http_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+# Lanes, in priority order: a free worker always goes to the waiting
+# request in the lowest-numbered lane.
+LANE_STATIC = 0
+LANE_METADATA = 1
+LANE_DATA = 2
+LANE_NAMES = ("static", "metadata", "data")
+
+# Final path components of plugin routes that list small amounts of
+# metadata rather than reading data.
+_METADATA_ROUTE_NAMES = frozenset(
+    (
+        "config",
+        "environment",
+        "experiment",
+        "info",
+        "layout",
+        "runs",
+        "tags",
+    )
+)
+
+_PLUGIN_ROUTE_RE = re.compile(r"/data/plugin/[^/]+/(.*)$")
+
+# Value of the `Retry-After` header on shed requests, in seconds.
+_RETRY_AFTER_SECS = 1
+
+
+def classify_path(path):
+    """Returns the lane for a request path.
+
+    Args:
+      path: The path of a request, possibly under a path prefix or an
+        `/experiment/<id>` prefix.
+
+    Returns:
+      One of `LANE_STATIC`, `LANE_METADATA`, or `LANE_DATA`.
+    """
+    index = path.find("/data/")
+    if index < 0:
+        return LANE_STATIC
+    match = _PLUGIN_ROUTE_RE.match(path, index)
+    if match is None:
+        return LANE_METADATA
+    route = match.group(1).rstrip("/")
+    if route.rsplit("/", 1)[-1] in _METADATA_ROUTE_NAMES:
+        return LANE_METADATA
+    return LANE_DATA
+
+
+class _Ticket:
+    __slots__ = ("granted",)
+
+    def __init__(self):
+        self.granted = threading.Event()
+
+
+class RequestScheduler:
+    """Grants a fixed number of worker slots to requests, by priority.
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_workers, max_queued_per_lane):
+        """Initializes the scheduler.
+
+        Args:
+          max_workers: Positive number of requests that may hold a slot at
+            once.
+          max_queued_per_lane: Non-negative number of requests that may
+            wait for a slot in each lane before further requests in that
+            lane are rejected.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive: %r" % max_workers)
+        if max_queued_per_lane < 0:
+            raise ValueError(
+                "max_queued_per_lane must be non-negative: %r"
+                % max_queued_per_lane
+            )
+        self._max_workers = max_workers
+        self._max_queued = max_queued_per_lane
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiting = [collections.deque() for _ in LANE_NAMES]
+        self._admitted = [0] * len(LANE_NAMES)
+        self._rejected = [0] * len(LANE_NAMES)
+
+    def acquire(self, lane):
+        """Waits for a worker slot for a request in `lane`.
+
+        Returns:
+          True once the caller holds a slot, which it must give back with
+          `release`; or False immediately if the lane's queue is full.
+        """
+        with self._lock:
+            if self._active < self._max_workers and not any(self._waiting):
+                self._active += 1
+                self._admitted[lane] += 1
+                return True
+            queue = self._waiting[lane]
+            if len(queue) >= self._max_queued:
+                self._rejected[lane] += 1
+                return False
+            ticket = _Ticket()
+            queue.append(ticket)
+            self._admitted[lane] += 1
+        # `release` hands its slot directly to this ticket, so `_active`
+        # already counts it once the event is set.
+        ticket.granted.wait()
+        return True
+
+    def release(self):
+        """Gives back a slot, passing it to the next waiting request."""
+        with self._lock:
+            for queue in self._waiting:
+                if queue:
+                    queue.popleft().granted.set()
+                    return
+            self._active -= 1
+
+    def stats(self):
+        """Returns a snapshot of counters, for logging and benchmarks."""
+        with self._lock:
+            return {
+                "active": self._active,
+                "lanes": {
+                    name: {
+                        "waiting": len(self._waiting[i]),
+                        "admitted": self._admitted[i],
+                        "rejected": self._rejected[i],
+                    }
+                    for (i, name) in enumerate(LANE_NAMES)
+                },
+            }
+
+
+class SchedulingMiddleware:
+    """WSGI middleware that runs each request under a `RequestScheduler`.
+
+    The slot is held until the server closes the response iterable, so
+    that producing a streamed response body also counts against the
+    worker bound.
+    """
+
+    def __init__(self, application, scheduler, classify=classify_path):
+        """Initializes this middleware.
+
+        Args:
+          application: The WSGI application to wrap (see PEP 3333).
+          scheduler: A `RequestScheduler`.
+          classify: A function from request path to lane.
+        """
+        self._application = application
+        self._scheduler = scheduler
+        self._classify = classify
+
+    def __call__(self, environ, start_response):
+        lane = self._classify(environ.get("PATH_INFO", ""))
+        if not self._scheduler.acquire(lane):
+            logger.warning(
+                "Shedding %s request for %s: too many queued requests",
+                LANE_NAMES[lane],
+                environ.get("PATH_INFO", ""),
+            )
+            response = http_util.Respond(
+                wrappers.Request(environ),
+                "TensorBoard is overloaded; try again later.",
+                "text/plain",
+                code=503,
+                headers=[("Retry-After", str(_RETRY_AFTER_SECS))],
+            )
+            return response(environ, start_response)
+        try:
+            body = self._application(environ, start_response)
+        except BaseException:
+            self._scheduler.release()
+            raise
+        return _ReleasingIterable(body, self._scheduler.release)
+
+
+class _ReleasingIterable:
+    """Wraps a WSGI response iterable to call `release` once on close."""
+
+    def __init__(self, body, release):
+        self._body = body
+        self._release = release
+        self._released = False
+
+    def __iter__(self):
+        return iter(self._body)
+
+    def close(self):
+        if self._released:
+            return
+        self._released = True
+        try:
+            close = getattr(self._body, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._release()
@@ -0,0 +1,193 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load test of TensorBoard's HTTP servers under concurrent clients.
+
+Serves a synthetic WSGI app whose data route burns CPU while holding the
+GIL, as serializing a large time series response does, and whose static
+and metadata routes are cheap. Many client threads then issue a mix of
+requests over keep-alive connections, and tail latencies per lane are
+reported for the thread-per-connection `WerkzeugServer` and for
+`WorkerPoolWerkzeugServer` with a few pool sizes.
+"""
+
+
+import argparse
+import http.client
+import os
+import random
+import threading
+import time
+
+
+from absl import app
+from absl import logging
+
+from tensorboard import program
+from tensorboard.backend import request_scheduler
+from tensorboard.util import benchmark_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+_NUM_CLIENTS = 64
+_REQUESTS_PER_CLIENT = 40
+_HEAVY_REQUEST_SECS = 0.02
+_HEAVY_RESPONSE_BYTES = 256 * 1024
+_MAX_QUEUED_REQUESTS = 64
+
+# Request mix, as `(path, weight)` pairs.
+_REQUEST_MIX = (
+    ("/index.js", 2),
+    ("/data/runs", 2),
+    ("/data/plugin/scalars/tags", 1),
+    ("/data/plugin/timeseries/timeSeries", 5),
+)
+
+
+def _synthetic_app(environ, start_response):
+    path = environ["PATH_INFO"]
+    lane = request_scheduler.classify_path(path)
+    if lane == request_scheduler.LANE_DATA:
+        deadline = time.perf_counter() + _HEAVY_REQUEST_SECS
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        body = b"x" * _HEAVY_RESPONSE_BYTES
+    else:
+        body = b"x" * 1024
+    start_response(
+        "200 OK",
+        [("Content-Type", "text/plain"), ("Content-Length", str(len(body)))],
+    )
+    return [body]
+
+
+def _client(port, seed, latencies, shed):
+    """Issues requests on one connection, recording latency by lane."""
+    rng = random.Random(seed)
+    paths = [p for (p, weight) in _REQUEST_MIX for _ in range(weight)]
+    conn = http.client.HTTPConnection("localhost", port, timeout=120)
+    try:
+        for _ in range(_REQUESTS_PER_CLIENT):
+            path = rng.choice(paths)
+            lane = request_scheduler.classify_path(path)
+            start_time = time.perf_counter()
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            elapsed = time.perf_counter() - start_time
+            if response.status == 503:
+                shed[lane].append(elapsed)
+            else:
+                latencies[lane].append(elapsed)
+    finally:
+        conn.close()
+
+
+def bench(server_class, max_request_workers):
+    """Runs the load test against a server.
+
+    Returns:
+      A tuple `(total_secs, latencies, shed)`, where the latter two are
+      lists indexed by lane, of the latencies of served and of shed
+      requests.
+    """
+    flags = argparse.Namespace(
+        host="localhost",
+        bind_all=False,
+        reuse_port=False,
+        port=0,
+        path_prefix="",
+        max_request_workers=max_request_workers,
+        max_queued_requests=_MAX_QUEUED_REQUESTS,
+    )
+    server = server_class(_synthetic_app, flags)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    latencies = [[] for _ in request_scheduler.LANE_NAMES]
+    shed = [[] for _ in request_scheduler.LANE_NAMES]
+    clients = [
+        threading.Thread(
+            target=_client,
+            args=(server.server_port, seed, latencies, shed),
+        )
+        for seed in range(_NUM_CLIENTS)
+    ]
+    start_time = time.perf_counter()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    total_secs = time.perf_counter() - start_time
+    server.shutdown()
+    server_thread.join()
+    server.server_close()
+    return (total_secs, latencies, shed)
+
+
+def _percentile(values, fraction):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def main(unused_argv):
+    # Werkzeug's per-request access logs would drown out the table.
+    logging.set_verbosity(logging.WARNING)
+    cpus = os.cpu_count() or 1
+    configs = [
+        ("threaded", program.WerkzeugServer, 0),
+        ("pool-2", program.WorkerPoolWerkzeugServer, 2),
+        ("pool-%d" % cpus, program.WorkerPoolWerkzeugServer, cpus),
+    ]
+
+    logger.warning(
+        "Running %d clients x %d requests...",
+        _NUM_CLIENTS,
+        _REQUESTS_PER_CLIENT,
+    )
+    headers = (
+        "SERVER    ",
+        "LANE    ",
+        "SERVED",
+        "SHED",
+        "P50_SECS",
+        "P90_SECS",
+        "P99_SECS",
+        "MAX_SECS",
+        "TOTAL_TIME",
+    )
+    logger.warning(benchmark_util.format_line(headers, headers))
+    for name, server_class, workers in configs:
+        (total_secs, latencies, shed) = bench(server_class, workers)
+        for lane, lane_name in enumerate(request_scheduler.LANE_NAMES):
+            values = latencies[lane]
+            fields = (
+                name,
+                lane_name,
+                len(values),
+                len(shed[lane]),
+                _percentile(values, 0.5),
+                _percentile(values, 0.9),
+                _percentile(values, 0.99),
+                max(values) if values else float("nan"),
+                total_secs,
+            )
+            logger.warning(benchmark_util.format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,147 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.backend.request_scheduler`."""
+
+
+import threading
+import time
+
+import werkzeug
+from werkzeug import test as werkzeug_test
+
+from tensorboard import test as tb_test
+from tensorboard.backend import request_scheduler
+
+
+def _num_waiting(scheduler):
+    return sum(lane["waiting"] for lane in scheduler.stats()["lanes"].values())
+
+
+class ClassifyPathTest(tb_test.TestCase):
+    def test_lanes(self):
+        static = request_scheduler.LANE_STATIC
+        metadata = request_scheduler.LANE_METADATA
+        data = request_scheduler.LANE_DATA
+        cases = [
+            ("/", static),
+            ("/index.js", static),
+            ("/font-roboto/abc.woff2", static),
+            ("/data/runs", metadata),
+            ("/data/environment", metadata),
+            ("/data/plugins_listing", metadata),
+            ("/data/plugin/scalars/tags", metadata),
+            ("/data/plugin/custom_scalars/layout", metadata),
+            ("/data/plugin/scalars/scalars", data),
+            ("/data/plugin/timeseries/timeSeries", data),
+            ("/data/plugin/hparams/session_groups", data),
+            ("/data/plugin/graphs/graph", data),
+            ("/data/plugin/images/individualImage", data),
+            ("/prefix/experiment/123/data/plugin/scalars/tags", metadata),
+            ("/prefix/experiment/123/data/plugin/scalars/scalars", data),
+            ("/prefix/experiment/123/index.html", static),
+        ]
+        for path, lane in cases:
+            self.assertEqual(
+                request_scheduler.classify_path(path), lane, msg=path
+            )
+
+
+class RequestSchedulerTest(tb_test.TestCase):
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            request_scheduler.RequestScheduler(0, 1)
+        with self.assertRaises(ValueError):
+            request_scheduler.RequestScheduler(1, -1)
+
+    def test_rejects_when_lane_is_full(self):
+        scheduler = request_scheduler.RequestScheduler(1, 0)
+        self.assertTrue(scheduler.acquire(request_scheduler.LANE_DATA))
+        self.assertFalse(scheduler.acquire(request_scheduler.LANE_DATA))
+        self.assertFalse(scheduler.acquire(request_scheduler.LANE_STATIC))
+        scheduler.release()
+        self.assertTrue(scheduler.acquire(request_scheduler.LANE_STATIC))
+        stats = scheduler.stats()
+        self.assertEqual(stats["active"], 1)
+        self.assertEqual(stats["lanes"]["data"]["admitted"], 1)
+        self.assertEqual(stats["lanes"]["data"]["rejected"], 1)
+        self.assertEqual(stats["lanes"]["static"]["admitted"], 1)
+
+    def test_grants_by_priority_then_arrival(self):
+        scheduler = request_scheduler.RequestScheduler(1, 10)
+        self.assertTrue(scheduler.acquire(request_scheduler.LANE_DATA))
+        order = []
+        threads = []
+
+        def worker(name, lane):
+            scheduler.acquire(lane)
+            order.append(name)
+            scheduler.release()
+
+        waiters = [
+            ("data1", request_scheduler.LANE_DATA),
+            ("metadata", request_scheduler.LANE_METADATA),
+            ("data2", request_scheduler.LANE_DATA),
+            ("static", request_scheduler.LANE_STATIC),
+        ]
+        for i, (name, lane) in enumerate(waiters):
+            thread = threading.Thread(target=worker, args=(name, lane))
+            thread.start()
+            threads.append(thread)
+            # Wait for each thread to queue before starting the next.
+            while _num_waiting(scheduler) < i + 1:
+                time.sleep(0.001)
+        scheduler.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order, ["static", "metadata", "data1", "data2"])
+        self.assertEqual(scheduler.stats()["active"], 0)
+
+
+class SchedulingMiddlewareTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = request_scheduler.RequestScheduler(1, 0)
+
+    def _app(self, environ, start_response):
+        if environ["PATH_INFO"] == "/data/plugin/foo/broken":
+            raise RuntimeError("broken")
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    def _client(self):
+        app = request_scheduler.SchedulingMiddleware(self._app, self.scheduler)
+        return werkzeug_test.Client(app, werkzeug.Response)
+
+    def test_releases_on_close(self):
+        with self._client().get("/data/plugin/foo/bar") as response:
+            self.assertEqual(response.get_data(), b"ok")
+            self.assertEqual(self.scheduler.stats()["active"], 1)
+        self.assertEqual(self.scheduler.stats()["active"], 0)
+
+    def test_releases_on_exception(self):
+        with self.assertRaises(RuntimeError):
+            self._client().get("/data/plugin/foo/broken")
+        self.assertEqual(self.scheduler.stats()["active"], 0)
+
+    def test_sheds_load(self):
+        self.assertTrue(self.scheduler.acquire(request_scheduler.LANE_DATA))
+        response = self._client().get("/data/plugin/foo/bar")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers.get("Retry-After"), "1")
+        self.assertEqual(self.scheduler.stats()["lanes"]["data"]["rejected"], 1)
+
+
+if __name__ == "__main__":
+    tb_test.main()
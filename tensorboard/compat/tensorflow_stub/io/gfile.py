@@ -20,15 +20,21 @@ TensorBoard.  This allows running TensorBoard without depending on
 TensorFlow for file operations.
 """
 
+import collections
+import concurrent.futures
 import dataclasses
 import glob as py_glob
 import io
 import os
 import os.path
+import re
 import sys
 import tempfile
+import threading
+from typing import Optional
 
 try:
+    import botocore.config
     import botocore.exceptions
     import boto3
 
@@ -56,6 +62,30 @@ from tensorboard.compat.tensorflow_stub import compat, errors
 _DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
 
 
+# Reads from S3 of more than this many bytes are split into byte ranges of
+# this size, which are fetched concurrently.
+_S3_RANGE_READ_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Maximum number of byte ranges of a single S3 read to fetch concurrently.
+_S3_RANGE_READ_MAX_WORKERS = 8
+
+# Size of the HTTP connection pool of each S3 client. This must be large
+# enough for concurrent range reads from several threads.
+_S3_MAX_POOL_CONNECTIONS = 32
+
+# Matches the `Content-Range` of a ranged S3 GET, e.g. "bytes 0-9/100".
+_S3_CONTENT_RANGE_REGEX = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+# Default maximum number of open read handles kept by `FSSpecFileSystem`.
+_FSSPEC_DEFAULT_MAX_OPEN_FILES = 64
+
+# Default fsspec cache type for files opened for reading by
+# `FSSpecFileSystem`; see `fsspec.caching.caches`. Read-ahead suits the
+# sequential reads of event files.
+_FSSPEC_DEFAULT_CACHE_TYPE = "readahead"
+
+
 # Registry of filesystems by prefix.
 #
 # Currently supports "s3://" URLs for S3 based on boto3 and falls
@@ -90,9 +120,12 @@ class StatData:
 
     Attributes:
       length: Length of the data content.
+      mtime_nsec: Last modification time in nanoseconds since epoch, or
+        `None` if the file system does not report one.
     """
 
     length: int
+    mtime_nsec: Optional[int] = None
 
 
 class LocalFileSystem:
@@ -212,10 +245,56 @@ class LocalFileSystem:
         # NOTE: Size of the file is given by .st_size as returned from
         # os.stat(), but we convert to .length
         try:
-            file_length = os.stat(compat.as_bytes(filename)).st_size
+            stat = os.stat(compat.as_bytes(filename))
         except OSError:
             raise errors.NotFoundError(None, None, "Could not find file")
-        return StatData(file_length)
+        return StatData(stat.st_size, stat.st_mtime_ns)
+
+
+def _s3_range(start, end):
+    """Formats an HTTP `Range` header for bytes `start` through `end`.
+
+    The `end` is inclusive, or `None` to read to the end of the object.
+    """
+    return "bytes={}-{}".format(start, "" if end is None else end)
+
+
+class _S3ClientPool:
+    """A thread-safe cache of S3 clients, with one client per endpoint.
+
+    Low-level boto3 clients are thread-safe and each keeps its own pool of
+    HTTP connections, so sharing a client across calls reuses connections
+    and TLS sessions, and resolves credentials only once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+
+    def get(self, endpoint_url):
+        """Returns the S3 client for the given endpoint URL.
+
+        Args:
+          endpoint_url: The endpoint URL of the S3 service, or `None` to
+            use the default endpoint.
+        """
+        with self._lock:
+            client = self._clients.get(endpoint_url)
+            if client is None:
+                # Create a new session rather than using the default one,
+                # since sessions are not thread-safe.
+                client = boto3.session.Session().client(
+                    "s3",
+                    endpoint_url=endpoint_url,
+                    config=botocore.config.Config(
+                        max_pool_connections=_S3_MAX_POOL_CONNECTIONS
+                    ),
+                )
+                self._clients[endpoint_url] = client
+            return client
+
+
+_s3_client_pool = _S3ClientPool()
 
 
 class S3FileSystem:
@@ -225,6 +304,14 @@ class S3FileSystem:
         if not boto3:
             raise ImportError("boto3 must be installed for S3 support.")
         self._s3_endpoint = os.environ.get("S3_ENDPOINT", None)
+        self._range_read_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_S3_RANGE_READ_MAX_WORKERS,
+            thread_name_prefix="S3FileSystem",
+        )
+
+    def _client(self):
+        """Returns the shared S3 client for this filesystem's endpoint."""
+        return _s3_client_pool.get(self._s3_endpoint)
 
     def bucket_and_path(self, url):
         """Split an S3-prefixed URL into bucket and path."""
@@ -238,7 +325,7 @@ class S3FileSystem:
 
     def exists(self, filename):
         """Determines whether a path exists or not."""
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         r = client.list_objects(Bucket=bucket, Prefix=path, Delimiter="/")
         if r.get("Contents") or r.get("CommonPrefixes"):
@@ -269,9 +356,8 @@ class S3FileSystem:
             is an opaque value that can be passed to the next invocation of
             `read(...) ' in order to continue from the last read position.
         """
-        s3 = boto3.resource("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
-        args = {}
 
         # For the S3 case, we use continuation tokens of the form
         # {byte_offset: number}
@@ -279,25 +365,20 @@ class S3FileSystem:
         if continue_from is not None:
             offset = continue_from.get("byte_offset", 0)
 
-        endpoint = ""
+        endpoint = None
         if size is not None:
             # TODO(orionr): This endpoint risks splitting a multi-byte
             # character or splitting \r and \n in the case of CRLFs,
             # producing decoding errors below.
             endpoint = offset + size
 
-        if offset != 0 or endpoint != "":
-            # Asked for a range, so modify the request
-            args["Range"] = "bytes={}-{}".format(offset, endpoint)
-
         try:
-            stream = s3.Object(bucket, path).get(**args)["Body"].read()
+            stream = self._read_range(client, bucket, path, offset, endpoint)
         except botocore.exceptions.ClientError as exc:
             if exc.response["Error"]["Code"] in ["416", "InvalidRange"]:
                 if size is not None:
                     # Asked for too much, so request just to the end. Do this
                     # in a second request so we don't check length in all cases.
-                    client = boto3.client("s3", endpoint_url=self._s3_endpoint)
                     obj = client.head_object(Bucket=bucket, Key=path)
                     content_length = obj["ContentLength"]
                     endpoint = min(content_length, offset + size)
@@ -305,8 +386,9 @@ class S3FileSystem:
                     # Asked for no bytes, so just return empty
                     stream = b""
                 else:
-                    args["Range"] = "bytes={}-{}".format(offset, endpoint)
-                    stream = s3.Object(bucket, path).get(**args)["Body"].read()
+                    stream = self._get_object(
+                        client, bucket, path, offset, endpoint
+                    )
             else:
                 raise
         # `stream` should contain raw bytes here (i.e., there has been neither
@@ -318,6 +400,96 @@ class S3FileSystem:
         else:
             return (stream.decode("utf-8"), continuation_token)
 
+    def _read_range(self, client, bucket, path, start, end):
+        """Reads a byte range of an object, in parallel if it is large.
+
+        Ranges of up to `_S3_RANGE_READ_CHUNK_SIZE` bytes are fetched in a
+        single request. For larger or unbounded ranges, the first chunk is
+        fetched on its own, and its response gives the size and ETag of
+        the object. Any remaining chunks are then fetched concurrently,
+        conditional on the ETag, so that chunks of different versions of
+        the object are never combined.
+
+        Args:
+            client: An S3 client.
+            bucket: The name of the bucket.
+            path: The key of the object.
+            start: The offset of the first byte to read.
+            end: The offset of the last byte to read, inclusive, or `None`
+                to read to the end of the object.
+
+        Returns:
+            The bytes read, which may be fewer than requested if the range
+            extends past the end of the object.
+
+        Raises:
+            botocore.exceptions.ClientError: If a request fails; e.g., with
+                code "InvalidRange" if `start` is past the end of the object.
+        """
+        if end is not None and end - start < _S3_RANGE_READ_CHUNK_SIZE:
+            return self._get_object(client, bucket, path, start, end)
+
+        first_end = start + _S3_RANGE_READ_CHUNK_SIZE - 1
+        if end is not None:
+            first_end = min(first_end, end)
+        try:
+            response = client.get_object(
+                Bucket=bucket, Key=path, Range=_s3_range(start, first_end)
+            )
+        except botocore.exceptions.ClientError as exc:
+            code = exc.response["Error"]["Code"]
+            if end is None and code in ["416", "InvalidRange"]:
+                # Reading to the end from at or past the end of the object
+                # (which includes reading all of an empty object).
+                return b""
+            raise
+        first_chunk = response["Body"].read()
+        match = _S3_CONTENT_RANGE_REGEX.match(response.get("ContentRange", ""))
+        if match is None:
+            # Not a partial response, so we have the whole object already.
+            return first_chunk
+        object_size = int(match.group(3))
+        last = object_size - 1 if end is None else min(end, object_size - 1)
+        if first_end >= last:
+            return first_chunk
+
+        etag = response["ETag"]
+
+        def read_chunk(chunk_start):
+            chunk_end = min(chunk_start + _S3_RANGE_READ_CHUNK_SIZE - 1, last)
+            response = client.get_object(
+                Bucket=bucket,
+                Key=path,
+                Range=_s3_range(chunk_start, chunk_end),
+                IfMatch=etag,
+            )
+            return response["Body"].read()
+
+        chunk_starts = range(first_end + 1, last + 1, _S3_RANGE_READ_CHUNK_SIZE)
+        try:
+            chunks = list(
+                self._range_read_executor.map(read_chunk, chunk_starts)
+            )
+        except botocore.exceptions.ClientError as exc:
+            code = exc.response["Error"]["Code"]
+            if code not in ["412", "PreconditionFailed"]:
+                raise
+            # The object was replaced while we were reading it, so read the
+            # range again from the new version in a single request.
+            return self._get_object(client, bucket, path, start, end)
+        return b"".join([first_chunk] + chunks)
+
+    def _get_object(self, client, bucket, path, start, end):
+        """Reads a byte range of an object in a single request.
+
+        The range is as in `_read_range`, except that a range starting at
+        0 with no end reads the whole object without a `Range` header.
+        """
+        args = {}
+        if start != 0 or end is not None:
+            args["Range"] = _s3_range(start, end)
+        return client.get_object(Bucket=bucket, Key=path, **args)["Body"].read()
+
     def write(self, filename, file_content, binary_mode=False):
         """Writes string file contents to a file.
 
@@ -326,7 +498,7 @@ class S3FileSystem:
             file_content: string, the contents
             binary_mode: bool, write as binary if True, otherwise text
         """
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         # Always convert to bytes for writing
         if binary_mode:
@@ -353,7 +525,7 @@ class S3FileSystem:
             # filesystems in some way.
             return []
         filename = filename[:-1]
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         p = client.get_paginator("list_objects")
         keys = []
@@ -366,7 +538,7 @@ class S3FileSystem:
 
     def isdir(self, dirname):
         """Returns whether the path is a directory or not."""
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(dirname)
         if not path.endswith("/"):
             path += "/"  # This will now only retrieve subdir content
@@ -377,7 +549,7 @@ class S3FileSystem:
 
     def listdir(self, dirname):
         """Returns a list of entries contained within a directory."""
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(dirname)
         p = client.get_paginator("list_objects")
         if not path.endswith("/"):
@@ -396,7 +568,7 @@ class S3FileSystem:
     def makedirs(self, dirname):
         """Creates a directory and all parent/intermediate directories."""
         if not self.exists(dirname):
-            client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+            client = self._client()
             bucket, path = self.bucket_and_path(dirname)
             if not path.endswith("/"):
                 path += "/"  # This will make sure we don't override a file
@@ -406,7 +578,7 @@ class S3FileSystem:
         """Returns file statistics for a given path."""
         # NOTE: Size of the file is given by ContentLength from S3,
         # but we convert to .length
-        client = boto3.client("s3", endpoint_url=self._s3_endpoint)
+        client = self._client()
         bucket, path = self.bucket_and_path(filename)
         try:
             obj = client.head_object(Bucket=bucket, Key=path)
@@ -418,17 +590,75 @@ class S3FileSystem:
                 raise
 
 
+class _FileHandleCache:
+    """A thread-safe LRU cache of open file handles.
+
+    Handles are checked out with `acquire` and returned with `release`, so
+    that each is used by at most one thread at a time. Handles evicted or
+    displaced from the cache are closed.
+    """
+
+    def __init__(self, capacity):
+        """Creates a cache.
+
+        Args:
+          capacity: The maximum number of handles to keep open. If zero, no
+            handles are kept.
+
+        Raises:
+          ValueError: If `capacity` is negative.
+        """
+        if capacity < 0:
+            raise ValueError("capacity must be non-negative: %r" % capacity)
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._handles = collections.OrderedDict()
+
+    def acquire(self, key):
+        """Removes and returns the handle for `key`, or `None` if absent."""
+        with self._lock:
+            return self._handles.pop(key, None)
+
+    def release(self, key, handle):
+        """Returns `handle` to the cache under `key`."""
+        to_close = []
+        with self._lock:
+            if key in self._handles or self._capacity == 0:
+                # Another thread released a handle for this key first.
+                to_close.append(handle)
+            else:
+                self._handles[key] = handle
+                while len(self._handles) > self._capacity:
+                    (_, evicted) = self._handles.popitem(last=False)
+                    to_close.append(evicted)
+        for h in to_close:
+            h.close()
+
+    def discard(self, predicate):
+        """Closes and removes all handles whose keys satisfy `predicate`."""
+        with self._lock:
+            keys = [k for k in self._handles if predicate(k)]
+            to_close = [self._handles.pop(k) for k in keys]
+        for h in to_close:
+            h.close()
+
+
 class FSSpecFileSystem:
     """Provides filesystem access via fsspec.
 
     The current gfile interface doesn't map perfectly to the fsspec interface
     leading to some notable inefficiencies.
 
-    * Reads and writes to files cause the file to be reopened each time which
-      can cause a performance hit when accessing local file systems.
+    * Writes to files cause the file to be reopened each time which can
+      cause a performance hit when accessing local file systems.
     * walk doesn't use the native fsspec walk function so performance may be
       slower.
 
+    Files opened for reading are kept open in a bounded LRU cache, so that
+    successive reads of a file through `GFile` reuse the same handle and
+    its block cache. A handle is closed once a read reaches its end, since
+    handles for some file systems do not observe data appended afterward.
+
     See https://github.com/tensorflow/tensorboard/issues/5286 for more info on
     limitations.
     """
@@ -436,6 +666,27 @@ class FSSpecFileSystem:
     SEPARATOR = "://"
     CHAIN_SEPARATOR = "::"
 
+    def __init__(
+        self,
+        max_open_files=_FSSPEC_DEFAULT_MAX_OPEN_FILES,
+        cache_type=_FSSPEC_DEFAULT_CACHE_TYPE,
+        block_size=None,
+    ):
+        """Creates a filesystem.
+
+        Args:
+          max_open_files: The maximum number of files to keep open for
+            reading. If zero, each read opens and closes the file.
+          cache_type: The fsspec cache type used for files opened for
+            reading, such as "readahead", "blockcache", or "none".
+          block_size: The size of the blocks fetched for files opened for
+            reading, or `None` for the fsspec default of the file system.
+        """
+        self._read_handles = _FileHandleCache(max_open_files)
+        self._open_kwargs = {"cache_type": cache_type}
+        if block_size is not None:
+            self._open_kwargs["block_size"] = block_size
+
     def _validate_path(self, path):
         parts = path.split(self.CHAIN_SEPARATOR)
         for part in parts[:-1]:
@@ -518,15 +769,21 @@ class FSSpecFileSystem:
             is an opaque value that can be passed to the next invocation of
             `read(...) ' in order to continue from the last read position.
         """
-        fs, path = self._fs_path(filename)
-
-        mode = "rb" if binary_mode else "r"
-        encoding = None if binary_mode else "utf8"
-        if not exists(filename):
-            raise errors.NotFoundError(
-                None, None, "Not Found: " + compat.as_text(filename)
-            )
-        with fs.open(path, mode, encoding=encoding) as f:
+        if isinstance(filename, bytes):
+            filename = filename.decode("utf-8")
+        key = (filename, binary_mode)
+        f = self._read_handles.acquire(key)
+        reused = f is not None
+        if not reused:
+            fs, path = self._fs_path(filename)
+            mode = "rb" if binary_mode else "r"
+            encoding = None if binary_mode else "utf8"
+            # A missing file raises `FileNotFoundError`, so there is no need
+            # to check for existence first.
+            f = fs.open(path, mode, encoding=encoding, **self._open_kwargs)
+        keep_open = False
+        try:
+            offset = None
             if continue_from is not None:
                 if not f.seekable():
                     raise errors.InvalidArgumentError(
@@ -535,8 +792,11 @@ class FSSpecFileSystem:
                         "{} is not seekable".format(filename),
                     )
                 offset = continue_from.get("opaque_offset", None)
-                if offset is not None:
-                    f.seek(offset)
+            if offset is not None:
+                f.seek(offset)
+            elif reused:
+                # Unlike a new handle, a reused one may not be at the start.
+                f.seek(0)
 
             data = f.read(size)
             # The new offset may not be `offset + len(data)`, due to decoding
@@ -545,7 +805,16 @@ class FSSpecFileSystem:
             continuation_token = (
                 {"opaque_offset": f.tell()} if f.seekable() else {}
             )
+            # Only keep handles that have not reached the end of the file,
+            # so that the next read after the end reopens the file and sees
+            # any data appended since.
+            keep_open = f.seekable() and size is not None and len(data) == size
             return (data, continuation_token)
+        finally:
+            if keep_open:
+                self._read_handles.release(key, f)
+            else:
+                f.close()
 
     @_translate_errors
     def write(self, filename, file_content, binary_mode=False):
@@ -571,6 +840,10 @@ class FSSpecFileSystem:
 
     def _write(self, filename, file_content, mode):
         fs, path = self._fs_path(filename)
+        if isinstance(filename, bytes):
+            filename = filename.decode("utf-8")
+        # Don't serve later reads from handles opened before this write.
+        self._read_handles.discard(lambda key: key[0] == filename)
         encoding = None if "b" in mode else "utf8"
         with fs.open(path, mode, encoding=encoding) as f:
             compatify = compat.as_bytes if "b" in mode else compat.as_text
@@ -748,6 +1021,40 @@ class GFile:
 
         return result
 
+    def readinto(self, buffer):
+        """Reads bytes into a preallocated, writable buffer.
+
+        Like `read(len(buffer))` for files opened in binary mode, but
+        copies buffered data straight into `buffer` instead of building
+        a new bytestring.
+
+        Args:
+            buffer: a writable bytes-like object, such as a `bytearray`
+                or a `memoryview` of one
+
+        Returns:
+            The number of bytes read, which is less than `len(buffer)`
+            only at end of file.
+        """
+        if not self.binary_mode:
+            raise errors.InvalidArgumentError(
+                None, None, "readinto requires a file opened in binary mode"
+            )
+        view = memoryview(buffer).cast("B")
+        n = len(view)
+        filled = 0
+        if self.buff and len(self.buff) > self.buff_offset:
+            filled = min(n, len(self.buff) - self.buff_offset)
+            view[:filled] = memoryview(self.buff)[
+                self.buff_offset : self.buff_offset + filled
+            ]
+            self.buff_offset += filled
+        if filled < n:
+            data = self.read(n - filled)
+            view[filled : filled + len(data)] = data
+            filled += len(data)
+        return filled
+
     def write(self, file_content):
         """Writes string file contents to file, clearing contents of the file
         on first write and then appending on subsequent calls.
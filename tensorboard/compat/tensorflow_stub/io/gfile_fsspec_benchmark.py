@@ -0,0 +1,125 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks sequential reads through `FSSpecFileSystem`.
+
+Reads a file from start to end in fixed-size chunks, as `GFile` does when
+loading an event file, from an in-memory fsspec file system that sleeps
+for a fixed latency on every request, like a remote object store. Each
+configuration of `FSSpecFileSystem` is timed, and the number of simulated
+round trips is reported alongside.
+"""
+
+
+import threading
+import time
+
+
+from absl import app
+from absl import logging
+import fsspec
+from fsspec import spec
+
+from tensorboard.compat.tensorflow_stub.io import gfile
+from tensorboard.util import benchmark_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+_PROTOCOL = "tbslowmem"
+_LATENCY_SECS = 0.005
+_FILE_SIZE = 32 * 1024 * 1024
+
+
+class _SlowMemoryFileSystem(spec.AbstractFileSystem):
+    """An in-memory, read-only file system with latency on every request."""
+
+    protocol = _PROTOCOL
+    contents = {}
+    round_trips = 0
+    _round_trips_lock = threading.Lock()
+
+    @classmethod
+    def _round_trip(cls):
+        with cls._round_trips_lock:
+            cls.round_trips += 1
+        time.sleep(_LATENCY_SECS)
+
+    def info(self, path, **kwargs):
+        self._round_trip()
+        path = self._strip_protocol(path)
+        if path not in self.contents:
+            raise FileNotFoundError(path)
+        return {"name": path, "size": len(self.contents[path]), "type": "file"}
+
+    def ls(self, path, detail=True, **kwargs):
+        return [self.info(path)] if detail else [path]
+
+    def _open(self, path, mode="rb", block_size=None, **kwargs):
+        return _SlowMemoryFile(self, path, mode, block_size, **kwargs)
+
+
+class _SlowMemoryFile(spec.AbstractBufferedFile):
+    def _fetch_range(self, start, end):
+        self.fs._round_trip()
+        return self.fs.contents[self.path][start:end]
+
+
+def bench(fs, path, read_size):
+    """Read all of `path` through `fs` in chunks of `read_size` bytes.
+
+    Returns:
+      A tuple `(seconds, round_trips)`.
+    """
+    _SlowMemoryFileSystem.round_trips = 0
+    start_time = time.perf_counter()
+    token = None
+    while True:
+        (data, token) = fs.read(
+            path, binary_mode=True, size=read_size, continue_from=token
+        )
+        if not data:
+            break
+    end_time = time.perf_counter()
+    return (end_time - start_time, _SlowMemoryFileSystem.round_trips)
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    fsspec.register_implementation(_PROTOCOL, _SlowMemoryFileSystem)
+    _SlowMemoryFileSystem.contents["/events"] = bytes(_FILE_SIZE)
+    path = "%s:///events" % _PROTOCOL
+
+    configs = [
+        ("reopen", dict(max_open_files=0, cache_type="none")),
+        ("reopen+readahead", dict(max_open_files=0, cache_type="readahead")),
+        ("cached", dict(cache_type="none")),
+        ("cached+readahead", dict(cache_type="readahead")),
+    ]
+    read_sizes = [64 * 1024, 1024 * 1024, 16 * 1024 * 1024]
+
+    logger.info("Running...")
+    headers = ("CONFIG          ", "READ_SIZE", "ROUND_TRIPS", "TOTAL_TIME")
+    logger.info(benchmark_util.format_line(headers, headers))
+    for read_size in read_sizes:
+        for name, kwargs in configs:
+            fs = gfile.FSSpecFileSystem(**kwargs)
+            (total_time, round_trips) = bench(fs, path, read_size)
+            fields = (name, read_size, round_trips, total_time)
+            logger.info(benchmark_util.format_line(headers, fields))
+
+
+if __name__ == "__main__":
+    app.run(main)
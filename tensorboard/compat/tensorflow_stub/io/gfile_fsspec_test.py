@@ -15,12 +15,14 @@
 
 
 import posixpath
+from unittest import mock
 
 from tensorboard import test as tb_test
 from tensorboard.compat.tensorflow_stub import errors
 from tensorboard.compat.tensorflow_stub.io import gfile
 
 import fsspec
+from fsspec.implementations import local as fsspec_local
 
 
 class GFileFSSpecTest(tb_test.TestCase):
@@ -226,6 +228,94 @@ class GFileFSSpecTest(tb_test.TestCase):
             ckpt_read = f.read()
             self.assertEqual(ckpt_b_content, ckpt_read)
 
+    def testReadReusesOpenFile(self):
+        temp_dir = self.get_temp_dir()
+        ckpt_path = posixpath.join(temp_dir, "model.ckpt")
+        with fsspec.open(ckpt_path, "w") as f:
+            f.write("asdfasdfasdffoobarbuzz")
+        open_file = fsspec_local.LocalFileSystem._open
+        with mock.patch.object(
+            fsspec_local.LocalFileSystem,
+            "_open",
+            autospec=True,
+            side_effect=open_file,
+        ) as mock_open:
+            with gfile.GFile(ckpt_path, "rb") as f:
+                f.buff_chunk_size = 4
+                self.assertEqual(b"asdfasdfasdffoobar", f.read(18))
+                self.assertEqual(b"buzz", f.read())
+            self.assertEqual(1, mock_open.call_count)
+            # The last read reached the end of the file, closing it.
+            with gfile.GFile(ckpt_path, "rb") as f:
+                self.assertEqual(b"asdf", f.read(4))
+            self.assertEqual(2, mock_open.call_count)
+
+    def testReadSeesAppendedData(self):
+        temp_dir = self.get_temp_dir()
+        ckpt_path = posixpath.join(temp_dir, "model.ckpt")
+        with fsspec.open(ckpt_path, "wb") as f:
+            f.write(b"asdf")
+        fs = gfile.get_filesystem(ckpt_path)
+        (data, token) = fs.read(ckpt_path, binary_mode=True, size=4)
+        self.assertEqual(b"asdf", data)
+        (data, token) = fs.read(
+            ckpt_path, binary_mode=True, size=4, continue_from=token
+        )
+        self.assertEqual(b"", data)
+        with fsspec.open(ckpt_path, "ab") as f:
+            f.write(b"foo")
+        (data, token) = fs.read(
+            ckpt_path, binary_mode=True, size=4, continue_from=token
+        )
+        self.assertEqual(b"foo", data)
+
+    def testReadAfterWriteSeesNewContent(self):
+        temp_dir = self.get_temp_dir()
+        ckpt_path = posixpath.join(temp_dir, "model.ckpt")
+        with gfile.GFile(ckpt_path, "wb") as f:
+            f.write(b"asdfasdf")
+        fs = gfile.get_filesystem(ckpt_path)
+        (data, _) = fs.read(ckpt_path, binary_mode=True, size=4)
+        self.assertEqual(b"asdf", data)
+        with gfile.GFile(ckpt_path, "wb") as f:
+            f.write(b"foobar")
+        (data, _) = fs.read(ckpt_path, binary_mode=True, size=4)
+        self.assertEqual(b"foob", data)
+
+    def testReadMissingFile(self):
+        fs = gfile.FSSpecFileSystem()
+        path = posixpath.join(self.get_temp_dir(), "nonexistent")
+        with self.assertRaises(errors.NotFoundError):
+            fs.read(path, binary_mode=True, size=4)
+
+    def testReadWithoutOpenFiles(self):
+        temp_dir = self.get_temp_dir()
+        ckpt_path = posixpath.join(temp_dir, "model.ckpt")
+        with fsspec.open(ckpt_path, "wb") as f:
+            f.write(b"asdfasdf")
+        fs = gfile.FSSpecFileSystem(max_open_files=0, cache_type="none")
+        (data, token) = fs.read(ckpt_path, binary_mode=True, size=4)
+        self.assertEqual(b"asdf", data)
+        (data, token) = fs.read(
+            ckpt_path, binary_mode=True, size=4, continue_from=token
+        )
+        self.assertEqual(b"asdf", data)
+
+    def testFileHandleCacheEvictsLeastRecentlyUsed(self):
+        cache = gfile._FileHandleCache(2)
+        handles = [mock.Mock() for _ in range(3)]
+        cache.release("a", handles[0])
+        cache.release("b", handles[1])
+        self.assertIs(handles[0], cache.acquire("a"))
+        cache.release("a", handles[0])
+        cache.release("c", handles[2])
+        handles[1].close.assert_called_once_with()
+        self.assertIsNone(cache.acquire("b"))
+        handles[0].close.assert_not_called()
+        cache.discard(lambda key: key == "a")
+        handles[0].close.assert_called_once_with()
+        self.assertIsNone(cache.acquire("a"))
+
     def testWrite(self):
         temp_dir = self.get_temp_dir()
         self._CreateDeepDirectoryStructure(temp_dir)
@@ -17,6 +17,7 @@
 import boto3
 import os
 import unittest
+from unittest import mock
 from moto import mock_s3
 
 from tensorboard.compat.tensorflow_stub import errors
@@ -227,6 +228,57 @@ class GFileTest(unittest.TestCase):
             ckpt_read = f.read()
             self.assertEqual(ckpt_b_content, ckpt_read)
 
+    @mock_s3
+    def testReadInParallelRanges(self):
+        ckpt_content = "asdfasdfasdffoobarbuzz"
+        temp_dir = self._CreateDeepS3Structure(ckpt_content=ckpt_content)
+        ckpt_path = self._PathJoin(temp_dir, "model.ckpt")
+        with mock.patch.object(gfile, "_S3_RANGE_READ_CHUNK_SIZE", 4):
+            with gfile.GFile(ckpt_path, "r") as f:
+                f.buff_chunk_size = 10
+                self.assertEqual("asdfasdfasdf", f.read(12))
+                self.assertEqual("foobar", f.read(6))
+                self.assertEqual("buzz", f.read())
+                self.assertEqual("", f.read(1000))
+            with gfile.GFile(ckpt_path, "rb") as f:
+                self.assertEqual(ckpt_content.encode(), f.read())
+            empty_path = self._PathJoin(temp_dir, "a.tfevents.1")
+            with gfile.GFile(empty_path, "rb") as f:
+                self.assertEqual(b"", f.read())
+
+    @mock_s3
+    def testReadInParallelRangesOfReplacedObject(self):
+        temp_dir = self._CreateDeepS3Structure(ckpt_content="old content")
+        ckpt_path = self._PathJoin(temp_dir, "model.ckpt")
+        client = gfile.get_filesystem(ckpt_path)._client()
+        get_object = client.get_object
+
+        def replace_after_first_chunk(**kwargs):
+            response = get_object(**kwargs)
+            if "IfMatch" not in kwargs and not replaced:
+                replaced.append(True)
+                client.put_object(
+                    Body="new content", Bucket="test", Key="top_dir/model.ckpt"
+                )
+            return response
+
+        replaced = []
+        with mock.patch.object(gfile, "_S3_RANGE_READ_CHUNK_SIZE", 4):
+            with mock.patch.object(
+                client, "get_object", side_effect=replace_after_first_chunk
+            ):
+                with gfile.GFile(ckpt_path, "rb") as f:
+                    self.assertEqual(b"new content", f.read())
+
+    @mock_s3
+    def testClientsArePooledPerEndpoint(self):
+        temp_dir = self._CreateDeepS3Structure()
+        fs = gfile.get_filesystem(temp_dir)
+        self.assertIs(fs._client(), fs._client())
+        pool = gfile._S3ClientPool()
+        self.assertIs(pool.get(None), pool.get(None))
+        self.assertIsNot(pool.get(None), pool.get("http://localhost:9000"))
+
     @mock_s3
     def testWrite(self):
         temp_dir = self._CreateDeepS3Structure()
@@ -165,6 +165,7 @@ class GFileTest(tb_test.TestCase):
             f.write(ckpt_content)
         ckpt_stat = gfile.stat(ckpt_path)
         self.assertEqual(ckpt_stat.length, len(ckpt_content))
+        self.assertEqual(ckpt_stat.mtime_nsec, os.stat(ckpt_path).st_mtime_ns)
         bad_ckpt_path = os.path.join(temp_dir, "bad_model.ckpt")
         with self.assertRaises(errors.NotFoundError):
             gfile.stat(bad_ckpt_path)
@@ -230,6 +231,26 @@ class GFileTest(tb_test.TestCase):
             ckpt_read = f.read()
             self.assertEqual(ckpt_b_content, ckpt_read)
 
+    def testReadInto(self):
+        temp_dir = self.get_temp_dir()
+        ckpt_path = os.path.join(temp_dir, "model.ckpt")
+        with open(ckpt_path, "wb") as f:
+            f.write(b"asdfasdfasdffoobarbuzz")
+        with gfile.GFile(ckpt_path, "rb") as f:
+            f.buff_chunk_size = 4  # Test buffering by reducing chunk size
+            buf = bytearray(12)
+            self.assertEqual(f.read(2), b"as")
+            self.assertEqual(f.readinto(buf), 12)
+            self.assertEqual(buf, b"dfasdfasdffo")
+            self.assertEqual(f.readinto(memoryview(buf)[:3]), 3)
+            self.assertEqual(buf[:3], b"oba")
+            self.assertEqual(f.readinto(buf), 5)
+            self.assertEqual(buf[:5], b"rbuzz")
+            self.assertEqual(f.readinto(buf), 0)
+        with gfile.GFile(ckpt_path, "r") as f:
+            with self.assertRaises(errors.InvalidArgumentError):
+                f.readinto(bytearray(1))
+
     def testWrite(self):
         temp_dir = self.get_temp_dir()
         self._CreateDeepDirectoryStructure(temp_dir)
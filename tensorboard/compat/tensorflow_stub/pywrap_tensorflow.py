@@ -130,7 +130,10 @@ def crc_update(crc, data):
       32-bit updated CRC-32C as long.
     """
 
-    if type(data) != array.array or data.itemsize != 1:
+    if isinstance(data, (bytes, bytearray)):
+        # Iterating over these yields each byte as an int, without copying.
+        buf = data
+    elif type(data) != array.array or data.itemsize != 1:
         buf = array.array("B", data)
     else:
         buf = data
@@ -165,6 +168,13 @@ def crc32c(data):
     return crc_finalize(crc_update(CRC_INIT, data))
 
 
+# Sizes of the parts of a TFRecord other than its data: the data length,
+# with its masked crc32 in a header, and the masked crc32 of the data.
+_LENGTH_SIZE = 8
+_CRC_SIZE = 4
+_HEADER_SIZE = _LENGTH_SIZE + _CRC_SIZE
+
+
 class PyRecordReader_New:
     def __init__(
         self, filename=None, start_offset=0, compression_type=None, status=None
@@ -194,52 +204,56 @@ class PyRecordReader_New:
         self.status = status
         self.curr_event = None
         self.file_handle = gfile.GFile(self.filename, "rb")
-        # Maintain a buffer of partially read records, so we can recover from
-        # truncated records upon a retry.
-        self._buffer = b""
-        self._buffer_pos = 0
+        # The record being read, which may be partial, so that we can
+        # resume a truncated record upon a retry without rereading it.
+        # `_header` holds the length and its crc32; once those are known,
+        # `_body` holds the data and its crc32, allocated at full size.
+        # `_filled` counts bytes read into the current one of the two.
+        self._header = bytearray(_HEADER_SIZE)
+        self._body = None
+        self._filled = 0
 
     def GetNext(self):
-        # Each new read should start at the beginning of any partial record.
-        self._buffer_pos = 0
-        # Read the header
         self.curr_event = None
-        header_str = self._read(8)
-        if not header_str:
-            # Hit EOF so raise and exit
-            raise errors.OutOfRangeError(None, None, "No more events to read")
-        if len(header_str) < 8:
-            raise self._truncation_error("header")
-        header = struct.unpack("<Q", header_str)
-
-        # Read the crc32, which is 4 bytes, and check it against
-        # the crc32 of the header
-        crc_header_str = self._read(4)
-        if len(crc_header_str) < 4:
-            raise self._truncation_error("header crc")
-        crc_header = struct.unpack("<I", crc_header_str)
-        header_crc_calc = masked_crc32c(header_str)
-        if header_crc_calc != crc_header[0]:
-            raise errors.DataLossError(
-                None, None, "{} failed header crc32 check".format(self.filename)
+        if self._body is None:
+            self._filled += self.file_handle.readinto(
+                memoryview(self._header)[self._filled :]
             )
-
-        # The length of the header tells us how many bytes the Event
-        # string takes
-        header_len = int(header[0])
-        event_str = self._read(header_len)
-        if len(event_str) < header_len:
-            raise self._truncation_error("data")
-
+            if self._filled == 0:
+                # Hit EOF so raise and exit
+                raise errors.OutOfRangeError(
+                    None, None, "No more events to read"
+                )
+            if self._filled < _LENGTH_SIZE:
+                raise self._truncation_error("header")
+            if self._filled < _HEADER_SIZE:
+                raise self._truncation_error("header crc")
+            (length, crc_header) = struct.unpack("<QI", self._header)
+            header_crc_calc = masked_crc32c(self._header[:_LENGTH_SIZE])
+            if header_crc_calc != crc_header:
+                raise errors.DataLossError(
+                    None,
+                    None,
+                    "{} failed header crc32 check".format(self.filename),
+                )
+            # The length of the header tells us how many bytes the Event
+            # string takes; it is followed by the crc32 of the Event.
+            self._body = bytearray(int(length) + _CRC_SIZE)
+            self._filled = 0
+
+        body = memoryview(self._body)
+        length = len(body) - _CRC_SIZE
+        if self._filled < len(body):
+            self._filled += self.file_handle.readinto(body[self._filled :])
+            if self._filled < length:
+                raise self._truncation_error("data")
+            if self._filled < len(body):
+                raise self._truncation_error("data crc")
+
+        event_str = body[:length].tobytes()
         event_crc_calc = masked_crc32c(event_str)
-
-        # The next 4 bytes contain the crc32 of the Event string,
-        # which we check for integrity.
-        crc_event_str = self._read(4)
-        if len(crc_event_str) < 4:
-            raise self._truncation_error("data crc")
-        crc_event = struct.unpack("<I", crc_event_str)
-        if event_crc_calc != crc_event[0]:
+        (crc_event,) = struct.unpack_from("<I", body, length)
+        if event_crc_calc != crc_event:
             raise errors.DataLossError(
                 None,
                 None,
@@ -248,33 +262,9 @@ class PyRecordReader_New:
 
         # Set the current event to be read later by record() call
         self.curr_event = event_str
-        # Clear the buffered partial record since we're done reading it.
-        self._buffer = b""
-
-    def _read(self, n):
-        """Read up to n bytes from the underlying file, with buffering.
-
-        Reads are satisfied from a buffer of previous data read starting at
-        `self._buffer_pos` until the buffer is exhausted, and then from the
-        actual underlying file. Any new data is added to the buffer, and
-        `self._buffer_pos` is advanced to the point in the buffer past all
-        data returned as part of this read.
-
-        Args:
-          n: non-negative number of bytes to read
-
-        Returns:
-          bytestring of data read, up to n bytes
-        """
-        result = self._buffer[self._buffer_pos : self._buffer_pos + n]
-        self._buffer_pos += len(result)
-        n -= len(result)
-        if n > 0:
-            new_data = self.file_handle.read(n)
-            result += new_data
-            self._buffer += new_data
-            self._buffer_pos += len(new_data)
-        return result
+        # Start the next record afresh now that we're done with this one.
+        self._body = None
+        self._filled = 0
 
     def _truncation_error(self, section):
         return errors.DataLossError(
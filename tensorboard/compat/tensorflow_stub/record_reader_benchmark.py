@@ -0,0 +1,92 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks the stub `PyRecordReader_New` on huge single records.
+
+Writes one record to a file in a number of pieces, calling `GetNext`
+after each, as TensorBoard polls an event file while a large graph or
+mesh event is being flushed to it. Every call but the last finds the
+record truncated. Time spent in those retries should stay proportional
+to the record size, however many pieces it arrives in; the final call
+also checks the record's CRC, which is reported separately.
+"""
+
+
+import io
+import os
+import tempfile
+import time
+
+
+from absl import app
+from absl import logging
+
+from tensorboard.compat.tensorflow_stub import errors
+from tensorboard.compat.tensorflow_stub import pywrap_tensorflow
+from tensorboard.summary.writer import record_writer
+from tensorboard.util import benchmark_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+_MIB = 1024 * 1024
+_RECORD_SIZES = (1 * _MIB, 16 * _MIB)
+_PIECE_COUNTS = (1, 64, 1024)
+
+
+def bench(path, record, pieces):
+    """Appends `record` to `path` in `pieces` and reads it as it grows.
+
+    Returns:
+      A tuple `(retry_secs, final_secs)` of the time spent in `GetNext`
+      calls that found the record truncated and in the final call.
+    """
+    with open(path, "wb"):
+        pass
+    reader = pywrap_tensorflow.PyRecordReader_New(path)
+    piece_size = -(-len(record) // pieces)
+    retry_secs = 0.0
+    with open(path, "ab", buffering=0) as outfile:
+        for start in range(0, len(record), piece_size):
+            outfile.write(record[start : start + piece_size])
+            start_time = time.perf_counter()
+            try:
+                reader.GetNext()
+            except errors.DataLossError:
+                retry_secs += time.perf_counter() - start_time
+            else:
+                final_secs = time.perf_counter() - start_time
+    reader.file_handle.close()
+    return (retry_secs, final_secs)
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    headers = ("RECORD_MIB", "PIECES", "RETRY_SECS", "FINAL_SECS")
+    logger.info(benchmark_util.format_line(headers, headers))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "events.out.tfevents")
+        for size in _RECORD_SIZES:
+            with io.BytesIO() as buf:
+                record_writer.RecordWriter(buf).write(os.urandom(size))
+                record = buf.getvalue()
+            for pieces in _PIECE_COUNTS:
+                (retry_secs, final_secs) = bench(path, record, pieces)
+                row = (size // _MIB, pieces, retry_secs, final_secs)
+                logger.info(benchmark_util.format_line(headers, row))
+
+
+if __name__ == "__main__":
+    app.run(main)
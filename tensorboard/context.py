@@ -41,6 +41,9 @@ class RequestContext:
         feature flag key/value pairs sent by the client application. Usage of
         client_feature_flags should know the name of the feature flag key and
         should know and validate the type of the value.
+      request_record: A `request_metrics.RequestRecord` that collects
+        timings of the current request, such as data provider calls, or
+        None if the request is not being measured.
     """
 
     def __init__(
@@ -49,6 +52,7 @@ class RequestContext:
         remote_ip=None,
         x_forwarded_for=None,
         client_feature_flags=None,
+        request_record=None,
     ):
         """Create a request context.
 
@@ -64,6 +68,7 @@ class RequestContext:
         self._remote_ip = remote_ip
         self._x_forwarded_for = x_forwarded_for or ()
         self._client_feature_flags = client_feature_flags or {}
+        self._request_record = request_record
 
     @property
     def auth(self):
@@ -81,6 +86,10 @@ class RequestContext:
     def client_feature_flags(self):
         return self._client_feature_flags
 
+    @property
+    def request_record(self):
+        return self._request_record
+
     def replace(self, **kwargs):
         """Create a copy of this context with updated key-value pairs.
 
@@ -98,6 +107,7 @@ class RequestContext:
         kwargs.setdefault("remote_ip", self.remote_ip)
         kwargs.setdefault("x_forwarded_for", self.x_forwarded_for)
         kwargs.setdefault("client_feature_flags", self.client_feature_flags)
+        kwargs.setdefault("request_record", self.request_record)
         return type(self)(**kwargs)
 
 
@@ -31,6 +31,7 @@ class RequestContextTest(tb_test.TestCase):
         self.assertEqual(ctx.remote_ip, None)
         self.assertEqual(ctx.x_forwarded_for, ())
         self.assertEqual(ctx.client_feature_flags, {})
+        self.assertIsNone(ctx.request_record)
 
     def test_args(self):
         auth = auth_lib.AuthContext({}, {"REQUEST_METHOD": "GET"})
@@ -143,6 +144,13 @@ class RequestContextTest(tb_test.TestCase):
             req_context_new.client_feature_flags, client_feature_flags2
         )
 
+        record = object()
+        req_context_new = req_context.replace(request_record=record)
+        self.assertIs(req_context_new.request_record, record)
+        self.assertIs(
+            req_context_new.replace(auth=auth2).request_record, record
+        )
+
 
 if __name__ == "__main__":
     tb_test.main()
@@ -230,6 +230,56 @@ class GrpcDataProviderTest(tb_test.TestCase):
         req.downsample.num_points = 4
         self.stub.ReadScalars.assert_called_once_with(req)
 
+    def test_read_scalars_columnar(self):
+        res = data_provider_pb2.ReadScalarsResponse()
+        run = res.runs.add(run_name="test")
+        tag = run.tags.add(tag_name="accuracy")
+        tag.data.step.extend([0, 1, 2, 4])
+        tag.data.wall_time.extend([1234.0, 1235.0, 1236.0, 1237.0])
+        tag.data.value.extend([0.25, 0.50, 0.75, 1.00])
+        run.tags.add(tag_name="empty")
+        self.stub.ReadScalars.return_value = res
+
+        actual = self.provider.read_scalars_columnar(
+            self.ctx,
+            experiment_id="123",
+            plugin_name="scalars",
+            downsample=4,
+        )
+        columns = actual["test"]["accuracy"]
+        self.assertEqual(columns.step.dtype, np.int64)
+        self.assertEqual(columns.wall_time.dtype, np.float64)
+        self.assertEqual(columns.value.dtype, np.float64)
+        np.testing.assert_array_equal(columns.step, [0, 1, 2, 4])
+        np.testing.assert_array_equal(
+            columns.wall_time, [1234.0, 1235.0, 1236.0, 1237.0]
+        )
+        np.testing.assert_array_equal(columns.value, [0.25, 0.5, 0.75, 1.0])
+        self.assertLen(actual["test"]["empty"], 0)
+
+    def test_read_tensors_columnar(self):
+        res = data_provider_pb2.ReadTensorsResponse()
+        run = res.runs.add(run_name="test")
+        tag = run.tags.add(tag_name="weights")
+        tag.data.step.extend([0, 1])
+        tag.data.wall_time.extend([1234.0, 1235.0])
+        tag.data.value.append(tensor_util.make_tensor_proto([1.0, 2.0]))
+        tag.data.value.append(tensor_util.make_tensor_proto([[3, 4]]))
+        self.stub.ReadTensors.return_value = res
+
+        actual = self.provider.read_tensors_columnar(
+            self.ctx,
+            experiment_id="123",
+            plugin_name="histograms",
+            downsample=2,
+        )
+        expected = provider.TensorColumns(
+            step=np.array([0, 1]),
+            wall_time=np.array([1234.0, 1235.0]),
+            numpy=(np.array([1.0, 2.0]), np.array([[3, 4]])),
+        )
+        self.assertEqual(actual, {"test": {"weights": expected}})
+
     def test_read_last_scalars(self):
         tag1 = data_provider_pb2.ReadScalarsResponse.TagEntry(
             tag_name="tag1",
@@ -497,7 +547,7 @@ class GrpcDataProviderTest(tb_test.TestCase):
     def test_read_blob_error(self):
         def fake_handler(req):
             del req  # unused
-            yield data_provider_pb2.ReadBlobResponse(data=b"hello wo"),
+            yield data_provider_pb2.ReadBlobResponse(data=b"hello wo")
             raise _grpc_error(grpc.StatusCode.NOT_FOUND, "it ran away!")
 
         self.stub.ReadBlob.side_effect = fake_handler
@@ -505,6 +555,33 @@ class GrpcDataProviderTest(tb_test.TestCase):
         with self.assertRaisesRegex(errors.NotFoundError, "it ran away!"):
             self.provider.read_blob(self.ctx, blob_key="myblob")
 
+    def test_read_blob_stream(self):
+        consumed = []
+
+        def fake_handler(req):
+            del req  # unused
+            for data in (b"hello wo", b"rld"):
+                consumed.append(data)
+                yield data_provider_pb2.ReadBlobResponse(data=data)
+
+        self.stub.ReadBlob.side_effect = fake_handler
+
+        chunks = self.provider.read_blob_stream(self.ctx, blob_key="myblob")
+        self.assertEqual(consumed, [b"hello wo"])
+        self.assertEqual(list(chunks), [b"hello wo", b"rld"])
+
+    def test_read_blob_stream_error(self):
+        def fake_handler(req):
+            del req  # unused
+            raise _grpc_error(grpc.StatusCode.NOT_FOUND, "it ran away!")
+            yield
+
+        self.stub.ReadBlob.side_effect = fake_handler
+
+        # Raised eagerly, before any chunks are consumed.
+        with self.assertRaisesRegex(errors.NotFoundError, "it ran away!"):
+            self.provider.read_blob_stream(self.ctx, blob_key="myblob")
+
     def test_rpc_error(self):
         # This error handling is implemented with a context manager used
         # for all the methods, so take `list_plugins` as representative.
@@ -0,0 +1,331 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""A gRPC server that exposes a data provider.
+
+This is the counterpart of `grpc_provider.GrpcDataProvider`: it serves
+the `TensorBoardDataProvider` service from any `provider.DataProvider`,
+typically a `MultiplexerDataProvider` whose multiplexer is kept loaded
+by this process. Other TensorBoard processes can then read the same data
+with `--grpc_data_provider` without ingesting it themselves.
+"""
+
+from concurrent import futures
+import contextlib
+import functools
+
+import grpc
+
+from tensorboard import context
+from tensorboard import errors
+from tensorboard.data import provider
+from tensorboard.data.proto import data_provider_pb2
+from tensorboard.data.proto import data_provider_pb2_grpc
+from tensorboard.util import tb_logging
+from tensorboard.util import tensor_util
+
+
+logger = tb_logging.get_logger()
+
+# Maximum size of each message in a `ReadBlob` response stream. Matches
+# the chunk size of the Rust data server.
+BLOB_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Default number of threads serving RPCs.
+_DEFAULT_MAX_WORKERS = 16
+
+# Matches the receive limit that `server_ingester` sets on its channels.
+_MAX_MESSAGE_LENGTH = 256 * 1024 * 1024
+
+_ERROR_CODES = (
+    (errors.InvalidArgumentError, grpc.StatusCode.INVALID_ARGUMENT),
+    (errors.NotFoundError, grpc.StatusCode.NOT_FOUND),
+    (errors.PermissionDeniedError, grpc.StatusCode.PERMISSION_DENIED),
+    (errors.UnauthenticatedError, grpc.StatusCode.UNAUTHENTICATED),
+)
+
+
+def _translate_errors(fn):
+    """Decorates a servicer method to report `errors.PublicError`s."""
+
+    @functools.wraps(fn)
+    def wrapper(self, request, grpc_context):
+        try:
+            return fn(self, request, grpc_context)
+        except errors.PublicError as e:
+            grpc_context.abort(_status_code(e), str(e))
+
+    return wrapper
+
+
+def _status_code(e):
+    for error_type, code in _ERROR_CODES:
+        if isinstance(e, error_type):
+            return code
+    return grpc.StatusCode.UNKNOWN
+
+
+class DataProviderServicer(
+    data_provider_pb2_grpc.TensorBoardDataProviderServicer
+):
+    """Implements the `TensorBoardDataProvider` service."""
+
+    def __init__(self, data_provider):
+        """Initializes a servicer.
+
+        Args:
+          data_provider: The `provider.DataProvider` to serve.
+        """
+        self._data_provider = data_provider
+
+    @_translate_errors
+    def GetExperiment(self, request, grpc_context):
+        metadata = self._data_provider.experiment_metadata(
+            context.RequestContext(), experiment_id=request.experiment_id
+        )
+        res = data_provider_pb2.GetExperimentResponse()
+        res.data_location = metadata.data_location
+        res.name = metadata.experiment_name
+        res.description = metadata.experiment_description
+        if metadata.creation_time:
+            res.creation_time.FromNanoseconds(int(metadata.creation_time * 1e9))
+        return res
+
+    @_translate_errors
+    def ListPlugins(self, request, grpc_context):
+        plugins = self._data_provider.list_plugins(
+            context.RequestContext(), experiment_id=request.experiment_id
+        )
+        res = data_provider_pb2.ListPluginsResponse()
+        for plugin_name in plugins:
+            res.plugins.add().name = plugin_name
+        return res
+
+    @_translate_errors
+    def ListRuns(self, request, grpc_context):
+        runs = self._data_provider.list_runs(
+            context.RequestContext(), experiment_id=request.experiment_id
+        )
+        res = data_provider_pb2.ListRunsResponse()
+        for run in runs:
+            run_proto = res.runs.add()
+            run_proto.name = run.run_name
+            if run.start_time is not None:
+                run_proto.start_time = run.start_time
+        return res
+
+    @_translate_errors
+    def ListScalars(self, request, grpc_context):
+        result = self._data_provider.list_scalars(
+            context.RequestContext(),
+            experiment_id=request.experiment_id,
+            plugin_name=_plugin_name(request),
+            run_tag_filter=_parse_rtf(request),
+        )
+        res = data_provider_pb2.ListScalarsResponse()
+        for tag_entry, time_series in _entries(res, result):
+            _populate_metadata(request, time_series, tag_entry.metadata)
+        return res
+
+    @_translate_errors
+    def ReadScalars(self, request, grpc_context):
+        result = self._data_provider.read_scalars(
+            context.RequestContext(),
+            experiment_id=request.experiment_id,
+            plugin_name=_plugin_name(request),
+            downsample=request.downsample.num_points,
+            run_tag_filter=_parse_rtf(request),
+        )
+        res = data_provider_pb2.ReadScalarsResponse()
+        for tag_entry, series in _entries(res, result):
+            data = tag_entry.data
+            data.step.extend(datum.step for datum in series)
+            data.wall_time.extend(datum.wall_time for datum in series)
+            data.value.extend(datum.value for datum in series)
+        return res
+
+    @_translate_errors
+    def ListTensors(self, request, grpc_context):
+        result = self._data_provider.list_tensors(
+            context.RequestContext(),
+            experiment_id=request.experiment_id,
+            plugin_name=_plugin_name(request),
+            run_tag_filter=_parse_rtf(request),
+        )
+        res = data_provider_pb2.ListTensorsResponse()
+        for tag_entry, time_series in _entries(res, result):
+            _populate_metadata(request, time_series, tag_entry.metadata)
+        return res
+
+    @_translate_errors
+    def ReadTensors(self, request, grpc_context):
+        result = self._data_provider.read_tensors(
+            context.RequestContext(),
+            experiment_id=request.experiment_id,
+            plugin_name=_plugin_name(request),
+            downsample=request.downsample.num_points,
+            run_tag_filter=_parse_rtf(request),
+        )
+        res = data_provider_pb2.ReadTensorsResponse()
+        for tag_entry, series in _entries(res, result):
+            data = tag_entry.data
+            data.step.extend(datum.step for datum in series)
+            data.wall_time.extend(datum.wall_time for datum in series)
+            data.value.extend(
+                tensor_util.make_tensor_proto(datum.numpy) for datum in series
+            )
+        return res
+
+    @_translate_errors
+    def ListBlobSequences(self, request, grpc_context):
+        result = self._data_provider.list_blob_sequences(
+            context.RequestContext(),
+            experiment_id=request.experiment_id,
+            plugin_name=_plugin_name(request),
+            run_tag_filter=_parse_rtf(request),
+        )
+        res = data_provider_pb2.ListBlobSequencesResponse()
+        for tag_entry, time_series in _entries(res, result):
+            metadata = tag_entry.metadata
+            _populate_metadata(request, time_series, metadata)
+            metadata.max_length = time_series.max_length
+        return res
+
+    @_translate_errors
+    def ReadBlobSequences(self, request, grpc_context):
+        result = self._data_provider.read_blob_sequences(
+            context.RequestContext(),
+            experiment_id=request.experiment_id,
+            plugin_name=_plugin_name(request),
+            downsample=request.downsample.num_points,
+            run_tag_filter=_parse_rtf(request),
+        )
+        res = data_provider_pb2.ReadBlobSequencesResponse()
+        for tag_entry, series in _entries(res, result):
+            data = tag_entry.data
+            for datum in series:
+                data.step.append(datum.step)
+                data.wall_time.append(datum.wall_time)
+                blob_refs = data.values.add().blob_refs
+                for ref in datum.values:
+                    blob_refs.add(blob_key=ref.blob_key, url=ref.url or "")
+        return res
+
+    def ReadBlob(self, request, grpc_context):
+        with _aborting_on_error(grpc_context):
+            chunks = self._data_provider.read_blob_stream(
+                context.RequestContext(), blob_key=request.blob_key
+            )
+            # Re-chunk the blob so that no one message is too large;
+            # slicing a `memoryview` avoids copying each chunk twice.
+            for chunk in chunks:
+                view = memoryview(chunk)
+                for start in range(0, len(view), BLOB_CHUNK_SIZE):
+                    yield data_provider_pb2.ReadBlobResponse(
+                        data=bytes(view[start : start + BLOB_CHUNK_SIZE])
+                    )
+
+
+@contextlib.contextmanager
+def _aborting_on_error(grpc_context):
+    """Like `_translate_errors`, for use in streaming RPCs."""
+    try:
+        yield
+    except errors.PublicError as e:
+        grpc_context.abort(_status_code(e), str(e))
+
+
+def _plugin_name(request):
+    plugin_name = request.plugin_filter.plugin_name
+    if not plugin_name:
+        raise errors.InvalidArgumentError("plugin_filter.plugin_name required")
+    return plugin_name
+
+
+def _parse_rtf(request):
+    """Converts the `run_tag_filter` of `request` to a `RunTagFilter`."""
+    if not request.HasField("run_tag_filter"):
+        return None
+    rtf_proto = request.run_tag_filter
+    runs = rtf_proto.runs.names if rtf_proto.HasField("runs") else None
+    tags = rtf_proto.tags.names if rtf_proto.HasField("tags") else None
+    return provider.RunTagFilter(runs=runs, tags=tags)
+
+
+def _entries(res, result):
+    """Adds a run and tag entry to `res` for each time series in `result`.
+
+    Args:
+      res: A `List*Response` or `Read*Response` proto.
+      result: A data provider result, as a dict of dicts keyed by run and
+        then tag name.
+
+    Yields:
+      A tuple `(tag_entry, value)` for each time series, where
+      `value` is the entry of `result` for that series.
+    """
+    for run_name, tags in result.items():
+        run_entry = res.runs.add(run_name=run_name)
+        for tag_name, value in tags.items():
+            tag_entry = run_entry.tags.add(tag_name=tag_name)
+            yield (tag_entry, value)
+
+
+def _populate_metadata(request, time_series, metadata):
+    """Fills a `*Metadata` proto from a `provider._TimeSeries`."""
+    metadata.max_step = time_series.max_step
+    metadata.max_wall_time = time_series.max_wall_time
+    summary_metadata = metadata.summary_metadata
+    summary_metadata.plugin_data.plugin_name = request.plugin_filter.plugin_name
+    summary_metadata.plugin_data.content = time_series.plugin_content
+    summary_metadata.summary_description = time_series.description
+    summary_metadata.display_name = time_series.display_name
+
+
+def start_server(data_provider, address, *, max_workers=_DEFAULT_MAX_WORKERS):
+    """Starts serving `data_provider` over gRPC.
+
+    The server listens without transport security, like the Rust data
+    server; clients on the same host may connect with the default
+    `--grpc_creds_type=local`.
+
+    Args:
+      data_provider: The `provider.DataProvider` to serve.
+      address: Address to bind, like `localhost:6806`. Port 0 picks any
+        free port.
+      max_workers: Number of threads serving RPCs concurrently.
+
+    Returns:
+      A tuple `(server, port)`, where `server` is the started
+      `grpc.Server`, which the caller should eventually `stop`, and
+      `port` is the port that it is bound to.
+    """
+    server = grpc.server(
+        futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="GrpcDataServer"
+        ),
+        options=[
+            ("grpc.max_send_message_length", _MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", _MAX_MESSAGE_LENGTH),
+        ],
+    )
+    data_provider_pb2_grpc.add_TensorBoardDataProviderServicer_to_server(
+        DataProviderServicer(data_provider), server
+    )
+    port = server.add_insecure_port(address)
+    if not port:
+        raise ValueError("Failed to bind gRPC data server to %r" % address)
+    server.start()
+    logger.info("Serving data provider over gRPC on port %d", port)
+    return (server, port)
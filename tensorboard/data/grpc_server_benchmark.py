@@ -0,0 +1,197 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End-to-end benchmark of serving a multiplexer over gRPC.
+
+Writes a log directory of scalar event files, loads it once into a
+`MultiplexerDataProvider`, and serves that with `grpc_server`. Separate
+client processes, standing in for stateless TensorBoard web frontends
+started with `--grpc_data_provider`, then read all scalars through
+`GrpcDataProvider` in a loop. Latency and aggregate throughput are
+reported for several numbers of clients, alongside the same read made
+directly against the multiplexer in-process.
+"""
+
+
+import multiprocessing
+import os
+import tempfile
+import time
+
+
+from absl import app
+from absl import logging
+import grpc
+
+from tensorboard import context
+from tensorboard.backend.event_processing import data_provider
+from tensorboard.backend.event_processing import plugin_event_multiplexer
+from tensorboard.compat.proto import event_pb2
+from tensorboard.data import grpc_provider
+from tensorboard.data import grpc_server
+from tensorboard.plugins.scalar import metadata as scalars_metadata
+from tensorboard.plugins.scalar import summary_v2 as scalar_summary
+from tensorboard.summary.writer import event_file_writer
+from tensorboard.util import benchmark_util
+from tensorboard.util import tb_logging
+
+
+logger = tb_logging.get_logger()
+
+_NUM_RUNS = 8
+_NUM_TAGS = 32
+_NUM_STEPS = 1000
+_DOWNSAMPLE = 1000
+_READS_PER_CLIENT = 20
+_CLIENT_COUNTS = (1, 2, 4, 8)
+
+
+def _write_logdir(logdir):
+    for run in range(_NUM_RUNS):
+        writer = event_file_writer.EventFileWriter(
+            os.path.join(logdir, "run%d" % run)
+        )
+        for step in range(_NUM_STEPS):
+            for tag in range(_NUM_TAGS):
+                summary = scalar_summary.scalar_pb("tag%d" % tag, step * 0.5)
+                writer.add_event(
+                    event_pb2.Event(
+                        wall_time=1e9 + step, step=step, summary=summary
+                    )
+                )
+        writer.close()
+
+
+def _read_all(provider):
+    return provider.read_scalars(
+        context.RequestContext(),
+        experiment_id="",
+        plugin_name=scalars_metadata.PLUGIN_NAME,
+        downsample=_DOWNSAMPLE,
+    )
+
+
+def _client(addr, barrier, results):
+    """Reads all scalars repeatedly, reporting latencies to `results`."""
+    channel = grpc.insecure_channel(
+        addr, options=[("grpc.max_receive_message_length", 256 * 1024 * 1024)]
+    )
+    provider = grpc_provider.GrpcDataProvider(
+        addr, grpc_provider.make_stub(channel)
+    )
+    _read_all(provider)  # warm up the connection
+    barrier.wait()
+    latencies = []
+    for _ in range(_READS_PER_CLIENT):
+        start_time = time.perf_counter()
+        _read_all(provider)
+        latencies.append(time.perf_counter() - start_time)
+    results.put(latencies)
+
+
+def _run_clients(addr, num_clients):
+    """Returns `(latencies, total_secs)` across `num_clients` processes."""
+    mp_context = multiprocessing.get_context("spawn")
+    # The parent also waits, to start the clock once all clients are ready.
+    barrier = mp_context.Barrier(num_clients + 1)
+    results = mp_context.Queue()
+    processes = [
+        mp_context.Process(target=_client, args=(addr, barrier, results))
+        for _ in range(num_clients)
+    ]
+    for process in processes:
+        process.start()
+    barrier.wait()
+    start_time = time.perf_counter()
+    latencies = []
+    for _ in processes:
+        latencies.extend(results.get())
+    total_secs = time.perf_counter() - start_time
+    for process in processes:
+        process.join()
+    return (latencies, total_secs)
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def main(unused_argv):
+    logging.set_verbosity(logging.INFO)
+    with tempfile.TemporaryDirectory() as logdir:
+        logger.info(
+            "Writing %d runs x %d tags x %d steps...",
+            _NUM_RUNS,
+            _NUM_TAGS,
+            _NUM_STEPS,
+        )
+        _write_logdir(logdir)
+        multiplexer = plugin_event_multiplexer.EventMultiplexer(
+            tensor_size_guidance={scalars_metadata.PLUGIN_NAME: _NUM_STEPS}
+        )
+        multiplexer.AddRunsFromDirectory(logdir)
+        multiplexer.Reload()
+        provider = data_provider.MultiplexerDataProvider(multiplexer, logdir)
+
+        headers = (
+            "MODE        ",
+            "CLIENTS",
+            "P50_SECS",
+            "P99_SECS",
+            "READS_PER_SEC",
+        )
+        logger.warning(benchmark_util.format_line(headers, headers))
+
+        latencies = []
+        for _ in range(_READS_PER_CLIENT):
+            start_time = time.perf_counter()
+            _read_all(provider)
+            latencies.append(time.perf_counter() - start_time)
+        logger.warning(
+            benchmark_util.format_line(
+                headers,
+                (
+                    "in-process",
+                    1,
+                    _percentile(latencies, 0.5),
+                    _percentile(latencies, 0.99),
+                    len(latencies) / sum(latencies),
+                ),
+            )
+        )
+
+        (server, port) = grpc_server.start_server(provider, "localhost:0")
+        addr = "localhost:%d" % port
+        try:
+            for num_clients in _CLIENT_COUNTS:
+                (latencies, total_secs) = _run_clients(addr, num_clients)
+                logger.warning(
+                    benchmark_util.format_line(
+                        headers,
+                        (
+                            "grpc",
+                            num_clients,
+                            _percentile(latencies, 0.5),
+                            _percentile(latencies, 0.99),
+                            len(latencies) / total_secs,
+                        ),
+                    )
+                )
+        finally:
+            server.stop(None)
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,324 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for `tensorboard.data.grpc_server`."""
+
+from unittest import mock
+
+import grpc
+import numpy as np
+
+from tensorboard import context
+from tensorboard import errors
+from tensorboard import test as tb_test
+from tensorboard.data import grpc_provider
+from tensorboard.data import grpc_server
+from tensorboard.data import provider
+from tensorboard.data.proto import data_provider_pb2
+
+
+def _filter(data, run_tag_filter):
+    """Applies a `RunTagFilter` to a dict of dicts."""
+    result = {}
+    for run, tags in data.items():
+        if run_tag_filter.runs is not None and run not in run_tag_filter.runs:
+            continue
+        tags = {
+            tag: value
+            for (tag, value) in tags.items()
+            if run_tag_filter.tags is None or tag in run_tag_filter.tags
+        }
+        if tags:
+            result[run] = tags
+    return result
+
+
+class _FakeDataProvider(provider.DataProvider):
+    """Serves a fixed set of data for plugin "fake"."""
+
+    _SCALARS = {
+        "train": {
+            "loss": [
+                provider.ScalarDatum(step=i, wall_time=100.0 + i, value=i / 2)
+                for i in range(5)
+            ],
+            "accuracy": [
+                provider.ScalarDatum(step=0, wall_time=100.0, value=0.25)
+            ],
+        },
+        "eval": {
+            "loss": [provider.ScalarDatum(step=4, wall_time=104.0, value=2.5)]
+        },
+    }
+
+    _TENSORS = {
+        "train": {
+            "weights": [
+                provider.TensorDatum(
+                    step=1,
+                    wall_time=101.0,
+                    numpy=np.array([[1.0, 2.0], [3.0, 4.0]]),
+                )
+            ],
+        },
+    }
+
+    _BLOBS = {
+        "train": {
+            "images": [
+                provider.BlobSequenceDatum(
+                    step=2,
+                    wall_time=102.0,
+                    values=(
+                        provider.BlobReference("blob0"),
+                        provider.BlobReference("blob1", url="http://x/1"),
+                    ),
+                )
+            ],
+        },
+    }
+
+    def __init__(self):
+        self.blobs = {"blob0": b"hello", "blob1": b"x" * 100}
+
+    def _check(self, experiment_id, plugin_name=None):
+        if experiment_id != "123":
+            raise errors.NotFoundError("no experiment %r" % experiment_id)
+        if plugin_name is not None and plugin_name != "fake":
+            raise errors.InvalidArgumentError("no plugin %r" % plugin_name)
+
+    def experiment_metadata(self, ctx=None, *, experiment_id):
+        self._check(experiment_id)
+        return provider.ExperimentMetadata(
+            data_location="/tmp/logs",
+            experiment_name="mnist",
+            experiment_description="digits",
+            creation_time=1234.5,
+        )
+
+    def list_plugins(self, ctx=None, *, experiment_id):
+        self._check(experiment_id)
+        return ["fake"]
+
+    def list_runs(self, ctx=None, *, experiment_id):
+        self._check(experiment_id)
+        return [
+            provider.Run(run_id="train", run_name="train", start_time=100.0),
+            provider.Run(run_id="eval", run_name="eval", start_time=None),
+        ]
+
+    def list_scalars(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        self._check(experiment_id, plugin_name)
+        data = _filter(self._SCALARS, run_tag_filter or provider.RunTagFilter())
+        return {
+            run: {
+                tag: provider.ScalarTimeSeries(
+                    max_step=series[-1].step,
+                    max_wall_time=series[-1].wall_time,
+                    plugin_content=b"content",
+                    description="desc",
+                    display_name="",
+                )
+                for (tag, series) in tags.items()
+            }
+            for (run, tags) in data.items()
+        }
+
+    def read_scalars(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        self._check(experiment_id, plugin_name)
+        data = _filter(self._SCALARS, run_tag_filter or provider.RunTagFilter())
+        return {
+            run: {tag: series[-downsample:] for (tag, series) in tags.items()}
+            for (run, tags) in data.items()
+        }
+
+    def read_last_scalars(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        raise NotImplementedError()
+
+    def list_tensors(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        self._check(experiment_id, plugin_name)
+        return {
+            "train": {
+                "weights": provider.TensorTimeSeries(
+                    max_step=1,
+                    max_wall_time=101.0,
+                    plugin_content=b"",
+                    description="",
+                    display_name="Weights",
+                )
+            }
+        }
+
+    def read_tensors(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        self._check(experiment_id, plugin_name)
+        return self._TENSORS
+
+    def list_blob_sequences(
+        self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
+    ):
+        self._check(experiment_id, plugin_name)
+        return {
+            "train": {
+                "images": provider.BlobSequenceTimeSeries(
+                    max_step=2,
+                    max_wall_time=102.0,
+                    max_length=2,
+                    plugin_content=b"",
+                    description="",
+                    display_name="",
+                )
+            }
+        }
+
+    def read_blob_sequences(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        self._check(experiment_id, plugin_name)
+        return self._BLOBS
+
+    def read_blob(self, ctx=None, *, blob_key):
+        if blob_key not in self.blobs:
+            raise errors.NotFoundError("no blob %r" % blob_key)
+        return self.blobs[blob_key]
+
+
+class GrpcServerTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.fake = _FakeDataProvider()
+        (self.server, port) = grpc_server.start_server(
+            self.fake, "localhost:0", max_workers=2
+        )
+        addr = "localhost:%d" % port
+        self.channel = grpc.insecure_channel(addr)
+        self.stub = grpc_provider.make_stub(self.channel)
+        self.provider = grpc_provider.GrpcDataProvider(addr, self.stub)
+        self.ctx = context.RequestContext()
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop(None)
+        super().tearDown()
+
+    def test_experiment_metadata(self):
+        self.assertEqual(
+            self.provider.experiment_metadata(self.ctx, experiment_id="123"),
+            self.fake.experiment_metadata(experiment_id="123"),
+        )
+
+    def test_list_plugins_and_runs(self):
+        self.assertEqual(
+            self.provider.list_plugins(self.ctx, experiment_id="123"),
+            ["fake"],
+        )
+        runs = self.provider.list_runs(self.ctx, experiment_id="123")
+        self.assertEqual([run.run_name for run in runs], ["train", "eval"])
+        self.assertEqual(runs[0].start_time, 100.0)
+        self.assertEqual(runs[1].start_time, 0.0)
+
+    def test_scalars(self):
+        kwargs = dict(experiment_id="123", plugin_name="fake")
+        self.assertEqual(
+            self.provider.list_scalars(self.ctx, **kwargs),
+            self.fake.list_scalars(**kwargs),
+        )
+        rtf = provider.RunTagFilter(runs=["train"], tags=["loss"])
+        self.assertEqual(
+            self.provider.read_scalars(
+                self.ctx, downsample=3, run_tag_filter=rtf, **kwargs
+            ),
+            self.fake.read_scalars(downsample=3, run_tag_filter=rtf, **kwargs),
+        )
+
+    def test_tensors(self):
+        kwargs = dict(experiment_id="123", plugin_name="fake")
+        self.assertEqual(
+            self.provider.list_tensors(self.ctx, **kwargs),
+            self.fake.list_tensors(**kwargs),
+        )
+        result = self.provider.read_tensors(self.ctx, downsample=1, **kwargs)
+        [datum] = result["train"]["weights"]
+        self.assertEqual(datum.step, 1)
+        np.testing.assert_array_equal(
+            datum.numpy, np.array([[1.0, 2.0], [3.0, 4.0]])
+        )
+
+    def test_blob_sequences(self):
+        kwargs = dict(experiment_id="123", plugin_name="fake")
+        self.assertEqual(
+            self.provider.list_blob_sequences(self.ctx, **kwargs),
+            self.fake.list_blob_sequences(**kwargs),
+        )
+        self.assertEqual(
+            self.provider.read_blob_sequences(self.ctx, downsample=1, **kwargs),
+            self.fake.read_blob_sequences(**kwargs),
+        )
+
+    def test_read_blob_in_chunks(self):
+        self.assertEqual(self.provider.read_blob(self.ctx, "blob0"), b"hello")
+        with mock.patch.object(grpc_server, "BLOB_CHUNK_SIZE", 30):
+            req = data_provider_pb2.ReadBlobRequest(blob_key="blob1")
+            chunks = [res.data for res in self.stub.ReadBlob(req)]
+        self.assertEqual([len(chunk) for chunk in chunks], [30, 30, 30, 10])
+        self.assertEqual(b"".join(chunks), self.fake.blobs["blob1"])
+        self.fake.blobs["empty"] = b""
+        self.assertEqual(self.provider.read_blob(self.ctx, "empty"), b"")
+
+    def test_errors(self):
+        with self.assertRaisesRegex(errors.NotFoundError, "no experiment"):
+            self.provider.list_runs(self.ctx, experiment_id="456")
+        with self.assertRaisesRegex(errors.InvalidArgumentError, "no plugin"):
+            self.provider.list_scalars(
+                self.ctx, experiment_id="123", plugin_name="other"
+            )
+        with self.assertRaisesRegex(errors.NotFoundError, "no blob"):
+            self.provider.read_blob(self.ctx, "nope")
+
+    def test_requires_plugin_name(self):
+        req = data_provider_pb2.ListScalarsRequest(experiment_id="123")
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.stub.ListScalars(req)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+
+if __name__ == "__main__":
+    tb_test.main()
@@ -291,6 +291,54 @@ class DataProvider(metaclass=abc.ABCMeta):
         """
         pass
 
+    def read_scalars_columnar(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        """Read values from scalar time series, as columns.
+
+        Like `read_scalars`, but each time series is returned as a single
+        `ScalarColumns` value rather than as a list of `ScalarDatum`s. Long
+        series are much cheaper to build and consume this way when an
+        implementation can fill the arrays in bulk. The default
+        implementation converts the result of `read_scalars`, so callers
+        may use this method with any data provider.
+
+        Args:
+          ctx: A TensorBoard `RequestContext` value.
+          experiment_id: ID of enclosing experiment.
+          plugin_name: String name of the TensorBoard plugin that created
+            the data to be queried. Required.
+          downsample: As for `read_scalars`. Required.
+          run_tag_filter: As for `read_scalars`.
+
+        Returns:
+          A nested map `d` such that `d[run][tag]` is a `ScalarColumns`
+          value, with points sorted by step.
+
+        Raises:
+          tensorboard.errors.PublicError: See `DataProvider` class docstring.
+        """
+        result = self.read_scalars(
+            ctx,
+            experiment_id=experiment_id,
+            plugin_name=plugin_name,
+            downsample=downsample,
+            run_tag_filter=run_tag_filter,
+        )
+        return {
+            run: {
+                tag: ScalarColumns.from_data(data)
+                for (tag, data) in tags_for_run.items()
+            }
+            for (run, tags_for_run) in result.items()
+        }
+
     def list_tensors(
         self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
     ):
@@ -354,6 +402,54 @@ class DataProvider(metaclass=abc.ABCMeta):
         """
         pass
 
+    def read_tensors_columnar(
+        self,
+        ctx=None,
+        *,
+        experiment_id,
+        plugin_name,
+        downsample=None,
+        run_tag_filter=None,
+    ):
+        """Read values from tensor time series, as columns.
+
+        Like `read_tensors`, but each time series is returned as a single
+        `TensorColumns` value rather than as a list of `TensorDatum`s. Long
+        series are much cheaper to build and consume this way when an
+        implementation can fill the arrays in bulk. The default
+        implementation converts the result of `read_tensors`, so callers
+        may use this method with any data provider.
+
+        Args:
+          ctx: A TensorBoard `RequestContext` value.
+          experiment_id: ID of enclosing experiment.
+          plugin_name: String name of the TensorBoard plugin that created
+            the data to be queried. Required.
+          downsample: As for `read_tensors`. Required.
+          run_tag_filter: As for `read_tensors`.
+
+        Returns:
+          A nested map `d` such that `d[run][tag]` is a `TensorColumns`
+          value, with points sorted by step.
+
+        Raises:
+          tensorboard.errors.PublicError: See `DataProvider` class docstring.
+        """
+        result = self.read_tensors(
+            ctx,
+            experiment_id=experiment_id,
+            plugin_name=plugin_name,
+            downsample=downsample,
+            run_tag_filter=run_tag_filter,
+        )
+        return {
+            run: {
+                tag: TensorColumns.from_data(data)
+                for (tag, data) in tags_for_run.items()
+            }
+            for (run, tags_for_run) in result.items()
+        }
+
     def list_blob_sequences(
         self, ctx=None, *, experiment_id, plugin_name, run_tag_filter=None
     ):
@@ -428,6 +524,30 @@ class DataProvider(metaclass=abc.ABCMeta):
         """
         pass
 
+    def read_blob_stream(self, ctx=None, *, blob_key):
+        """Read data for a single blob, as a stream of chunks.
+
+        Like `read_blob`, but implementations may yield the blob in pieces
+        as they become available, so that callers can pass it on without
+        holding all of it in memory. Errors in finding the blob are raised
+        by this call rather than when the result is first iterated, so a
+        caller can still report them before starting a response. The
+        default implementation yields the result of `read_blob` whole.
+
+        Args:
+          ctx: A TensorBoard `RequestContext` value.
+          blob_key: A key identifying the desired blob, as provided by
+            `read_blob_sequences(...)`.
+
+        Returns:
+          An iterator of `bytes` chunks that concatenate to the blob
+          contents.
+
+        Raises:
+          tensorboard.errors.PublicError: See `DataProvider` class docstring.
+        """
+        return iter((self.read_blob(ctx, blob_key=blob_key),))
+
     def list_hyperparameters(self, ctx=None, *, experiment_ids, limit=None):
         """List hyperparameters metadata.
 
@@ -989,6 +1109,89 @@ class ScalarDatum:
         )
 
 
+class ScalarColumns:
+    """The points of a scalar time series, as parallel NumPy arrays.
+
+    This is the columnar counterpart of a list of `ScalarDatum`s, as
+    returned by `DataProvider.read_scalars_columnar`. The arrays all have
+    the same length and should be treated as read-only.
+
+    Attributes:
+      step: An `int64` array of the global step of each point.
+      wall_time: A `float64` array of the wall time of each point, as
+        seconds since epoch.
+      value: A `float64` array of the scalar value of each point.
+    """
+
+    __slots__ = ("_step", "_wall_time", "_value")
+
+    def __init__(self, step, wall_time, value):
+        self._step = step
+        self._wall_time = wall_time
+        self._value = value
+
+    @classmethod
+    def from_data(cls, data):
+        """Builds columns from a sequence of `ScalarDatum`s."""
+        n = len(data)
+        return cls(
+            step=np.fromiter((d.step for d in data), np.int64, count=n),
+            wall_time=np.fromiter(
+                (d.wall_time for d in data), np.float64, count=n
+            ),
+            value=np.fromiter((d.value for d in data), np.float64, count=n),
+        )
+
+    def to_data(self):
+        """Returns these points as a list of `ScalarDatum`s."""
+        return [
+            ScalarDatum(step=step, wall_time=wall_time, value=value)
+            for (step, wall_time, value) in zip(
+                self._step.tolist(),
+                self._wall_time.tolist(),
+                self._value.tolist(),
+            )
+        ]
+
+    @property
+    def step(self):
+        return self._step
+
+    @property
+    def wall_time(self):
+        return self._wall_time
+
+    @property
+    def value(self):
+        return self._value
+
+    def __len__(self):
+        return len(self._step)
+
+    def __eq__(self, other):
+        if not isinstance(other, ScalarColumns):
+            return False
+        if not np.array_equal(self._step, other._step):
+            return False
+        if not np.array_equal(self._wall_time, other._wall_time):
+            return False
+        if not np.array_equal(self._value, other._value):
+            return False
+        return True
+
+    # Unhashable type: numpy arrays are mutable.
+    __hash__ = None
+
+    def __repr__(self):
+        return "ScalarColumns(%s)" % ", ".join(
+            (
+                "step=%r" % (self._step,),
+                "wall_time=%r" % (self._wall_time,),
+                "value=%r" % (self._value,),
+            )
+        )
+
+
 class TensorTimeSeries(_TimeSeries):
     """Metadata about a tensor time series for a particular run and tag.
 
@@ -1099,6 +1302,129 @@ class TensorDatum:
         )
 
 
+class TensorColumns:
+    """The points of a tensor time series, in columnar form.
+
+    This is the columnar counterpart of a list of `TensorDatum`s, as
+    returned by `DataProvider.read_tensors_columnar`. Tensors may differ
+    in shape and dtype from point to point, so in general `numpy` holds
+    one array per point. Implementations that know the tensors to agree
+    may instead pass a single array stacked along a new first axis, which
+    `stacked` then returns without copying.
+
+    Attributes:
+      step: An `int64` array of the global step of each point.
+      wall_time: A `float64` array of the wall time of each point, as
+        seconds since epoch.
+      numpy: A sequence of the `numpy.ndarray` value of each point: a
+        tuple of arrays, or a stacked `numpy.ndarray` whose rows are the
+        values.
+    """
+
+    __slots__ = ("_step", "_wall_time", "_numpy")
+
+    def __init__(self, step, wall_time, numpy):
+        self._step = step
+        self._wall_time = wall_time
+        self._numpy = numpy
+
+    @classmethod
+    def from_data(cls, data):
+        """Builds columns from a sequence of `TensorDatum`s."""
+        n = len(data)
+        return cls(
+            step=np.fromiter((d.step for d in data), np.int64, count=n),
+            wall_time=np.fromiter(
+                (d.wall_time for d in data), np.float64, count=n
+            ),
+            numpy=tuple(d.numpy for d in data),
+        )
+
+    def to_data(self):
+        """Returns these points as a list of `TensorDatum`s."""
+        return [
+            TensorDatum(step=step, wall_time=wall_time, numpy=value)
+            for (step, wall_time, value) in zip(
+                self._step.tolist(), self._wall_time.tolist(), self._numpy
+            )
+        ]
+
+    @property
+    def step(self):
+        return self._step
+
+    @property
+    def wall_time(self):
+        return self._wall_time
+
+    @property
+    def numpy(self):
+        return self._numpy
+
+    def stacked(self):
+        """Returns the values of all points as one stacked array.
+
+        Series whose values all have the same shape and dtype, like most
+        histograms, can then be processed and serialized in bulk.
+
+        Returns:
+          A `numpy.ndarray` of shape `[len(self), *shape]` whose `i`th
+          row is the value of the `i`th point, or `None` if there are no
+          points or their values differ in shape or dtype.
+        """
+        if isinstance(self._numpy, np.ndarray):
+            return self._numpy if len(self._numpy) else None
+        if not self._numpy:
+            return None
+        first = self._numpy[0]
+        if any(
+            x.shape != first.shape or x.dtype != first.dtype
+            for x in self._numpy
+        ):
+            return None
+        return np.stack(self._numpy)
+
+    def tolist(self):
+        """Returns the values of all points as a list of nested lists.
+
+        When every point has the same shape and dtype, as is usual for
+        histograms, the values are converted in a single call rather
+        than point by point.
+        """
+        stacked = self.stacked()
+        if stacked is not None:
+            return stacked.tolist()
+        return [x.tolist() for x in self._numpy]
+
+    def __len__(self):
+        return len(self._step)
+
+    def __eq__(self, other):
+        if not isinstance(other, TensorColumns):
+            return False
+        if not np.array_equal(self._step, other._step):
+            return False
+        if not np.array_equal(self._wall_time, other._wall_time):
+            return False
+        if len(self._numpy) != len(other._numpy):
+            return False
+        return all(
+            np.array_equal(x, y) for (x, y) in zip(self._numpy, other._numpy)
+        )
+
+    # Unhashable type: numpy arrays are mutable.
+    __hash__ = None
+
+    def __repr__(self):
+        return "TensorColumns(%s)" % ", ".join(
+            (
+                "step=%r" % (self._step,),
+                "wall_time=%r" % (self._wall_time,),
+                "numpy=%r" % (self._numpy,),
+            )
+        )
+
+
 class BlobSequenceTimeSeries(_TimeSeries):
     """Metadata about a blob sequence time series for a particular run and tag.
 
@@ -172,6 +172,49 @@ class ScalarDatumTest(tb_test.TestCase):
         self.assertNotEqual(hash(x1), hash(x3))
 
 
+class ScalarColumnsTest(tb_test.TestCase):
+    def _data(self):
+        return [
+            provider.ScalarDatum(step=1, wall_time=0.25, value=1.25),
+            provider.ScalarDatum(step=3, wall_time=0.5, value=-0.5),
+        ]
+
+    def test_from_data(self):
+        x = provider.ScalarColumns.from_data(self._data())
+        self.assertLen(x, 2)
+        self.assertEqual(x.step.dtype, np.int64)
+        self.assertEqual(x.wall_time.dtype, np.float64)
+        self.assertEqual(x.value.dtype, np.float64)
+        np.testing.assert_array_equal(x.step, [1, 3])
+        np.testing.assert_array_equal(x.wall_time, [0.25, 0.5])
+        np.testing.assert_array_equal(x.value, [1.25, -0.5])
+        self.assertLen(provider.ScalarColumns.from_data([]), 0)
+
+    def test_to_data(self):
+        x = provider.ScalarColumns.from_data(self._data())
+        self.assertEqual(x.to_data(), self._data())
+        self.assertIsInstance(x.to_data()[0].step, int)
+
+    def test_repr(self):
+        x = provider.ScalarColumns.from_data(self._data())
+        repr_ = repr(x)
+        self.assertIn(repr(x.step), repr_)
+        self.assertIn(repr(x.value), repr_)
+
+    def test_eq(self):
+        x1 = provider.ScalarColumns.from_data(self._data())
+        x2 = provider.ScalarColumns.from_data(self._data())
+        x3 = provider.ScalarColumns.from_data(self._data()[:1])
+        self.assertEqual(x1, x2)
+        self.assertNotEqual(x1, x3)
+        self.assertNotEqual(x1, object())
+
+    def test_hash(self):
+        x = provider.ScalarColumns.from_data(self._data())
+        with self.assertRaisesRegex(TypeError, "unhashable type"):
+            hash(x)
+
+
 class TensorTimeSeriesTest(tb_test.TestCase):
     def _tensor_time_series(
         self, max_step, max_wall_time, plugin_content, description, display_name
@@ -262,6 +305,77 @@ class TensorDatumTest(tb_test.TestCase):
             hash(x)
 
 
+class TensorColumnsTest(tb_test.TestCase):
+    def _data(self):
+        return [
+            provider.TensorDatum(step=1, wall_time=0.25, numpy=np.array(1.5)),
+            provider.TensorDatum(
+                step=3, wall_time=0.5, numpy=np.array([[1, 2], [3, 4]])
+            ),
+        ]
+
+    def test_from_data(self):
+        x = provider.TensorColumns.from_data(self._data())
+        self.assertLen(x, 2)
+        self.assertEqual(x.step.dtype, np.int64)
+        np.testing.assert_array_equal(x.step, [1, 3])
+        np.testing.assert_array_equal(x.wall_time, [0.25, 0.5])
+        self.assertIsInstance(x.numpy, tuple)
+        np.testing.assert_array_equal(x.numpy[1], [[1, 2], [3, 4]])
+
+    def test_to_data(self):
+        x = provider.TensorColumns.from_data(self._data())
+        self.assertEqual(x.to_data(), self._data())
+
+    def test_stacked(self):
+        x = provider.TensorColumns.from_data(self._data())
+        self.assertIsNone(x.stacked())
+        self.assertIsNone(provider.TensorColumns.from_data([]).stacked())
+        data = [
+            provider.TensorDatum(step=i, wall_time=0.5, numpy=np.arange(3) * i)
+            for i in range(4)
+        ]
+        x = provider.TensorColumns.from_data(data)
+        np.testing.assert_array_equal(x.stacked(), np.outer(range(4), range(3)))
+
+    def test_tolist(self):
+        x = provider.TensorColumns.from_data(self._data())
+        self.assertEqual(x.tolist(), [d.numpy.tolist() for d in self._data()])
+        self.assertEqual(provider.TensorColumns.from_data([]).tolist(), [])
+        x = provider.TensorColumns(
+            step=np.array([1, 2]),
+            wall_time=np.array([0.5, 1.0]),
+            numpy=np.arange(6).reshape(2, 3),
+        )
+        self.assertEqual(x.tolist(), [[0, 1, 2], [3, 4, 5]])
+
+    def test_stacked_values(self):
+        stack = np.arange(6).reshape(2, 3)
+        x = provider.TensorColumns(
+            step=np.array([1, 2]), wall_time=np.array([0.5, 1.0]), numpy=stack
+        )
+        self.assertIs(x.stacked(), stack)
+        self.assertEqual(
+            x, provider.TensorColumns.from_data(x.to_data()), x.to_data()
+        )
+        np.testing.assert_array_equal(x.to_data()[1].numpy, [3, 4, 5])
+
+    def test_eq(self):
+        x1 = provider.TensorColumns.from_data(self._data())
+        x2 = provider.TensorColumns.from_data(self._data())
+        x3 = provider.TensorColumns.from_data(self._data()[::-1])
+        x4 = provider.TensorColumns.from_data(self._data()[:1])
+        self.assertEqual(x1, x2)
+        self.assertNotEqual(x1, x3)
+        self.assertNotEqual(x1, x4)
+        self.assertNotEqual(x1, object())
+
+    def test_hash(self):
+        x = provider.TensorColumns.from_data(self._data())
+        with self.assertRaisesRegex(TypeError, "unhashable type"):
+            hash(x)
+
+
 class BlobSequenceTimeSeriesTest(tb_test.TestCase):
     def _blob_sequence_time_series(
         self,
@@ -27,44 +27,51 @@ for less repetition.
 import logging
 from importlib import metadata
 
-from tensorboard.plugins.audio import audio_plugin
+from tensorboard.backend import lazy_plugin
 from tensorboard.plugins.core import core_plugin
-from tensorboard.plugins.custom_scalar import custom_scalars_plugin
-from tensorboard.plugins.debugger_v2 import debugger_v2_plugin
-from tensorboard.plugins.distribution import distributions_plugin
-from tensorboard.plugins.graph import graphs_plugin
-from tensorboard.plugins.histogram import histograms_plugin
-from tensorboard.plugins.hparams import hparams_plugin
-from tensorboard.plugins.image import images_plugin
-from tensorboard.plugins.metrics import metrics_plugin
-from tensorboard.plugins.pr_curve import pr_curves_plugin
 from tensorboard.plugins.profile_redirect import profile_redirect_plugin
-from tensorboard.plugins.scalar import scalars_plugin
-from tensorboard.plugins.text import text_plugin
-from tensorboard.plugins.mesh import mesh_plugin
 from tensorboard.plugins.wit_redirect import wit_redirect_plugin
 
 logger = logging.getLogger(__name__)
 
 
+def _lazy(plugin_name, module_name, class_name):
+    return lazy_plugin.LazyLoader(
+        plugin_name, "tensorboard.plugins." + module_name, class_name
+    )
+
+
 # Ordering matters. The order in which these lines appear determines the
 # ordering of tabs in TensorBoard's GUI.
+#
+# Plugins are imported lazily, on first use, so that their dependencies
+# do not slow down startup. Their names are given here so that routes
+# can be registered without importing them; `default_test` checks that
+# these names match the plugin classes.
 _PLUGINS = [
     core_plugin.CorePluginLoader(include_debug_info=True),
-    metrics_plugin.MetricsPlugin,
-    scalars_plugin.ScalarsPlugin,
-    custom_scalars_plugin.CustomScalarsPlugin,
-    images_plugin.ImagesPlugin,
-    audio_plugin.AudioPlugin,
-    debugger_v2_plugin.DebuggerV2Plugin,
-    graphs_plugin.GraphsPlugin,
-    distributions_plugin.DistributionsPlugin,
-    histograms_plugin.HistogramsPlugin,
-    text_plugin.TextPlugin,
-    pr_curves_plugin.PrCurvesPlugin,
+    _lazy("timeseries", "metrics.metrics_plugin", "MetricsPlugin"),
+    _lazy("scalars", "scalar.scalars_plugin", "ScalarsPlugin"),
+    _lazy(
+        "custom_scalars",
+        "custom_scalar.custom_scalars_plugin",
+        "CustomScalarsPlugin",
+    ),
+    _lazy("images", "image.images_plugin", "ImagesPlugin"),
+    _lazy("audio", "audio.audio_plugin", "AudioPlugin"),
+    _lazy("debugger-v2", "debugger_v2.debugger_v2_plugin", "DebuggerV2Plugin"),
+    _lazy("graphs", "graph.graphs_plugin", "GraphsPlugin"),
+    _lazy(
+        "distributions",
+        "distribution.distributions_plugin",
+        "DistributionsPlugin",
+    ),
+    _lazy("histograms", "histogram.histograms_plugin", "HistogramsPlugin"),
+    _lazy("text", "text.text_plugin", "TextPlugin"),
+    _lazy("pr_curves", "pr_curve.pr_curves_plugin", "PrCurvesPlugin"),
     profile_redirect_plugin.ProfileRedirectPluginLoader,
-    hparams_plugin.HParamsPlugin,
-    mesh_plugin.MeshPlugin,
+    _lazy("hparams", "hparams.hparams_plugin", "HParamsPlugin"),
+    _lazy("mesh", "mesh.mesh_plugin", "MeshPlugin"),
     wit_redirect_plugin.WITRedirectPluginLoader,
 ]
 
@@ -14,10 +14,13 @@
 # ==============================================================================
 """Unit tests for `tensorboard.default`."""
 
+import subprocess
+import sys
 from unittest import mock
 
 from tensorboard import default
 from tensorboard import test
+from tensorboard.backend import lazy_plugin
 
 
 class FakeEntryPoint:
@@ -39,6 +42,33 @@ class DefaultTest(test.TestCase):
         mock_iter_entry_points.assert_called_with("tensorboard_plugins")
         self.assertEqual(actual_plugins, [fake_plugin])
 
+    def test_lazy_plugin_names(self):
+        loaders = [
+            p
+            for p in default.get_static_plugins()
+            if isinstance(p, lazy_plugin.LazyLoader)
+        ]
+        self.assertNotEmpty(loaders)
+        for loader in loaders:
+            self.assertEqual(
+                loader.plugin_class().plugin_name, loader.plugin_name
+            )
+
+    def test_does_not_import_lazy_plugins(self):
+        # Run in a fresh interpreter, since other tests import plugins.
+        code = "\n".join(
+            [
+                "import sys",
+                "from tensorboard import default",
+                "from tensorboard.backend import lazy_plugin",
+                "for p in default.get_static_plugins():",
+                "    if isinstance(p, lazy_plugin.LazyLoader):",
+                "        print(p.module_name in sys.modules)",
+            ]
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(set(output.decode().split()), {"False"})
+
 
 if __name__ == "__main__":
     test.main()
@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Benchmarks for the `tensorboard.util.encode_png` function.
+"""Benchmarks for the `tensorboard.util.encoder` PNG functions.
+
+The first table times `encode_png` on a single large image from a number
+of threads at once. The second table times `encode_png_batch`, which
+encodes a stack of images without TensorFlow, on a number of workers.
+Both report throughput in images per second.
 
 Here are the results of running this benchmark on a workstation running
 Ubuntu 14.04 with an Intel(R) Xeon(R) CPU E5-1650 v4 @ 3.60GHz:
@@ -29,6 +34,9 @@ Ubuntu 14.04 with an Intel(R) Xeon(R) CPU E5-1650 v4 @ 3.60GHz:
          16      6.2662     0.3916   6.7182       0.4199
          32     10.5142     0.3286   8.0077       0.2502
 
+(These results predate the `IMAGES_PER_SEC` column, which is simply
+`THREADS / TOTAL_TIME`.)
+
 The total time for one thread is the "base time." Speedup is computed by
 dividing the unit time by the base time. Effective parallelism is computed
 by dividing the speedup by the number of threads used.
@@ -51,6 +59,7 @@ from absl import app
 from absl import logging
 import numpy as np
 
+from tensorboard.util import benchmark_util
 from tensorboard.util import encoder
 from tensorboard.util import tb_logging
 
@@ -79,6 +88,18 @@ def bench(image, thread_count):
     return delta
 
 
+def bench_batch(images, max_workers):
+    """Encode the stack `images` with `encode_png_batch` on `max_workers`.
+
+    Returns:
+      A `float` representing number of seconds that it takes to encode
+      all of `images`.
+    """
+    start_time = time.perf_counter()
+    encoder.encode_png_batch(images, max_workers=max_workers)
+    return time.perf_counter() - start_time
+
+
 def _image_of_size(image_size):
     """Generate a square RGB test image of the given side length."""
     return np.random.uniform(0, 256, [image_size, image_size, 3]).astype(
@@ -86,29 +107,6 @@ def _image_of_size(image_size):
     )
 
 
-def _format_line(headers, fields):
-    """Format a line of a table.
-
-    Arguments:
-      headers: A list of strings that are used as the table headers.
-      fields: A list of the same length as `headers` where `fields[i]` is
-        the entry for `headers[i]` in this row. Elements can be of
-        arbitrary types. Pass `headers` to print the header row.
-
-    Returns:
-      A pretty string.
-    """
-    assert len(fields) == len(headers), (fields, headers)
-    fields = [
-        "%2.4f" % field if isinstance(field, float) else str(field)
-        for field in fields
-    ]
-    return "  ".join(
-        " " * max(0, len(header) - len(field)) + field
-        for (header, field) in zip(headers, fields)
-    )
-
-
 def main(unused_argv):
     logging.set_verbosity(logging.INFO)
     np.random.seed(0)
@@ -123,8 +121,15 @@ def main(unused_argv):
     logger.info("Running...")
     results = {}
     image = _image_of_size(4096)
-    headers = ("THREADS", "TOTAL_TIME", "UNIT_TIME", "SPEEDUP", "PARALLELISM")
-    logger.info(_format_line(headers, headers))
+    headers = (
+        "THREADS",
+        "TOTAL_TIME",
+        "UNIT_TIME",
+        "SPEEDUP",
+        "PARALLELISM",
+        "IMAGES_PER_SEC",
+    )
+    logger.info(benchmark_util.format_line(headers, headers))
     for thread_count in thread_counts:
         time.sleep(1.0)
         total_time = min(
@@ -141,8 +146,28 @@ def main(unused_argv):
         results[thread_count] = unit_time
         speedup = results[1] / results[thread_count]
         parallelism = speedup / thread_count
-        fields = (thread_count, total_time, unit_time, speedup, parallelism)
-        logger.info(_format_line(headers, fields))
+        fields = (
+            thread_count,
+            total_time,
+            unit_time,
+            speedup,
+            parallelism,
+            thread_count / total_time,
+        )
+        logger.info(benchmark_util.format_line(headers, fields))
+
+    logger.info("Running batch encoding...")
+    batch_size = 64
+    images = np.stack([_image_of_size(1024) for _ in range(batch_size)])
+    headers = ("WORKERS", "TOTAL_TIME", "SPEEDUP", "IMAGES_PER_SEC")
+    logger.info(benchmark_util.format_line(headers, headers))
+    batch_results = {}
+    for max_workers in thread_counts:
+        total_time = min(bench_batch(images, max_workers) for _ in range(3))
+        batch_results[max_workers] = total_time
+        speedup = batch_results[1] / total_time
+        fields = (max_workers, total_time, speedup, batch_size / total_time)
+        logger.info(benchmark_util.format_line(headers, fields))
 
 
 if __name__ == "__main__":
@@ -220,8 +220,11 @@ class AudioPlugin(base_plugin.TBPlugin):
                 "Illegal mime type %r" % mime_type
             )
         blob_key = request.args["blob_key"]
-        data = self._data_provider.read_blob(ctx, blob_key=blob_key)
-        return http_util.Respond(request, data, mime_type)
+        chunks = self._data_provider.read_blob_stream(ctx, blob_key=blob_key)
+        (_, chunks, content_length) = http_util.peek_stream(chunks)
+        return http_util.RespondStream(
+            request, chunks, mime_type, content_length=content_length
+        )
 
     @wrappers.Request.application
     def _serve_tags(self, request):
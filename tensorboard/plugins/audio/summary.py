@@ -196,8 +196,8 @@ def pb(
 
     if encoding == "wav":
         encoding = metadata.Encoding.Value("WAV")
-        encoder = functools.partial(
-            encoder_util.encode_wav, samples_per_second=sample_rate
+        encode_batch = functools.partial(
+            encoder_util.encode_wav_batch, samples_per_second=sample_rate
         )
     else:
         raise ValueError("Unknown encoding: %r" % encoding)
@@ -210,7 +210,7 @@ def pb(
             tf.compat.as_bytes(label) for label in labels[:max_outputs]
         ]
 
-    encoded_audio = [encoder(a) for a in limited_audio]
+    encoded_audio = encode_batch(limited_audio)
     content = np.array([encoded_audio, limited_labels]).transpose()
     tensor = tf.make_tensor_proto(content, dtype=tf.string)
 
@@ -20,12 +20,14 @@ import functools
 import gzip
 import io
 import mimetypes
+import os
 import posixpath
 import zipfile
 
 from werkzeug import utils
 from werkzeug import wrappers
 
+from tensorboard import errors
 from tensorboard import plugin_util
 from tensorboard.backend import http_util
 from tensorboard.plugins import base_plugin
@@ -73,6 +75,7 @@ class CorePlugin(base_plugin.TBPlugin):
         self._path_prefix = context.flags.path_prefix if context.flags else None
         self._assets_zip_provider = context.assets_zip_provider
         self._data_provider = context.data_provider
+        self._multiplexer = context.multiplexer
         self._include_debug_info = bool(include_debug_info)
 
     def is_active(self):
@@ -87,6 +90,7 @@ class CorePlugin(base_plugin.TBPlugin):
             "/data/runs": self._serve_runs,
             "/data/experiments": self._serve_experiments,
             "/data/experiment_runs": self._serve_experiment_runs,
+            "/data/ingestion_metrics": self._serve_ingestion_metrics,
             "/data/notifications": self._serve_notifications,
             "/data/window_properties": self._serve_window_properties,
             "/events": self._redirect_to_index,
@@ -290,6 +294,33 @@ class CorePlugin(base_plugin.TBPlugin):
         results = []
         return http_util.Respond(request, results, "application/json")
 
+    @wrappers.Request.application
+    def _serve_ingestion_metrics(self, request):
+        """Serve counters describing the loading of event files.
+
+        Responds with JSON by default, or in the Prometheus text exposition
+        format given the query parameter `format=prometheus`. Only available
+        when data is loaded in-process by an `EventMultiplexer`.
+        """
+        output_format = request.args.get("format", "json")
+        if output_format not in ("json", "prometheus"):
+            raise errors.InvalidArgumentError(
+                "Unknown format: %r" % output_format
+            )
+        get_metrics = getattr(self._multiplexer, "IngestionMetrics", None)
+        if get_metrics is None:
+            raise errors.NotFoundError(
+                "Ingestion metrics are not available for this data source"
+            )
+        metrics = get_metrics()
+        if output_format == "prometheus":
+            return http_util.Respond(
+                request,
+                metrics.AsPrometheusText(),
+                "text/plain; version=0.0.4",
+            )
+        return http_util.Respond(request, metrics.AsDict(), "application/json")
+
     @wrappers.Request.application
     def _serve_notifications(self, request):
         """Serve JSON payload of notifications to show in the UI."""
@@ -394,6 +425,45 @@ port to TensorBoard as a subprocess.(default: %(default)s).\
 """,
         )
 
+        parser.add_argument(
+            "--max_request_workers",
+            metavar="COUNT",
+            type=_nonnegative_int,
+            default=0,
+            help="""\
+[experimental] If positive, at most this many HTTP requests are served at
+once, and further requests wait in priority lanes: static assets first, then
+metadata such as run and tag listings, then data. Set to 0 to serve every
+connection on its own thread without limit. (default: %(default)s)\
+""",
+        )
+
+        parser.add_argument(
+            "--max_queued_requests",
+            metavar="COUNT",
+            type=_nonnegative_int,
+            default=64,
+            help="""\
+[experimental] With --max_request_workers, the number of requests that may
+wait in each priority lane; further requests get HTTP 503 responses.
+(default: %(default)s)\
+""",
+        )
+
+        parser.add_argument(
+            "--serving_processes",
+            metavar="COUNT",
+            type=_nonnegative_int,
+            default=0,
+            help="""\
+[experimental] If greater than 1, serve HTTP requests from this many forked
+processes, which read data that one separate process loads from the logdir
+and publishes to shared memory. Requires --load_fast=false and a platform
+with fork(2), and cannot be combined with --grpc_data_provider or
+--grpc_data_server_port. (default: %(default)s)\
+""",
+        )
+
         parser.add_argument(
             "--load_fast",
             type=str,
@@ -443,6 +513,19 @@ string to disable. (default: %(default)s)
 """,
         )
 
+        parser.add_argument(
+            "--grpc_data_server_port",
+            metavar="PORT",
+            type=_nonnegative_int,
+            default=None,
+            help="""\
+Experimental. If set, also serve the loaded data over gRPC on this port (0
+picks a free port), so that other TensorBoard processes can read it with
+`--grpc_data_provider=HOST:PORT` rather than each loading the logdir. Binds
+to the same host as the web server. (default: disabled)
+""",
+        )
+
         parser.add_argument(
             "--purge_orphaned_data",
             metavar="BOOL",
@@ -548,6 +631,19 @@ based routing of an ELB when the website base_url is not available e.g.
             help="changes title of browser window",
         )
 
+        parser.add_argument(
+            "--slow_request_secs",
+            metavar="SECONDS",
+            type=_nonnegative_float,
+            default=0.0,
+            help="""\
+Log a warning for each HTTP request that takes at least this many seconds
+to serve, with the time it spent in data provider calls. Set to 0 to log
+no requests. Latency metrics for all requests are served at
+/data/request_metrics regardless. (default: %(default)s)\
+""",
+        )
+
         parser.add_argument(
             "--max_reload_threads",
             metavar="COUNT",
@@ -715,6 +811,26 @@ disable fast-loading mode. (default: false)\
                 "--detect_file_replacement=true"
             )
 
+        if flags.serving_processes > 1:
+            if not hasattr(os, "fork"):
+                raise FlagsError(
+                    "--serving_processes is not supported on this platform."
+                )
+            if flags.load_fast != "false":
+                raise FlagsError(
+                    "--serving_processes requires --load_fast=false."
+                )
+            if flags.grpc_data_provider:
+                raise FlagsError(
+                    "--serving_processes requires no --grpc_data_provider."
+                )
+            if flags.grpc_data_server_port is not None:
+                # The gRPC server's threads would not survive the fork of
+                # the serving processes.
+                raise FlagsError(
+                    "--serving_processes requires no --grpc_data_server_port."
+                )
+
         flags.path_prefix = flags.path_prefix.rstrip("/")
         if flags.path_prefix and not flags.path_prefix.startswith("/"):
             raise FlagsError(
@@ -745,6 +861,16 @@ def _parse_samples_per_plugin(value):
     return result
 
 
+def _nonnegative_int(v):
+    try:
+        v = int(v)
+    except ValueError:
+        raise argparse.ArgumentTypeError("invalid int: %r" % v)
+    if v < 0:
+        raise argparse.ArgumentTypeError("must be non-negative: %r" % v)
+    return v
+
+
 def _nonnegative_float(v):
     try:
         v = float(v)
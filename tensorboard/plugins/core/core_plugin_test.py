@@ -49,9 +49,11 @@ class FakeFlags:
         self,
         bind_all=False,
         db="",
+        detect_file_replacement=False,
         event_file="",
         generic_data="true",
         grpc_data_provider="",
+        grpc_data_server_port=None,
         host=None,
         inspect=False,
         load_fast="auto",
@@ -59,13 +61,16 @@ class FakeFlags:
         logdir_spec="",
         path_prefix="",
         reuse_port=False,
+        serving_processes=0,
         version_tb=False,
     ):
         self.bind_all = bind_all
         self.db = db
+        self.detect_file_replacement = detect_file_replacement
         self.event_file = event_file
         self.generic_data = generic_data
         self.grpc_data_provider = grpc_data_provider
+        self.grpc_data_server_port = grpc_data_server_port
         self.host = host
         self.inspect = inspect
         self.load_fast = load_fast
@@ -73,6 +78,7 @@ class FakeFlags:
         self.logdir_spec = logdir_spec
         self.path_prefix = path_prefix
         self.reuse_port = reuse_port
+        self.serving_processes = serving_processes
         self.version_tb = version_tb
 
 
@@ -110,6 +116,36 @@ class CorePluginFlagsTest(tf.test.TestCase):
                 FakeFlags(inspect=False, event_file="/tmp/event.out")
             )
 
+    def testServingProcesses(self):
+        loader = core_plugin.CorePluginLoader()
+        loader.fix_flags(
+            FakeFlags(logdir="/tmp", load_fast="false", serving_processes=4)
+        )
+        for load_fast in ("true", "auto"):
+            with self.assertRaisesRegex(ValueError, "--load_fast=false"):
+                loader.fix_flags(
+                    FakeFlags(
+                        logdir="/tmp", load_fast=load_fast, serving_processes=4
+                    )
+                )
+        with self.assertRaisesRegex(ValueError, "--grpc_data_provider"):
+            loader.fix_flags(
+                FakeFlags(
+                    grpc_data_provider="localhost:6806",
+                    load_fast="false",
+                    serving_processes=4,
+                )
+            )
+        with self.assertRaisesRegex(ValueError, "--grpc_data_server_port"):
+            loader.fix_flags(
+                FakeFlags(
+                    logdir="/tmp",
+                    load_fast="false",
+                    grpc_data_server_port=0,
+                    serving_processes=4,
+                )
+            )
+
     def testPathPrefix_stripsTrailingSlashes(self):
         loader = core_plugin.CorePluginLoader()
         for path_prefix in ("/hello", "/hello/", "/hello//", "/hello///"):
@@ -145,6 +181,7 @@ class CorePluginTest(tf.test.TestCase):
             assets_zip_provider=get_test_assets_zip_provider(),
             logdir=self.logdir,
             data_provider=provider,
+            multiplexer=self.multiplexer,
             window_title="title foo",
         )
         self.plugin = core_plugin.CorePlugin(context)
@@ -384,6 +421,44 @@ class CorePluginTest(tf.test.TestCase):
                 ["run1", "avocado", "zebra", "ox", "enigmatic", "mysterious"],
             )
 
+    def testIngestionMetrics_json(self):
+        self._add_run("run1")
+        parsed_object = self._get_json(self.server, "/data/ingestion_metrics")
+        self.assertEqual(list(parsed_object["runs"]), ["run1"])
+        run = parsed_object["runs"]["run1"]
+        self.assertEqual(run["reloads"], 1)
+        # A file version event and the test summary.
+        self.assertEqual(run["records_read"], 2)
+        self.assertEqual(run["events_processed"], 2)
+        self.assertLen(run["files"], 1)
+
+    def testIngestionMetrics_prometheus(self):
+        self._add_run("run1")
+        response = self.server.get("/data/ingestion_metrics?format=prometheus")
+        self.assertEqual(200, response.status_code)
+        self.assertStartsWith(
+            response.headers.get("Content-Type"), "text/plain"
+        )
+        text = response.get_data().decode("utf-8")
+        self.assertIn(
+            'tensorboard_ingestion_run_events_total{run="run1"} 2', text
+        )
+
+    def testIngestionMetrics_badFormat(self):
+        response = self.server.get("/data/ingestion_metrics?format=xml")
+        self.assertEqual(400, response.status_code)
+
+    def testIngestionMetrics_withoutMultiplexer(self):
+        context = base_plugin.TBContext(
+            assets_zip_provider=get_test_assets_zip_provider(),
+            logdir=self.logdir,
+        )
+        plugin = core_plugin.CorePlugin(context)
+        app = application.TensorBoardWSGI([plugin])
+        server = werkzeug_test.Client(app, wrappers.Response)
+        response = server.get("/data/ingestion_metrics")
+        self.assertEqual(404, response.status_code)
+
     def testNotificationsRedirectSuccess(self):
         """Test that the /data/notifications endpoint redirect to /notifications_note.json."""
         response = self.server.get("/data/notifications")
@@ -21,7 +21,9 @@ See `http_api.md` in this directory for specifications of the routes for
 this plugin.
 """
 
+import collections
 import re
+import threading
 
 from werkzeug import wrappers
 
@@ -33,7 +35,6 @@ from tensorboard.plugins import base_plugin
 from tensorboard.plugins.custom_scalar import layout_pb2
 from tensorboard.plugins.custom_scalar import metadata
 from tensorboard.plugins.scalar import metadata as scalars_metadata
-from tensorboard.plugins.scalar import scalars_plugin
 
 
 # The name of the property in the response for whether the regex is valid.
@@ -47,6 +48,49 @@ _TAG_TO_EVENTS_PROPERTY = "tag_to_events"
 # layout.
 _CONFIG_FILE_CHECK_THROTTLE = 60
 
+# The number of (experiment, run, regex) combinations for which to remember
+# the matching tags.
+_TAG_MATCH_CACHE_CAPACITY = 256
+
+
+class _TagMatchCache:
+    """A thread-safe LRU cache of the tags that match a regex.
+
+    An entry is valid only for the set of tags that it was computed from,
+    so that a lookup after new tags have arrived is a miss.
+    """
+
+    def __init__(self, capacity=_TAG_MATCH_CACHE_CAPACITY):
+        self._capacity = capacity
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def matching_tags(self, key, regex, tags):
+        """Returns the tags in `tags` that `regex` matches, in order.
+
+        Args:
+          key: A hashable value identifying the run and regex.
+          regex: A compiled regular expression.
+          tags: An iterable of tag names.
+
+        Returns:
+          A tuple of tag names.
+        """
+        tags = tuple(tags)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None and entry[0] == tags:
+            return entry[1]
+        matches = tuple(tag for tag in tags if regex.match(tag))
+        with self._lock:
+            self._entries[key] = (tags, matches)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+        return matches
+
 
 class CustomScalarsPlugin(base_plugin.TBPlugin):
     """CustomScalars Plugin for TensorBoard."""
@@ -62,6 +106,7 @@ class CustomScalarsPlugin(base_plugin.TBPlugin):
         self._logdir = context.logdir
         self._data_provider = context.data_provider
         self._plugin_name_to_instance = context.plugin_name_to_instance
+        self._tag_match_cache = _TagMatchCache()
 
     def _get_scalars_plugin(self):
         """Tries to get the scalars plugin.
@@ -236,14 +281,15 @@ class CustomScalarsPlugin(base_plugin.TBPlugin):
                     )
                 )
 
-            form = scalars_plugin.OutputFormat.JSON
-            payload = {
-                tag: scalars_plugin_instance.scalars_impl(
-                    ctx, tag, run, experiment, form
-                )[0]
-                for tag in tag_to_data.keys()
-                if regex.match(tag)
-            }
+            tags = self._tag_match_cache.matching_tags(
+                (experiment, run, tag_regex_string), regex, tag_to_data.keys()
+            )
+            payload = {}
+            if tags:
+                # Read all matching tags at once rather than one at a time.
+                (payload, _) = scalars_plugin_instance.scalars_multitag_impl(
+                    ctx, tags, run, experiment
+                )
 
         return {
             _REGEX_VALID_PROPERTY: True,
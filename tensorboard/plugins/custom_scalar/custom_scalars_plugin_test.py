@@ -20,6 +20,8 @@ import csv
 import io
 import json
 import os
+import re
+from unittest import mock
 
 import numpy as np
 import tensorflow as tf
@@ -230,6 +232,56 @@ class CustomScalarsPluginTest(tf.test.TestCase):
             self.assertEqual(step, entry[1])
             np.testing.assert_allclose(step + 1, entry[2])
 
+    def testScalarsReadsMatchingTagsInOneCall(self):
+        with test_util.FileWriterCache.get(
+            os.path.join(self.logdir, "baz")
+        ) as writer:
+            for step in range(2):
+                for name in ("loss_a", "loss_b", "accuracy"):
+                    writer.add_summary(
+                        test_util.ensure_tb_summary_proto(
+                            scalar_summary.pb(name, step)
+                        ),
+                        step,
+                    )
+        plugin = self.createPlugin(self.logdir)
+        ctx = context.RequestContext()
+        provider = plugin._data_provider
+        with mock.patch.object(
+            provider,
+            "read_scalars_columnar",
+            wraps=provider.read_scalars_columnar,
+        ) as read_scalars_columnar:
+            body = plugin.scalars_impl(ctx, "baz", "loss", "exp_id")
+        read_scalars_columnar.assert_called_once()
+        self.assertTrue(body["regex_valid"])
+        self.assertCountEqual(
+            ["loss_a/scalar_summary", "loss_b/scalar_summary"],
+            body["tag_to_events"],
+        )
+        self.assertLen(body["tag_to_events"]["loss_a/scalar_summary"], 2)
+
+    def testTagMatchCache(self):
+        cache = custom_scalars_plugin._TagMatchCache(capacity=1)
+        regex = mock.Mock(wraps=re.compile("a"))
+        self.assertEqual(
+            cache.matching_tags("k", regex, ["a1", "b1", "a2"]), ("a1", "a2")
+        )
+        self.assertEqual(regex.match.call_count, 3)
+        # Same tags: served from the cache.
+        cache.matching_tags("k", regex, ["a1", "b1", "a2"])
+        self.assertEqual(regex.match.call_count, 3)
+        # New tags: recomputed.
+        self.assertEqual(
+            cache.matching_tags("k", regex, ["a1", "b1", "a2", "a3"]),
+            ("a1", "a2", "a3"),
+        )
+        self.assertEqual(regex.match.call_count, 7)
+        # Evicted by another key.
+        cache.matching_tags("j", regex, [])
+        cache.matching_tags("k", regex, ["a1", "b1", "a2", "a3"])
+        self.assertEqual(regex.match.call_count, 11)
+
     def testMergedLayout(self):
         ctx = context.RequestContext()
         parsed_layout = layout_pb2.Layout()
@@ -23,6 +23,7 @@ from werkzeug import wrappers
 
 from tensorboard import errors
 from tensorboard import plugin_util
+from tensorboard.backend import columnar_format
 from tensorboard.backend import http_util
 from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
@@ -99,11 +100,15 @@ class HistogramsPlugin(base_plugin.TBPlugin):
             element_name="tf-histogram-dashboard"
         )
 
-    def histograms_impl(self, ctx, tag, run, experiment, downsample_to=None):
+    def histograms_impl(
+        self, ctx, tag, run, experiment, downsample_to=None, columnar=False
+    ):
         """Result of the form `(body, mime_type)`.
 
         At most `downsample_to` events will be returned. If this value is
-        `None`, then default downsampling will be performed.
+        `None`, then default downsampling will be performed. If `columnar`
+        is true, the body is encoded with `columnar_format` instead of as
+        a JSON-serializable list.
 
         Raises:
           tensorboard.errors.PublicError: On invalid request.
@@ -111,7 +116,7 @@ class HistogramsPlugin(base_plugin.TBPlugin):
         sample_count = (
             downsample_to if downsample_to is not None else self._downsample_to
         )
-        all_histograms = self._data_provider.read_tensors(
+        all_histograms = self._data_provider.read_tensors_columnar(
             ctx,
             experiment_id=experiment,
             plugin_name=metadata.PLUGIN_NAME,
@@ -123,7 +128,16 @@ class HistogramsPlugin(base_plugin.TBPlugin):
             raise errors.NotFoundError(
                 "No histogram tag %r for run %r" % (tag, run)
             )
-        events = [(e.wall_time, e.step, e.numpy.tolist()) for e in histograms]
+        if columnar:
+            body = columnar_format.encode_histograms({run: histograms})
+            return (body, columnar_format.MIME_TYPE)
+        events = list(
+            zip(
+                histograms.wall_time.tolist(),
+                histograms.step.tolist(),
+                histograms.tolist(),
+            )
+        )
         return (events, "application/json")
 
     @wrappers.Request.application
@@ -141,6 +155,13 @@ class HistogramsPlugin(base_plugin.TBPlugin):
         tag = request.args.get("tag")
         run = request.args.get("run")
         (body, mime_type) = self.histograms_impl(
-            ctx, tag, run, experiment=experiment, downsample_to=self.SAMPLE_SIZE
+            ctx,
+            tag,
+            run,
+            experiment=experiment,
+            downsample_to=self.SAMPLE_SIZE,
+            columnar=columnar_format.accepts(request),
+        )
+        return http_util.Respond(
+            request, body, mime_type, headers=[("Vary", "Accept")]
         )
-        return http_util.Respond(request, body, mime_type)
@@ -23,6 +23,7 @@ import tensorflow as tf
 
 from tensorboard import errors
 from tensorboard import context
+from tensorboard.backend import columnar_format
 from tensorboard.backend.event_processing import data_provider
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
@@ -220,6 +221,25 @@ class HistogramsPluginTest(tf.test.TestCase):
             "%s/histogram_summary" % self._HISTOGRAM_TAG,
         )
 
+    def test_histograms_columnar(self):
+        plugin = self.load_plugin([self._RUN_WITH_HISTOGRAM])
+        (body, mime_type) = plugin.histograms_impl(
+            context.RequestContext(),
+            "%s/histogram_summary" % self._HISTOGRAM_TAG,
+            self._RUN_WITH_HISTOGRAM,
+            experiment="exp",
+            columnar=True,
+        )
+        self.assertEqual(columnar_format.MIME_TYPE, mime_type)
+        (kind, data) = columnar_format.decode(body)
+        self.assertEqual(columnar_format.KIND_HISTOGRAMS, kind)
+        series = data[self._RUN_WITH_HISTOGRAM]
+        self.assertEqual(list(range(self._STEPS)), series["step"].tolist())
+        for step, buckets in zip(series["step"], series["buckets"]):
+            self.assertEqual(1 + step, buckets[0][0])
+            self.assertEqual(3 + step, buckets[-1][1])
+            self.assertAlmostEqual(3, buckets[:, 2].sum())
+
 
 if __name__ == "__main__":
     tf.test.main()
@@ -18,12 +18,14 @@ handlers for the HParams plugin backend."""
 
 import collections
 import os
+import re
 
 
 from tensorboard.data import provider
 from tensorboard.plugins.hparams import api_pb2
 from tensorboard.plugins.hparams import json_format_compat
 from tensorboard.plugins.hparams import metadata
+from tensorboard.plugins.hparams import session_group_table
 from google.protobuf import json_format
 from tensorboard.plugins.scalar import metadata as scalar_metadata
 
@@ -52,6 +54,12 @@ class Context:
           tb_context: base_plugin.TBContext. The "base" context we extend.
         """
         self._tb_context = tb_context
+        self._session_group_table_cache = (
+            session_group_table.SessionGroupTableCache()
+        )
+        # The `_SessionRunIndex` most recently used to compute metric names.
+        # It is reused for as long as the set of session runs is unchanged.
+        self._session_run_index = None
 
     def experiment_from_metadata(
         self,
@@ -124,6 +132,12 @@ class Context:
     def tb_context(self):
         return self._tb_context
 
+    @property
+    def session_group_table_cache(self):
+        """A `SessionGroupTableCache` shared by the handlers that list
+        session groups."""
+        return self._session_group_table_cache
+
     def _convert_plugin_metadata(self, data_provider_output):
         return {
             run: {
@@ -482,21 +496,25 @@ class Context:
         scalars_run_to_tag_to_content = self.scalars_metadata(
             ctx, experiment_id
         )
+        session_run_index = self._get_session_run_index(session_runs)
         for run, tags in scalars_run_to_tag_to_content.items():
-            session = _find_longest_parent_path(session_runs, run)
-            if session is None:
+            group = session_run_index.group(run)
+            if group is None:
                 continue
-            group = os.path.relpath(run, session)
-            # relpath() returns "." for the 'session' directory, we use an empty
-            # string, unless the run name actually ends with ".".
-            if group == "." and not run.endswith("."):
-                group = ""
             metric_names_set.update((tag, group) for tag in tags)
         metric_names_list = list(metric_names_set)
         # Sort metrics for determinism.
         metric_names_list.sort()
         return metric_names_list
 
+    def _get_session_run_index(self, session_runs):
+        """Returns a `_SessionRunIndex` over the given session runs."""
+        index = self._session_run_index
+        if index is None or index.session_runs != session_runs:
+            index = _SessionRunIndex(session_runs)
+            self._session_run_index = index
+        return index
+
 
 def generate_data_provider_session_name(session):
     """Generates a name from a HyperparameterSesssionRun.
@@ -514,32 +532,126 @@ def generate_data_provider_session_name(session):
         return f"{session.experiment_id}/{session.run}"
 
 
-def _find_longest_parent_path(path_set, path):
-    """Finds the longest "parent-path" of 'path' in 'path_set'.
+# Sentinel key marking the trie nodes of `_SessionRunIndex` that correspond
+# to the full path of some session run.
+_SESSION_MARKER = None
 
-    This function takes and returns "path-like" strings which are strings
-    made of strings separated by os.sep. No file access is performed here, so
-    these strings need not correspond to actual files in some file-system..
-    This function returns the longest ancestor path
-    For example, for path_set=["/foo/bar", "/foo", "/bar/foo"] and
-    path="/foo/bar/sub_dir", returns "/foo/bar".
+_SEPARATOR_CHARS = os.sep + (os.path.altsep or "")
+_PATH_SEPARATORS = re.compile("[%s]" % re.escape(_SEPARATOR_CHARS))
 
-    Args:
-      path_set: set of path-like strings -- e.g. a list of strings separated by
-        os.sep. No actual disk-access is performed here, so these need not
-        correspond to actual files.
-      path: a path-like string.
+
+class _SessionRunIndex:
+    """Resolves runs to the session run they belong to.
+
+    A run belongs to the session whose run is its longest "parent-path", as
+    would be found by repeatedly applying `os.path.dirname` to the run. For
+    example, for session runs ["/foo/bar", "/foo", "/bar/foo"], the run
+    "/foo/bar/sub_dir" belongs to the session "/foo/bar".
+
+    Session runs are stored in a trie keyed by path component, so that a run
+    is resolved with a single walk over its components. Results are memoized
+    for the lifetime of the index, which should be discarded once the set of
+    session runs changes.
+    """
+
+    def __init__(self, session_runs):
+        """Builds the index.
+
+        Args:
+          session_runs: set of path-like strings -- e.g. a list of strings
+            separated by os.sep. No actual disk-access is performed here, so
+            these need not correspond to actual files.
+        """
+        self._session_runs = frozenset(session_runs)
+        self._root = {}
+        for session in self._session_runs:
+            node = self._root
+            for component, _ in _split_path(session):
+                node = node.setdefault(component, {})
+            node[_SESSION_MARKER] = True
+        self._groups = {}
+
+    @property
+    def session_runs(self):
+        return self._session_runs
+
+    def group(self, run):
+        """Returns the metric group of `run`.
+
+        The group is the path of `run` relative to its session run, or the
+        empty string for the session run itself.
+
+        Returns:
+          A string, or None if `run` does not belong to any session.
+        """
+        try:
+            return self._groups[run]
+        except KeyError:
+            pass
+        session = self._find_session(run)
+        group = None if session is None else _relative_group(run, session)
+        self._groups[run] = group
+        return group
+
+    def _find_session(self, run):
+        """Returns the longest session run which is a parent-path of `run`,
+        or None."""
+        if run in self._session_runs:
+            return run
+        # Like `os.path.dirname`, only consider the prefixes of `run` that end
+        # right before a separator, and skip those which themselves end with a
+        # separator.
+        result = None
+        node = self._root
+        components = _split_path(run)
+        for component, end in components[:-1]:
+            node = node.get(component)
+            if node is None:
+                break
+            if (
+                component
+                and _SESSION_MARKER in node
+                and run[:end] in self._session_runs
+            ):
+                result = run[:end]
+        if result is not None:
+            return result
+        # Finally, `os.path.dirname` reaches the root of an absolute path or
+        # the empty string for a relative one.
+        root = run[: len(run) - len(run.lstrip(_SEPARATOR_CHARS))]
+        return root if root in self._session_runs else None
+
+
+def _split_path(path):
+    """Splits a path-like string into components.
 
     Returns:
-      The element in path_set which is the longest parent directory of 'path'.
+      A list of `(component, end)` pairs, where `end` is the index in `path`
+      right after the component.
     """
-    # This could likely be more efficiently implemented with a trie
-    # data-structure, but we don't want to add an extra dependency for that.
-    while path not in path_set:
-        if not path:
-            return None
-        path = os.path.dirname(path)
-    return path
+    result = []
+    start = 0
+    for match in _PATH_SEPARATORS.finditer(path):
+        result.append((path[start : match.start()], match.start()))
+        start = match.end()
+    result.append((path[start:], len(path)))
+    return result
+
+
+def _relative_group(run, session):
+    """Returns the metric group of `run` relative to its `session` run."""
+    remainder = run[len(session) :].lstrip(_SEPARATOR_CHARS)
+    components = _PATH_SEPARATORS.split(remainder)
+    if remainder and not any(c in ("", ".", "..") for c in components):
+        # Common case: no normalization is needed, and the result is the same
+        # as that of `os.path.relpath` without its file-system access.
+        return remainder
+    group = os.path.relpath(run, session)
+    # relpath() returns "." for the 'session' directory, we use an empty
+    # string, unless the run name actually ends with ".".
+    if group == "." and not run.endswith("."):
+        group = ""
+    return group
 
 
 def _can_be_converted_to_string(value):
@@ -1370,6 +1370,51 @@ class BackendContextTest(tf.test.TestCase):
         return metadata.create_summary_metadata(plugin_data).plugin_data.content
 
 
+class SessionRunIndexTest(tf.test.TestCase):
+    def test_group(self):
+        index = backend_context._SessionRunIndex(
+            ["exp/session1", "exp/session2", "exp/session2/eval/x"]
+        )
+        self.assertEqual("", index.group("exp/session1"))
+        self.assertEqual("eval", index.group("exp/session2/eval"))
+        self.assertEqual("", index.group("exp/session2/eval/x"))
+        self.assertEqual("y", index.group("exp/session2/eval/x/y"))
+        self.assertEqual(
+            "validation/a", index.group("exp/session2/validation/a")
+        )
+        self.assertIsNone(index.group("exp/no-session"))
+        self.assertIsNone(index.group("exp"))
+        self.assertIsNone(index.group("exp/session10"))
+
+    def test_group_normalizes_relative_path(self):
+        index = backend_context._SessionRunIndex(["exp/session"])
+        self.assertEqual("eval", index.group("exp/session//eval/"))
+        self.assertEqual("eval", index.group("exp/session/./eval"))
+        self.assertEqual("", index.group("exp/session/"))
+
+    def test_root_session(self):
+        index = backend_context._SessionRunIndex(["", "a/b"])
+        self.assertEqual("a", index.group("a"))
+        self.assertEqual("c", index.group("a/b/c"))
+        self.assertEqual("x/y", index.group("x/y"))
+
+    def test_absolute_runs(self):
+        index = backend_context._SessionRunIndex(
+            ["/foo/bar", "/foo", "/bar/foo"]
+        )
+        self.assertEqual("sub_dir", index.group("/foo/bar/sub_dir"))
+        self.assertEqual("baz", index.group("/foo/baz"))
+        self.assertIsNone(index.group("/baz"))
+
+    def test_index_reused_while_session_runs_unchanged(self):
+        ctx = backend_context.Context(base_plugin.TBContext())
+        first = ctx._get_session_run_index({"a", "b"})
+        self.assertIs(first, ctx._get_session_run_index({"b", "a"}))
+        second = ctx._get_session_run_index({"a", "b", "c"})
+        self.assertIsNot(first, second)
+        self.assertEqual("", second.group("c"))
+
+
 def _canonicalize_experiment(exp):
     """Sorts the repeated fields of an Experiment message."""
     exp.hparam_infos.sort(key=operator.attrgetter("name"))
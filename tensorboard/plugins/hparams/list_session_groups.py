@@ -18,11 +18,8 @@
 import collections
 import dataclasses
 import operator
-import re
 from typing import Optional
 
-from google.protobuf import struct_pb2
-
 from tensorboard.data import provider
 from tensorboard.plugins.hparams import api_pb2
 from tensorboard.plugins.hparams import backend_context as backend_context_lib
@@ -31,6 +28,7 @@ from tensorboard.plugins.hparams import json_format_compat
 from tensorboard.plugins.hparams import metadata
 from tensorboard.plugins.hparams import metrics
 from tensorboard.plugins.hparams import plugin_data_pb2
+from tensorboard.plugins.hparams import session_group_table
 
 
 class Handler:
@@ -74,7 +72,12 @@ class Handler:
 
         session_groups_from_tags = self._session_groups_from_tags()
         if session_groups_from_tags:
-            return self._create_response(session_groups_from_tags)
+            return self._create_response(
+                session_groups_from_tags,
+                reduce_to_hparams_to_include=_specifies_include(
+                    self._request.col_params
+                ),
+            )
 
         session_groups_from_data_provider = (
             self._session_groups_from_data_provider()
@@ -106,21 +109,78 @@ class Handler:
                 hyperparameters=[], session_groups=[]
             ),
         )
-        extractors = _create_extractors(self._request.col_params)
-        filters = _create_filters(self._request.col_params, extractors)
-
-        session_groups = self._build_session_groups(
+        table = self._session_group_table(
             hparams_run_to_tag_to_content, experiment.metric_infos
         )
-        session_groups = self._filter(session_groups, filters)
-        self._sort(session_groups, extractors)
+        return table.query(self._request.col_params)
+
+    def _session_group_table(self, hparams_run_to_tag_to_content, metric_infos):
+        """Returns a SessionGroupTable of all the session groups.
 
-        if _specifies_include(self._request.col_params):
-            _reduce_to_hparams_to_include(
-                session_groups, self._request.col_params
+        The table is served from the backend context's cache if it was built
+        from the same summary metadata and metric values, and is built (and
+        cached) otherwise.
+        """
+        session_names = [
+            run
+            for (run, tags) in hparams_run_to_tag_to_content.items()
+            if metadata.SESSION_START_INFO_TAG in tags
+        ]
+        all_metric_evals = (
+            self._read_metric_evals(session_names, metric_infos)
+            if self._include_metrics
+            else {}
+        )
+        cache_key = (
+            self._experiment_id,
+            self._include_metrics,
+            self._request.aggregation_type,
+            self._request.aggregation_metric.SerializeToString(
+                deterministic=True
+            ),
+            tuple(self._request.allowed_statuses),
+        )
+        cache_inputs = (
+            hparams_run_to_tag_to_content,
+            [
+                (metric_info.name.group, metric_info.name.tag)
+                for metric_info in metric_infos
+            ],
+            all_metric_evals,
+        )
+        cache = self._backend_context.session_group_table_cache
+        table = cache.get(cache_key, cache_inputs)
+        if table is None:
+            table = session_group_table.SessionGroupTable(
+                self._build_session_groups(
+                    hparams_run_to_tag_to_content,
+                    metric_infos,
+                    all_metric_evals,
+                )
             )
+            cache.put(cache_key, cache_inputs, table)
+        return table
 
-        return session_groups
+    def _read_metric_evals(self, session_names, metric_infos):
+        """Reads the last values of the given metrics in the given
+        sessions."""
+        metric_runs = set()
+        metric_tags = set()
+        for session_name in session_names:
+            for metric in metric_infos:
+                metric_name = metric.name
+                (run, tag) = metrics.run_tag_from_session_and_metric(
+                    session_name, metric_name
+                )
+                metric_runs.add(run)
+                metric_tags.add(tag)
+        return self._backend_context.read_last_scalars(
+            self._request_context,
+            self._experiment_id,
+            run_tag_filter=provider.RunTagFilter(
+                runs=metric_runs, tags=metric_tags
+            ),
+        )
 
     def _session_groups_from_data_provider(self):
         """Constructs lists of SessionGroups based on DataProvider results."""
@@ -213,19 +273,19 @@ class Handler:
             if group.sessions:
                 self._aggregate_metrics(group)
 
-        extractors = _create_extractors(self._request.col_params)
-        filters = _create_filters(
+        # The DataProvider has already sorted the session groups, so we only
+        # filter them by metric values here, keeping their order.
+        table = session_group_table.SessionGroupTable(session_groups)
+        return table.query(
             self._request.col_params,
-            extractors,
             # We assume the DataProvider will apply hparam filters and we do not
             # attempt to reapply them.
             include_hparam_filters=False,
+            sort=False,
         )
-        session_groups = self._filter(session_groups, filters)
-        return session_groups
 
     def _build_session_groups(
-        self, hparams_run_to_tag_to_content, metric_infos
+        self, hparams_run_to_tag_to_content, metric_infos, all_metric_evals
     ):
         """Returns a list of SessionGroups protobuffers from the summary
         data."""
@@ -236,36 +296,11 @@ class Handler:
         # protobuffer from each run and add it to the relevant SessionGroup object
         # in the 'groups_by_name' dict. We create the SessionGroup object, if this
         # is the first session of that group we encounter.
-        groups_by_name = {}
+        #
         # The TensorBoard runs with session start info are the
         # "sessions", which are not necessarily the runs that actually
         # contain metrics (may be in subdirectories).
-        session_names = [
-            run
-            for (run, tags) in hparams_run_to_tag_to_content.items()
-            if metadata.SESSION_START_INFO_TAG in tags
-        ]
-        metric_runs = set()
-        metric_tags = set()
-        for session_name in session_names:
-            for metric in metric_infos:
-                metric_name = metric.name
-                (run, tag) = metrics.run_tag_from_session_and_metric(
-                    session_name, metric_name
-                )
-                metric_runs.add(run)
-                metric_tags.add(tag)
-        all_metric_evals = (
-            self._backend_context.read_last_scalars(
-                self._request_context,
-                self._experiment_id,
-                run_tag_filter=provider.RunTagFilter(
-                    runs=metric_runs, tags=metric_tags
-                ),
-            )
-            if self._include_metrics
-            else {}
-        )
+        groups_by_name = {}
         for (
             session_name,
             tag_to_content,
@@ -413,138 +448,30 @@ class Handler:
                 % self._request.aggregation_type
             )
 
-    def _filter(self, session_groups, filters):
-        return [
-            sg for sg in session_groups if self._passes_all_filters(sg, filters)
+    def _create_response(
+        self, session_groups, reduce_to_hparams_to_include=False
+    ):
+        page = session_groups[
+            self._request.start_index : self._request.start_index
+            + self._request.slice_size
         ]
-
-    def _passes_all_filters(self, session_group, filters):
-        return all(filter_fn(session_group) for filter_fn in filters)
-
-    def _sort(self, session_groups, extractors):
-        """Sorts 'session_groups' in place according to _request.col_params."""
-
-        # Sort by session_group name so we have a deterministic order.
-        session_groups.sort(key=operator.attrgetter("name"))
-        # Sort by lexicographical order of the _request.col_params whose order
-        # is not ORDER_UNSPECIFIED. The first such column is the primary sorting
-        # key, the second is the secondary sorting key, etc. To achieve that we
-        # need to iterate on these columns in reverse order (thus the primary key
-        # is the key used in the last sort).
-        for col_param, extractor in reversed(
-            list(zip(self._request.col_params, extractors))
-        ):
-            if col_param.order == api_pb2.ORDER_UNSPECIFIED:
-                continue
-            if col_param.order == api_pb2.ORDER_ASC:
-                session_groups.sort(
-                    key=_create_key_func(
-                        extractor,
-                        none_is_largest=not col_param.missing_values_first,
-                    )
-                )
-            elif col_param.order == api_pb2.ORDER_DESC:
-                session_groups.sort(
-                    key=_create_key_func(
-                        extractor,
-                        none_is_largest=col_param.missing_values_first,
-                    ),
-                    reverse=True,
-                )
-            else:
-                raise error.HParamsError(
-                    "Unknown col_param.order given: %s" % col_param
-                )
-
-    def _create_response(self, session_groups):
+        if reduce_to_hparams_to_include:
+            # The session groups may be shared with a cached table, so only
+            # modify copies of those in the requested page.
+            page = [_copy_session_group(group) for group in page]
+            _reduce_to_hparams_to_include(page, self._request.col_params)
         return api_pb2.ListSessionGroupsResponse(
-            session_groups=session_groups[
-                self._request.start_index : self._request.start_index
-                + self._request.slice_size
-            ],
+            session_groups=page,
             total_size=len(session_groups),
         )
 
 
-def _create_key_func(extractor, none_is_largest):
-    """Returns a key_func to be used in list.sort().
-
-    Returns a key_func to be used in list.sort() that sorts session groups
-    by the value extracted by extractor. 'None' extracted values will either
-    be considered largest or smallest as specified by the "none_is_largest"
-    boolean parameter.
-
-    Args:
-      extractor: An extractor function that extract the key from the session
-        group.
-      none_is_largest: bool. If true treats 'None's as largest; otherwise
-        smallest.
-    """
-    if none_is_largest:
-
-        def key_func_none_is_largest(session_group):
-            value = extractor(session_group)
-            return (value is None, value)
-
-        return key_func_none_is_largest
-
-    def key_func_none_is_smallest(session_group):
-        value = extractor(session_group)
-        return (value is not None, value)
-
-    return key_func_none_is_smallest
-
-
-# Extractors. An extractor is a function that extracts some property (a metric
-# or a hyperparameter) from a SessionGroup instance.
-def _create_extractors(col_params):
-    """Creates extractors to extract properties corresponding to 'col_params'.
-
-    Args:
-      col_params: List of ListSessionGroupsRequest.ColParam protobufs.
-    Returns:
-      A list of extractor functions. The ith element in the
-      returned list extracts the column corresponding to the ith element of
-      _request.col_params
-    """
-    result = []
-    for col_param in col_params:
-        result.append(_create_extractor(col_param))
+def _copy_session_group(session_group):
+    result = api_pb2.SessionGroup()
+    result.CopyFrom(session_group)
     return result
 
 
-def _create_extractor(col_param):
-    if col_param.HasField("metric"):
-        return _create_metric_extractor(col_param.metric)
-    elif col_param.HasField("hparam"):
-        return _create_hparam_extractor(col_param.hparam)
-    else:
-        raise error.HParamsError(
-            'Got ColParam with both "metric" and "hparam" fields unset: %s'
-            % col_param
-        )
-
-
-def _create_metric_extractor(metric_name):
-    """Returns function that extracts a metric from a session group or a
-    session.
-
-    Args:
-      metric_name: tensorboard.hparams.MetricName protobuffer. Identifies the
-      metric to extract from the session group.
-    Returns:
-      A function that takes a tensorboard.hparams.SessionGroup or
-      tensorborad.hparams.Session protobuffer and returns the value of the metric
-      identified by 'metric_name' or None if the value doesn't exist.
-    """
-
-    def extractor_fn(session_or_group):
-        metric_value = _find_metric_value(session_or_group, metric_name)
-        return metric_value.value if metric_value else None
-
-    return extractor_fn
-
-
 def _find_metric_value(session_or_group, metric_name):
     """Returns the metric_value for a given metric in a session or session
     group.
@@ -568,172 +495,6 @@ def _find_metric_value(session_or_group, metric_name):
             return metric_value
 
 
-def _create_hparam_extractor(hparam_name):
-    """Returns an extractor function that extracts an hparam from a session
-    group.
-
-    Args:
-      hparam_name: str. Identies the hparam to extract from the session group.
-    Returns:
-      A function that takes a tensorboard.hparams.SessionGroup protobuffer and
-      returns the value, as a native Python object, of the hparam identified by
-      'hparam_name'.
-    """
-
-    def extractor_fn(session_group):
-        if hparam_name in session_group.hparams:
-            return _value_to_python(session_group.hparams[hparam_name])
-        return None
-
-    return extractor_fn
-
-
-# Filters. A filter is a boolean function that takes a session group and returns
-# True if it should be included in the result. Currently, Filters are functions
-# of a single column value extracted from the session group with a given
-# extractor specified in the construction of the filter.
-def _create_filters(col_params, extractors, *, include_hparam_filters=True):
-    """Creates filters for the given col_params.
-
-    Args:
-      col_params: List of ListSessionGroupsRequest.ColParam protobufs.
-      extractors: list of extractor functions of the same length as col_params.
-        Each element should extract the column described by the corresponding
-        element of col_params.
-      include_hparam_filters: bool that indicates whether hparam filters should
-        be generated. Defaults to True.
-    Returns:
-      A list of filter functions. Each corresponding to a single
-      col_params.filter oneof field of _request
-    """
-    result = []
-    for col_param, extractor in zip(col_params, extractors):
-        if not include_hparam_filters and col_param.hparam:
-            continue
-
-        a_filter = _create_filter(col_param, extractor)
-        if a_filter:
-            result.append(a_filter)
-    return result
-
-
-def _create_filter(col_param, extractor):
-    """Creates a filter for the given col_param and extractor.
-
-    Args:
-      col_param: A tensorboard.hparams.ColParams object identifying the column
-        and describing the filter to apply.
-      extractor: A function that extract the column value identified by
-        'col_param' from a tensorboard.hparams.SessionGroup protobuffer.
-    Returns:
-      A boolean function taking a tensorboard.hparams.SessionGroup protobuffer
-      returning True if the session group passes the filter described by
-      'col_param'. If col_param does not specify a filter (i.e. any session
-      group passes) returns None.
-    """
-    include_missing_values = not col_param.exclude_missing_values
-    if col_param.HasField("filter_regexp"):
-        value_filter_fn = _create_regexp_filter(col_param.filter_regexp)
-    elif col_param.HasField("filter_interval"):
-        value_filter_fn = _create_interval_filter(col_param.filter_interval)
-    elif col_param.HasField("filter_discrete"):
-        value_filter_fn = _create_discrete_set_filter(col_param.filter_discrete)
-    elif include_missing_values:
-        # No 'filter' field and include_missing_values is True.
-        # Thus, the resulting filter always returns True, so to optimize for this
-        # common case we do not include it in the list of filters to check.
-        return None
-    else:
-        value_filter_fn = lambda _: True
-
-    def filter_fn(session_group):
-        value = extractor(session_group)
-        if value is None:
-            return include_missing_values
-        return value_filter_fn(value)
-
-    return filter_fn
-
-
-def _create_regexp_filter(regex):
-    """Returns a boolean function that filters strings based on a regular exp.
-
-    Args:
-      regex: A string describing the regexp to use.
-    Returns:
-      A function taking a string and returns True if any of its substrings
-      matches regex.
-    """
-    # Warning: Note that python's regex library allows inputs that take
-    # exponential time. Time-limiting it is difficult. When we move to
-    # a true multi-tenant tensorboard server, the regexp implementation here
-    # would need to be replaced by something more secure.
-    compiled_regex = re.compile(regex)
-
-    def filter_fn(value):
-        if not isinstance(value, str):
-            raise error.HParamsError(
-                "Cannot use a regexp filter for a value of type %s. Value: %s"
-                % (type(value), value)
-            )
-        return re.search(compiled_regex, value) is not None
-
-    return filter_fn
-
-
-def _create_interval_filter(interval):
-    """Returns a function that checkes whether a number belongs to an interval.
-
-    Args:
-      interval: A tensorboard.hparams.Interval protobuf describing the interval.
-    Returns:
-      A function taking a number (float or int) that returns True if the number
-      belongs to (the closed) 'interval'.
-    """
-
-    def filter_fn(value):
-        if not isinstance(value, (int, float)):
-            raise error.HParamsError(
-                "Cannot use an interval filter for a value of type: %s, Value: %s"
-                % (type(value), value)
-            )
-        return interval.min_value <= value and value <= interval.max_value
-
-    return filter_fn
-
-
-def _create_discrete_set_filter(discrete_set):
-    """Returns a function that checks whether a value belongs to a set.
-
-    Args:
-      discrete_set: A list of objects representing the set.
-    Returns:
-      A function taking an object and returns True if its in the set. Membership
-      is tested using the Python 'in' operator (thus, equality of distinct
-      objects is computed using the '==' operator).
-    """
-
-    def filter_fn(value):
-        return value in discrete_set
-
-    return filter_fn
-
-
-def _value_to_python(value):
-    """Converts a google.protobuf.Value to a native Python object."""
-
-    assert isinstance(value, struct_pb2.Value)
-    field = value.WhichOneof("kind")
-    if field == "number_value":
-        return value.number_value
-    elif field == "string_value":
-        return value.string_value
-    elif field == "bool_value":
-        return value.bool_value
-    else:
-        raise ValueError("Unknown struct_pb2.Value oneof field set: %s" % field)
-
-
 @dataclasses.dataclass(frozen=True)
 class _MetricIdentifier:
     """An identifier for a metric.
@@ -937,7 +698,10 @@ def _build_data_provider_filter(col_param):
         )
     elif col_param.HasField("filter_discrete"):
         filter_type = provider.HyperparameterFilterType.DISCRETE
-        fltr = [_value_to_python(b) for b in col_param.filter_discrete.values]
+        fltr = [
+            session_group_table.value_to_python(b)
+            for b in col_param.filter_discrete.values
+        ]
     else:
         return None
 
@@ -2420,11 +2420,112 @@ class ListSessionGroupsTest(tf.test.TestCase):
             ["hparam1", "hparam3", "hparam4"],
         )
 
-    def _run_handler(self, request):
+    def test_session_group_table_reused_across_requests(self):
+        ctx = backend_context.Context(self._mock_tb_context)
+        request = """
+            col_params: {
+              metric: { tag: 'delta_temp' }
+              order: ORDER_DESC
+            }
+            allowed_statuses: [
+              STATUS_UNKNOWN,
+              STATUS_SUCCESS,
+              STATUS_FAILURE,
+              STATUS_RUNNING
+            ]
+            start_index: 0
+            slice_size: 2
+        """
+        with mock.patch.object(
+            metadata,
+            "parse_session_start_info_plugin_data",
+            wraps=metadata.parse_session_start_info_plugin_data,
+        ) as mock_parse:
+            first = self._run_handler(request, backend_context_=ctx)
+            num_parses = mock_parse.call_count
+            second = self._run_handler(
+                request.replace("ORDER_DESC", "ORDER_ASC"),
+                backend_context_=ctx,
+            )
+            # The session groups are not rebuilt for the second request.
+            self.assertEqual(num_parses, mock_parse.call_count)
+        self.assertEqual(
+            ["group_2", "group_1"], [sg.name for sg in first.session_groups]
+        )
+        self.assertEqual(
+            ["group_3", "group_1"], [sg.name for sg in second.session_groups]
+        )
+        self.assertEqual(3, second.total_size)
+
+    def test_session_group_table_rebuilt_on_new_metric_values(self):
+        ctx = backend_context.Context(self._mock_tb_context)
+        request = """
+            col_params: {
+              metric: { tag: 'delta_temp' }
+              order: ORDER_ASC
+            }
+            allowed_statuses: [
+              STATUS_UNKNOWN,
+              STATUS_SUCCESS,
+              STATUS_FAILURE,
+              STATUS_RUNNING
+            ]
+            start_index: 0
+            slice_size: 3
+        """
+        response = self._run_handler(request, backend_context_=ctx)
+        self.assertEqual(
+            ["group_3", "group_1", "group_2"],
+            [sg.name for sg in response.session_groups],
+        )
+
+        def read_last_scalars_with_new_value(*args, **kwargs):
+            result = self._mock_read_last_scalars(*args, **kwargs)
+            result["session_2"]["delta_temp"] = provider.ScalarDatum(
+                wall_time=12, step=4, value=-1000.0
+            )
+            return result
+
+        self._mock_tb_context.data_provider.read_last_scalars.side_effect = (
+            read_last_scalars_with_new_value
+        )
+        response = self._run_handler(request, backend_context_=ctx)
+        self.assertEqual(
+            ["group_2", "group_3", "group_1"],
+            [sg.name for sg in response.session_groups],
+        )
+
+    def test_include_in_result_does_not_modify_cached_groups(self):
+        ctx = backend_context.Context(self._mock_tb_context)
+        request = """
+            col_params: {
+              hparam: 'initial_temp'
+              include_in_result: false
+            }
+            allowed_statuses: [
+              STATUS_UNKNOWN,
+              STATUS_SUCCESS,
+              STATUS_FAILURE,
+              STATUS_RUNNING
+            ]
+            start_index: 0
+            slice_size: 3
+        """
+        response = self._run_handler(request, backend_context_=ctx)
+        self.assertNotIn("initial_temp", response.session_groups[0].hparams)
+        response = self._run_handler(
+            request.replace("include_in_result: false", ""),
+            backend_context_=ctx,
+        )
+        self.assertIn("initial_temp", response.session_groups[0].hparams)
+
+    def _run_handler(self, request, backend_context_=None):
         request_proto = api_pb2.ListSessionGroupsRequest()
         text_format.Merge(request, request_proto)
+        if backend_context_ is None:
+            backend_context_ = backend_context.Context(self._mock_tb_context)
         handler = list_session_groups.Handler(
-            backend_context=backend_context.Context(self._mock_tb_context),
+            backend_context=backend_context_,
             request_context=context.RequestContext(),
             experiment_id="123",
             request=request_proto,
@@ -0,0 +1,401 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""A materialized, columnar table of session groups.
+
+The ListSessionGroups handler builds every SessionGroup of an experiment
+from the hparams summary metadata and the latest metric values. Building
+these protos dominates the cost of the request for experiments with many
+sessions, yet the result only changes when new runs or metric values
+arrive. A `SessionGroupTable` holds the built session groups together with
+lazily extracted columns (one per hparam or metric) so that filtering,
+sorting and pagination can be done with NumPy operations over column codes
+rather than by calling Python closures on each SessionGroup proto.
+"""
+
+
+import collections
+import re
+import threading
+
+import numpy as np
+
+from google.protobuf import struct_pb2
+
+from tensorboard.plugins.hparams import api_pb2
+from tensorboard.plugins.hparams import error
+
+
+# Maximum number of tables kept by a `SessionGroupTableCache`. Each entry
+# corresponds to a distinct (experiment, aggregation, allowed statuses)
+# combination, so a small number suffices for the usual dashboard traffic.
+_DEFAULT_CACHE_CAPACITY = 16
+
+
+class SessionGroupTable:
+    """An immutable table of session groups with columnar accessors.
+
+    The session groups held by a table are shared between requests and
+    must not be modified. Callers that need to alter a session group (for
+    example to drop hparams from a response) must copy it first.
+    """
+
+    def __init__(self, session_groups):
+        """Initializes the table.
+
+        Args:
+          session_groups: An iterable of `api_pb2.SessionGroup` protos. The
+            table takes ownership of them.
+        """
+        self._session_groups = list(session_groups)
+        self._metric_values = [
+            {
+                (metric_value.name.group, metric_value.name.tag): (
+                    metric_value.value
+                )
+                for metric_value in group.metric_values
+            }
+            for group in self._session_groups
+        ]
+        self._name_ranks = None
+        self._columns = {}
+        self._columns_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._session_groups)
+
+    @property
+    def session_groups(self):
+        """The session groups of the table, in construction order."""
+        return self._session_groups
+
+    def query(self, col_params, *, include_hparam_filters=True, sort=True):
+        """Filters and sorts the table according to `col_params`.
+
+        Semantics match those of the ListSessionGroups API: a session group
+        is kept if it passes the filters of all columns, and the result is
+        sorted lexicographically by the columns with a specified order, in
+        the order they appear in `col_params`. Ties are broken by session
+        group name.
+
+        Args:
+          col_params: List of ColParams protobufs.
+          include_hparam_filters: bool. Whether to apply filters on hparam
+            columns. Set to False if these have already been applied.
+          sort: bool. Whether to sort the result. If False, the result is in
+            the order in which the session groups were given to the table.
+
+        Returns:
+          A list of `api_pb2.SessionGroup` protos. These are shared with the
+          table and must not be modified.
+
+        Raises:
+          error.HParamsError: If a column param is malformed or if a filter
+            does not apply to the type of values in its column.
+        """
+        column_keys = [_column_key(col_param) for col_param in col_params]
+        mask = np.ones(len(self._session_groups), dtype=bool)
+        for col_param, column_key in zip(col_params, column_keys):
+            if not include_hparam_filters and col_param.hparam:
+                continue
+            column_mask = self._filter_mask(col_param, column_key)
+            if column_mask is not None:
+                mask &= column_mask
+        indices = np.flatnonzero(mask)
+        if sort:
+            indices = self._sort(indices, col_params, column_keys)
+        return [self._session_groups[i] for i in indices]
+
+    def _column(self, column_key):
+        """Returns the `_Column` identified by `column_key`, computing it if
+        needed."""
+        column = self._columns.get(column_key)
+        if column is not None:
+            return column
+        (kind, name) = column_key
+        if kind == "hparam":
+            values = (
+                (
+                    value_to_python(group.hparams[name])
+                    if name in group.hparams
+                    else None
+                )
+                for group in self._session_groups
+            )
+        else:
+            values = (
+                metric_values.get(name) for metric_values in self._metric_values
+            )
+        column = _Column(values)
+        with self._columns_lock:
+            return self._columns.setdefault(column_key, column)
+
+    def _filter_mask(self, col_param, column_key):
+        """Returns a boolean mask of the rows passing the filter of
+        `col_param`, or None if every row passes."""
+        include_missing_values = not col_param.exclude_missing_values
+        if col_param.HasField("filter_regexp"):
+            value_filter_fn = _create_regexp_filter(col_param.filter_regexp)
+        elif col_param.HasField("filter_interval"):
+            value_filter_fn = _create_interval_filter(col_param.filter_interval)
+        elif col_param.HasField("filter_discrete"):
+            discrete_set = col_param.filter_discrete
+            value_filter_fn = lambda value: value in discrete_set
+        elif include_missing_values:
+            return None
+        else:
+            value_filter_fn = lambda _: True
+        column = self._column(column_key)
+        # Evaluate the filter once per distinct value, and then broadcast
+        # the result to all rows through the column codes. Missing values
+        # have code -1, which maps to the final entry.
+        passes = np.fromiter(
+            (value_filter_fn(value) for value in column.distinct_values),
+            dtype=bool,
+            count=len(column.distinct_values),
+        )
+        passes = np.append(passes, include_missing_values)
+        return passes[column.codes]
+
+    def _sort(self, indices, col_params, column_keys):
+        """Sorts row `indices` according to the order given in
+        `col_params`."""
+        # np.lexsort uses the last key as the primary one, so the name ranks
+        # come first to break ties by session group name.
+        sort_keys = [self._get_name_ranks()[indices]]
+        for col_param, column_key in zip(col_params, column_keys):
+            if col_param.order == api_pb2.ORDER_UNSPECIFIED:
+                continue
+            if col_param.order not in (api_pb2.ORDER_ASC, api_pb2.ORDER_DESC):
+                raise error.HParamsError(
+                    "Unknown col_param.order given: %s" % col_param
+                )
+            column = self._column(column_key)
+            ranks = column.ranks[column.codes[indices]]
+            num_ranks = column.num_ranks
+            if col_param.order == api_pb2.ORDER_DESC:
+                ranks = num_ranks - 1 - ranks
+            # Missing values have code -1 and therefore the rank of the final
+            # entry, which we place first or last as requested.
+            missing = column.codes[indices] < 0
+            ranks = np.where(
+                missing,
+                -1 if col_param.missing_values_first else num_ranks,
+                ranks,
+            )
+            sort_keys.insert(1, ranks)
+        return indices[np.lexsort(sort_keys)]
+
+    def _get_name_ranks(self):
+        """Returns an int array holding the rank of each row's session group
+        name."""
+        if self._name_ranks is None:
+            order = sorted(
+                range(len(self._session_groups)),
+                key=lambda i: self._session_groups[i].name,
+            )
+            name_ranks = np.empty(len(order), dtype=np.int64)
+            name_ranks[order] = np.arange(len(order))
+            self._name_ranks = name_ranks
+        return self._name_ranks
+
+
+class _Column:
+    """The values of a single hparam or metric across a table.
+
+    Attributes:
+      distinct_values: A list of the distinct non-missing values of the
+        column, as native Python objects.
+      codes: An int array with one entry per row, holding the index of the
+        row's value in `distinct_values`, or -1 if the value is missing.
+    """
+
+    __slots__ = ["distinct_values", "codes", "_ranks", "_num_ranks"]
+
+    def __init__(self, values):
+        value_to_code = {}
+        codes = []
+        for value in values:
+            if value is None:
+                codes.append(-1)
+                continue
+            # Key on the type too, so that e.g. True and 1.0 stay distinct.
+            key = (type(value), value)
+            code = value_to_code.get(key)
+            if code is None:
+                code = value_to_code[key] = len(value_to_code)
+            codes.append(code)
+        self.distinct_values = [value for (_, value) in value_to_code]
+        self.codes = np.array(codes, dtype=np.int64)
+        self._ranks = None
+        self._num_ranks = None
+
+    @property
+    def ranks(self):
+        """An int array mapping each code to the rank of its value.
+
+        Equal values share a rank. The array has one extra trailing entry
+        so that it can be indexed by the code -1 of missing values.
+        """
+        if self._ranks is None:
+            self._compute_ranks()
+        return self._ranks
+
+    @property
+    def num_ranks(self):
+        """The number of distinct ranks among non-missing values."""
+        if self._ranks is None:
+            self._compute_ranks()
+        return self._num_ranks
+
+    def _compute_ranks(self):
+        # Sorting the distinct values with Python's comparison operators
+        # keeps the ordering (and errors on incomparable values) consistent
+        # with sorting the session groups themselves.
+        order = sorted(
+            range(len(self.distinct_values)),
+            key=self.distinct_values.__getitem__,
+        )
+        ranks = np.zeros(len(self.distinct_values) + 1, dtype=np.int64)
+        rank = -1
+        previous = None
+        for position, code in enumerate(order):
+            value = self.distinct_values[code]
+            if position == 0 or value != previous:
+                rank += 1
+                previous = value
+            ranks[code] = rank
+        self._num_ranks = rank + 1
+        self._ranks = ranks
+
+
+class SessionGroupTableCache:
+    """A thread-safe LRU cache of `SessionGroupTable`s.
+
+    Tables are keyed by the parameters that determine how they are built,
+    and are valid only for the inputs they were built from: a lookup with
+    different inputs (for instance because new runs or metric values have
+    arrived) is a miss.
+    """
+
+    def __init__(self, capacity=_DEFAULT_CACHE_CAPACITY):
+        if capacity < 1:
+            raise ValueError("The cache capacity must be >=1")
+        self._capacity = capacity
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, inputs):
+        """Returns the table cached for `key` if it was built from `inputs`.
+
+        Args:
+          key: A hashable value identifying how the table was built.
+          inputs: A value supporting `==`, representing the data the table
+            was built from.
+
+        Returns:
+          A `SessionGroupTable`, or None if there is no valid cached table.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        (cached_inputs, table) = entry
+        if cached_inputs != inputs:
+            return None
+        return table
+
+    def put(self, key, inputs, table):
+        """Caches `table`, built from `inputs`, under `key`."""
+        with self._lock:
+            self._entries[key] = (inputs, table)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+
+
+def _column_key(col_param):
+    """Returns a hashable key identifying the column of `col_param`."""
+    if col_param.HasField("metric"):
+        return ("metric", (col_param.metric.group, col_param.metric.tag))
+    elif col_param.HasField("hparam"):
+        return ("hparam", col_param.hparam)
+    else:
+        raise error.HParamsError(
+            'Got ColParam with both "metric" and "hparam" fields unset: %s'
+            % col_param
+        )
+
+
+def _create_regexp_filter(regex):
+    """Returns a boolean function that filters strings based on a regular exp.
+
+    Args:
+      regex: A string describing the regexp to use.
+    Returns:
+      A function taking a string and returns True if any of its substrings
+      matches regex.
+    """
+    # Warning: Note that python's regex library allows inputs that take
+    # exponential time. Time-limiting it is difficult. When we move to
+    # a true multi-tenant tensorboard server, the regexp implementation here
+    # would need to be replaced by something more secure.
+    compiled_regex = re.compile(regex)
+
+    def filter_fn(value):
+        if not isinstance(value, str):
+            raise error.HParamsError(
+                "Cannot use a regexp filter for a value of type %s. Value: %s"
+                % (type(value), value)
+            )
+        return re.search(compiled_regex, value) is not None
+
+    return filter_fn
+
+
+def _create_interval_filter(interval):
+    """Returns a function that checkes whether a number belongs to an interval.
+
+    Args:
+      interval: A tensorboard.hparams.Interval protobuf describing the interval.
+    Returns:
+      A function taking a number (float or int) that returns True if the number
+      belongs to (the closed) 'interval'.
+    """
+
+    def filter_fn(value):
+        if not isinstance(value, (int, float)):
+            raise error.HParamsError(
+                "Cannot use an interval filter for a value of type: %s, Value: %s"
+                % (type(value), value)
+            )
+        return interval.min_value <= value and value <= interval.max_value
+
+    return filter_fn
+
+
+def value_to_python(value):
+    """Converts a google.protobuf.Value to a native Python object."""
+
+    assert isinstance(value, struct_pb2.Value)
+    field = value.WhichOneof("kind")
+    if field == "number_value":
+        return value.number_value
+    elif field == "string_value":
+        return value.string_value
+    elif field == "bool_value":
+        return value.bool_value
+    else:
+        raise ValueError("Unknown struct_pb2.Value oneof field set: %s" % field)
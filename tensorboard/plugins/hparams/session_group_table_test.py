@@ -0,0 +1,192 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for session_group_table."""
+
+
+from google.protobuf import text_format
+from tensorboard import test as tb_test
+from tensorboard.plugins.hparams import api_pb2
+from tensorboard.plugins.hparams import error
+from tensorboard.plugins.hparams import session_group_table
+
+
+def _session_group(name, hparams=None, metrics=None):
+    group = api_pb2.SessionGroup(name=name)
+    for key, value in (hparams or {}).items():
+        if isinstance(value, bool):
+            group.hparams[key].bool_value = value
+        elif isinstance(value, str):
+            group.hparams[key].string_value = value
+        else:
+            group.hparams[key].number_value = value
+    for tag, value in (metrics or {}).items():
+        group.metric_values.add(name=api_pb2.MetricName(tag=tag), value=value)
+    return group
+
+
+def _col_params(*text_protos):
+    return [
+        text_format.Parse(text, api_pb2.ColParams()) for text in text_protos
+    ]
+
+
+class SessionGroupTableTest(tb_test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self._table = session_group_table.SessionGroupTable(
+            [
+                _session_group("d", {"lr": 0.1, "opt": "adam"}, {"loss": 3.0}),
+                _session_group("b", {"lr": 0.01, "opt": "sgd"}, {"loss": 1.0}),
+                _session_group("c", {"lr": 0.1, "opt": "sgd"}),
+                _session_group("a", {"opt": "adam"}, {"loss": 2.0}),
+            ]
+        )
+
+    def _query_names(self, *text_protos, **kwargs):
+        return [
+            group.name
+            for group in self._table.query(_col_params(*text_protos), **kwargs)
+        ]
+
+    def test_no_col_params_sorts_by_name(self):
+        self.assertEqual(["a", "b", "c", "d"], self._query_names())
+
+    def test_no_sort_keeps_construction_order(self):
+        self.assertEqual(
+            ["d", "b", "c", "a"], self._query_names("hparam: 'lr'", sort=False)
+        )
+
+    def test_filter_interval(self):
+        self.assertEqual(
+            ["a", "c", "d"],
+            self._query_names(
+                "hparam: 'lr' filter_interval { min_value: 0.05 max_value: 1 }"
+            ),
+        )
+        self.assertEqual(
+            ["c", "d"],
+            self._query_names(
+                """
+                hparam: 'lr'
+                filter_interval { min_value: 0.05 max_value: 1 }
+                exclude_missing_values: true
+                """
+            ),
+        )
+
+    def test_filter_regexp(self):
+        self.assertEqual(
+            ["b", "c"],
+            self._query_names("hparam: 'opt' filter_regexp: 'g'"),
+        )
+
+    def test_filter_regexp_on_numbers_raises(self):
+        with self.assertRaises(error.HParamsError):
+            self._query_names("hparam: 'lr' filter_regexp: '0'")
+
+    def test_filter_discrete(self):
+        self.assertEqual(
+            ["a", "d"],
+            self._query_names(
+                "hparam: 'opt' filter_discrete { values { string_value: 'adam' } }"
+            ),
+        )
+
+    def test_filter_multiple_columns(self):
+        self.assertEqual(
+            ["d"],
+            self._query_names(
+                "hparam: 'opt' filter_regexp: 'adam'",
+                "metric { tag: 'loss' } exclude_missing_values: true",
+                "hparam: 'lr' exclude_missing_values: true",
+            ),
+        )
+
+    def test_skip_hparam_filters(self):
+        self.assertEqual(
+            ["a", "b", "d"],
+            self._query_names(
+                "hparam: 'opt' filter_regexp: 'adam'",
+                "metric { tag: 'loss' } exclude_missing_values: true",
+                include_hparam_filters=False,
+            ),
+        )
+
+    def test_sort_multiple_columns(self):
+        self.assertEqual(
+            ["b", "d", "c", "a"],
+            self._query_names(
+                "hparam: 'lr' order: ORDER_ASC",
+                "metric { tag: 'loss' } order: ORDER_DESC",
+            ),
+        )
+
+    def test_sort_missing_values_first(self):
+        self.assertEqual(
+            ["a", "b", "c", "d"],
+            self._query_names(
+                "hparam: 'lr' order: ORDER_ASC missing_values_first: true"
+            ),
+        )
+        self.assertEqual(
+            ["a", "c", "d", "b"],
+            self._query_names(
+                "hparam: 'lr' order: ORDER_DESC missing_values_first: true"
+            ),
+        )
+        self.assertEqual(
+            ["c", "d", "b", "a"],
+            self._query_names("hparam: 'lr' order: ORDER_DESC"),
+        )
+
+    def test_col_param_without_column_raises(self):
+        with self.assertRaises(error.HParamsError):
+            self._query_names("order: ORDER_ASC")
+
+    def test_empty_table(self):
+        table = session_group_table.SessionGroupTable([])
+        col_params = _col_params(
+            "hparam: 'lr' order: ORDER_ASC exclude_missing_values: true"
+        )
+        self.assertEqual([], table.query(col_params))
+
+
+class SessionGroupTableCacheTest(tb_test.TestCase):
+    def test_hit_requires_same_inputs(self):
+        cache = session_group_table.SessionGroupTableCache()
+        table = session_group_table.SessionGroupTable([])
+        cache.put("key", {"run": 1}, table)
+        self.assertIs(table, cache.get("key", {"run": 1}))
+        self.assertIsNone(cache.get("key", {"run": 2}))
+        self.assertIsNone(cache.get("other_key", {"run": 1}))
+
+    def test_evicts_least_recently_used(self):
+        cache = session_group_table.SessionGroupTableCache(capacity=2)
+        tables = [session_group_table.SessionGroupTable([]) for _ in range(3)]
+        cache.put(0, None, tables[0])
+        cache.put(1, None, tables[1])
+        cache.get(0, None)
+        cache.put(2, None, tables[2])
+        self.assertIs(tables[0], cache.get(0, None))
+        self.assertIsNone(cache.get(1, None))
+        self.assertIs(tables[2], cache.get(2, None))
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            session_group_table.SessionGroupTableCache(capacity=0)
+
+
+if __name__ == "__main__":
+    tb_test.main()
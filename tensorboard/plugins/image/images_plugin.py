@@ -204,9 +204,9 @@ class ImagesPlugin(base_plugin.TBPlugin):
           blob_key: As returned by a previous `read_blob_sequences` call.
 
         Returns:
-          A bytestring of the raw image bytes.
+          An iterator of chunks of the raw image bytes.
         """
-        return self._data_provider.read_blob(ctx, blob_key=blob_key)
+        return self._data_provider.read_blob_stream(ctx, blob_key=blob_key)
 
     @wrappers.Request.application
     def _serve_individual_image(self, request):
@@ -214,7 +214,7 @@ class ImagesPlugin(base_plugin.TBPlugin):
         try:
             ctx = plugin_util.context(request.environ)
             blob_key = request.args["blob_key"]
-            data = self._get_generic_data_individual_image(ctx, blob_key)
+            chunks = self._get_generic_data_individual_image(ctx, blob_key)
         except (KeyError, IndexError):
             return http_util.Respond(
                 request,
@@ -222,8 +222,13 @@ class ImagesPlugin(base_plugin.TBPlugin):
                 "text/plain",
                 code=400,
             )
-        mime_type = img_mime_type_detector.from_bytes(data)
-        return http_util.Respond(request, data, mime_type)
+        # The image header is in the first chunk, so the rest of the blob
+        # can be streamed to the client without buffering it.
+        (head, chunks, content_length) = http_util.peek_stream(chunks)
+        mime_type = img_mime_type_detector.from_bytes(head)
+        return http_util.RespondStream(
+            request, chunks, mime_type, content_length=content_length
+        )
 
     @wrappers.Request.application
     def _serve_tags(self, request):
@@ -220,6 +220,10 @@ class ImagesPluginTest(tf.test.TestCase):
         )
         self.assertEqual(200, response.status_code)
         self.assertEqual("image/png", response.headers.get("content-type"))
+        self.assertEqual(
+            str(len(response.get_data())),
+            response.headers.get("content-length"),
+        )
 
     def testRunsRoute(self):
         """Tests that the /runs route offers the correct run to tag mapping."""
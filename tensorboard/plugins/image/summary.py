@@ -138,7 +138,7 @@ def pb(name, images, max_outputs=3, display_name=None, description=None):
         raise ValueError("Shape %r must have rank 4" % (images.shape,))
 
     limited_images = images[:max_outputs]
-    encoded_images = [encoder.encode_png(image) for image in limited_images]
+    encoded_images = encoder.encode_png_batch(limited_images)
     (width, height) = (images.shape[2], images.shape[1])
     content = [str(width), str(height)] + encoded_images
     tensor = tf.make_tensor_proto(content, dtype=tf.string)
@@ -38,6 +38,13 @@ _SINGLE_RUN_PLUGINS = frozenset(
 
 _SAMPLED_PLUGINS = frozenset([image_metadata.PLUGIN_NAME])
 
+# Values of a `TimeSeriesRequest`'s `histogramFormat` (see http_api.md).
+_HISTOGRAM_FORMAT_BINS = "bins"
+_HISTOGRAM_FORMAT_COLUMNS = "columns"
+_HISTOGRAM_FORMATS = frozenset(
+    [_HISTOGRAM_FORMAT_BINS, _HISTOGRAM_FORMAT_COLUMNS]
+)
+
 
 def _get_tag_description_info(mapping):
     """Gets maps from tags to descriptions, and descriptions to runs.
@@ -435,6 +442,12 @@ class MetricsPlugin(base_plugin.TBPlugin):
         if plugin in _SAMPLED_PLUGINS and not isinstance(sample, int):
             return "Missing sample"
 
+        histogram_format = series_request.get(
+            "histogramFormat", _HISTOGRAM_FORMAT_BINS
+        )
+        if histogram_format not in _HISTOGRAM_FORMATS:
+            return "Invalid histogramFormat"
+
         return None
 
     def _get_time_series(self, ctx, experiment, series_request):
@@ -467,7 +480,11 @@ class MetricsPlugin(base_plugin.TBPlugin):
 
         if plugin == histogram_metadata.PLUGIN_NAME:
             run_to_series = self._get_run_to_histogram_series(
-                ctx, experiment, tag, runs
+                ctx,
+                experiment,
+                tag,
+                runs,
+                series_request.get("histogramFormat", _HISTOGRAM_FORMAT_BINS),
             )
 
         if plugin == image_metadata.PLUGIN_NAME:
@@ -514,20 +531,21 @@ class MetricsPlugin(base_plugin.TBPlugin):
 
         return run_to_series
 
-    def _format_histogram_datum_bins(self, datum):
+    def _format_histogram_bins(self, bucket_list):
         """Formats a histogram datum's bins for client consumption.
 
         Args:
-            datum: a DataProvider's TensorDatum.
+            bucket_list: a histogram's buckets, as a list of
+                `[left_edge, right_edge, count]` lists.
 
         Returns:
             A list of `HistogramBin`s (see http_api.md).
         """
-        numpy_list = datum.numpy.tolist()
-        bins = [{"min": x[0], "max": x[1], "count": x[2]} for x in numpy_list]
-        return bins
+        return [{"min": x[0], "max": x[1], "count": x[2]} for x in bucket_list]
 
-    def _get_run_to_histogram_series(self, ctx, experiment, tag, runs):
+    def _get_run_to_histogram_series(
+        self, ctx, experiment, tag, runs, histogram_format
+    ):
         """Builds a run-to-histogram-series dict for client consumption.
 
         Args:
@@ -535,11 +553,15 @@ class MetricsPlugin(base_plugin.TBPlugin):
             experiment: a string experiment id.
             tag: string of the requested tag.
             runs: optional list of run names as strings.
+            histogram_format: `"bins"` or `"columns"`, as requested by the
+                `histogramFormat` of a `TimeSeriesRequest`.
 
         Returns:
-            A map from string run names to `HistogramStepDatum` (see http_api.md).
+            A map from string run names to `HistogramStepDatum` lists, or
+            to `HistogramColumns` for the `"columns"` format (see
+            http_api.md).
         """
-        mapping = self._data_provider.read_tensors(
+        mapping = self._data_provider.read_tensors_columnar(
             ctx,
             experiment_id=experiment,
             plugin_name=histogram_metadata.PLUGIN_NAME,
@@ -551,13 +573,26 @@ class MetricsPlugin(base_plugin.TBPlugin):
         for result_run, tag_data in mapping.items():
             if tag not in tag_data:
                 continue
+            columns = tag_data[tag]
+            wall_times = columns.wall_time.tolist()
+            steps = columns.step.tolist()
+            bucket_lists = columns.tolist()
+            if histogram_format == _HISTOGRAM_FORMAT_COLUMNS:
+                run_to_series[result_run] = {
+                    "wallTime": wall_times,
+                    "step": steps,
+                    "bins": bucket_lists,
+                }
+                continue
             values = [
                 {
-                    "wallTime": datum.wall_time,
-                    "step": datum.step,
-                    "bins": self._format_histogram_datum_bins(datum),
+                    "wallTime": wall_time,
+                    "step": step,
+                    "bins": self._format_histogram_bins(bucket_list),
                 }
-                for datum in tag_data[tag]
+                for (wall_time, step, bucket_list) in zip(
+                    wall_times, steps, bucket_lists
+                )
             ]
             run_to_series[result_run] = values
 
@@ -453,6 +453,36 @@ class MetricsPluginTest(tf.test.TestCase):
             clean_response,
         )
 
+    def test_time_series_histogram_columns(self):
+        self._write_histogram_data("run1", "histograms/tagA", [0, 10])
+        self._multiplexer.Reload()
+
+        request = {
+            "plugin": "histograms",
+            "tag": "histograms/tagA",
+            "run": "run1",
+        }
+        (bins_response,) = self._plugin._time_series_impl(
+            context.RequestContext(), "", [request]
+        )
+        request["histogramFormat"] = "columns"
+        (columns_response,) = self._plugin._time_series_impl(
+            context.RequestContext(), "", [request]
+        )
+
+        series = bins_response["runToSeries"]["run1"]
+        columns = columns_response["runToSeries"]["run1"]
+        self.assertEqual([0, 1], columns["step"])
+        self.assertEqual([d["wallTime"] for d in series], columns["wallTime"])
+        self.assertEqual(
+            [
+                [[b["min"], b["max"], b["count"]] for b in d["bins"]]
+                for d in series
+            ],
+            columns["bins"],
+        )
+        self.assertEqual([10, 10, 1.0], columns["bins"][1][-1])
+
     def test_time_series_unmatching_request(self):
         self._write_scalar_data("run1", "scalars/tagA", [0, 100, -200])
 
@@ -627,6 +657,12 @@ class MetricsPluginTest(tf.test.TestCase):
         requests = [
             {"plugin": "images"},
             {"plugin": "unknown_plugin", "tag": "tagA"},
+            {
+                "plugin": "histograms",
+                "tag": "tagA",
+                "run": "run1",
+                "histogramFormat": "dicts",
+            },
         ]
         response = self._plugin._time_series_impl(
             context.RequestContext(), "expid", requests
@@ -635,7 +671,10 @@ class MetricsPluginTest(tf.test.TestCase):
             series_response.get("error", "") for series_response in response
         ]
 
-        self.assertEqual(errors, ["Missing tag", "Invalid plugin"])
+        self.assertEqual(
+            errors,
+            ["Missing tag", "Invalid plugin", "Invalid histogramFormat"],
+        )
 
     def test_image_data_from_time_series_query(self):
         self._write_image("run1", "images/tagA", samples=3)
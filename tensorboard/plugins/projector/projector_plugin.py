@@ -15,10 +15,15 @@
 """The Embedding Projector plugin."""
 
 
+import atexit
 import collections
 import functools
+import hashlib
 import mimetypes
 import os
+import shutil
+import struct
+import tempfile
 import threading
 
 import numpy as np
@@ -30,6 +35,7 @@ from google.protobuf import text_format
 from tensorboard import context
 from tensorboard.backend.event_processing import plugin_asset_util
 from tensorboard.backend.http_util import Respond
+from tensorboard.backend.http_util import RespondStream
 from tensorboard.compat import tf
 from tensorboard.plugins import base_plugin
 from tensorboard.plugins.projector import metadata
@@ -39,7 +45,31 @@ from tensorboard.util import img_mime_type_detector, tb_logging
 logger = tb_logging.get_logger()
 
 # Number of tensors in the LRU cache.
-_TENSOR_CACHE_CAPACITY = 1
+_TENSOR_CACHE_CAPACITY = 16
+
+# Total size of the tensors in the LRU cache that are held in memory.
+# Memory-mapped tensors do not count toward this budget.
+_TENSOR_CACHE_MAX_BYTES = 1 << 30
+
+# Number of lines of a tensor TSV file to parse at once.
+_TSV_PARSE_CHUNK_LINES = 16384
+
+# Size of each chunk of a streamed tensor or metadata response.
+_RESPONSE_CHUNK_BYTES = 1 << 20
+
+# Number of metadata and bookmarks files in the LRU cache, and their
+# total size. Larger files are read on each request without caching.
+_ASSET_FILE_CACHE_CAPACITY = 16
+_ASSET_FILE_CACHE_MAX_BYTES = 512 << 20
+
+# Directory for binary copies of tensor TSV files, keyed by path, size,
+# and modification time. If `None`, a private directory is created on
+# first use and removed when the process exits.
+_TENSOR_SIDECAR_DIR = None
+_tensor_sidecar_dir_lock = threading.Lock()
+
+# Header of a binary tensor sidecar: number of rows and columns.
+_TENSOR_SIDECAR_HEADER = struct.Struct("<qq")
 
 # HTTP routes.
 CONFIG_ROUTE = "/info"
@@ -53,32 +83,48 @@ SPRITE_IMAGE_ROUTE = "/sprite_image"
 class LRUCache:
     """LRU cache.
 
-    Used for storing the last used tensor.
+    Used for storing the last used tensors. Entries are evicted once there
+    are more than `size` of them or once their total `sizeof` exceeds
+    `max_bytes`, but the most recently set entry is always kept.
     """
 
-    def __init__(self, size):
+    def __init__(self, size, max_bytes=None, sizeof=None):
         if size < 1:
             raise ValueError("The cache size must be >=1")
         self._size = size
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._bytes = 0
         self._dict = collections.OrderedDict()
+        self._lock = threading.Lock()
 
     def get(self, key):
-        try:
-            value = self._dict.pop(key)
-            self._dict[key] = value
-            return value
-        except KeyError:
-            return None
+        with self._lock:
+            try:
+                value = self._dict.pop(key)
+                self._dict[key] = value
+                return value
+            except KeyError:
+                return None
 
     def set(self, key, value):
         if value is None:
             raise ValueError("value must be != None")
-        try:
-            self._dict.pop(key)
-        except KeyError:
-            if len(self._dict) >= self._size:
-                self._dict.popitem(last=False)
-        self._dict[key] = value
+        with self._lock:
+            old_value = self._dict.pop(key, None)
+            if old_value is not None:
+                self._bytes -= self._sizeof(old_value)
+            self._dict[key] = value
+            self._bytes += self._sizeof(value)
+            while len(self._dict) > 1 and (
+                len(self._dict) > self._size
+                or (
+                    self._max_bytes is not None
+                    and self._bytes > self._max_bytes
+                )
+            ):
+                (_, evicted) = self._dict.popitem(last=False)
+                self._bytes -= self._sizeof(evicted)
 
 
 class EmbeddingMetadata:
@@ -139,21 +185,303 @@ class EmbeddingMetadata:
         self.name_to_values[column_name] = column_values
 
 
+def _file_fingerprint(fpath):
+    """Returns a value that changes whenever the file at `fpath` does."""
+    stat = tf.io.gfile.stat(fpath)
+    # Not all file systems report modification times.
+    return (stat.length, getattr(stat, "mtime_nsec", None))
+
+
+def _tensor_cache_key(run, name, fpath):
+    """Key of the tensor `name` of `run` read from the file `fpath`.
+
+    Includes the file's fingerprint, so that a rewritten file is read
+    again rather than served from the cache.
+
+    Raises:
+      tf.errors.NotFoundError: If `fpath` does not exist.
+    """
+    return (run, name, _file_fingerprint(fpath))
+
+
+def _resident_nbytes(tensor):
+    """Size of `tensor` in memory, or 0 if it is memory-mapped."""
+    return 0 if isinstance(tensor, np.memmap) else tensor.nbytes
+
+
+def _iter_tsv_tensor_blocks(f):
+    """Yields the rows of a tensor TSV file as 2D float32 arrays."""
+    lines = []
+    for line in f:
+        if line.strip():
+            lines.append(line)
+        if len(lines) >= _TSV_PARSE_CHUNK_LINES:
+            yield _parse_tsv_tensor_lines(lines)
+            lines = []
+    if lines:
+        yield _parse_tsv_tensor_lines(lines)
+
+
+def _parse_tsv_tensor_lines(lines):
+    return np.loadtxt(
+        lines, dtype="float32", delimiter="\t", comments=None, ndmin=2
+    )
+
+
+def _tensor_sidecar_dir():
+    """Returns the directory for tensor sidecars, creating it if needed."""
+    global _TENSOR_SIDECAR_DIR
+    with _tensor_sidecar_dir_lock:
+        if _TENSOR_SIDECAR_DIR is None:
+            # Readable only by this user, so that no one else can plant
+            # sidecars for us to serve.
+            path = tempfile.mkdtemp(prefix="tensorboard-projector-")
+            atexit.register(shutil.rmtree, path, ignore_errors=True)
+            _TENSOR_SIDECAR_DIR = path
+        else:
+            os.makedirs(_TENSOR_SIDECAR_DIR, mode=0o700, exist_ok=True)
+        return _TENSOR_SIDECAR_DIR
+
+
+def _write_tensor_sidecar(fpath, sidecar_path):
+    """Converts the tensor TSV file `fpath` to a binary sidecar file."""
+    (fd, tmp_path) = tempfile.mkstemp(dir=os.path.dirname(sidecar_path))
+    try:
+        num_rows = 0
+        num_cols = 0
+        with os.fdopen(fd, "wb") as out, tf.io.gfile.GFile(fpath, "r") as f:
+            out.write(_TENSOR_SIDECAR_HEADER.pack(0, 0))
+            for block in _iter_tsv_tensor_blocks(f):
+                if num_rows and block.shape[1] != num_cols:
+                    raise ValueError(
+                        "Tensor file %r has rows of different lengths" % fpath
+                    )
+                num_cols = block.shape[1]
+                num_rows += block.shape[0]
+                out.write(block.tobytes())
+            out.seek(0)
+            out.write(_TENSOR_SIDECAR_HEADER.pack(num_rows, num_cols))
+        os.replace(tmp_path, sidecar_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _remove_stale_tensor_sidecars(sidecar_path, prefix):
+    """Removes sidecars named with `prefix`, other than `sidecar_path`."""
+    directory = os.path.dirname(sidecar_path)
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if name.startswith(prefix) and path != sidecar_path:
+            try:
+                os.remove(path)
+            except OSError:
+                # E.g., still mapped on Windows; retried on next write.
+                pass
+
+
+def _read_tensor_sidecar(sidecar_path):
+    """Memory-maps a sidecar file.
+
+    Raises:
+      ValueError: If the file's size does not match its header.
+    """
+    with open(sidecar_path, "rb") as f:
+        header = f.read(_TENSOR_SIDECAR_HEADER.size)
+        if len(header) != _TENSOR_SIDECAR_HEADER.size:
+            raise ValueError("Truncated tensor sidecar %r" % sidecar_path)
+        shape = _TENSOR_SIDECAR_HEADER.unpack(header)
+        expected_size = _TENSOR_SIDECAR_HEADER.size + 4 * shape[0] * shape[1]
+        actual_size = os.fstat(f.fileno()).st_size
+    if min(shape) < 0 or actual_size != expected_size:
+        raise ValueError(
+            "Tensor sidecar %r has %d bytes, but shape %r needs %d"
+            % (sidecar_path, actual_size, shape, expected_size)
+        )
+    if 0 in shape:
+        return np.zeros(shape, dtype="float32")
+    return np.memmap(
+        sidecar_path,
+        dtype="float32",
+        mode="r",
+        offset=_TENSOR_SIDECAR_HEADER.size,
+        shape=shape,
+    )
+
+
+def _copy_tensor_sidecar(fpath, sidecar_path, shape):
+    """Copies the binary tensor file `fpath` to a sidecar file."""
+    (fd, tmp_path) = tempfile.mkstemp(dir=os.path.dirname(sidecar_path))
+    try:
+        size = 0
+        with os.fdopen(fd, "wb") as out, tf.io.gfile.GFile(fpath, "rb") as f:
+            out.write(_TENSOR_SIDECAR_HEADER.pack(*shape))
+            while True:
+                chunk = f.read(_RESPONSE_CHUNK_BYTES)
+                if not chunk:
+                    break
+                size += len(chunk)
+                out.write(chunk)
+        _check_tensor_binary_size(fpath, size, shape)
+        os.replace(tmp_path, sidecar_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _read_tensor_file(fpath, version, write_sidecar, read_into_memory):
+    """Reads a tensor file, memory-mapped from a binary sidecar.
+
+    The sidecar is written only once per version of the file, by
+    `write_sidecar(fpath, sidecar_path)`, and replaces sidecars of
+    earlier versions. The tensor file itself is never mapped, since it
+    may be rewritten in place while TensorBoard reads it. If the file
+    system does not report modification times, versions cannot be told
+    apart, so the tensor is read by `read_into_memory()` instead, as it
+    is if the sidecar cannot be written or read.
+
+    Args:
+      fpath: Path to the tensor file.
+      version: A value that tells apart ways of reading the file.
+      write_sidecar: Function to write a sidecar file from `fpath`.
+      read_into_memory: Function to read the tensor as an array.
+    """
+    fingerprint = _file_fingerprint(fpath)
+    if fingerprint[1] is not None:
+        prefix = hashlib.sha256(fpath.encode("utf-8")).hexdigest() + "."
+        version = hashlib.sha256(repr((fingerprint, version)).encode("utf-8"))
+        try:
+            sidecar_path = os.path.join(
+                _tensor_sidecar_dir(),
+                prefix + version.hexdigest()[:16] + ".tensor",
+            )
+            if not os.path.exists(sidecar_path):
+                write_sidecar(fpath, sidecar_path)
+                _remove_stale_tensor_sidecars(sidecar_path, prefix)
+            return _read_tensor_sidecar(sidecar_path)
+        except UnicodeDecodeError:
+            raise
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "Could not cache tensor file %r as binary; reading it into "
+                "memory instead: %s",
+                fpath,
+                e,
+            )
+    return read_into_memory()
+
+
 def _read_tensor_tsv_file(fpath):
-    with tf.io.gfile.GFile(fpath, "r") as f:
-        tensor = []
-        for line in f:
-            line = line.rstrip("\n")
-            if line:
-                tensor.append(list(map(float, line.split("\t"))))
-    return np.array(tensor, dtype="float32")
+    """Reads a tensor TSV file, parsed once per version into a sidecar.
+
+    Raises:
+      UnicodeDecodeError: If `fpath` is not a text file.
+    """
+
+    def read_into_memory():
+        with tf.io.gfile.GFile(fpath, "r") as f:
+            blocks = list(_iter_tsv_tensor_blocks(f))
+        if not blocks:
+            return np.zeros((0, 0), dtype="float32")
+        return np.concatenate(blocks)
+
+    return _read_tensor_file(
+        fpath, None, _write_tensor_sidecar, read_into_memory
+    )
+
+
+def _check_tensor_binary_size(fpath, size, shape):
+    expected_size = 4 * shape[0] * shape[1]
+    if size != expected_size:
+        raise ValueError(
+            "Tensor file %r has %d bytes, but shape %r needs %d"
+            % (fpath, size, shape, expected_size)
+        )
 
 
 def _read_tensor_binary_file(fpath, shape):
+    """Reads a file of row-major float32 values of the given shape.
+
+    The file is copied once per version into a sidecar, which is mapped.
+    """
     if len(shape) != 2:
         raise ValueError("Tensor must be 2D, got shape {}".format(shape))
-    tensor = np.fromfile(fpath, dtype="float32")
-    return tensor.reshape(shape)
+    shape = tuple(shape)
+    _check_tensor_binary_size(fpath, _file_fingerprint(fpath)[0], shape)
+
+    def read_into_memory():
+        with tf.io.gfile.GFile(fpath, "rb") as f:
+            data = f.read()
+        _check_tensor_binary_size(fpath, len(data), shape)
+        return np.frombuffer(data, dtype="float32").reshape(shape)
+
+    return _read_tensor_file(
+        fpath,
+        shape,
+        functools.partial(_copy_tensor_sidecar, shape=shape),
+        read_into_memory,
+    )
+
+
+def _iter_chunks(data):
+    """Yields the bytes of a bytes-like object in bounded chunks."""
+    data = memoryview(data).cast("B")
+    for start in range(0, len(data), _RESPONSE_CHUNK_BYTES):
+        yield bytes(data[start : start + _RESPONSE_CHUNK_BYTES])
+
+
+class _AssetFile:
+    """Contents of a metadata or bookmarks file, indexed by line.
+
+    Attributes:
+      data: The file contents, as `bytes`.
+      fingerprint: The `_file_fingerprint` of the file when it was read.
+    """
+
+    def __init__(self, data, fingerprint):
+        self.data = data
+        self.fingerprint = fingerprint
+        self._line_ends = None
+
+    @property
+    def nbytes(self):
+        return len(self.data)
+
+    def line_ends(self):
+        """Offsets just past the end of each line, as a 1D array."""
+        if self._line_ends is None:
+            buf = np.frombuffer(self.data, dtype=np.uint8)
+            ends = np.flatnonzero(buf == ord("\n")) + 1
+            if len(self.data) and self.data[-1:] != b"\n":
+                ends = np.append(ends, len(self.data))
+            self._line_ends = ends
+        return self._line_ends
+
+    def head(self, num_lines):
+        """The first `num_lines` lines, as a zero-copy `memoryview`."""
+        ends = self.line_ends()
+        if num_lines is None or num_lines >= len(ends):
+            return memoryview(self.data)
+        if num_lines <= 0:
+            return memoryview(b"")
+        return memoryview(self.data)[: ends[num_lines - 1]]
+
+
+def _read_metadata_lines(fpath, num_rows):
+    """Reads the header and first `num_rows` rows of a metadata file.
+
+    This streams the file, stopping early, for files too large to cache.
+    """
+    num_header_rows = 0
+    with tf.io.gfile.GFile(fpath, "r") as f:
+        lines = []
+        for line in f:
+            lines.append(line)
+            if len(lines) == 1 and "\t" in lines[0]:
+                num_header_rows = 1
+            if num_rows and len(lines) >= num_rows + num_header_rows:
+                break
+    return "".join(lines)
 
 
 def _assets_dir_to_logdir(assets_dir):
@@ -246,12 +574,22 @@ class ProjectorPlugin(base_plugin.TBPlugin):
           context: A base_plugin.TBContext instance.
         """
         self.data_provider = context.data_provider
+        self.multiplexer = context.multiplexer
         self.logdir = context.logdir
         self.readers = {}
         self._run_paths = None
         self._configs = {}
         self.config_fpaths = None
-        self.tensor_cache = LRUCache(_TENSOR_CACHE_CAPACITY)
+        self.tensor_cache = LRUCache(
+            _TENSOR_CACHE_CAPACITY,
+            max_bytes=_TENSOR_CACHE_MAX_BYTES,
+            sizeof=_resident_nbytes,
+        )
+        self.asset_file_cache = LRUCache(
+            _ASSET_FILE_CACHE_CAPACITY,
+            max_bytes=_ASSET_FILE_CACHE_MAX_BYTES,
+            sizeof=lambda asset_file: asset_file.nbytes,
+        )
 
         # Whether the plugin is active (has meaningful data to process and serve).
         # Once the plugin is deemed active, we no longer re-compute the value
@@ -388,7 +726,18 @@ class ProjectorPlugin(base_plugin.TBPlugin):
                             e,
                         )
                         continue
-                    tensor = self.tensor_cache.get((run, embedding.tensor_name))
+                    try:
+                        key = _tensor_cache_key(
+                            run, embedding.tensor_name, fpath
+                        )
+                    except tf.errors.NotFoundError:
+                        logger.warning(
+                            'Tensor file "%s" for run "%s" does not exist',
+                            fpath,
+                            run,
+                        )
+                        continue
+                    tensor = self.tensor_cache.get(key)
                     if tensor is None:
                         try:
                             tensor = _read_tensor_tsv_file(fpath)
@@ -396,9 +745,7 @@ class ProjectorPlugin(base_plugin.TBPlugin):
                             tensor = _read_tensor_binary_file(
                                 fpath, embedding.tensor_shape
                             )
-                        self.tensor_cache.set(
-                            (run, embedding.tensor_name), tensor
-                        )
+                        self.tensor_cache.set(key, tensor)
                     if not embedding.tensor_shape:
                         embedding.tensor_shape.extend(
                             [len(tensor), len(tensor[0])]
@@ -505,6 +852,24 @@ class ProjectorPlugin(base_plugin.TBPlugin):
         self.readers[run] = reader
         return reader
 
+    def _read_asset_file(self, fpath):
+        """Reads `fpath`, reusing a cached copy if the file is unchanged.
+
+        Returns:
+          An `_AssetFile`, or `None` if the file is too large to cache.
+        """
+        fingerprint = _file_fingerprint(fpath)
+        asset_file = self.asset_file_cache.get(fpath)
+        if asset_file is not None and asset_file.fingerprint == fingerprint:
+            return asset_file
+        (length, _) = fingerprint
+        if length > _ASSET_FILE_CACHE_MAX_BYTES:
+            return None
+        with tf.io.gfile.GFile(fpath, "rb") as f:
+            asset_file = _AssetFile(f.read(), fingerprint)
+        self.asset_file_cache.set(fpath, asset_file)
+        return asset_file
+
     def _get_metadata_file_for_tensor(self, tensor_name, config):
         embedding_info = self._get_embedding(tensor_name, config)
         if embedding_info:
@@ -536,8 +901,17 @@ class ProjectorPlugin(base_plugin.TBPlugin):
     def _append_plugin_asset_directories(self, run_path_pairs):
         extra = []
         plugin_assets_name = metadata.PLUGIN_ASSETS_NAME
+        # The multiplexer indexes the assets of each run, listing them
+        # again only after reloads, so prefer it to listing directories.
+        indexed_assets = {}
+        if self.multiplexer is not None:
+            indexed_assets = self.multiplexer.PluginAssets(plugin_assets_name)
         for run, logdir in run_path_pairs:
-            assets = plugin_asset_util.ListAssets(logdir, plugin_assets_name)
+            assets = indexed_assets.get(run)
+            if assets is None:
+                assets = plugin_asset_util.ListAssets(
+                    logdir, plugin_assets_name
+                )
             if metadata.PROJECTOR_FILENAME not in assets:
                 continue
             assets_dir = os.path.join(
@@ -628,18 +1002,23 @@ class ProjectorPlugin(base_plugin.TBPlugin):
                 400,
             )
 
-        num_header_rows = 0
-        with tf.io.gfile.GFile(fpath, "r") as f:
-            lines = []
-            # Stream reading the file with early break in case the file doesn't fit in
-            # memory.
-            for line in f:
-                lines.append(line)
-                if len(lines) == 1 and "\t" in lines[0]:
-                    num_header_rows = 1
-                if num_rows and len(lines) >= num_rows + num_header_rows:
-                    break
-        return Respond(request, "".join(lines), "text/plain")
+        asset_file = self._read_asset_file(fpath)
+        if asset_file is None:
+            return Respond(
+                request, _read_metadata_lines(fpath, num_rows), "text/plain"
+            )
+        num_lines = None
+        if num_rows:
+            first_line = bytes(asset_file.head(1))
+            num_header_rows = 1 if b"\t" in first_line else 0
+            num_lines = num_rows + num_header_rows
+        content = asset_file.head(num_lines)
+        return RespondStream(
+            request,
+            _iter_chunks(content),
+            "text/plain",
+            content_length=len(content),
+        )
 
     @wrappers.Request.application
     def _serve_tensor(self, request):
@@ -670,25 +1049,28 @@ class ProjectorPlugin(base_plugin.TBPlugin):
             return Respond(
                 request, 'Unknown run: "%s"' % run, "text/plain", 400
             )
-        tensor = self.tensor_cache.get((run, name))
+        # See if there is a tensor file in the config.
+        embedding = self._get_embedding(name, config)
+        fpath = None
+        key = (run, name)
+        if embedding and embedding.tensor_path:
+            try:
+                fpath = _rel_to_abs_asset_path(
+                    embedding.tensor_path, self.config_fpaths[run]
+                )
+                key = _tensor_cache_key(run, name, fpath)
+            except ValueError as e:
+                return Respond(request, str(e), "text/plain", 400)
+            except tf.errors.NotFoundError:
+                return Respond(
+                    request,
+                    'Tensor file "%s" does not exist' % fpath,
+                    "text/plain",
+                    400,
+                )
+        tensor = self.tensor_cache.get(key)
         if tensor is None:
-            # See if there is a tensor file in the config.
-            embedding = self._get_embedding(name, config)
-
-            if embedding and embedding.tensor_path:
-                try:
-                    fpath = _rel_to_abs_asset_path(
-                        embedding.tensor_path, self.config_fpaths[run]
-                    )
-                except ValueError as e:
-                    return Respond(request, str(e), "text/plain", 400)
-                if not tf.io.gfile.exists(fpath):
-                    return Respond(
-                        request,
-                        'Tensor file "%s" does not exist' % fpath,
-                        "text/plain",
-                        400,
-                    )
+            if fpath is not None:
                 try:
                     tensor = _read_tensor_tsv_file(fpath)
                 except UnicodeDecodeError:
@@ -710,14 +1092,21 @@ class ProjectorPlugin(base_plugin.TBPlugin):
                 except tf.errors.InvalidArgumentError as e:
                     return Respond(request, str(e), "text/plain", 400)
 
-            self.tensor_cache.set((run, name), tensor)
+            self.tensor_cache.set(key, tensor)
 
         if num_rows:
             tensor = tensor[:num_rows]
         if tensor.dtype != "float32":
             tensor = tensor.astype(dtype="float32", copy=False)
-        data_bytes = tensor.tobytes()
-        return Respond(request, data_bytes, "application/octet-stream")
+        # A no-op for slices of rows of memory-mapped tensors, so that
+        # only the rows that are sent are ever read from disk.
+        tensor = np.ascontiguousarray(tensor)
+        return RespondStream(
+            request,
+            _iter_chunks(tensor.reshape(-1)),
+            "application/octet-stream",
+            content_length=tensor.nbytes,
+        )
 
     @wrappers.Request.application
     def _serve_bookmarks(self, request):
@@ -760,9 +1149,12 @@ class ProjectorPlugin(base_plugin.TBPlugin):
                 400,
             )
 
-        bookmarks_json = None
-        with tf.io.gfile.GFile(fpath, "rb") as f:
-            bookmarks_json = f.read()
+        asset_file = self._read_asset_file(fpath)
+        if asset_file is None:
+            with tf.io.gfile.GFile(fpath, "rb") as f:
+                bookmarks_json = f.read()
+        else:
+            bookmarks_json = asset_file.data
         return Respond(request, bookmarks_json, "application/json")
 
     @wrappers.Request.application
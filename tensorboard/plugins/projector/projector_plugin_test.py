@@ -20,9 +20,11 @@ import gzip
 import io
 import json
 import os
+import shutil
 import numpy as np
 import tensorflow as tf
 import unittest
+from unittest import mock
 
 from werkzeug import test as werkzeug_test
 from werkzeug import wrappers
@@ -31,6 +33,7 @@ from google.protobuf import text_format
 
 from tensorboard.backend import application
 from tensorboard.backend.event_processing import data_provider
+from tensorboard.backend.event_processing import plugin_asset_util
 from tensorboard.backend.event_processing import (
     plugin_event_multiplexer as event_multiplexer,
 )
@@ -38,6 +41,7 @@ from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import summary_pb2
 from tensorboard.compat import tf as tf_compat
 from tensorboard.plugins import base_plugin
+from tensorboard.plugins.projector import metadata
 from tensorboard.plugins.projector import projector_config_pb2
 from tensorboard.plugins.projector import projector_plugin
 from tensorboard.util import test_util
@@ -56,6 +60,13 @@ class ProjectorAppTest(tf.test.TestCase):
 
     def setUp(self):
         self.test_dir = self.get_temp_dir()
+        sidecar_dir_patch = mock.patch.object(
+            projector_plugin,
+            "_TENSOR_SIDECAR_DIR",
+            os.path.join(self.test_dir, "sidecars"),
+        )
+        sidecar_dir_patch.start()
+        self.addCleanup(sidecar_dir_patch.stop)
         self.log_dir = os.path.join(self.test_dir, "log_dir")
         self.restricted_dir = os.path.join(self.test_dir, "restricted_dir")
         tf.io.gfile.makedirs(self.log_dir)
@@ -156,6 +167,31 @@ class ProjectorAppTest(tf.test.TestCase):
         expected_tensor = np.array([[6, 6]], dtype=np.float32)
         self._AssertTensorResponse(tensor_bytes, expected_tensor)
 
+    def testTensorFromTsvFile(self):
+        self._GenerateProjectorAssetsTestData()
+        self._WriteTextFile(
+            self._ResolveAssetPath("tensor.tsv"),
+            "1.0\t2.0\n\n3.0\t4.0\n5.0\t6.0\n",
+        )
+        self._SetupWSGIApp()
+
+        url = "/data/plugin/projector/tensor?run=.&name=embedding"
+        expected_tensor = np.array([[1, 2], [3, 4], [5, 6]], dtype=np.float32)
+        self._AssertTensorResponse(self._Get(url).data, expected_tensor)
+        self._AssertTensorResponse(
+            self._Get(url + "&num_rows=2").data, expected_tensor[:2]
+        )
+        key = projector_plugin._tensor_cache_key(
+            ".", "embedding", self._ResolveAssetPath("tensor.tsv")
+        )
+        self.assertIsInstance(self.plugin.tensor_cache.get(key), np.memmap)
+
+        # A rewritten file is read again rather than served stale.
+        self._WriteTextFile(self._ResolveAssetPath("tensor.tsv"), "7.0\t8.0\n")
+        self._AssertTensorResponse(
+            self._Get(url).data, np.array([[7, 8]], dtype=np.float32)
+        )
+
     def testBookmarksRequestMissingRunAndName(self):
         self._GenerateProjectorTestData()
         self._SetupWSGIApp()
@@ -214,6 +250,48 @@ class ProjectorAppTest(tf.test.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, b"label\nvalue\n")
 
+    def testMetadataNumRowsIsServedFromCache(self):
+        metadata_path = os.path.join(self.log_dir, "metadata.tsv")
+        self._GenerateProjectorAssetsTestData(metadata_path="metadata.tsv")
+        self._WriteTextFile(metadata_path, "a\tb\n1\t2\n3\t4\n5\t6")
+        self._SetupWSGIApp()
+        url = "/data/plugin/projector/metadata?run=.&name=embedding"
+
+        self.assertEqual(self._Get(url).data, b"a\tb\n1\t2\n3\t4\n5\t6")
+        with mock.patch.object(
+            tf_compat.io.gfile, "GFile", side_effect=AssertionError
+        ):
+            self.assertEqual(
+                self._Get(url + "&num_rows=2").data, b"a\tb\n1\t2\n3\t4\n"
+            )
+            self.assertEqual(
+                self._Get(url + "&num_rows=5").data,
+                b"a\tb\n1\t2\n3\t4\n5\t6",
+            )
+
+        # Rewriting the file invalidates the cache.
+        self._WriteTextFile(metadata_path, "x\ny\nz\n")
+        os.utime(metadata_path, ns=(0, 0))
+        self.assertEqual(self._Get(url + "&num_rows=1").data, b"x\n")
+
+    def testMetadataIsGzipped(self):
+        self._GenerateProjectorAssetsTestData(metadata_path="metadata.tsv")
+        contents = "".join("label_%d\n" % i for i in range(1000))
+        self._WriteTextFile(
+            os.path.join(self.log_dir, "metadata.tsv"), contents
+        )
+        self._SetupWSGIApp()
+
+        response = self.server.get(
+            "/data/plugin/projector/metadata?run=.&name=embedding",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+        self.assertEqual(
+            gzip.decompress(response.data), contents.encode("utf-8")
+        )
+
     def testMetadataRejectsTraversalOutsideLogdir(self):
         outside_metadata_path = os.path.join(
             self.restricted_dir, "outside_metadata.tsv"
@@ -298,6 +376,47 @@ class ProjectorAppTest(tf.test.TestCase):
         run_json = self._GetJson("/data/plugin/projector/runs")
         self.assertEqual(run_json, [])
 
+    def testRunAssetsAreListedFromMultiplexer(self):
+        run_dir = os.path.join(self.log_dir, "train")
+        with test_util.FileWriterCache.get(run_dir) as writer:
+            writer.add_graph(tf.Graph())
+        assets_dir = plugin_asset_util.PluginDirectory(
+            run_dir, metadata.PLUGIN_ASSETS_NAME
+        )
+        self._WriteTextFile(os.path.join(assets_dir, "tensor.tsv"), "1.0\n")
+        config = projector_config_pb2.ProjectorConfig()
+        config.embeddings.add(tensor_name="embedding", tensor_path="tensor.tsv")
+        self._WriteTextFile(
+            os.path.join(assets_dir, metadata.PROJECTOR_FILENAME),
+            text_format.MessageToString(config),
+        )
+        multiplexer = event_multiplexer.EventMultiplexer()
+        multiplexer.AddRunsFromDirectory(self.log_dir)
+        multiplexer.Reload()
+        context = base_plugin.TBContext(
+            logdir=self.log_dir,
+            data_provider=data_provider.MultiplexerDataProvider(
+                multiplexer, self.log_dir
+            ),
+            multiplexer=multiplexer,
+        )
+        self.plugin = projector_plugin.ProjectorPlugin(context)
+        wsgi_app = application.TensorBoardWSGI([self.plugin])
+        self.server = werkzeug_test.Client(wsgi_app, wrappers.Response)
+
+        self.assertEqual(
+            ["train"], self._GetJson("/data/plugin/projector/runs")
+        )
+        with mock.patch.object(
+            plugin_asset_util, "ListAssets", wraps=plugin_asset_util.ListAssets
+        ) as list_assets:
+            self.assertEqual(
+                ["train"], self._GetJson("/data/plugin/projector/runs")
+            )
+        # The run's assets are served from its index until the next
+        # reload, without listing its directory.
+        list_assets.assert_not_called()
+
     def _AssertTensorResponse(self, tensor_bytes, expected_tensor):
         tensor = np.reshape(
             np.frombuffer(tensor_bytes, dtype=np.float32), expected_tensor.shape
@@ -526,6 +645,144 @@ class MetadataColumnsTest(tf.test.TestCase):
             metadata.add_column("Labels", np.array(["a", "b"]))
 
 
+class TensorFileTest(tf.test.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sidecar_dir = os.path.join(self.get_temp_dir(), "sidecars")
+        sidecar_dir_patch = mock.patch.object(
+            projector_plugin, "_TENSOR_SIDECAR_DIR", self.sidecar_dir
+        )
+        sidecar_dir_patch.start()
+        self.addCleanup(sidecar_dir_patch.stop)
+
+    def _write(self, contents, mode="w"):
+        path = os.path.join(self.get_temp_dir(), "tensor")
+        with open(path, mode) as f:
+            f.write(contents)
+        return path
+
+    def testTsvIsConvertedToSidecarOnce(self):
+        expected = np.random.RandomState(0).rand(100, 7).astype(np.float32)
+        path = self._write(
+            "".join(
+                "\t".join(map(repr, row)) + "\n" for row in expected.tolist()
+            )
+        )
+        with mock.patch.object(projector_plugin, "_TSV_PARSE_CHUNK_LINES", 8):
+            tensor = projector_plugin._read_tensor_tsv_file(path)
+        self.assertIsInstance(tensor, np.memmap)
+        self.assertAllEqual(expected, tensor)
+        self.assertLen(os.listdir(self.sidecar_dir), 1)
+
+        with mock.patch.object(
+            projector_plugin, "_write_tensor_sidecar"
+        ) as write:
+            self.assertAllEqual(
+                expected, projector_plugin._read_tensor_tsv_file(path)
+            )
+        write.assert_not_called()
+
+    def testTsvSidecarIsInvalidatedByChanges(self):
+        path = self._write("1.0\t2.0\n")
+        self.assertAllEqual(
+            [[1, 2]], projector_plugin._read_tensor_tsv_file(path)
+        )
+        self._write("1.0\t2.0\n3.0\t4.0\n")
+        self.assertAllEqual(
+            [[1, 2], [3, 4]], projector_plugin._read_tensor_tsv_file(path)
+        )
+        # The sidecar of the earlier version has been removed.
+        self.assertLen(os.listdir(self.sidecar_dir), 1)
+
+    def testTsvWithoutMtimeIsNotCached(self):
+        path = self._write("1.0\t2.0\n")
+        with mock.patch.object(
+            projector_plugin, "_file_fingerprint", return_value=(8, None)
+        ):
+            tensor = projector_plugin._read_tensor_tsv_file(path)
+        self.assertNotIsInstance(tensor, np.memmap)
+        self.assertAllEqual([[1, 2]], tensor)
+        self.assertFalse(os.path.exists(self.sidecar_dir))
+
+    def testCorruptSidecarFallsBackToMemory(self):
+        path = self._write("1.0\t2.0\n3.0\t4.0\n")
+        projector_plugin._read_tensor_tsv_file(path)
+        (name,) = os.listdir(self.sidecar_dir)
+        with open(os.path.join(self.sidecar_dir, name), "r+b") as f:
+            f.truncate(20)
+        with self.assertLogs(level="WARNING"):
+            tensor = projector_plugin._read_tensor_tsv_file(path)
+        self.assertNotIsInstance(tensor, np.memmap)
+        self.assertAllEqual([[1, 2], [3, 4]], tensor)
+
+    def testDefaultSidecarDirIsPrivate(self):
+        path = self._write("1.0\t2.0\n")
+        with mock.patch.object(projector_plugin, "_TENSOR_SIDECAR_DIR", None):
+            projector_plugin._read_tensor_tsv_file(path)
+            sidecar_dir = projector_plugin._TENSOR_SIDECAR_DIR
+        self.addCleanup(shutil.rmtree, sidecar_dir)
+        self.assertNotEqual(sidecar_dir, self.sidecar_dir)
+        self.assertEqual(0o700, os.stat(sidecar_dir).st_mode & 0o777)
+        self.assertLen(os.listdir(sidecar_dir), 1)
+
+    def testTsvWithRaggedRows(self):
+        path = self._write("1.0\t2.0\n3.0\n")
+        with self.assertRaises(ValueError):
+            projector_plugin._read_tensor_tsv_file(path)
+        self.assertEqual([], os.listdir(self.sidecar_dir))
+
+    def testTsvFallsBackToMemoryIfSidecarCannotBeWritten(self):
+        path = self._write("1.0\t2.0\n")
+        with mock.patch.object(
+            projector_plugin,
+            "_write_tensor_sidecar",
+            side_effect=PermissionError("read-only"),
+        ):
+            tensor = projector_plugin._read_tensor_tsv_file(path)
+        self.assertNotIsInstance(tensor, np.memmap)
+        self.assertAllEqual([[1, 2]], tensor)
+
+    def testBinaryFileIsMappedFromPrivateCopy(self):
+        expected = np.arange(12, dtype=np.float32).reshape([4, 3])
+        path = self._write(expected.tobytes(), mode="wb")
+        tensor = projector_plugin._read_tensor_binary_file(path, [4, 3])
+        self.assertIsInstance(tensor, np.memmap)
+        self.assertNotEqual(path, tensor.filename)
+        self.assertEqual(self.sidecar_dir, os.path.dirname(tensor.filename))
+        # Truncating the file in place does not affect the mapped copy.
+        with open(path, "r+b") as f:
+            f.truncate(0)
+        self.assertAllEqual(expected, tensor)
+        with self.assertRaisesRegex(ValueError, "needs 64"):
+            projector_plugin._read_tensor_binary_file(path, [4, 4])
+
+    def testBinaryFileWithoutMtimeIsReadIntoMemory(self):
+        expected = np.arange(6, dtype=np.float32).reshape([2, 3])
+        path = self._write(expected.tobytes(), mode="wb")
+        with mock.patch.object(
+            projector_plugin, "_file_fingerprint", return_value=(24, None)
+        ):
+            tensor = projector_plugin._read_tensor_binary_file(path, [2, 3])
+        self.assertNotIsInstance(tensor, np.memmap)
+        self.assertAllEqual(expected, tensor)
+        self.assertFalse(os.path.exists(self.sidecar_dir))
+
+
+class AssetFileTest(tf.test.TestCase):
+    def testHead(self):
+        asset_file = projector_plugin._AssetFile(b"a\nbb\n\nccc", None)
+        self.assertEqual(b"", bytes(asset_file.head(0)))
+        self.assertEqual(b"a\n", bytes(asset_file.head(1)))
+        self.assertEqual(b"a\nbb\n\n", bytes(asset_file.head(3)))
+        self.assertEqual(b"a\nbb\n\nccc", bytes(asset_file.head(4)))
+        self.assertEqual(b"a\nbb\n\nccc", bytes(asset_file.head(10)))
+        self.assertEqual(b"a\nbb\n\nccc", bytes(asset_file.head(None)))
+
+    def testEmpty(self):
+        asset_file = projector_plugin._AssetFile(b"", None)
+        self.assertEqual(b"", bytes(asset_file.head(1)))
+
+
 class LRUCacheTest(tf.test.TestCase):
     def testInvalidSize(self):
         with self.assertRaises(ValueError):
@@ -561,6 +818,24 @@ class LRUCacheTest(tf.test.TestCase):
         self.assertEqual(cache.get("b"), 2)
         self.assertEqual(cache.get("d"), 4)
 
+    def testByteBudget(self):
+        cache = projector_plugin.LRUCache(10, max_bytes=10, sizeof=len)
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+        cache.set("c", "xxxx")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), "xxxx")
+        self.assertEqual(cache.get("c"), "xxxx")
+
+        # An entry over budget by itself is kept until the next one.
+        cache.set("d", "x" * 20)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.get("d"), "x" * 20)
+        cache.set("d", "x")
+        cache.set("e", "x")
+        self.assertEqual(cache.get("d"), "x")
+
 
 if __name__ == "__main__":
     tf.test.main()
@@ -27,6 +27,7 @@ from werkzeug import wrappers
 
 from tensorboard import errors
 from tensorboard import plugin_util
+from tensorboard.backend import columnar_format
 from tensorboard.backend import http_util
 from tensorboard.data import provider
 from tensorboard.plugins import base_plugin
@@ -40,6 +41,8 @@ class OutputFormat:
 
     JSON = "json"
     CSV = "csv"
+    # Negotiated with the `Accept` header; see `columnar_format`.
+    COLUMNAR = "columnar"
 
 
 class ScalarsPlugin(base_plugin.TBPlugin):
@@ -100,7 +103,7 @@ class ScalarsPlugin(base_plugin.TBPlugin):
 
     def scalars_impl(self, ctx, tag, run, experiment, output_format):
         """Result of the form `(body, mime_type)`."""
-        all_scalars = self._data_provider.read_scalars(
+        all_scalars = self._data_provider.read_scalars_columnar(
             ctx,
             experiment_id=experiment,
             plugin_name=metadata.PLUGIN_NAME,
@@ -112,7 +115,10 @@ class ScalarsPlugin(base_plugin.TBPlugin):
             raise errors.NotFoundError(
                 "No scalar data for run=%r, tag=%r" % (run, tag)
             )
-        values = [(x.wall_time, x.step, x.value) for x in scalars]
+        if output_format == OutputFormat.COLUMNAR:
+            body = columnar_format.encode_scalars({run: scalars})
+            return (body, columnar_format.MIME_TYPE)
+        values = _json_values(scalars)
         if output_format == OutputFormat.CSV:
             string_io = io.StringIO()
             writer = csv.writer(string_io)
@@ -122,21 +128,47 @@ class ScalarsPlugin(base_plugin.TBPlugin):
         else:
             return (values, "application/json")
 
-    def scalars_multirun_impl(self, ctx, tag, runs, experiment):
+    def scalars_multirun_impl(
+        self, ctx, tag, runs, experiment, output_format=OutputFormat.JSON
+    ):
         """Result of the form `(body, mime_type)`."""
-        all_scalars = self._data_provider.read_scalars(
+        all_scalars = self._data_provider.read_scalars_columnar(
             ctx,
             experiment_id=experiment,
             plugin_name=metadata.PLUGIN_NAME,
             downsample=self._downsample_to,
             run_tag_filter=provider.RunTagFilter(runs=runs, tags=[tag]),
         )
+        if output_format == OutputFormat.COLUMNAR:
+            body = columnar_format.encode_scalars(
+                {run: run_data[tag] for (run, run_data) in all_scalars.items()}
+            )
+            return (body, columnar_format.MIME_TYPE)
         body = {
-            run: [(x.wall_time, x.step, x.value) for x in run_data[tag]]
+            run: _json_values(run_data[tag])
             for (run, run_data) in all_scalars.items()
         }
         return (body, "application/json")
 
+    def scalars_multitag_impl(self, ctx, tags, run, experiment):
+        """Result of the form `(body, mime_type)`.
+
+        Reads all of `tags` for `run` in a single data provider call. The
+        body maps each of those tags that has data to its JSON values.
+        """
+        all_scalars = self._data_provider.read_scalars_columnar(
+            ctx,
+            experiment_id=experiment,
+            plugin_name=metadata.PLUGIN_NAME,
+            downsample=self._downsample_to,
+            run_tag_filter=provider.RunTagFilter(runs=[run], tags=tags),
+        )
+        body = {
+            tag: _json_values(scalars)
+            for (tag, scalars) in all_scalars.get(run, {}).items()
+        }
+        return (body, "application/json")
+
     @wrappers.Request.application
     def tags_route(self, request):
         ctx = plugin_util.context(request.environ)
@@ -158,10 +190,14 @@ class ScalarsPlugin(base_plugin.TBPlugin):
         ctx = plugin_util.context(request.environ)
         experiment = plugin_util.experiment_id(request.environ)
         output_format = request.args.get("format")
+        if output_format is None and columnar_format.accepts(request):
+            output_format = OutputFormat.COLUMNAR
         (body, mime_type) = self.scalars_impl(
             ctx, tag, run, experiment, output_format
         )
-        return http_util.Respond(request, body, mime_type)
+        return http_util.Respond(
+            request, body, mime_type, headers=[("Vary", "Accept")]
+        )
 
     @wrappers.Request.application
     def scalars_multirun_route(self, request):
@@ -178,7 +214,23 @@ class ScalarsPlugin(base_plugin.TBPlugin):
 
         ctx = plugin_util.context(request.environ)
         experiment = plugin_util.experiment_id(request.environ)
+        output_format = OutputFormat.JSON
+        if columnar_format.accepts(request):
+            output_format = OutputFormat.COLUMNAR
         (body, mime_type) = self.scalars_multirun_impl(
-            ctx, tag, runs, experiment
+            ctx, tag, runs, experiment, output_format
+        )
+        return http_util.Respond(
+            request, body, mime_type, headers=[("Vary", "Accept")]
+        )
+
+
+def _json_values(scalars):
+    """Converts `provider.ScalarColumns` to `[wall_time, step, value]` rows."""
+    return list(
+        zip(
+            scalars.wall_time.tolist(),
+            scalars.step.tolist(),
+            scalars.value.tolist(),
         )
-        return http_util.Respond(request, body, mime_type)
+    )
@@ -25,6 +25,7 @@ import tensorflow as tf
 from werkzeug import test as werkzeug_test
 from werkzeug import wrappers
 
+from tensorboard.backend import columnar_format
 from tensorboard.backend import application
 from tensorboard.backend.event_processing import data_provider
 from tensorboard.backend.event_processing import (
@@ -180,6 +181,31 @@ class ScalarsPluginTest(tf.test.TestCase):
         self.assertEqual("application/json", response.headers["Content-Type"])
         self.assertEqual(self._STEPS, len(json.loads(response.get_data())))
 
+    def test_scalars_with_scalars_columnar(self):
+        server = self.load_server([self._RUN_WITH_SCALARS])
+        response = server.get(
+            "/data/plugin/scalars/scalars",
+            query_string={
+                "run": self._RUN_WITH_SCALARS,
+                "tag": "%s/scalar_summary" % self._SCALAR_TAG,
+            },
+            headers={"Accept": columnar_format.MIME_TYPE},
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            columnar_format.MIME_TYPE, response.headers["Content-Type"]
+        )
+        self.assertEqual("Accept", response.headers["Vary"])
+        (_, data) = columnar_format.decode(response.get_data())
+        self.assertCountEqual([self._RUN_WITH_SCALARS], data)
+        series = data[self._RUN_WITH_SCALARS]
+        self.assertEqual(list(range(self._STEPS)), series["step"].tolist())
+        # Sums of `[1 + step, 2 + step, 3 + step]`.
+        self.assertEqual(
+            [6.0 + 3 * step for step in range(self._STEPS)],
+            series["value"].tolist(),
+        )
+
     def test_scalars_with_scalars_unspecified_run(self):
         server = self.load_server([self._RUN_WITH_SCALARS])
         response = server.get(
@@ -241,6 +267,39 @@ class ScalarsPluginTest(tf.test.TestCase):
             data[self._RUN_WITH_SCALARS_3][0][2],
         )
 
+    def test_scalars_multirun_columnar(self):
+        server = self.load_server(
+            [
+                self._RUN_WITH_SCALARS,
+                self._RUN_WITH_SCALARS_2,
+                self._RUN_WITH_HISTOGRAM,
+            ]
+        )
+        response = server.post(
+            "/data/plugin/scalars/scalars_multirun",
+            data={
+                "tag": "%s/scalar_summary" % self._SCALAR_TAG,
+                "runs": [
+                    self._RUN_WITH_SCALARS,
+                    self._RUN_WITH_SCALARS_2,
+                    self._RUN_WITH_HISTOGRAM,
+                ],
+            },
+            headers={"Accept": columnar_format.MIME_TYPE},
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            columnar_format.MIME_TYPE, response.headers["Content-Type"]
+        )
+        (_, data) = columnar_format.decode(response.get_data())
+        self.assertCountEqual(
+            [self._RUN_WITH_SCALARS, self._RUN_WITH_SCALARS_2], data
+        )
+        self.assertEqual(
+            2 * data[self._RUN_WITH_SCALARS]["value"][0],
+            data[self._RUN_WITH_SCALARS_2]["value"][0],
+        )
+
     def test_scalars_multirun_single_run(self):
         # Checks for any problems with singleton arrays.
         server = self.load_server(
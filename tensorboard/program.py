@@ -36,6 +36,7 @@ import logging
 import mimetypes
 import os
 import shlex
+import shutil
 import signal
 import socket
 import sys
@@ -50,8 +51,11 @@ from werkzeug import serving
 from tensorboard import manager
 from tensorboard import version
 from tensorboard.backend import application
+from tensorboard.backend import request_scheduler
 from tensorboard.backend.event_processing import data_ingester as local_ingester
+from tensorboard.backend.event_processing import data_snapshot
 from tensorboard.backend.event_processing import event_file_inspector as efi
+from tensorboard.data import grpc_server
 from tensorboard.data import server_ingester
 from tensorboard.plugins.core import core_plugin
 from tensorboard.util import tb_logging
@@ -139,7 +143,7 @@ class TensorBoard:
                 ) from e
             assets_zip_provider = assets.get_default_assets_zip_provider()
         if server_class is None:
-            server_class = create_port_scanning_werkzeug_server
+            server_class = _create_default_server
         if subcommands is None:
             subcommands = []
         self.plugin_loaders = [
@@ -448,6 +452,11 @@ class TensorBoard:
                 )
 
         ingester = local_ingester.LocalDataIngester(flags)
+        if _serves_in_processes(flags):
+            snapshot_dir = data_snapshot.make_snapshot_dir()
+            atexit.register(shutil.rmtree, snapshot_dir, ignore_errors=True)
+            ingester.publish_snapshots(snapshot_dir)
+            self._snapshot_dir = snapshot_dir
         ingester.start()
         return ingester
 
@@ -458,14 +467,36 @@ class TensorBoard:
         # (See comment in `SubprocessServerDataIngester.start` for details.)
         self._ingester = ingester
 
+        if _serves_in_processes(self.flags):
+            # Serve the published snapshots, which all serving processes
+            # share, rather than the ingester's own copy of the data.
+            provider = data_snapshot.SnapshotDataProvider(self._snapshot_dir)
+            return (provider, None)
         deprecated_multiplexer = None
         if isinstance(ingester, local_ingester.LocalDataIngester):
             deprecated_multiplexer = ingester.deprecated_multiplexer
         return (ingester.data_provider, deprecated_multiplexer)
 
+    def _start_grpc_data_server(self, data_provider):
+        """Serves `data_provider` on `--grpc_data_server_port`."""
+        flags = self.flags
+        if flags.bind_all:
+            host = "[::]"
+        else:
+            host = flags.host or "localhost"
+        (self._grpc_data_server, port) = grpc_server.start_server(
+            data_provider, "%s:%d" % (host, flags.grpc_data_server_port)
+        )
+        sys.stderr.write(
+            "Serving TensorBoard data over gRPC at %s:%d\n" % (host, port)
+        )
+        sys.stderr.flush()
+
     def _make_server(self):
         """Constructs the TensorBoard WSGI app and instantiates the server."""
         (data_provider, deprecated_multiplexer) = self._make_data_provider()
+        if self.flags.grpc_data_server_port is not None:
+            self._start_grpc_data_server(data_provider)
         app = application.TensorBoardWSGIApp(
             self.flags,
             self.plugin_loaders,
@@ -476,6 +507,10 @@ class TensorBoard:
         return self.server_class(app, self.flags)
 
 
+def _serves_in_processes(flags):
+    return getattr(flags, "serving_processes", 0) > 1
+
+
 def _should_use_data_server(flags):
     if flags.logdir_spec and not flags.logdir:
         logger.info(
@@ -909,4 +944,123 @@ class WerkzeugServer(serving.ThreadedWSGIServer, TensorBoardServer):
         logging.getLogger("werkzeug").setLevel(logging.NOTSET)
 
 
+class WorkerPoolWerkzeugServer(WerkzeugServer):
+    """Werkzeug server that serves a bounded number of requests at once.
+
+    Connections are still accepted on their own threads, which do socket
+    I/O, but only `--max_request_workers` requests run application code at
+    a time. Other requests wait in priority lanes and are shed with HTTP
+    503 when their lane's queue is full; see `request_scheduler`.
+    """
+
+    def __init__(self, wsgi_app, flags):
+        max_workers = getattr(flags, "max_request_workers", 0) or (
+            os.cpu_count() or 1
+        )
+        max_queued = getattr(flags, "max_queued_requests", 64)
+        self.scheduler = request_scheduler.RequestScheduler(
+            max_workers, max_queued
+        )
+        wsgi_app = request_scheduler.SchedulingMiddleware(
+            wsgi_app, self.scheduler
+        )
+        super().__init__(wsgi_app, flags)
+
+
+class _PreforkMixin:
+    """Serves from `--serving_processes` processes sharing one socket.
+
+    `serve_forever` forks the other processes once the socket is bound,
+    and each accepts connections on it independently, so requests are
+    served in parallel across cores. Children exit when the parent does.
+    This only happens when serving from the main thread: forking from
+    other threads (e.g., under `TensorBoard.launch`) is unsafe, so the
+    server then runs in just the current process.
+    """
+
+    # Seconds between checks by children that their parent is alive.
+    _PARENT_POLL_SECS = 1.0
+
+    def serve_forever(self, *args, **kwargs):
+        count = getattr(self._flags, "serving_processes", 0)
+        if threading.current_thread() is not threading.main_thread():
+            logger.warning(
+                "Not forking serving processes outside the main thread"
+            )
+            count = 1
+        parent_pid = os.getpid()
+        children = []
+        for _ in range(count - 1):
+            pid = os.fork()
+            if pid == 0:
+                self._serve_as_child(parent_pid, *args, **kwargs)
+            children.append(pid)
+        if children:
+            logger.info("Forked serving processes: %r", children)
+        try:
+            super().serve_forever(*args, **kwargs)
+        finally:
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass
+
+    def _serve_as_child(self, parent_pid, *args, **kwargs):
+        """Serves in a forked child process; never returns."""
+
+        def exit_with_parent():
+            while os.getppid() == parent_pid:
+                time.sleep(self._PARENT_POLL_SECS)
+            os._exit(0)
+
+        # The parent stops children with SIGTERM; they need no cleanup.
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        # Exit directly when done, skipping cleanup that `atexit`
+        # handlers and the like inherited from the parent would do.
+        exit_code = 0
+        try:
+            threading.Thread(
+                target=exit_with_parent, name="ParentWatcher", daemon=True
+            ).start()
+            super().serve_forever(*args, **kwargs)
+        except (SystemExit, KeyboardInterrupt):
+            pass
+        except BaseException:
+            logger.exception("Serving process failed")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+
+class PreforkWerkzeugServer(_PreforkMixin, WerkzeugServer):
+    """Werkzeug server that serves from `--serving_processes` processes."""
+
+
+class PreforkWorkerPoolWerkzeugServer(_PreforkMixin, WorkerPoolWerkzeugServer):
+    """Like `WorkerPoolWerkzeugServer`, in `--serving_processes` processes."""
+
+
 create_port_scanning_werkzeug_server = with_port_scanning(WerkzeugServer)
+create_port_scanning_worker_pool_server = with_port_scanning(
+    WorkerPoolWerkzeugServer
+)
+create_port_scanning_prefork_server = with_port_scanning(PreforkWerkzeugServer)
+create_port_scanning_prefork_worker_pool_server = with_port_scanning(
+    PreforkWorkerPoolWerkzeugServer
+)
+
+
+def _create_default_server(wsgi_app, flags):
+    """Creates a server as configured by `--max_request_workers` and
+    `--serving_processes`."""
+    pool = getattr(flags, "max_request_workers", 0)
+    if _serves_in_processes(flags):
+        if pool:
+            return create_port_scanning_prefork_worker_pool_server(
+                wsgi_app, flags
+            )
+        return create_port_scanning_prefork_server(wsgi_app, flags)
+    if pool:
+        return create_port_scanning_worker_pool_server(wsgi_app, flags)
+    return create_port_scanning_werkzeug_server(wsgi_app, flags)
@@ -16,7 +16,10 @@
 
 import argparse
 import io
+import os
 import sys
+import threading
+import urllib.request
 from unittest import mock
 
 from tensorboard import program
@@ -81,6 +84,27 @@ class TensorBoardTest(tb_test.TestCase):
         with self.assertRaisesRegex(ValueError, "Unknown TensorBoard flag"):
             tb.configure(foo="bar")
 
+    def testGrpcDataServer(self):
+        tb = program.TensorBoard(
+            plugins=[core_plugin.CorePluginLoader],
+            assets_zip_provider=fake_asset_provider,
+        )
+        tb.configure(logdir=self.get_temp_dir(), grpc_data_server_port=0)
+        data_provider = mock.Mock()
+        data_provider.list_plugins.return_value = ["scalars"]
+        with mock.patch("sys.stderr", io.StringIO()) as stderr:
+            tb._start_grpc_data_server(data_provider)
+        self.addCleanup(tb._grpc_data_server.stop, None)
+        addr = stderr.getvalue().split()[-1]
+        self.assertTrue(addr.startswith("localhost:"), addr)
+        ingester = program.server_ingester.ExistingServerDataIngester(
+            addr, channel_creds_type=tb.flags.grpc_creds_type
+        )
+        self.assertEqual(
+            ingester.data_provider.list_plugins(None, experiment_id=""),
+            ["scalars"],
+        )
+
     def test_should_use_data_server(self):
         def f(**kwargs):
             kwargs.setdefault("logdir", "")
@@ -169,6 +193,101 @@ class WerkzeugServerTest(tb_test.TestCase):
         )
 
 
+class WorkerPoolWerkzeugServerTest(tb_test.TestCase):
+    def make_flags(self, **kwargs):
+        flags = argparse.Namespace(
+            host="localhost",
+            bind_all=False,
+            reuse_port=False,
+            port=0,
+            path_prefix="",
+            max_request_workers=2,
+            max_queued_requests=3,
+        )
+        for k, v in kwargs.items():
+            setattr(flags, k, v)
+        return flags
+
+    def testServesThroughScheduler(self):
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Length", "2")])
+            return [b"ok"]
+
+        server = program.WorkerPoolWerkzeugServer(app, self.make_flags())
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.shutdown)
+        url = "%sdata/plugin/scalars/scalars" % server.get_url()
+        with urllib.request.urlopen(url) as response:
+            self.assertEqual(response.read(), b"ok")
+        stats = server.scheduler.stats()
+        self.assertEqual(stats["lanes"]["data"]["admitted"], 1)
+
+    def testDefaultServerDispatch(self):
+        # Patch by name: `program` may be a lazy proxy for the real module.
+        with mock.patch(
+            "tensorboard.program.create_port_scanning_werkzeug_server"
+        ) as plain, mock.patch(
+            "tensorboard.program.create_port_scanning_worker_pool_server"
+        ) as pooled:
+            program._create_default_server(
+                None, self.make_flags(max_request_workers=0)
+            )
+            plain.assert_called_once()
+            pooled.assert_not_called()
+            program._create_default_server(None, self.make_flags())
+            pooled.assert_called_once()
+
+
+class PreforkWerkzeugServerTest(tb_test.TestCase):
+    def make_flags(self, **kwargs):
+        flags = argparse.Namespace(
+            host="localhost",
+            bind_all=False,
+            reuse_port=False,
+            port=0,
+            path_prefix="",
+            max_request_workers=0,
+            serving_processes=4,
+        )
+        for k, v in kwargs.items():
+            setattr(flags, k, v)
+        return flags
+
+    def testDoesNotForkOutsideMainThread(self):
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Length", "2")])
+            return [b"ok"]
+
+        server = program.PreforkWerkzeugServer(app, self.make_flags())
+        with mock.patch.object(os, "fork") as fork:
+            with self.assertLogs(level="WARNING"):
+                thread = threading.Thread(
+                    target=server.serve_forever, daemon=True
+                )
+                thread.start()
+                self.addCleanup(thread.join)
+                self.addCleanup(server.shutdown)
+                with urllib.request.urlopen(server.get_url()) as response:
+                    self.assertEqual(response.read(), b"ok")
+            fork.assert_not_called()
+
+    def testDefaultServerDispatch(self):
+        with mock.patch(
+            "tensorboard.program.create_port_scanning_prefork_server"
+        ) as prefork, mock.patch(
+            "tensorboard.program.create_port_scanning_prefork_worker_pool_server"
+        ) as pooled:
+            program._create_default_server(None, self.make_flags())
+            prefork.assert_called_once()
+            pooled.assert_not_called()
+            program._create_default_server(
+                None, self.make_flags(max_request_workers=2)
+            )
+            pooled.assert_called_once()
+
+
 class SubcommandTest(tb_test.TestCase):
     def setUp(self):
         super().setUp()
@@ -80,6 +80,58 @@ class RecordWriterTest(tb_test.TestCase):
             self.assertEqual(r.record(), bytes)
         w.close()
 
+    def test_record_truncated_resumes(self):
+        filename = os.path.join(self.get_temp_dir(), "record_truncated")
+        with io.BytesIO() as mem_f:
+            RecordWriter(mem_f).write(b"hello world")
+            record = mem_f.getvalue()
+        sections = ["header"] * 7 + ["header crc"] * 4
+        sections += ["data"] * len(b"hello world") + ["data crc"] * 4
+        with open(filename, "wb", buffering=0) as f:
+            r = PyRecordReader_New(filename)
+            with self.assertRaises(errors.OutOfRangeError):
+                r.GetNext()
+            for i, section in enumerate(sections):
+                f.write(record[i : i + 1])
+                with self.assertRaisesRegex(
+                    errors.DataLossError, "truncated record in %s$" % section
+                ):
+                    r.GetNext()
+            f.write(record[-1:])
+            r.GetNext()
+            self.assertEqual(r.record(), b"hello world")
+            with self.assertRaises(errors.OutOfRangeError):
+                r.GetNext()
+
+    def test_record_large_in_pieces(self):
+        filename = os.path.join(self.get_temp_dir(), "record_large")
+        data = os.urandom(1 << 16)
+        with io.BytesIO() as mem_f:
+            RecordWriter(mem_f).write(data)
+            record = mem_f.getvalue()
+        with open(filename, "wb", buffering=0) as f:
+            r = PyRecordReader_New(filename)
+            for i in range(0, len(record) - 1000, 1000):
+                f.write(record[i : i + 1000])
+                with self.assertRaises(errors.DataLossError):
+                    r.GetNext()
+            f.write(record[i + 1000 :])
+            r.GetNext()
+            self.assertEqual(r.record(), data)
+
+    def test_record_corrupt_data(self):
+        filename = os.path.join(self.get_temp_dir(), "record_corrupt")
+        with io.BytesIO() as mem_f:
+            RecordWriter(mem_f).write(b"hello world")
+            record = bytearray(mem_f.getvalue())
+        record[-5] ^= 1
+        with open(filename, "wb") as f:
+            f.write(record)
+        r = PyRecordReader_New(filename)
+        for _ in range(2):
+            with self.assertRaisesRegex(errors.DataLossError, "event crc32"):
+                r.GetNext()
+
     def test_expect_bytes_written_bytes_IO(self):
         byte_len = 64
         Bytes_io = io.BytesIO()
@@ -54,6 +54,9 @@ class LogdirLoader:
         self._directory_loader_factory = directory_loader_factory
         # Maps run names to corresponding DirectoryLoader instances.
         self._directory_loaders = {}
+        # Reused across calls to `synchronize_runs` so that unchanged
+        # directories need not be listed again on each traversal.
+        self._local_traverser = io_wrapper.LocalDirectoryTraverser()
 
     def synchronize_runs(self):
         """Finds new runs within `logdir` and makes `DirectoryLoaders` for
@@ -64,7 +67,9 @@ class LogdirLoader:
         """
         logger.info("Starting logdir traversal of %s", self._logdir)
         runs_seen = set()
-        for subdir in io_wrapper.GetLogdirSubdirectories(self._logdir):
+        for subdir in io_wrapper.GetLogdirSubdirectories(
+            self._logdir, local_traverser=self._local_traverser
+        ):
             run = os.path.relpath(subdir, self._logdir)
             runs_seen.add(run)
             if run not in self._directory_loaders:
@@ -0,0 +1,38 @@
+# Copyright 2026 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities shared by TensorBoard's benchmark scripts."""
+
+
+def format_line(headers, fields):
+    """Format a line of a table.
+
+    Arguments:
+      headers: A list of strings that are used as the table headers.
+      fields: A list of the same length as `headers` where `fields[i]` is
+        the entry for `headers[i]` in this row. Elements can be of
+        arbitrary types. Pass `headers` to print the header row.
+
+    Returns:
+      A pretty string.
+    """
+    assert len(fields) == len(headers), (fields, headers)
+    fields = [
+        "%2.4f" % field if isinstance(field, float) else str(field)
+        for field in fields
+    ]
+    return "  ".join(
+        " " * max(0, len(header) - len(field)) + field
+        for (header, field) in zip(headers, fields)
+    )
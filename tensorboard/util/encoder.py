@@ -14,10 +14,18 @@
 
 """TensorBoard encoder helper module.
 
-Encoder depends on TensorFlow.
+`encode_png` and `encode_wav` depend on TensorFlow. `encode_png_numpy`,
+`encode_wav_numpy`, and the batch encoders built on them need only NumPy
+and zlib.
 """
 
 
+import os
+import struct
+import threading
+import zlib
+from concurrent import futures
+
 import numpy as np
 
 from tensorboard.util import op_evaluator
@@ -115,3 +123,184 @@ class _TensorFlowWavEncoder(op_evaluator.PersistentOpEvaluator):
 
 
 encode_wav = _TensorFlowWavEncoder()
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# PNG color types, indexed by number of channels.
+_PNG_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+_PNG_FILTER_UP = 2
+_PNG_COMPRESSION_LEVEL = 6
+
+
+def _png_chunk(chunk_type, data):
+    return b"".join(
+        [
+            struct.pack(">I", len(data)),
+            chunk_type,
+            data,
+            struct.pack(">I", zlib.crc32(chunk_type + data)),
+        ]
+    )
+
+
+def encode_png_numpy(image):
+    """Encode an image to PNG without TensorFlow.
+
+    Every row is stored with the PNG "Up" filter, which is cheap to
+    compute with NumPy and compresses natural images well. Compression
+    releases the GIL, so this function has good parallel performance
+    when run on multiple threads.
+
+    Arguments:
+      image: A numpy array of shape `[height, width, channels]`, where
+        `channels` is 1, 2, 3, or 4, and of dtype uint8.
+
+    Returns:
+      A bytestring with PNG-encoded data.
+    """
+    if not isinstance(image, np.ndarray):
+        raise ValueError("'image' must be a numpy array: %r" % image)
+    if image.dtype != np.uint8:
+        raise ValueError("'image' dtype must be uint8, but is %r" % image.dtype)
+    if image.ndim != 3 or image.shape[2] not in _PNG_COLOR_TYPES:
+        raise ValueError(
+            "'image' must have shape [height, width, channels] with 1 to 4 "
+            "channels, but has shape %r" % (image.shape,)
+        )
+    (height, width, channels) = image.shape
+    rows = image.reshape(height, width * channels)
+    filtered = np.empty((height, 1 + width * channels), dtype=np.uint8)
+    filtered[:, 0] = _PNG_FILTER_UP
+    filtered[:1, 1:] = rows[:1]
+    # uint8 arithmetic wraps modulo 256, as the filter requires.
+    np.subtract(rows[1:], rows[:-1], out=filtered[1:, 1:])
+    header = struct.pack(
+        ">IIBBBBB", width, height, 8, _PNG_COLOR_TYPES[channels], 0, 0, 0
+    )
+    return b"".join(
+        [
+            _PNG_SIGNATURE,
+            _png_chunk(b"IHDR", header),
+            _png_chunk(
+                b"IDAT",
+                zlib.compress(filtered.tobytes(), _PNG_COMPRESSION_LEVEL),
+            ),
+            _png_chunk(b"IEND", b""),
+        ]
+    )
+
+
+def encode_wav_numpy(audio, samples_per_second):
+    """Encode an audio clip to 16-bit PCM WAV without TensorFlow.
+
+    The output is identical to that of `encode_wav`.
+
+    Arguments:
+      audio: A numpy array of shape `[samples, channels]`, with values in
+        `[-1.0, 1.0]`. Values outside this range are clipped.
+      samples_per_second: A positive `int`, in Hz.
+
+    Returns:
+      A bytestring with WAV-encoded data.
+    """
+    if not isinstance(audio, np.ndarray):
+        raise ValueError("'audio' must be a numpy array: %r" % audio)
+    if not isinstance(samples_per_second, int):
+        raise ValueError(
+            "'samples_per_second' must be an int: %r" % samples_per_second
+        )
+    if audio.ndim != 2:
+        raise ValueError(
+            "'audio' must have shape [samples, channels], but has shape %r"
+            % (audio.shape,)
+        )
+    (_, channels) = audio.shape
+    # Scale in float32 and round half away from zero, as TensorFlow does.
+    scaled = (audio.astype(np.float32) * np.float32(1 << 15)).astype(np.float64)
+    samples = np.clip(
+        np.trunc(scaled + np.copysign(0.5, scaled)),
+        -(1 << 15),
+        (1 << 15) - 1,
+    ).astype("<i2")
+    data = samples.tobytes()
+    bytes_per_sample = 2
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + len(data),
+        b"WAVE",
+        b"fmt ",
+        16,  # size of the rest of the "fmt " chunk
+        1,  # PCM
+        channels,
+        samples_per_second,
+        samples_per_second * channels * bytes_per_sample,
+        channels * bytes_per_sample,
+        8 * bytes_per_sample,
+        b"data",
+        len(data),
+    )
+    return header + data
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _shared_pool():
+    """Returns the process-wide encoding pool, creating it if needed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = futures.ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="TensorBoardEncoder",
+            )
+        return _pool
+
+
+def _map_in_pool(fn, items, max_workers):
+    """Applies `fn` to each of `items` in parallel, preserving order."""
+    items = list(items)
+    if len(items) <= 1 or max_workers == 1:
+        return [fn(item) for item in items]
+    if max_workers is None:
+        return list(_shared_pool().map(fn, items))
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(fn, items))
+
+
+def encode_png_batch(images, max_workers=None):
+    """Encode a stack of images to PNG in parallel, without TensorFlow.
+
+    Arguments:
+      images: A numpy array of shape `[k, height, width, channels]` and
+        dtype uint8, or a sequence of `k` arrays accepted by
+        `encode_png_numpy`.
+      max_workers: Optional `int`. If given, at most this many images are
+        encoded at once. By default, images are encoded on a process-wide
+        pool with one thread per CPU.
+
+    Returns:
+      A list of `k` bytestrings with PNG-encoded data.
+    """
+    return _map_in_pool(encode_png_numpy, images, max_workers)
+
+
+def encode_wav_batch(audio, samples_per_second, max_workers=None):
+    """Encode a stack of audio clips to WAV in parallel, without TensorFlow.
+
+    Arguments:
+      audio: A numpy array of shape `[k, samples, channels]`, or a
+        sequence of `k` arrays accepted by `encode_wav_numpy`.
+      samples_per_second: A positive `int`, in Hz.
+      max_workers: Optional `int`, as for `encode_png_batch`.
+
+    Returns:
+      A list of `k` bytestrings with WAV-encoded data.
+    """
+    return _map_in_pool(
+        lambda clip: encode_wav_numpy(clip, samples_per_second),
+        audio,
+        max_workers,
+    )
@@ -72,5 +72,69 @@ class TensorFlowWavEncoderTest(tf.test.TestCase):
         self._check_wav(self._encode(self._stereo, samples_per_second=44100))
 
 
+class NumpyPngEncoderTest(tf.test.TestCase):
+    def test_invalid_non_numpy(self):
+        with self.assertRaisesRegex(ValueError, "must be a numpy array"):
+            encoder.encode_png_numpy([[[0]]])
+
+    def test_invalid_non_uint8(self):
+        with self.assertRaisesRegex(ValueError, "dtype must be uint8"):
+            encoder.encode_png_numpy(np.zeros([2, 2, 3], dtype=np.float32))
+
+    def test_invalid_shape(self):
+        with self.assertRaisesRegex(ValueError, "must have shape"):
+            encoder.encode_png_numpy(np.zeros([2, 2, 5], dtype=np.uint8))
+        with self.assertRaisesRegex(ValueError, "must have shape"):
+            encoder.encode_png_numpy(np.zeros([2, 2], dtype=np.uint8))
+
+    def test_roundtrip(self):
+        rng = np.random.default_rng(0)
+        for channels in (1, 2, 3, 4):
+            image = rng.integers(0, 256, [12, 34, channels], dtype=np.uint8)
+            data = encoder.encode_png_numpy(image)
+            self.assertEqual(b"\x89PNG", data[:4])
+            self.assertAllEqual(image, tf.image.decode_png(data))
+
+
+class NumpyWavEncoderTest(tf.test.TestCase):
+    def test_matches_tensorflow(self):
+        rng = np.random.default_rng(0)
+        # Include out-of-range values, which are clipped.
+        audio = rng.uniform(-1.5, 1.5, [4410, 2])
+        self.assertEqual(
+            encoder.encode_wav(audio, samples_per_second=44100),
+            encoder.encode_wav_numpy(audio, 44100),
+        )
+
+    def test_invalid_samples_per_second(self):
+        with self.assertRaisesRegex(ValueError, "must be an int"):
+            encoder.encode_wav_numpy(np.zeros([10, 1]), 44100.0)
+
+
+class BatchEncoderTest(tf.test.TestCase):
+    def test_encode_png_batch(self):
+        images = np.arange(5 * 6 * 7 * 3).reshape([5, 6, 7, 3]).astype(np.uint8)
+        for max_workers in (None, 1, 2):
+            encoded = encoder.encode_png_batch(images, max_workers=max_workers)
+            self.assertEqual(
+                [encoder.encode_png_numpy(image) for image in images], encoded
+            )
+
+    def test_encode_png_batch_empty(self):
+        self.assertEqual([], encoder.encode_png_batch(np.zeros([0, 2, 2, 1])))
+
+    def test_encode_wav_batch(self):
+        audio = np.linspace(-1.0, 1.0, 3 * 100 * 2).reshape([3, 100, 2])
+        encoded = encoder.encode_wav_batch(audio, 8000, max_workers=2)
+        self.assertEqual(
+            [encoder.encode_wav_numpy(clip, 8000) for clip in audio], encoded
+        )
+
+    def test_errors_propagate(self):
+        images = [np.zeros([2, 2, 3], dtype=np.uint8), np.zeros([2, 2, 3])]
+        with self.assertRaisesRegex(ValueError, "dtype must be uint8"):
+            encoder.encode_png_batch(images)
+
+
 if __name__ == "__main__":
     tf.test.main()